@@ -23,6 +23,7 @@ from classification_rules import (
     ClassificationSuggestion,
     NormalBalance,
 )
+from shared.classification_cache import current_classification_cache
 
 # Sprint 31: Threshold for generating suggestions
 SUGGESTION_THRESHOLD = 0.5  # Generate suggestions when confidence below 50%
@@ -190,6 +191,24 @@ class AccountClassifier:
                 requires_review=False
             )
 
+        # 1b. Per-client cache (default rule set only — custom rules aren't
+        # covered by the rule-version hash)
+        cache = current_classification_cache() if self.rules is DEFAULT_RULES else None
+        if cache is not None:
+            cached = cache.get_classification(account_name)
+            if cached is not None:
+                # The cache holds the unrounded confidence, so the review
+                # flag is decided on the same value as a fresh classification.
+                return ClassificationResult(
+                    account_name=account_name,
+                    category=cached.category,
+                    confidence=round(cached.confidence, 2),
+                    normal_balance=NORMAL_BALANCE_MAP[cached.category],
+                    matched_keywords=list(cached.matched_keywords),
+                    is_abnormal=self._is_abnormal(cached.category, net_balance),
+                    requires_review=cached.confidence < CONFIDENCE_HIGH,
+                )
+
         # 2. Extract account number for supplementary signal
         account_number = self._extract_account_number(account_name)
 
@@ -235,6 +254,8 @@ class AccountClassifier:
                 best_category,
                 best_score
             )
+        elif cache is not None:
+            cache.put_classification(account_name, best_category, confidence, matched_keywords[:5])
 
         return ClassificationResult(
             account_name=account_name,
@@ -20,8 +20,16 @@ GUARDRAIL 3: This template does NOT mimic ISA 265 structure.
   - Section III response blocks are BLANK — auditor owns classification.
 
 ZERO-STORAGE: Reads engagement metadata and follow-up item narratives only.
+
+Generation is split in two: ``AnomalySummaryGenerator.collect`` runs the
+queries and snapshots what the report needs into plain dataclasses, and
+``render_anomaly_summary_pdf`` lays out the PDF from that snapshot alone.
+The render half holds no session or ORM state, so the engagement package
+builder can run it in a worker process.
 """
 
+from dataclasses import dataclass
+from datetime import datetime
 from io import BytesIO
 from typing import Optional
 
@@ -40,11 +48,12 @@ from reportlab.platypus import (
 from sqlalchemy.orm import Session
 
 from engagement_model import Engagement, ToolName, ToolRun
-from follow_up_items_model import FollowUpItem
+from follow_up_items_model import FollowUpItem, FollowUpSeverity
 from models import Client
 from pdf_generator import ClassicalColors, LedgerRule, generate_reference_number
 from shared.framework_resolution import ResolvedFramework
 from shared.memo_base import RISK_TIER_DISPLAY, create_memo_styles
+from shared.pdf_branding import PDFBrandingContext
 from shared.report_chrome import (
     ReportMetadata,
     build_cover_page,
@@ -138,6 +147,86 @@ def _resolve_tool_name_from_source(tool_source: str) -> Optional[ToolName]:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Snapshots — the ORM-free inputs to the render phase
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class EngagementPeriodSnapshot:
+    period_start: Optional[datetime]
+    period_end: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class ToolRunSnapshot:
+    id: int
+    tool_name: Optional[ToolName]
+    run_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class FollowUpItemSnapshot:
+    description: str
+    severity: Optional[FollowUpSeverity]
+    tool_source: str
+
+
+@dataclass(frozen=True)
+class AnomalySummaryData:
+    """Everything ``render_anomaly_summary_pdf`` reads — picklable, no DB state."""
+
+    client_name: str
+    engagement: EngagementPeriodSnapshot
+    tool_runs: tuple[ToolRunSnapshot, ...]
+    follow_up_items: tuple[FollowUpItemSnapshot, ...]
+
+
+def render_anomaly_summary_pdf(
+    data: AnomalySummaryData,
+    branding: Optional[PDFBrandingContext] = None,
+    resolved_framework: ResolvedFramework = ResolvedFramework.FASB,
+) -> bytes:
+    """Render the anomaly summary PDF from a collected snapshot.
+
+    ``branding`` is passed explicitly (rather than read from the ContextVar)
+    so the call behaves the same inside a worker process.
+    """
+    branding = branding or PDFBrandingContext()
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        leftMargin=0.75 * inch,
+        rightMargin=0.75 * inch,
+        topMargin=0.75 * inch,
+        bottomMargin=0.75 * inch,
+    )
+    doc_width = letter[0] - 1.5 * inch
+
+    styles = create_memo_styles()
+    story = AnomalySummaryGenerator._build_story(
+        styles,
+        doc_width,
+        data.client_name,
+        data.engagement,
+        list(data.tool_runs),
+        list(data.follow_up_items),
+        resolved_framework=resolved_framework,
+        custom_logo_bytes=branding.effective_logo_bytes(),
+    )
+
+    footer_cb = make_branded_page_footer(
+        header_text=branding.effective_header_text(),
+        footer_text=branding.effective_footer_text(),
+    )
+    doc.build(story, onFirstPage=footer_cb, onLaterPages=footer_cb)
+    pdf_bytes = buffer.getvalue()
+    buffer.close()
+    return pdf_bytes
+
+
 # ---------------------------------------------------------------------------
 # Generator
 # ---------------------------------------------------------------------------
@@ -174,7 +263,14 @@ class AnomalySummaryGenerator:
         from shared.pdf_branding import current_pdf_branding
 
         branding = current_pdf_branding()
+        data = self.collect(user_id, engagement_id)
+        return render_anomaly_summary_pdf(data, branding, resolved_framework)
 
+    def collect(self, user_id: int, engagement_id: int) -> AnomalySummaryData:
+        """Run the report queries and snapshot the results for rendering.
+
+        Raises ValueError when the engagement is missing or not owned by ``user_id``.
+        """
         engagement = self._verify_engagement_access(user_id, engagement_id)
         if not engagement:
             raise ValueError("Engagement not found or access denied")
@@ -203,45 +299,21 @@ class AnomalySummaryGenerator:
             .all()
         )
 
-        # Build PDF
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            leftMargin=0.75 * inch,
-            rightMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
-        )
-        doc_width = letter[0] - 1.5 * inch
-
-        styles = create_memo_styles()
-        story = self._build_story(
-            styles,
-            doc_width,
-            client_name,
-            engagement,
-            tool_runs,
-            follow_up_items,
-            resolved_framework=resolved_framework,
-            custom_logo_bytes=branding.effective_logo_bytes(),
-        )
-
-        footer_cb = make_branded_page_footer(
-            header_text=branding.effective_header_text(),
-            footer_text=branding.effective_footer_text(),
+        return AnomalySummaryData(
+            client_name=client_name,
+            engagement=EngagementPeriodSnapshot(engagement.period_start, engagement.period_end),
+            tool_runs=tuple(ToolRunSnapshot(r.id, r.tool_name, r.run_at) for r in tool_runs),
+            follow_up_items=tuple(
+                FollowUpItemSnapshot(i.description, i.severity, i.tool_source) for i in follow_up_items
+            ),
         )
-        doc.build(story, onFirstPage=footer_cb, onLaterPages=footer_cb)
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
-        return pdf_bytes
 
+    @staticmethod
     def _build_story(
-        self,
         styles: dict,
         doc_width: float,
         client_name: str,
-        engagement: Engagement,
+        engagement: Engagement | EngagementPeriodSnapshot,
         tool_runs: list,
         follow_up_items: list,
         resolved_framework: ResolvedFramework = ResolvedFramework.FASB,
@@ -10,10 +10,10 @@ complete audit result dict consumed by the API layer.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from account_classifier import create_classifier
 from audit.classification import (
@@ -31,9 +31,13 @@ from security_utils import (
     log_secure_operation,
     process_tb_chunked,
     read_excel_multi_sheet_chunked,
+    read_tb_header,
 )
 from shared.monetary import BALANCE_TOLERANCE, quantize_monetary
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def audit_trial_balance_streaming(
     file_bytes: bytes,
@@ -43,8 +47,15 @@ def audit_trial_balance_streaming(
     progress_callback: Optional[Callable[[int, str], None]] = None,
     account_type_overrides: Optional[dict[str, str]] = None,
     column_mapping: Optional[dict[str, str]] = None,
+    chunks: Optional[Iterable[tuple[pd.DataFrame, int]]] = None,
 ) -> dict[str, Any]:
-    """Perform a complete streaming audit of a trial balance file."""
+    """Perform a complete streaming audit of a trial balance file.
+
+    ``chunks`` supplies already-read ``(chunk, rows_processed)`` pairs from
+    ``process_tb_chunked`` so a caller that needs the raw rows as well (the TB
+    analysis bundle) reads the upload only once; ``file_bytes`` is then unused.
+    Without it the upload is read with the auditor's column plan.
+    """
     log_secure_operation("streaming_audit_start", f"Starting streaming audit: {filename}")
 
     # Create classifier with any user overrides (Zero-Storage: session-only)
@@ -70,9 +81,18 @@ def audit_trial_balance_streaming(
 
     try:
         # ── Stage 1: Ingestion ───────────────────────────────────────
-        for chunk, rows_processed in process_tb_chunked(file_bytes, filename, chunk_size):
+        if chunks is None:
+            # Map columns from the header row so the read skips unused
+            # columns and parses debit/credit as numbers up front.
+            header = read_tb_header(file_bytes, filename)
+            column_plan = auditor.column_plan(header) if header else None
+            chunks = process_tb_chunked(file_bytes, filename, chunk_size, column_plan=column_plan)
+        rows_processed = 0
+        for chunk, rows_processed in chunks:
             auditor.process_chunk(chunk, rows_processed)
             del chunk
+        if progress_callback:
+            progress_callback(rows_processed, "Running anomaly detection")
 
         # ── Sprint 666 Issue 5 (BLOCKING): Block silent success ──
         # Fail the pipeline explicitly when ingestion produced no rows OR
@@ -176,6 +196,7 @@ def audit_trial_balance_streaming(
 
         # ── Stage 2: Classification + Balance Check ──────────────────
         result = auditor.get_balance_result()
+        auditor.prepare_account_table()
         account_classifications = auditor.get_classified_accounts()
 
         # ── Stage 3: Anomaly Detection ───────────────────────────────
@@ -537,6 +558,7 @@ def audit_trial_balance_multi_sheet(
                 del chunk
 
             sheet_balance = auditor.get_balance_result()
+            auditor.prepare_account_table()
             sheet_abnormals = auditor.get_abnormal_balances()
             sheet_suspense = auditor.detect_suspense_accounts()
             sheet_concentration = auditor.detect_concentration_risk()
@@ -2,7 +2,9 @@
 
 Each module contains one or more detection functions that take account-balance
 mappings and return lists of finding dicts.  The merger module combines
-findings from all detectors into a single de-duplicated list.
+findings from all detectors into a single de-duplicated list.  Detectors
+accept an optional ``AccountTable`` (see ``audit.rules.table``) so a caller
+running several of them classifies each account only once.
 """
 
 from audit.rules.balance import detect_abnormal_balances_streaming
@@ -20,6 +22,7 @@ from audit.rules.relationships import (
 )
 from audit.rules.rounding import detect_rounding_anomalies
 from audit.rules.suspense import detect_suspense_accounts
+from audit.rules.table import AccountRow, AccountTable, build_account_table
 
 __all__ = [
     "detect_abnormal_balances_streaming",
@@ -33,5 +36,8 @@ __all__ = [
     "detect_expense_concentration",
     "detect_account_number_gaps",
     "AccountGap",
+    "AccountRow",
+    "AccountTable",
+    "build_account_table",
     "_merge_anomalies",
 ]
@@ -2,18 +2,15 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import Any
 
 from account_classifier import AccountClassifier
 from audit.classification import (
     CONFIDENCE_HIGH,
     CONFIDENCE_MEDIUM,
-    build_display_name,
     is_balance_abnormal,
-    resolve_category,
-    resolve_csv_type,
 )
+from audit.rules.table import AccountTable, build_account_table
 from classification_rules import (
     CATEGORY_DISPLAY_NAMES,
     NORMAL_BALANCE_MAP,
@@ -21,7 +18,6 @@ from classification_rules import (
     NormalBalance,
 )
 from security_utils import log_secure_operation
-from shared.monetary import BALANCE_TOLERANCE
 
 
 def detect_abnormal_balances_streaming(
@@ -30,10 +26,12 @@ def detect_abnormal_balances_streaming(
     classifier: AccountClassifier,
     provided_account_types: dict[str, str],
     provided_account_names: dict[str, str],
+    table: AccountTable | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, int]]:
     """Detect accounts with abnormal balance directions using the heuristic classifier.
 
-    Returns (abnormal_balances_list, classification_stats_dict).
+    Returns (abnormal_balances_list, classification_stats_dict). Pass a
+    prebuilt ``table`` to reuse classifications across rules.
     """
     log_secure_operation(
         "streaming_abnormal",
@@ -44,30 +42,22 @@ def detect_abnormal_balances_streaming(
     abnormal_balances: list[dict[str, Any]] = []
     classification_stats = {"high": 0, "medium": 0, "low": 0, "unknown": 0}
 
-    for account_key, balances in account_balances.items():
-        debit_amount = balances["debit"]
-        credit_amount = balances["credit"]
-        net_balance = debit_amount - credit_amount
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
 
-        if abs(Decimal(str(net_balance))) < BALANCE_TOLERANCE:
+    for row in table.rows:
+        if row.is_zero:
             continue
-
-        category = resolve_category(
-            account_key,
-            net_balance,
-            provided_account_types,
-            provided_account_names,
-            classifier,
-        )
-        display = build_display_name(account_key, provided_account_names)
-
-        result = classifier.classify(display, net_balance)
-
-        csv_raw = provided_account_types.get(account_key, "")
-        csv_cat, csv_conf = resolve_csv_type(csv_raw)
-        has_csv_type = csv_cat is not None
-        effective_category = category
-        confidence = csv_conf if has_csv_type else result.confidence
+        debit_amount = row.balances["debit"]
+        credit_amount = row.balances["credit"]
+        net_balance = row.net
+        display = row.display
+        result = row.classification
+        assert result is not None  # classified whenever the balance is non-zero
+
+        has_csv_type = row.csv_confidence is not None
+        effective_category = row.category
+        confidence = row.csv_confidence if row.csv_confidence is not None else result.confidence
 
         if effective_category == AccountCategory.UNKNOWN:
             classification_stats["unknown"] += 1
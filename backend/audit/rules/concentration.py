@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Any
 
 from account_classifier import AccountClassifier
-from audit.classification import build_display_name, resolve_category
+from audit.rules.table import AccountTable, build_account_table
 from classification_rules import (
     CATEGORY_DISPLAY_NAMES,
     CONCENTRATION_CATEGORIES,
@@ -18,7 +18,6 @@ from classification_rules import (
     AccountCategory,
 )
 from security_utils import log_secure_operation
-from shared.monetary import BALANCE_TOLERANCE
 
 
 def detect_concentration_risk(
@@ -27,6 +26,7 @@ def detect_concentration_risk(
     classifier: AccountClassifier,
     provided_account_types: dict[str, str],
     provided_account_names: dict[str, str],
+    table: AccountTable | None = None,
 ) -> list[dict[str, Any]]:
     """Detect accounts with unusually high concentration within their category."""
     log_secure_operation(
@@ -35,41 +35,21 @@ def detect_concentration_risk(
 
     concentration_risks: list[dict[str, Any]] = []
 
-    category_accounts: dict[AccountCategory, list[tuple[str, float, float, float]]] = {
-        cat: [] for cat in CONCENTRATION_CATEGORIES
-    }
-    category_totals_dec: dict[AccountCategory, Decimal] = {cat: Decimal("0") for cat in CONCENTRATION_CATEGORIES}
-
-    for account_key, balances in account_balances.items():
-        debit_amount = balances["debit"]
-        credit_amount = balances["credit"]
-        net_balance = debit_amount - credit_amount
-
-        if abs(Decimal(str(net_balance))) < BALANCE_TOLERANCE:
-            continue
-
-        category = resolve_category(
-            account_key,
-            net_balance,
-            provided_account_types,
-            provided_account_names,
-            classifier,
-        )
-        display = build_display_name(account_key, provided_account_names)
-
-        if category in CONCENTRATION_CATEGORIES:
-            abs_balance = abs(net_balance)
-            category_accounts[category].append((display, abs_balance, debit_amount, credit_amount))
-            category_totals_dec[category] += Decimal(str(abs_balance))
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
 
     for category in CONCENTRATION_CATEGORIES:
-        total_dec = category_totals_dec[category]
+        total_dec = table.nonzero_category_totals.get(category, Decimal("0"))
 
         if float(total_dec) < CONCENTRATION_MIN_CATEGORY_TOTAL:
             continue
 
-        for display, abs_balance, debit_amount, credit_amount in category_accounts[category]:
-            concentration_pct = float(Decimal(str(abs_balance)) / total_dec)
+        for row in table.in_category(category):
+            if row.is_zero:
+                continue
+            display, abs_balance = row.display, row.abs_net
+            debit_amount, credit_amount = row.balances["debit"], row.balances["credit"]
+            concentration_pct = float(row.abs_net_dec / total_dec)
 
             severity = None
             if concentration_pct >= CONCENTRATION_THRESHOLD_HIGH:
@@ -139,32 +119,20 @@ def detect_revenue_concentration(
     classifier: AccountClassifier,
     provided_account_types: dict[str, str],
     provided_account_names: dict[str, str],
+    table: AccountTable | None = None,
 ) -> list[dict[str, Any]]:
     """Revenue concentration analysis."""
     findings: list[dict[str, Any]] = []
-    revenue_accounts: list[tuple[str, str, float, dict]] = []
-    total_revenue = Decimal("0")
-
-    for account_key, balances in account_balances.items():
-        net_balance = balances["debit"] - balances["credit"]
-        category = resolve_category(
-            account_key,
-            net_balance,
-            provided_account_types,
-            provided_account_names,
-            classifier,
-        )
-        if category == AccountCategory.REVENUE:
-            abs_bal = abs(net_balance)
-            display = build_display_name(account_key, provided_account_names)
-            revenue_accounts.append((account_key, display, abs_bal, balances))
-            total_revenue += Decimal(str(abs_bal))
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
+    total_revenue = table.category_totals.get(AccountCategory.REVENUE, Decimal("0"))
 
     if float(total_revenue) < CONCENTRATION_MIN_CATEGORY_TOTAL:
         return findings
 
-    for key, display, abs_bal, bals in revenue_accounts:
-        pct = float(Decimal(str(abs_bal)) / total_revenue)
+    for row in table.in_category(AccountCategory.REVENUE):
+        display, abs_bal, bals = row.display, row.abs_net, row.balances
+        pct = float(row.abs_net_dec / total_revenue)
         if pct >= REVENUE_CONCENTRATION_THRESHOLD:
             is_material = abs_bal >= materiality_threshold
             findings.append(
@@ -202,32 +170,20 @@ def detect_expense_concentration(
     classifier: AccountClassifier,
     provided_account_types: dict[str, str],
     provided_account_names: dict[str, str],
+    table: AccountTable | None = None,
 ) -> list[dict[str, Any]]:
     """Expense concentration analysis."""
     findings: list[dict[str, Any]] = []
-    expense_accounts: list[tuple[str, str, float, dict]] = []
-    total_expense = Decimal("0")
-
-    for account_key, balances in account_balances.items():
-        net_balance = balances["debit"] - balances["credit"]
-        category = resolve_category(
-            account_key,
-            net_balance,
-            provided_account_types,
-            provided_account_names,
-            classifier,
-        )
-        if category == AccountCategory.EXPENSE:
-            abs_bal = abs(net_balance)
-            display = build_display_name(account_key, provided_account_names)
-            expense_accounts.append((account_key, display, abs_bal, balances))
-            total_expense += Decimal(str(abs_bal))
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
+    total_expense = table.category_totals.get(AccountCategory.EXPENSE, Decimal("0"))
 
     if float(total_expense) < CONCENTRATION_MIN_CATEGORY_TOTAL:
         return findings
 
-    for key, display, abs_bal, bals in expense_accounts:
-        pct = float(Decimal(str(abs_bal)) / total_expense)
+    for row in table.in_category(AccountCategory.EXPENSE):
+        display, abs_bal, bals = row.display, row.abs_net, row.balances
+        pct = float(row.abs_net_dec / total_expense)
         if pct >= EXPENSE_CONCENTRATION_THRESHOLD:
             is_material = abs_bal >= materiality_threshold
             findings.append(
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Any
 
 from account_classifier import AccountClassifier
-from audit.classification import build_display_name, resolve_category
+from audit.rules.table import AccountTable, build_account_table
 from classification_rules import (
     EQUITY_DIVIDEND_KEYWORDS,
     EQUITY_RETAINED_EARNINGS_KEYWORDS,
@@ -21,23 +21,13 @@ def detect_equity_signals(
     classifier: AccountClassifier,
     provided_account_types: dict[str, str],
     provided_account_names: dict[str, str],
+    table: AccountTable | None = None,
 ) -> list[dict[str, Any]]:
     """Detect abnormal equity patterns (deficit + dividends)."""
     findings: list[dict[str, Any]] = []
-    equity_accounts: dict[str, tuple[str, float, dict]] = {}
-
-    for account_key, balances in account_balances.items():
-        net_balance = balances["debit"] - balances["credit"]
-        category = resolve_category(
-            account_key,
-            net_balance,
-            provided_account_types,
-            provided_account_names,
-            classifier,
-        )
-        if category == AccountCategory.EQUITY:
-            display = build_display_name(account_key, provided_account_names)
-            equity_accounts[account_key] = (display, net_balance, balances)
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
+    equity_accounts = table.in_category(AccountCategory.EQUITY)
 
     if not equity_accounts:
         return findings
@@ -47,8 +37,8 @@ def detect_equity_signals(
     treasury_stock = None
     total_equity = Decimal("0")
 
-    for key, (display, net, bals) in equity_accounts.items():
-        lower = display.lower()
+    for row in equity_accounts:
+        key, display, net, bals, lower = row.key, row.display, row.net, row.balances, row.display_lower
         total_equity += Decimal(str(net))
         if any(kw in lower for kw, _w, _p in EQUITY_RETAINED_EARNINGS_KEYWORDS):
             retained_earnings_deficit = (key, display, net, bals)
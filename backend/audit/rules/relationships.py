@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Any
 
 from account_classifier import AccountClassifier
-from audit.classification import build_display_name, resolve_category
+from audit.rules.table import AccountTable, build_account_table
 from classification_rules import (
     CATEGORY_DISPLAY_NAMES,
     INTERCOMPANY_KEYWORDS,
@@ -22,16 +22,18 @@ def detect_related_party_accounts(
     classifier: AccountClassifier,
     provided_account_types: dict[str, str],
     provided_account_names: dict[str, str],
+    table: AccountTable | None = None,
 ) -> list[dict[str, Any]]:
     """Detect accounts indicating related party activity."""
     findings: list[dict[str, Any]] = []
-    for account_key, balances in account_balances.items():
-        net_balance = balances["debit"] - balances["credit"]
-        if abs(Decimal(str(net_balance))) < BALANCE_TOLERANCE:
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
+    for row in table.rows:
+        if row.is_zero:
             continue
-
-        display = build_display_name(account_key, provided_account_names)
-        search_text = display.lower()
+        balances, net_balance = row.balances, row.net
+        display = row.display
+        search_text = row.display_lower
 
         if any(excl in search_text for excl in RELATED_PARTY_EXCLUSION_KEYWORDS):
             continue
@@ -46,14 +48,8 @@ def detect_related_party_accounts(
         if not matched:
             continue
 
-        abs_amount = abs(net_balance)
-        category = resolve_category(
-            account_key,
-            net_balance,
-            provided_account_types,
-            provided_account_names,
-            classifier,
-        )
+        abs_amount = row.abs_net
+        category = row.category
         is_material = abs_amount >= materiality_threshold
 
         findings.append(
@@ -86,6 +82,7 @@ def detect_intercompany_imbalances(
     provided_account_names: dict[str, str],
     counterparty_mapping: dict[str, str] | None = None,
     mapping_source: str = "none",
+    table: AccountTable | None = None,
 ) -> list[dict[str, Any]]:
     """Detect intercompany accounts with elimination gaps.
 
@@ -128,20 +125,20 @@ def detect_intercompany_imbalances(
                 return mapping[key]
         return None
 
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
+    categories = {row.key: row.category for row in table.rows}
+
     ic_accounts: list[tuple[str, str, float, dict, str | None]] = []
-    for account_key, balances in account_balances.items():
-        net_balance = balances["debit"] - balances["credit"]
-        if abs(Decimal(str(net_balance))) < BALANCE_TOLERANCE:
+    for row in table.rows:
+        if row.is_zero:
             continue
 
-        display = build_display_name(account_key, provided_account_names)
-        search_text = display.lower()
-
         # Metadata-flagged accounts always count as IC even if they don't
         # contain a keyword (auditor judgment overrides the heuristic).
-        metadata_cp = _metadata_lookup(account_key, display)
-        if metadata_cp or any(kw in search_text for kw, _w, _p in INTERCOMPANY_KEYWORDS):
-            ic_accounts.append((account_key, display, net_balance, balances, metadata_cp))
+        metadata_cp = _metadata_lookup(row.key, row.display)
+        if metadata_cp or any(kw in row.display_lower for kw, _w, _p in INTERCOMPANY_KEYWORDS):
+            ic_accounts.append((row.key, row.display, row.net, row.balances, metadata_cp))
 
     if not ic_accounts:
         return []
@@ -195,13 +192,7 @@ def detect_intercompany_imbalances(
             if abs(net) < 0.01:
                 continue
             abs_amount = abs(net)
-            category = resolve_category(
-                key,
-                net,
-                provided_account_types,
-                provided_account_names,
-                classifier,
-            )
+            category = categories[key]
             is_material = abs_amount >= materiality_threshold
 
             # Confidence reflects detection quality: metadata is auditor-
@@ -7,7 +7,7 @@ from decimal import Decimal
 from typing import Any
 
 from account_classifier import AccountClassifier
-from audit.classification import build_display_name, resolve_category
+from audit.rules.table import AccountTable, build_account_table
 from classification_rules import (
     CATEGORY_DISPLAY_NAMES,
     ROUNDING_MAX_ANOMALIES,
@@ -26,6 +26,7 @@ def detect_rounding_anomalies(
     provided_account_types: dict[str, str],
     provided_account_names: dict[str, str],
     provided_account_subtypes: dict[str, str],
+    table: AccountTable | None = None,
 ) -> list[dict[str, Any]]:
     """Detect suspicious round numbers that may indicate estimation or manipulation.
 
@@ -36,32 +37,27 @@ def detect_rounding_anomalies(
     log_secure_operation("DEPLOY-VERIFY-536", "tiered round-number detection active")
     log_secure_operation("DEPLOY-VERIFY-537", "informational severity tier active")
 
-    tb_total = sum(abs(b["debit"] - b["credit"]) for b in account_balances.values())
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
+    tb_total = sum(row.abs_net for row in table.rows)
 
     subtype_source = provided_account_subtypes or provided_account_types
 
     candidates: list[tuple[dict[str, Any], str, float, str, str]] = []
 
-    for account_key, balances in account_balances.items():
-        debit_amount = balances["debit"]
-        credit_amount = balances["credit"]
-        net_balance = debit_amount - credit_amount
-        abs_balance = abs(net_balance)
+    for row in table.rows:
+        debit_amount = row.balances["debit"]
+        credit_amount = row.balances["credit"]
+        abs_balance = row.abs_net
 
         if abs_balance < ROUNDING_MIN_AMOUNT:
             continue
 
-        display = build_display_name(account_key, provided_account_names)
-        category = resolve_category(
-            account_key,
-            net_balance,
-            provided_account_types,
-            provided_account_names,
-            classifier,
-        )
-        subtype_raw = subtype_source.get(account_key, "")
+        display = row.display
+        category = row.category
+        subtype_raw = subtype_source.get(row.key, "")
 
-        abs_balance_dec = Decimal(str(abs_balance))
+        abs_balance_dec = row.abs_net_dec
         matched_pattern = None
         for divisor, pattern_name, pattern_severity in ROUNDING_PATTERNS:
             divisor_dec = Decimal(str(divisor))
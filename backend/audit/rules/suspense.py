@@ -3,18 +3,16 @@
 from __future__ import annotations
 
 import re
-from decimal import Decimal
 from typing import Any
 
 from account_classifier import AccountClassifier
-from audit.classification import build_display_name, resolve_category
+from audit.rules.table import AccountTable, build_account_table
 from classification_rules import (
     CATEGORY_DISPLAY_NAMES,
     SUSPENSE_CONFIDENCE_THRESHOLD,
     SUSPENSE_KEYWORDS,
 )
 from security_utils import log_secure_operation
-from shared.monetary import BALANCE_TOLERANCE
 
 # Sprint 670 Issue 10: Structural patterns that indicate an unusual or
 # placeholder account regardless of vocabulary. These augment the literal
@@ -89,22 +87,23 @@ def detect_suspense_accounts(
     classifier: AccountClassifier,
     provided_account_types: dict[str, str],
     provided_account_names: dict[str, str],
+    table: AccountTable | None = None,
 ) -> list[dict[str, Any]]:
     """Detect suspense and clearing accounts with outstanding balances."""
     log_secure_operation("suspense_detection", f"Scanning {len(account_balances)} accounts for suspense indicators")
 
     suspense_accounts: list[dict[str, Any]] = []
+    if table is None:
+        table = build_account_table(account_balances, classifier, provided_account_types, provided_account_names)
 
-    for account_key, balances in account_balances.items():
-        debit_amount = balances["debit"]
-        credit_amount = balances["credit"]
-        net_balance = debit_amount - credit_amount
-
-        if abs(Decimal(str(net_balance))) < BALANCE_TOLERANCE:
+    for row in table.rows:
+        if row.is_zero:
             continue
-
-        display = build_display_name(account_key, provided_account_names)
-        account_lower = display.lower()
+        debit_amount = row.balances["debit"]
+        credit_amount = row.balances["credit"]
+        net_balance = row.net
+        display = row.display
+        account_lower = row.display_lower
         matched_keywords: list[str] = []
         total_weight = 0.0
 
@@ -126,14 +125,7 @@ def detect_suspense_accounts(
             abs_amount = abs(net_balance)
             is_material = abs_amount >= materiality_threshold
             materiality_status = "material" if is_material else "immaterial"
-
-            category = resolve_category(
-                account_key,
-                net_balance,
-                provided_account_types,
-                provided_account_names,
-                classifier,
-            )
+            category = row.category
 
             suspense_accounts.append(
                 {
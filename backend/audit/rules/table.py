@@ -0,0 +1,126 @@
+"""Per-account table shared by every anomaly rule.
+
+Each detector needs the same facts about every account: net balance, display
+name and category. Resolving a category means running the heuristic
+classifier, which is the expensive part of a rule. When each detector did it
+for itself, a TB was walked and re-classified once per rule.
+``build_account_table`` computes these facts once, together with per-category
+totals and index lists. The detectors then read the table, so a full rule run
+costs one classification pass plus each rule's own predicate work.
+
+Amounts stay in whatever type ``account_balances`` holds (Decimal after
+``StreamingAuditor._finalize_balances``), so every rule's arithmetic is
+unchanged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Optional
+
+from account_classifier import AccountClassifier, ClassificationResult
+from audit.classification import build_display_name, resolve_csv_type
+from classification_rules import AccountCategory
+from shared.monetary import BALANCE_TOLERANCE
+
+
+@dataclass(slots=True)
+class AccountRow:
+    """One account's precomputed facts."""
+
+    key: str
+    display: str
+    display_lower: str
+    balances: dict[str, Any]
+    net: Any
+    abs_net: Any
+    abs_net_dec: Decimal
+    # Below BALANCE_TOLERANCE — skipped by the rules that ignore cleared accounts.
+    is_zero: bool
+    category: AccountCategory
+    # Set when the CSV supplied a recognised account type.
+    csv_confidence: Optional[float]
+    # Heuristic classifier result for the display name; None only for zero
+    # balance accounts whose category came from the CSV.
+    classification: Optional[ClassificationResult]
+
+
+@dataclass
+class AccountTable:
+    """Every account's row plus per-category groupings and totals."""
+
+    rows: list[AccountRow]
+    by_category: dict[AccountCategory, list[AccountRow]] = field(default_factory=dict)
+    # Sum of |net| per category over all accounts, and over non-zero accounts only.
+    category_totals: dict[AccountCategory, Decimal] = field(default_factory=dict)
+    nonzero_category_totals: dict[AccountCategory, Decimal] = field(default_factory=dict)
+
+    def in_category(self, category: AccountCategory) -> list[AccountRow]:
+        return self.by_category.get(category, [])
+
+    @property
+    def nonzero(self) -> list[AccountRow]:
+        return [row for row in self.rows if not row.is_zero]
+
+
+def build_account_table(
+    account_balances: dict[str, dict[str, Any]],
+    classifier: AccountClassifier,
+    provided_account_types: dict[str, str],
+    provided_account_names: dict[str, str],
+) -> AccountTable:
+    """Classify every account once and group the results by category.
+
+    The CSV account type wins over the heuristic, as in ``resolve_category``.
+    The classifier still runs for non-zero CSV-typed accounts, as the
+    abnormal-balance rule always did, so the per-client classification cache
+    learns the same names it did before.
+    """
+    rows: list[AccountRow] = []
+    by_category: dict[AccountCategory, list[AccountRow]] = {}
+    category_totals: dict[AccountCategory, Decimal] = {}
+    nonzero_totals: dict[AccountCategory, Decimal] = {}
+
+    for account_key, balances in account_balances.items():
+        net = balances["debit"] - balances["credit"]
+        abs_net = abs(net)
+        abs_net_dec = Decimal(str(abs_net))
+        is_zero = abs_net_dec < BALANCE_TOLERANCE
+        display = build_display_name(account_key, provided_account_names)
+
+        csv_category, csv_confidence = resolve_csv_type(provided_account_types.get(account_key, ""))
+        classification = None
+        if csv_category is None or not is_zero:
+            classification = classifier.classify(display, net)
+        if csv_category is not None:
+            category = csv_category
+        else:
+            assert classification is not None  # classified whenever the CSV gives no type
+            category = classification.category
+
+        row = AccountRow(
+            key=account_key,
+            display=display,
+            display_lower=display.lower(),
+            balances=balances,
+            net=net,
+            abs_net=abs_net,
+            abs_net_dec=abs_net_dec,
+            is_zero=is_zero,
+            category=category,
+            csv_confidence=csv_confidence if csv_category is not None else None,
+            classification=classification,
+        )
+        rows.append(row)
+        by_category.setdefault(category, []).append(row)
+        category_totals[category] = category_totals.get(category, Decimal("0")) + abs_net_dec
+        if not is_zero:
+            nonzero_totals[category] = nonzero_totals.get(category, Decimal("0")) + abs_net_dec
+
+    return AccountTable(
+        rows=rows,
+        by_category=by_category,
+        category_totals=category_totals,
+        nonzero_category_totals=nonzero_totals,
+    )
@@ -52,16 +52,26 @@ from audit.classification import (
     resolve_csv_type,
     validate_balance_sheet_equation,
 )
+from audit.rules.table import AccountTable, build_account_table
 from classification_rules import (
     ROUND_NUMBER_TIER1_SUPPRESS,
     AccountCategory,
 )
 from column_detector import ColumnDetectionResult, ColumnMapping, detect_columns
 from ratio_engine import CategoryTotals, extract_category_totals
-from security_utils import DEFAULT_CHUNK_SIZE, log_secure_operation
+from security_utils import DEFAULT_CHUNK_SIZE, TBColumnPlan, log_secure_operation, parse_amount_column
 from shared.monetary import BALANCE_TOLERANCE, quantize_monetary
 
 
+def _text_values(values: pd.Series) -> pd.Series:
+    """Stripped text of a supplementary column, blank cells as "".
+
+    ``astype(str)`` leaves missing cells as NaN for pandas string columns,
+    so they are filled first.
+    """
+    return values.fillna("").astype(str).str.strip()
+
+
 class StreamingAuditor:
     """Memory-efficient streaming auditor that processes trial balances in chunks."""
 
@@ -97,6 +107,8 @@ class StreamingAuditor:
 
         # Per-account aggregation for abnormal balance detection
         self.account_balances: dict[str, dict[str, Decimal]] = {}
+        # Classified per-account table shared by the detectors (see prepare_account_table)
+        self._account_table: Optional[AccountTable] = None
 
         # Column mapping (discovered from first chunk or user-provided)
         self.debit_col: Optional[str] = None
@@ -212,6 +224,39 @@ class StreamingAuditor:
 
         return self.debit_col is not None and self.credit_col is not None
 
+    def _resolve_subtype_column(self, columns: list[str]) -> None:
+        """Sprint 535: find the optional subtype column once per upload."""
+        if hasattr(self, "_subtype_col_resolved"):
+            return
+        self._subtype_col_resolved = True
+        self._subtype_col: str | None = None
+        columns_lower = {str(c).lower().strip(): c for c in columns}
+        for candidate in ("subtype", "sub_type", "account_subtype", "account sub type"):
+            if candidate in columns_lower:
+                self._subtype_col = columns_lower[candidate]
+                break
+
+    def column_plan(self, header: list[str]) -> Optional[TBColumnPlan]:
+        """Discover columns from the header row alone and plan a pruned read.
+
+        The account, type, name and subtype columns are read as text and the
+        debit/credit columns as amounts; nothing else is read. Returns None
+        when debit/credit cannot be found, leaving discovery to the first
+        chunk so the failure is reported exactly as before.
+        """
+        frame = pd.DataFrame(columns=header)
+        if not self._discover_columns(frame):
+            self.columns_discovered = False
+            return None
+        names = list(frame.columns)
+        self._resolve_subtype_column(names)
+
+        text_names = [self.account_col, self.account_type_col, self.account_name_col, self._subtype_col]
+        text_columns = tuple(dict.fromkeys(names.index(c) for c in text_names if c))
+        amount_positions = (names.index(self.debit_col), names.index(self.credit_col))
+        amount_columns = tuple(dict.fromkeys(i for i in amount_positions if i not in text_columns))
+        return TBColumnPlan(header=tuple(header), text_columns=text_columns, amount_columns=amount_columns)
+
     def get_column_detection(self) -> Optional[ColumnDetectionResult]:
         """Get the column detection result after processing."""
         return self.column_detection
@@ -219,13 +264,14 @@ class StreamingAuditor:
     def process_chunk(self, chunk: pd.DataFrame, rows_so_far: int) -> None:
         """Process a single chunk, updating running totals and account aggregations."""
         chunk.columns = chunk.columns.str.strip()
+        self._account_table = None
 
         if not self._discover_columns(chunk):
             log_secure_operation("streaming_error", "Required columns not found")
             return
 
-        debits = pd.to_numeric(chunk[self.debit_col], errors="coerce").fillna(0)
-        credits = pd.to_numeric(chunk[self.credit_col], errors="coerce").fillna(0)
+        debits = parse_amount_column(chunk[self.debit_col]).fillna(0)
+        credits = parse_amount_column(chunk[self.credit_col]).fillna(0)
 
         # Sprint 666 Issue 2: Exclude totals rows from aggregation.
         # Heuristic: blank account name + both debit AND credit non-zero.
@@ -239,8 +285,11 @@ class StreamingAuditor:
         blank_mask = None
         totals_mask = None
         if self.account_col:
+            # Normalized once per chunk; the groupby and the type / name /
+            # subtype extraction below all reuse it.
             acct_series = chunk[self.account_col].astype(str).str.strip()
-            blank_mask = acct_series.isin(["", "nan", "none", "None", "NaN"])
+            # String columns keep missing cells as NaN through astype(str).
+            blank_mask = acct_series.isna() | acct_series.isin(["", "nan", "none", "None", "NaN"])
             totals_mask = blank_mask & (debits != 0) & (credits != 0)
             if bool(totals_mask.any()):
                 excluded = int(totals_mask.sum())
@@ -289,8 +338,8 @@ class StreamingAuditor:
             # Sprint 526: Extract account_type values
             if self.account_type_col and self.account_type_col in chunk.columns:
                 for acct_key, acct_type in zip(
-                    chunk[self.account_col].astype(str).str.strip(),
-                    chunk[self.account_type_col].astype(str).str.strip(),
+                    acct_series,
+                    _text_values(chunk[self.account_type_col]),
                 ):
                     if acct_key and acct_type and acct_type.lower() not in ("", "nan", "none"):
                         self.provided_account_types[acct_key] = acct_type
@@ -298,25 +347,18 @@ class StreamingAuditor:
             # Sprint 526: Extract account_name values
             if self.account_name_col and self.account_name_col in chunk.columns:
                 for acct_key, acct_name in zip(
-                    chunk[self.account_col].astype(str).str.strip(),
-                    chunk[self.account_name_col].astype(str).str.strip(),
+                    acct_series,
+                    _text_values(chunk[self.account_name_col]),
                 ):
                     if acct_key and acct_name and acct_name.lower() not in ("", "nan", "none"):
                         self.provided_account_names[acct_key] = acct_name
 
             # Sprint 535: Extract subtype values
-            if not hasattr(self, "_subtype_col_resolved"):
-                self._subtype_col_resolved = True
-                self._subtype_col: str | None = None
-                chunk_lower = {c.lower().strip(): c for c in chunk.columns}
-                for candidate in ("subtype", "sub_type", "account_subtype", "account sub type"):
-                    if candidate in chunk_lower:
-                        self._subtype_col = chunk_lower[candidate]
-                        break
+            self._resolve_subtype_column(list(chunk.columns))
             if self._subtype_col and self._subtype_col in chunk.columns:
                 for acct_key, acct_sub in zip(
-                    chunk[self.account_col].astype(str).str.strip(),
-                    chunk[self._subtype_col].astype(str).str.strip(),
+                    acct_series,
+                    _text_values(chunk[self._subtype_col]),
                 ):
                     if acct_key and acct_sub and acct_sub.lower() not in ("", "nan", "none"):
                         self.provided_account_subtypes[acct_key] = acct_sub
@@ -360,6 +402,22 @@ class StreamingAuditor:
             "message": "Trial balance is balanced" if is_balanced else "Trial balance is OUT OF BALANCE",
         }
 
+    def prepare_account_table(self) -> AccountTable:
+        """Classify every account once for the detectors that follow.
+
+        Call after the last chunk; until the next ``process_chunk`` or
+        ``clear`` every detector and ``get_classified_accounts`` read this
+        table instead of re-classifying each account themselves.
+        """
+        self._finalize_balances()
+        self._account_table = build_account_table(
+            self.account_balances,
+            self.classifier,
+            self.provided_account_types,
+            self.provided_account_names,
+        )
+        return self._account_table
+
     # ── Anomaly detection: delegate to pure functions in anomaly_rules ──
 
     def get_abnormal_balances(self) -> list[dict[str, Any]]:
@@ -370,6 +428,7 @@ class StreamingAuditor:
             self.classifier,
             self.provided_account_types,
             self.provided_account_names,
+            table=self._account_table,
         )
         self._classification_stats = classification_stats
         return abnormal_balances
@@ -386,6 +445,7 @@ class StreamingAuditor:
             self.classifier,
             self.provided_account_types,
             self.provided_account_names,
+            table=self._account_table,
         )
 
     def detect_concentration_risk(self) -> list[dict[str, Any]]:
@@ -396,6 +456,7 @@ class StreamingAuditor:
             self.classifier,
             self.provided_account_types,
             self.provided_account_names,
+            table=self._account_table,
         )
 
     def detect_rounding_anomalies(self) -> list[dict[str, Any]]:
@@ -407,6 +468,7 @@ class StreamingAuditor:
             self.provided_account_types,
             self.provided_account_names,
             self.provided_account_subtypes,
+            table=self._account_table,
         )
 
     def detect_related_party_accounts(self) -> list[dict[str, Any]]:
@@ -417,6 +479,7 @@ class StreamingAuditor:
             self.classifier,
             self.provided_account_types,
             self.provided_account_names,
+            table=self._account_table,
         )
 
     def detect_intercompany_imbalances(
@@ -439,6 +502,7 @@ class StreamingAuditor:
             self.provided_account_names,
             counterparty_mapping=counterparty_mapping,
             mapping_source=mapping_source,
+            table=self._account_table,
         )
 
     def detect_equity_signals(self) -> list[dict[str, Any]]:
@@ -449,6 +513,7 @@ class StreamingAuditor:
             self.classifier,
             self.provided_account_types,
             self.provided_account_names,
+            table=self._account_table,
         )
 
     def detect_revenue_concentration(self) -> list[dict[str, Any]]:
@@ -459,6 +524,7 @@ class StreamingAuditor:
             self.classifier,
             self.provided_account_types,
             self.provided_account_names,
+            table=self._account_table,
         )
 
     def detect_expense_concentration(self) -> list[dict[str, Any]]:
@@ -469,6 +535,7 @@ class StreamingAuditor:
             self.classifier,
             self.provided_account_types,
             self.provided_account_names,
+            table=self._account_table,
         )
 
     # ── Classification helpers (delegate to audit.classification) ─────
@@ -499,6 +566,8 @@ class StreamingAuditor:
 
     def get_classified_accounts(self) -> dict[str, str]:
         """Get classification for all accounts. Call after process_chunk."""
+        if self._account_table is not None:
+            return {row.key: row.category.value for row in self._account_table.rows}
         classified = {}
         for account_name in self.account_balances.keys():
             balances = self.account_balances[account_name]
@@ -547,6 +616,7 @@ class StreamingAuditor:
     def clear(self) -> None:
         """Clear all accumulated data and force garbage collection."""
         self.account_balances.clear()
+        self._account_table = None
         self.provided_account_subtypes.clear()
         self._debit_chunks.clear()
         self._credit_chunks.clear()
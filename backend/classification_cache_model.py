@@ -0,0 +1,58 @@
+"""
+Per-client account classification cache.
+
+Stores the outcome of the weighted-heuristic classifier and the lead-sheet
+keyword rules for account names a client has already submitted, so the next
+upload only classifies names it has not seen.
+
+ZERO-STORAGE COMPLIANCE:
+  - ``account_key`` is a SHA-256 digest of the normalized account name; the
+    name itself is never stored.
+  - No balances, amounts, or row data — category / lead sheet / confidence only.
+
+Rows are scoped by ``rule_version`` (hash of the classification and lead-sheet
+rule tables, see ``shared.classification_cache.classifier_rule_version``);
+changing any rule makes every existing row unreachable and the retention
+purge removes them.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class ClientClassificationCache(Base):
+    """Cached classification for one (client, rule version, account name) triple."""
+
+    __tablename__ = "client_classification_cache"
+    __table_args__ = (
+        UniqueConstraint("client_id", "rule_version", "account_key", name="uq_client_classification_cache_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    client_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    rule_version: Mapped[str] = mapped_column(String(16), nullable=False)
+    account_key: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # Heuristic classifier outcome (NULL when only the lead sheet is cached)
+    category: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
+    matched_keywords: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+    # Lead-sheet keyword match (NULL when no keyword rule matched — the
+    # category fallback is recomputed on read)
+    lead_sheet: Mapped[str | None] = mapped_column(String(2), nullable=True)
+    lead_sheet_confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
+    lead_sheet_keywords: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<ClientClassificationCache(client_id={self.client_id}, key={self.account_key[:12]}...)>"
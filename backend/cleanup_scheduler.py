@@ -29,6 +29,7 @@ from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import Any
 
 from config import (
@@ -93,6 +94,9 @@ class CleanupTelemetry:
     error_cause_fqn: str | None = field(default=None)
     error_orig_fqn: str | None = field(default=None)
     error_orig_pgcode: str | None = field(default=None)
+    # Committed batches for jobs that archive in keyset batches
+    # (retention_cleanup); 0 for single-statement jobs.
+    batches: int = field(default=0)
 
     def to_log_dict(self) -> dict:
         """Return a dict suitable for structured logging."""
@@ -103,6 +107,8 @@ class CleanupTelemetry:
             "duration_ms": round(self.duration_ms, 2),
             "records_processed": self.records_processed,
         }
+        if self.batches > 0:
+            d["batches"] = self.batches
         if self.error is not None:
             d["error"] = self.error
         if self.error_type_fqn is not None:
@@ -116,6 +122,34 @@ class CleanupTelemetry:
         return d
 
 
+class BatchTelemetryRecorder:
+    """Per-batch callback for batched cleanup jobs.
+
+    Logs one structured ``cleanup_batch`` event per committed batch and
+    counts them for the job's ``CleanupTelemetry``.
+    """
+
+    def __init__(self, job_name: str) -> None:
+        self.job_name = job_name
+        self.batches = 0
+
+    def __call__(self, batch: Any) -> None:
+        self.batches += 1
+        logger.info(
+            "Cleanup batch committed: %s",
+            {
+                "event": "cleanup_batch",
+                "job_name": self.job_name,
+                "table": batch.table,
+                "batch_number": batch.batch_number,
+                "rows_archived": batch.rows_archived,
+                "first_id": batch.first_id,
+                "last_id": batch.last_id,
+                "duration_ms": round(batch.duration_ms, 2),
+            },
+        )
+
+
 # ---------------------------------------------------------------------------
 # AUDIT-06 FIX 3: DB-backed execution lock
 # ---------------------------------------------------------------------------
@@ -185,6 +219,7 @@ def _run_cleanup_job(
     cleanup_func: Callable[..., object],
     *,
     is_retention: bool = False,
+    batch_recorder: BatchTelemetryRecorder | None = None,
 ) -> None:
     """Execute a cleanup function with telemetry, DB-backed lock, and its own DB session.
 
@@ -196,6 +231,8 @@ def _run_cleanup_job(
         cleanup_func: Callable(db) -> int  OR  Callable(db) -> dict[str, int]
             (retention returns a dict of {table: count}).
         is_retention: If True, sum dict values for records_deleted.
+        batch_recorder: Recorder passed to a batched cleanup_func; its batch
+            count is reported in the job telemetry.
     """
     from database import SessionLocal
 
@@ -297,6 +334,7 @@ def _run_cleanup_job(
         error_cause_fqn=error_cause_fqn,
         error_orig_fqn=error_orig_fqn,
         error_orig_pgcode=error_orig_pgcode,
+        batches=batch_recorder.batches if batch_recorder is not None else 0,
     )
 
     if error_msg:
@@ -333,7 +371,13 @@ def _job_tool_sessions() -> None:
 def _job_retention_cleanup() -> None:
     from retention_cleanup import run_retention_cleanup
 
-    _run_cleanup_job("retention_cleanup", run_retention_cleanup, is_retention=True)
+    recorder = BatchTelemetryRecorder("retention_cleanup")
+    _run_cleanup_job(
+        "retention_cleanup",
+        partial(run_retention_cleanup, on_batch=recorder),
+        is_retention=True,
+        batch_recorder=recorder,
+    )
 
 
 def _job_reset_upload_quotas() -> None:
@@ -493,6 +493,16 @@ LOKI_USER = _load_optional("LOKI_USER", "")
 LOKI_TOKEN = _load_optional("LOKI_TOKEN", "")
 LOKI_ENABLED = bool(LOKI_URL and LOKI_USER and LOKI_TOKEN)
 
+# =============================================================================
+# SECURITY LOG SAMPLING
+# =============================================================================
+# The in-memory security log (security_utils.log_secure_operation) keeps the
+# last 1000 operations. High-frequency operations can be sampled to keep them
+# from crowding out rarer ones: "operation=N,..." keeps every Nth call.
+# Empty (default) records every call.
+
+SECURITY_LOG_SAMPLE_RATES = _load_optional("SECURITY_LOG_SAMPLE_RATES", "")
+
 # =============================================================================
 # CLEANUP SCHEDULER (Sprint 307 — recurring background cleanup)
 # =============================================================================
@@ -641,6 +651,114 @@ CLEANUP_VERIFICATION_TOKEN_INTERVAL_MINUTES = _load_optional_int("CLEANUP_VERIFI
 CLEANUP_TOOL_SESSION_INTERVAL_MINUTES = _load_optional_int("CLEANUP_TOOL_SESSION_INTERVAL_MINUTES", 30)
 CLEANUP_RETENTION_INTERVAL_HOURS = _load_optional_int("CLEANUP_RETENTION_INTERVAL_HOURS", 24)
 
+# =============================================================================
+# COLD START (lazy generator / engine imports)
+# =============================================================================
+# Heavy memo generators and export builders import on first use (see
+# shared/lazy_import.py). Set to "true" to resolve them all during startup so
+# the first request after a scale-out does not pay the import cost.
+
+LAZY_IMPORT_WARMUP = _load_optional("LAZY_IMPORT_WARMUP", "false").lower() == "true"
+
+# =============================================================================
+# EXPORT RENDERING
+# =============================================================================
+# Diagnostic PDF / Excel exports with at least this many flagged accounts are
+# rendered into a spool that rolls over to a temp file beyond
+# EXPORT_SPOOL_MAX_MEMORY_MB, and streamed from there (see
+# shared/export_spool.py). Values below 1 fall back to the defaults.
+
+EXPORT_STREAMING_ROW_THRESHOLD = _load_optional_int("EXPORT_STREAMING_ROW_THRESHOLD", 500)
+EXPORT_SPOOL_MAX_MEMORY_MB = _load_optional_int("EXPORT_SPOOL_MAX_MEMORY_MB", 8)
+
+# Worker processes used to render engagement package artifacts in parallel
+# (see shared/export_render_pool.py). 0 renders everything inline.
+
+ENGAGEMENT_EXPORT_WORKERS = _load_optional_int("ENGAGEMENT_EXPORT_WORKERS", 2)
+
+
+# =============================================================================
+# ENGINE POOL
+# =============================================================================
+# Worker processes that parse uploads and run CPU-bound tool engines (TB
+# analysis, JE/AP/revenue/... testing) off the event-loop process — see
+# shared/engine_pool.py. 0 runs engines on threads as before; admission
+# limits and 429 back-pressure apply either way.
+
+ENGINE_POOL_WORKERS = _load_optional_int("ENGINE_POOL_WORKERS", 2)
+
+# Worker processes are replaced after this many engine runs to cap memory
+# growth from fragmentation in long-lived parsers. 0 never recycles.
+ENGINE_POOL_MAX_TASKS_PER_CHILD = _load_optional_int("ENGINE_POOL_MAX_TASKS_PER_CHILD", 50)
+
+# Engine runs of one tool allowed at once, and how many more may wait for a
+# slot before further requests get 429 + Retry-After. Per-tool overrides are
+# "tool=limit" pairs, e.g. "journal_entry_testing=1,trial_balance=3".
+ENGINE_POOL_TOOL_CONCURRENCY = _load_optional_int("ENGINE_POOL_TOOL_CONCURRENCY", 2)
+ENGINE_POOL_TOOL_LIMITS = _load_optional("ENGINE_POOL_TOOL_LIMITS", "")
+ENGINE_POOL_QUEUE_DEPTH = _load_optional_int("ENGINE_POOL_QUEUE_DEPTH", 8)
+
+# Loan / lease portfolios with at least this many instruments of one kind are
+# scheduled in chunks on the engine pool (see financing_portfolio_engine).
+FINANCING_PORTFOLIO_POOL_THRESHOLD = _load_optional_int("FINANCING_PORTFOLIO_POOL_THRESHOLD", 200)
+
+# =============================================================================
+# ANALYSIS JOBS
+# =============================================================================
+# Uploads submitted with async_job=true return a job id at once and run in the
+# background (see shared/analysis_jobs.py). Job status and progress live in
+# shared/bulk_job_store.py for this long; a finished result can be fetched
+# once within ANALYSIS_JOB_RESULT_TTL_SECONDS and is then deleted.
+
+ANALYSIS_JOB_TTL_SECONDS = _load_optional_int("ANALYSIS_JOB_TTL_SECONDS", 3600)
+ANALYSIS_JOB_RESULT_TTL_SECONDS = _load_optional_int("ANALYSIS_JOB_RESULT_TTL_SECONDS", 600)
+
+# =============================================================================
+# PREFLIGHT CACHE
+# =============================================================================
+# Holds uploaded bytes between preview/inspect and the audit call
+# (see shared/preflight_cache.py). "auto" uses Redis when REDIS_URL is
+# reachable so any worker can consume a token; "memory" is per-process and
+# bounded by PREFLIGHT_CACHE_MAX_MB of cached file bytes.
+
+PREFLIGHT_CACHE_BACKEND = _load_optional("PREFLIGHT_CACHE_BACKEND", "auto").lower()
+PREFLIGHT_CACHE_MAX_MB = _load_optional_int("PREFLIGHT_CACHE_MAX_MB", 256)
+PREFLIGHT_CACHE_TTL_SECONDS = _load_optional_int("PREFLIGHT_CACHE_TTL_SECONDS", 600)
+
+# =============================================================================
+# TOOL RESULT STORE
+# =============================================================================
+# Testing-tool results kept for memo/CSV export by result_id when the upload
+# sets store_result=true (see shared/result_store.py). Compressed JSON of the
+# tool output only; backend selection mirrors the preflight cache.
+
+RESULT_STORE_BACKEND = _load_optional("RESULT_STORE_BACKEND", "auto").lower()
+RESULT_STORE_MAX_MB = _load_optional_int("RESULT_STORE_MAX_MB", 128)
+RESULT_STORE_MAX_ENTRY_MB = _load_optional_int("RESULT_STORE_MAX_ENTRY_MB", 16)
+RESULT_STORE_TTL_SECONDS = _load_optional_int("RESULT_STORE_TTL_SECONDS", 3600)
+
+# =============================================================================
+# RENDERED-EXPORT CACHE
+# =============================================================================
+# Repeat downloads of the same memo / workpaper are served from a cache of
+# rendered bytes (see shared/render_cache.py). RENDER_CACHE_MAX_MB=0 turns
+# the in-memory tier off; RENDER_CACHE_OBJECT_STORE adds a tier in the S3/R2
+# bucket (S3_BUCKET_NAME) shared by every worker.
+
+RENDER_CACHE_MAX_MB = _load_optional_int("RENDER_CACHE_MAX_MB", 128)
+RENDER_CACHE_TTL_SECONDS = _load_optional_int("RENDER_CACHE_TTL_SECONDS", 1800)
+RENDER_CACHE_OBJECT_STORE = _load_optional("RENDER_CACHE_OBJECT_STORE", "false").lower() == "true"
+
+# =============================================================================
+# AUDIT CHAIN VERIFICATION
+# =============================================================================
+# A signed checkpoint is written every N links of a user's activity chain so
+# verification starts from the nearest checkpoint (see shared/audit_chain.py).
+# Ranges spanning several checkpoints are verified as parallel segments.
+
+AUDIT_CHAIN_CHECKPOINT_INTERVAL = _load_optional_int("AUDIT_CHAIN_CHECKPOINT_INTERVAL", 1000)
+AUDIT_CHAIN_VERIFY_WORKERS = _load_optional_int("AUDIT_CHAIN_VERIFY_WORKERS", 4)
+
 # =============================================================================
 # CONFIGURATION SUMMARY (logged at startup)
 # =============================================================================
@@ -127,6 +127,7 @@ def init_db() -> None:
 
     # Ensure ALL model modules are imported so Base.metadata sees every table
     # before create_all() — prevents NoReferencedTableError for cross-model FKs.
+    import classification_cache_model  # noqa: F401
     import engagement_model  # noqa: F401
     import export_share_model  # noqa: F401
     import firm_branding_model  # noqa: F401
@@ -137,6 +138,7 @@ def init_db() -> None:
     import subscription_model  # noqa: F401
     import team_activity_model  # noqa: F401
     import tool_session_model  # noqa: F401
+    import trend_series_model  # noqa: F401
     import upload_dedup_model  # noqa: F401
 
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,360 @@
+"""
+Depreciation Register Engine — book + tax schedules for a whole asset register.
+
+``depreciation_engine.generate_depreciation_schedule`` walks one asset at a
+time through Decimal loops, which is fine for the form endpoint but not for a
+register of thousands of assets. This engine groups assets that share a
+schedule shape — book method and life (or units-of-production period count),
+and MACRS percentage table — and runs each group's year loop once over NumPy
+arrays, so the Python-level work is per group-year rather than per asset-year.
+
+Exactness contract: the output is identical, entry for entry, to calling
+``generate_depreciation_schedule`` on each asset.
+
+- Schedules are computed in float64 and rounded to the cent HALF_UP. Every
+  step of the schedule arithmetic is continuous in its inputs (the salvage
+  and basis clamps and the DB→SL switch choose the same amount on either side
+  of their boundary), so float error can only change a rounded amount when the
+  unrounded value sits within noise of a half cent. Assets with any such
+  value are recomputed through the single-asset Decimal path.
+- The book-vs-tax bridge is computed in integer cents against the exact
+  ratio of ``tax_rate``, matching the Decimal path without tolerance.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+
+from depreciation_engine import (
+    CENT,
+    ZERO,
+    AssetConfig,
+    BookMethod,
+    BookTaxComparisonEntry,
+    DepreciationInputError,
+    DepreciationResult,
+    YearEntry,
+    _calendar_year,
+    _macrs_percentages,
+    _q,
+    generate_depreciation_schedule,
+)
+
+# Float results are trusted to the cent unless they fall within this distance
+# (in cents) of a half cent. The relative part scales with the asset's cost:
+# a few hundred float64 operations stay well inside 1e-12 of the largest
+# magnitude in the schedule.
+_ABS_TOL_CENTS = 1e-6
+_REL_TOL = 1e-12
+
+# Above this cost the cent grid is too coarse for float64; use Decimal.
+_MAX_FLOAT_COST = 1e12
+
+# (beginning, charge, accumulated, ending) × assets × years
+_ScheduleArrays = np.ndarray
+
+
+@dataclass
+class DepreciationRegisterResult:
+    """Per-asset results (input order) plus register totals."""
+
+    results: list[DepreciationResult]
+    decimal_fallbacks: int  # assets recomputed on the single-asset path
+
+    @property
+    def total_book_depreciation(self) -> Decimal:
+        return _q(sum((r.total_book_depreciation for r in self.results), ZERO))
+
+    @property
+    def total_tax_depreciation(self) -> Decimal:
+        return _q(sum((r.total_tax_depreciation for r in self.results), ZERO))
+
+    @property
+    def cumulative_deferred_tax(self) -> Decimal:
+        return _q(sum((r.cumulative_deferred_tax for r in self.results), ZERO))
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "asset_count": len(self.results),
+            "assets": [r.to_dict() for r in self.results],
+            "total_book_depreciation": str(self.total_book_depreciation),
+            "total_tax_depreciation": str(self.total_tax_depreciation),
+            "cumulative_deferred_tax": str(self.cumulative_deferred_tax),
+        }
+
+
+# =============================================================================
+# Float schedule kernels (one call per group)
+# =============================================================================
+
+
+def _straight_line_charges(cost: np.ndarray, salvage: np.ndarray, n: int) -> np.ndarray:
+    annual = (cost - salvage) / n
+    return np.repeat(annual[:, None], n, axis=1)
+
+
+def _declining_balance_charges(cost: np.ndarray, salvage: np.ndarray, factor: np.ndarray, n: int) -> np.ndarray:
+    rate = factor / n
+    book_value = cost.copy()
+    switched = np.zeros(len(cost), dtype=bool)
+    charges = np.empty((len(cost), n))
+    for j in range(n):
+        sl_charge = (book_value - salvage) / (n - j)
+        switched |= sl_charge > book_value * rate
+        charge = np.where(switched, sl_charge, book_value * rate)
+        charge = np.where(book_value - charge < salvage, book_value - salvage, charge)
+        charges[:, j] = charge
+        book_value = book_value - charge
+    return charges
+
+
+def _sum_of_years_digits_charges(cost: np.ndarray, salvage: np.ndarray, n: int) -> np.ndarray:
+    remaining = np.arange(n, 0, -1, dtype=float)
+    charges: np.ndarray = (cost - salvage)[:, None] * remaining[None, :] / (n * (n + 1) / 2)
+    return charges
+
+
+def _units_of_production_charges(
+    cost: np.ndarray, salvage: np.ndarray, units_total: np.ndarray, units: np.ndarray
+) -> np.ndarray:
+    rate_per_unit = (cost - salvage) / units_total
+    cumulative = np.zeros(len(cost))
+    charges = np.empty(units.shape)
+    for j in range(units.shape[1]):
+        usable = np.maximum(np.minimum(units[:, j], units_total - cumulative), 0.0)
+        cumulative = cumulative + usable
+        charges[:, j] = rate_per_unit * usable
+    return charges
+
+
+def _emit_book(cost: np.ndarray, salvage: np.ndarray, charges: np.ndarray) -> _ScheduleArrays:
+    """Array form of ``depreciation_engine._emit_year_entries``."""
+    years = charges.shape[1]
+    out = np.empty((4, *charges.shape))
+    book_value = cost.copy()
+    accumulated = np.zeros(len(cost))
+    for j in range(years):
+        if j == years - 1:
+            charge = np.maximum(book_value - salvage, 0.0)
+        else:
+            charge = charges[:, j]
+            charge = np.where(book_value - charge < salvage, book_value - salvage, charge)
+        out[0, :, j] = book_value
+        book_value = book_value - charge
+        accumulated = accumulated + charge
+        out[1, :, j] = charge
+        out[2, :, j] = accumulated
+        out[3, :, j] = book_value
+    return out
+
+
+def _emit_macrs(cost: np.ndarray, pcts: np.ndarray) -> _ScheduleArrays:
+    """Array form of ``depreciation_engine._macrs_schedule``."""
+    years = len(pcts)
+    out = np.empty((4, len(cost), years))
+    book_value = cost.copy()
+    accumulated = np.zeros(len(cost))
+    for j in range(years):
+        if j == years - 1:
+            charge = book_value
+        else:
+            charge = np.minimum(cost * pcts[j] / 100, book_value)
+        out[0, :, j] = book_value
+        book_value = book_value - charge
+        accumulated = accumulated + charge
+        out[1, :, j] = charge
+        out[2, :, j] = accumulated
+        out[3, :, j] = book_value
+    return out
+
+
+def _to_cents(values: _ScheduleArrays, cost: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Round to integer cents HALF_UP; flag assets whose rounding is not certain.
+
+    Returns ``(cents, suspect)`` where ``suspect`` is a per-asset mask of
+    schedules that must be recomputed in Decimal: a value within tolerance
+    of a half cent, or a small negative value that Decimal would render as
+    ``-0.00``.
+    """
+    tol = (_ABS_TOL_CENTS + cost * 100 * _REL_TOL)[None, :, None]
+    scaled = values * 100
+    magnitude = np.abs(scaled)
+    rounded = np.floor(magnitude + 0.5)
+    tie = np.abs(magnitude - np.floor(magnitude) - 0.5) <= tol
+    negative_zero = (scaled < -tol) & (rounded == 0)
+    suspect = (tie | negative_zero).any(axis=(0, 2))
+    cents = np.where(scaled < 0, -rounded, rounded).astype(np.int64)
+    return cents, suspect
+
+
+# =============================================================================
+# Grouping
+# =============================================================================
+
+
+def _book_group_key(config: AssetConfig) -> tuple:
+    if config.book_method == BookMethod.UNITS_OF_PRODUCTION:
+        return (config.book_method, len(config.units_per_year))
+    return (config.book_method, config.useful_life_years)
+
+
+def _book_cents(configs: list[AssetConfig], key: tuple) -> tuple[np.ndarray, np.ndarray]:
+    method, n = key
+    cost = np.array([float(c.cost) for c in configs])
+    salvage = np.array([float(c.salvage_value) for c in configs])
+    if method == BookMethod.STRAIGHT_LINE:
+        charges = _straight_line_charges(cost, salvage, n)
+    elif method == BookMethod.DECLINING_BALANCE:
+        factor = np.array([float(c.db_factor) for c in configs])
+        charges = _declining_balance_charges(cost, salvage, factor, n)
+    elif method == BookMethod.SUM_OF_YEARS_DIGITS:
+        charges = _sum_of_years_digits_charges(cost, salvage, n)
+    elif method == BookMethod.UNITS_OF_PRODUCTION:
+        units_total = np.array([float(c.units_total) for c in configs])  # type: ignore[arg-type]
+        units = np.array([[float(u) for u in c.units_per_year] for c in configs])
+        charges = _units_of_production_charges(cost, salvage, units_total, units)
+    else:
+        raise DepreciationInputError(f"Unsupported book method: {method}")
+    return _to_cents(_emit_book(cost, salvage, charges), cost)
+
+
+def _tax_cents(configs: list[AssetConfig], pcts: tuple[Decimal, ...]) -> tuple[np.ndarray, np.ndarray]:
+    cost = np.array([float(c.cost) for c in configs])
+    return _to_cents(_emit_macrs(cost, np.array([float(p) for p in pcts])), cost)
+
+
+# =============================================================================
+# Assembly (integer cents → result dataclasses)
+# =============================================================================
+
+
+def _money(cents: int, negative: bool = False) -> Decimal:
+    """Integer cents to a 2dp Decimal; ``negative`` keeps Decimal's ``-0.00``."""
+    if cents == 0 and negative:
+        return Decimal("-0.00")
+    return Decimal(cents) * CENT
+
+
+def _round_half_up(numerator: int, denominator: int) -> int:
+    """``numerator / denominator`` to the nearest integer, ties away from zero."""
+    magnitude = (2 * abs(numerator) + denominator) // (2 * denominator)
+    return -magnitude if numerator < 0 else magnitude
+
+
+def _year_entries(config: AssetConfig, cents: np.ndarray) -> list[YearEntry]:
+    """``cents`` is the (4, years) slice for one asset."""
+    amounts = [[Decimal(c) * CENT for c in row] for row in cents.tolist()]
+    return [
+        YearEntry(
+            year_index=idx,
+            calendar_year=_calendar_year(config.placed_in_service_year, idx),
+            beginning_book_value=beginning,
+            depreciation=charge,
+            accumulated_depreciation=accumulated,
+            ending_book_value=ending,
+        )
+        for idx, (beginning, charge, accumulated, ending) in enumerate(zip(*amounts), start=1)
+    ]
+
+
+def _comparison(book: list[int], tax: list[int], tax_rate: Decimal) -> list[BookTaxComparisonEntry]:
+    """Integer-cent form of ``depreciation_engine._book_tax_comparison``."""
+    if not tax:
+        return []
+    numerator, denominator = tax_rate.as_integer_ratio()
+    rate_signed = tax_rate.is_signed()
+    cumulative = 0  # in cents × denominator
+    rows: list[BookTaxComparisonEntry] = []
+    for idx in range(1, max(len(book), len(tax)) + 1):
+        book_dep = book[idx - 1] if idx <= len(book) else 0
+        tax_dep = tax[idx - 1] if idx <= len(tax) else 0
+        timing = tax_dep - book_dep
+        change = timing * numerator
+        cumulative += change
+        rows.append(
+            BookTaxComparisonEntry(
+                year_index=idx,
+                book_depreciation=_money(book_dep),
+                tax_depreciation=_money(tax_dep),
+                timing_difference=_money(timing),
+                deferred_tax_change=_money(_round_half_up(change, denominator), (timing < 0) != rate_signed),
+                cumulative_deferred_tax=_money(_round_half_up(cumulative, denominator), cumulative < 0),
+            )
+        )
+    return rows
+
+
+def _assemble(config: AssetConfig, book_cents: np.ndarray, tax_cents: np.ndarray | None) -> DepreciationResult:
+    book = _year_entries(config, book_cents)
+    tax = _year_entries(config, tax_cents) if tax_cents is not None else []
+    book_charges = book_cents[1].tolist()
+    tax_charges = tax_cents[1].tolist() if tax_cents is not None else []
+    comparison = _comparison(book_charges, tax_charges, config.tax_rate)
+    return DepreciationResult(
+        config=config,
+        book_schedule=book,
+        tax_schedule=tax,
+        book_tax_comparison=comparison,
+        total_book_depreciation=_money(sum(book_charges)),
+        total_tax_depreciation=_money(sum(tax_charges)),
+        cumulative_deferred_tax=comparison[-1].cumulative_deferred_tax if comparison else ZERO,
+    )
+
+
+# =============================================================================
+# Public engine
+# =============================================================================
+
+
+def generate_depreciation_register(configs: Sequence[AssetConfig]) -> DepreciationRegisterResult:
+    """Compute book + tax schedules for every asset in ``configs``.
+
+    Raises ``DepreciationInputError`` naming the first invalid asset (1-based)
+    before any schedule is computed.
+    """
+    tax_tables: list[tuple[Decimal, ...] | None] = []
+    for i, config in enumerate(configs, start=1):
+        try:
+            config.validate()
+            has_tax = config.macrs_system is not None and config.macrs_property_class is not None
+            tax_tables.append(tuple(_macrs_percentages(config)) if has_tax else None)
+        except DepreciationInputError as e:
+            raise DepreciationInputError(f"Asset {i} ({config.asset_name}): {e}") from e
+
+    fallback = {i for i, c in enumerate(configs) if c.cost >= _MAX_FLOAT_COST}
+    book_groups: dict[tuple, list[int]] = defaultdict(list)
+    tax_groups: dict[tuple[Decimal, ...], list[int]] = defaultdict(list)
+    for i, config in enumerate(configs):
+        if i in fallback:
+            continue
+        book_groups[_book_group_key(config)].append(i)
+        table = tax_tables[i]
+        if table is not None:
+            tax_groups[table].append(i)
+
+    book_cents: dict[int, np.ndarray] = {}
+    for key, members in book_groups.items():
+        cents, suspect = _book_cents([configs[i] for i in members], key)
+        for row, i in enumerate(members):
+            book_cents[i] = cents[:, row]
+            if suspect[row]:
+                fallback.add(i)
+
+    tax_cents: dict[int, np.ndarray] = {}
+    for table, members in tax_groups.items():
+        cents, suspect = _tax_cents([configs[i] for i in members], table)
+        for row, i in enumerate(members):
+            tax_cents[i] = cents[:, row]
+            if suspect[row]:
+                fallback.add(i)
+
+    results = [
+        generate_depreciation_schedule(config) if i in fallback else _assemble(config, book_cents[i], tax_cents.get(i))
+        for i, config in enumerate(configs)
+    ]
+    return DepreciationRegisterResult(results=results, decimal_fallbacks=len(fallback))
@@ -5,8 +5,18 @@ Phase X: Engagement Layer
 Generates a diagnostic package ZIP containing:
   - anomaly_summary.pdf — Anomaly summary report
   - workpaper_index.json — Workpaper index data
+  - follow_up_comments.md — Follow-up item comment threads (when any exist)
   - manifest.json — File list with SHA-256 hashes, timestamps, platform version
 
+Generation runs in two phases:
+  1. ``EngagementExporter.prepare_package`` — all DB work. Access check,
+     queries, and snapshots of everything the artifacts need.
+  2. ``iter_package_zip`` — no DB access. Each artifact renders in the
+     export render pool (``shared.export_render_pool``); as each completes it
+     is written into a streaming ZIP, hashed on the way in, and released, so
+     the first bytes reach the client as soon as one artifact is ready and
+     peak memory is roughly one artifact. The manifest is written last.
+
 ZERO-STORAGE COMPLIANCE:
   - Does NOT include uploaded financial data
   - Does NOT include individual tool exports (user downloads separately)
@@ -15,21 +25,184 @@ ZERO-STORAGE COMPLIANCE:
 
 import hashlib
 import json
+import logging
+from collections.abc import Callable, Iterator
+from concurrent.futures import as_completed
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from io import BytesIO
-from typing import Optional
+from typing import Any, Optional
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from sqlalchemy.orm import Session
 
-from anomaly_summary_generator import AnomalySummaryGenerator
+from anomaly_summary_generator import AnomalySummaryGenerator, render_anomaly_summary_pdf
 from engagement_model import Engagement
 from follow_up_items_manager import FollowUpItemsManager
 from follow_up_items_model import FollowUpItem
 from models import Client
+from shared.export_render_pool import render_result, submit_render
+from shared.pdf_branding import current_pdf_branding
 from version import __version__ as PLATFORM_VERSION
 from workpaper_index_generator import WorkpaperIndexGenerator
 
+logger = logging.getLogger(__name__)
+
+# Slice size when copying a rendered artifact into its ZIP entry; compressed
+# output is handed to the caller after every slice.
+ZIP_WRITE_CHUNK_BYTES = 64 * 1024
+
+
+# ---------------------------------------------------------------------------
+# Render-phase inputs and renderers (module level so worker processes can
+# import them by name)
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CommentSnapshot:
+    author: str
+    timestamp: str
+    text: str
+    replies: tuple["CommentSnapshot", ...] = ()
+
+
+@dataclass(frozen=True)
+class CommentThread:
+    item_id: int
+    description: str
+    comments: tuple[CommentSnapshot, ...]
+
+
+@dataclass(frozen=True)
+class PackageArtifact:
+    """One ZIP entry: rendered by ``render(*args)`` in the render pool."""
+
+    filename: str
+    render: Callable[..., bytes]
+    args: tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class EngagementPackage:
+    """Everything ``iter_package_zip`` needs — no session, no ORM instances."""
+
+    engagement_id: int
+    client_name: str
+    period_start: str
+    period_end: str
+    generated_at: str
+    download_filename: str
+    artifacts: tuple[PackageArtifact, ...]
+
+
+def render_workpaper_index_json(index_data: dict) -> bytes:
+    return json.dumps(index_data, indent=2, default=str).encode("utf-8")
+
+
+def render_comments_markdown(threads: tuple[CommentThread, ...]) -> bytes:
+    """Render follow-up comment threads as a markdown document."""
+    lines = [
+        "# Follow-Up Item Comments",
+        "",
+        "**DISCLAIMER:** This document is generated by Paciolus, a diagnostic intelligence tool.",
+        "It does not constitute an audit opinion or professional assurance.",
+        "",
+        "---",
+        "",
+    ]
+
+    for thread in threads:
+        lines.append(f"## Item #{thread.item_id}: {thread.description}")
+        lines.append("")
+
+        for comment in thread.comments:
+            lines.append(f"- **{comment.author}** ({comment.timestamp}): {comment.text}")
+
+            # Render replies (one level deep)
+            for reply in comment.replies:
+                lines.append(f"  - **{reply.author}** ({reply.timestamp}): {reply.text}")
+
+        lines.append("")
+
+    return "\n".join(lines).encode("utf-8")
+
+
+class _ZipChunkSink:
+    """Write-only, non-seekable ZIP target that buffers output until drained.
+
+    Having no ``tell``/``seek`` makes ``ZipFile`` use streaming mode (data
+    descriptors after each entry) instead of seeking back to patch headers.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
+
+
+def iter_package_zip(package: EngagementPackage) -> Iterator[bytes]:
+    """Render the package artifacts concurrently and yield the ZIP as it is written.
+
+    Entries appear in completion order; ``manifest.json`` lists files in the
+    package's declared order and is always the last entry.
+    """
+    sink = _ZipChunkSink()
+    digests: dict[str, tuple[int, str]] = {}
+
+    pending = {submit_render(a.render, *a.args): a for a in package.artifacts}
+    try:
+        with ZipFile(sink, "w", ZIP_DEFLATED) as zf:  # type: ignore[call-overload]  # write-only sink
+            for future in as_completed(pending):
+                artifact = pending[future]
+                content = render_result(future, artifact.render, *artifact.args)
+
+                sha256 = hashlib.sha256()
+                with zf.open(artifact.filename, "w") as entry:
+                    for offset in range(0, len(content), ZIP_WRITE_CHUNK_BYTES):
+                        piece = content[offset : offset + ZIP_WRITE_CHUNK_BYTES]
+                        sha256.update(piece)
+                        entry.write(piece)
+                        chunk = sink.drain()
+                        if chunk:
+                            yield chunk
+                digests[artifact.filename] = (len(content), sha256.hexdigest())
+                del content
+
+            manifest: dict[str, object] = {
+                "platform": "Paciolus",
+                "version": PLATFORM_VERSION,
+                "generated_at": package.generated_at,
+                "engagement_id": package.engagement_id,
+                "client_name": package.client_name,
+                "period_start": package.period_start,
+                "period_end": package.period_end,
+                "files": [
+                    {
+                        "filename": a.filename,
+                        "size_bytes": digests[a.filename][0],
+                        "sha256": digests[a.filename][1],
+                    }
+                    for a in package.artifacts
+                ],
+            }
+            zf.writestr("manifest.json", json.dumps(manifest, indent=2).encode("utf-8"))
+        tail = sink.drain()
+        if tail:
+            yield tail
+    finally:
+        for future in pending:
+            future.cancel()
+
 
 class EngagementExporter:
     """Generates a diagnostic package ZIP for an engagement."""
@@ -42,17 +215,17 @@ class EngagementExporter:
 
         return EngagementManager(self.db).get_engagement(user_id, engagement_id)
 
-    def _generate_comments_markdown(self, user_id: int, engagement_id: int) -> Optional[bytes]:
-        """Generate a markdown file of all follow-up item comment threads."""
+    def _collect_comment_threads(self, user_id: int, engagement_id: int) -> tuple[CommentThread, ...]:
+        """Snapshot all follow-up item comment threads, grouped by item."""
         manager = FollowUpItemsManager(self.db)
 
         try:
             comments = manager.get_comments_for_engagement(user_id, engagement_id)
         except ValueError:
-            return None
+            return ()
 
         if not comments:
-            return None
+            return ()
 
         # Group comments by follow-up item
         items_map: dict[int, list] = {}
@@ -69,21 +242,16 @@ class EngagementExporter:
         )
         item_descriptions: dict[int, str] = {item.id: item.description for item in items}
 
-        lines = [
-            "# Follow-Up Item Comments",
-            "",
-            "**DISCLAIMER:** This document is generated by Paciolus, a diagnostic intelligence tool.",
-            "It does not constitute an audit opinion or professional assurance.",
-            "",
-            "---",
-            "",
-        ]
+        def _snapshot(comment: Any, replies: tuple[CommentSnapshot, ...] = ()) -> CommentSnapshot:
+            return CommentSnapshot(
+                author=comment.author.name if comment.author else f"User {comment.user_id}",
+                timestamp=comment.created_at.strftime("%Y-%m-%d %H:%M") if comment.created_at else "",
+                text=comment.comment_text,
+                replies=replies,
+            )
 
+        threads: list[CommentThread] = []
         for item_id, item_comments in sorted(items_map.items()):
-            desc = item_descriptions.get(item_id, f"Follow-up item #{item_id}")
-            lines.append(f"## Item #{item_id}: {desc}")
-            lines.append("")
-
             # Separate top-level and replies
             top_level = [c for c in item_comments if c.parent_comment_id is None]
             replies_by_parent: dict[int, list] = {}
@@ -93,26 +261,28 @@ class EngagementExporter:
                         replies_by_parent[c.parent_comment_id] = []
                     replies_by_parent[c.parent_comment_id].append(c)
 
-            for comment in top_level:
-                author = comment.author.name if comment.author else f"User {comment.user_id}"
-                ts = comment.created_at.strftime("%Y-%m-%d %H:%M") if comment.created_at else ""
-                lines.append(f"- **{author}** ({ts}): {comment.comment_text}")
-
-                # Render replies (one level deep)
-                for reply in replies_by_parent.get(comment.id, []):
-                    r_author = reply.author.name if reply.author else f"User {reply.user_id}"
-                    r_ts = reply.created_at.strftime("%Y-%m-%d %H:%M") if reply.created_at else ""
-                    lines.append(f"  - **{r_author}** ({r_ts}): {reply.comment_text}")
+            threads.append(
+                CommentThread(
+                    item_id=item_id,
+                    description=item_descriptions.get(item_id, f"Follow-up item #{item_id}"),
+                    comments=tuple(
+                        _snapshot(c, tuple(_snapshot(r) for r in replies_by_parent.get(c.id, []))) for c in top_level
+                    ),
+                )
+            )
 
-            lines.append("")
+        return tuple(threads)
 
-        return "\n".join(lines).encode("utf-8")
+    def _generate_comments_markdown(self, user_id: int, engagement_id: int) -> Optional[bytes]:
+        """Generate a markdown file of all follow-up item comment threads."""
+        threads = self._collect_comment_threads(user_id, engagement_id)
+        return render_comments_markdown(threads) if threads else None
 
-    def generate_zip(self, user_id: int, engagement_id: int) -> tuple[bytes, str]:
+    def prepare_package(self, user_id: int, engagement_id: int) -> EngagementPackage:
         """
-        Generate diagnostic package ZIP.
+        Run every query the package needs and return a render-ready snapshot.
 
-        Returns (zip_bytes, filename) tuple.
+        Raises ValueError when the engagement is missing or not owned by ``user_id``.
         """
         engagement = self._verify_engagement_access(user_id, engagement_id)
         if not engagement:
@@ -120,65 +290,40 @@ class EngagementExporter:
 
         client = self.db.query(Client).filter(Client.id == engagement.client_id).first()
         client_name = client.name if client else f"Client_{engagement.client_id}"
-
-        # Generate component files
-        summary_gen = AnomalySummaryGenerator(self.db)
-        anomaly_pdf = summary_gen.generate_pdf(user_id, engagement_id)
-
-        index_gen = WorkpaperIndexGenerator(self.db)
-        index_data = index_gen.generate(user_id, engagement_id)
-        index_json = json.dumps(index_data, indent=2, default=str).encode("utf-8")
-
-        # Generate comment threads markdown
-        comments_md = self._generate_comments_markdown(user_id, engagement_id)
-
-        # Build manifest
         generated_at = datetime.now(UTC).isoformat()
-        files = {
-            "anomaly_summary.pdf": anomaly_pdf,
-            "workpaper_index.json": index_json,
-        }
-
-        if comments_md:
-            files["follow_up_comments.md"] = comments_md
-
-        file_entries: list[dict[str, object]] = []
-        manifest: dict[str, object] = {
-            "platform": "Paciolus",
-            "version": PLATFORM_VERSION,
-            "generated_at": generated_at,
-            "engagement_id": engagement_id,
-            "client_name": client_name,
-            "period_start": engagement.period_start.isoformat() if engagement.period_start else "",
-            "period_end": engagement.period_end.isoformat() if engagement.period_end else "",
-            "files": file_entries,
-        }
-
-        for filename, content in files.items():
-            sha256 = hashlib.sha256(content).hexdigest()
-            file_entries.append(
-                {
-                    "filename": filename,
-                    "size_bytes": len(content),
-                    "sha256": sha256,
-                }
-            )
-
-        manifest_json = json.dumps(manifest, indent=2).encode("utf-8")
 
-        # Build ZIP
-        zip_buffer = BytesIO()
-        with ZipFile(zip_buffer, "w", ZIP_DEFLATED) as zf:
-            for filename, content in files.items():
-                zf.writestr(filename, content)
-            zf.writestr("manifest.json", manifest_json)
+        summary_data = AnomalySummaryGenerator(self.db).collect(user_id, engagement_id)
+        index_data = WorkpaperIndexGenerator(self.db).generate(user_id, engagement_id)
+        comment_threads = self._collect_comment_threads(user_id, engagement_id)
 
-        zip_bytes = zip_buffer.getvalue()
+        artifacts = [
+            PackageArtifact("anomaly_summary.pdf", render_anomaly_summary_pdf, (summary_data, current_pdf_branding())),
+            PackageArtifact("workpaper_index.json", render_workpaper_index_json, (index_data,)),
+        ]
+        if comment_threads:
+            artifacts.append(PackageArtifact("follow_up_comments.md", render_comments_markdown, (comment_threads,)))
 
         # Build download filename
         safe_client = "".join(c if c.isalnum() or c in (" ", "-", "_") else "_" for c in client_name)
         safe_client = safe_client.strip().replace(" ", "_")
         period_end_str = engagement.period_end.strftime("%Y%m%d") if engagement.period_end else "unknown"
-        download_filename = f"{safe_client}_{period_end_str}_diagnostic_package.zip"
 
-        return zip_bytes, download_filename
+        return EngagementPackage(
+            engagement_id=engagement_id,
+            client_name=client_name,
+            period_start=engagement.period_start.isoformat() if engagement.period_start else "",
+            period_end=engagement.period_end.isoformat() if engagement.period_end else "",
+            generated_at=generated_at,
+            download_filename=f"{safe_client}_{period_end_str}_diagnostic_package.zip",
+            artifacts=tuple(artifacts),
+        )
+
+    def generate_zip(self, user_id: int, engagement_id: int) -> tuple[bytes, str]:
+        """
+        Generate diagnostic package ZIP.
+
+        Returns (zip_bytes, filename) tuple. Routes should prefer
+        ``prepare_package`` + ``iter_package_zip`` to stream instead.
+        """
+        package = self.prepare_package(user_id, engagement_id)
+        return b"".join(iter_package_zip(package)), package.download_filename
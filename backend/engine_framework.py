@@ -7,12 +7,32 @@ Defines AuditEngineBase with the common pipeline sequence:
 
 Each tool-specific engine (JE, AP, Payroll) extends this base class
 and implements only the abstract methods for its domain.
+
+run_pipeline_chunked() accepts the row chunks produced by
+shared.upload_pipeline.parse_uploaded_file_chunked(): each chunk is parsed
+into domain objects and released before the next is read.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, Optional
 
 
+def parse_row_chunks(row_chunks: Iterable[list[dict]], parse: Callable[[list[dict], int], list]) -> list:
+    """Parse each chunk with ``parse(chunk, row_offset)`` and concatenate the entries.
+
+    ``row_offset`` is the number of raw rows in earlier chunks, so row numbers
+    match a single-list parse. Each chunk is cleared once parsed.
+    """
+    entries: list = []
+    row_offset = 0
+    for chunk in row_chunks:
+        entries.extend(parse(chunk, row_offset))
+        row_offset += len(chunk)
+        chunk.clear()
+    return entries
+
+
 class AuditEngineBase(ABC):
     """Abstract base class for audit testing engines.
 
@@ -42,8 +62,11 @@ class AuditEngineBase(ABC):
         ...
 
     @abstractmethod
-    def parse_data(self, rows: list[dict], detection: Any) -> list:
-        """Parse raw rows into typed domain objects using detected columns."""
+    def parse_data(self, rows: list[dict], detection: Any, row_offset: int = 0) -> list:
+        """Parse raw rows into typed domain objects using detected columns.
+
+        ``row_offset`` is added to each row number (non-zero for later chunks).
+        """
         ...
 
     @abstractmethod
@@ -112,36 +135,68 @@ class AuditEngineBase(ABC):
         Sequence: detect → override → parse → quality → enrich →
                   test battery → composite score → build result → cleanup
         """
-        # 1. Detect columns
+        detection = self._detect(column_names, column_mapping)
+        entries = self.parse_data(rows, detection)
+        result = self._run_on_entries(entries, detection)
+        self.cleanup(rows)
+        return result
+
+    def run_pipeline_chunked(
+        self,
+        row_chunks: Iterable[list[dict]],
+        column_names: list[str],
+        column_mapping: Optional[dict] = None,
+    ) -> Any:
+        """Same pipeline as run_pipeline(), parsing rows one chunk at a time.
+
+        cleanup() runs on every chunk received, also when parsing or a test
+        raises part-way through.
+        """
+        received: list[list[dict]] = []
+
+        def _receive() -> Iterator[list[dict]]:
+            for chunk in row_chunks:
+                received.append(chunk)
+                yield chunk
+
+        try:
+            detection = self._detect(column_names, column_mapping)
+            entries = parse_row_chunks(_receive(), lambda chunk, offset: self.parse_data(chunk, detection, offset))
+            return self._run_on_entries(entries, detection)
+        finally:
+            for chunk in received:
+                self.cleanup(chunk)
+
+    def _detect(self, column_names: list[str], column_mapping: Optional[dict]) -> Any:
+        # Detect columns
         detection = self.detect_columns(column_names)
 
-        # 2. Apply manual overrides if provided
+        # Apply manual overrides if provided
         if column_mapping:
             detection = self.apply_column_overrides(detection, column_mapping)
 
         # Store detection for subclass access in run_tests()
         self.detection = detection
+        return detection
 
-        # 3. Parse raw data into domain objects
-        entries = self.parse_data(rows, detection)
-
-        # 4. Assess data quality
+    def _run_on_entries(self, entries: list, detection: Any) -> Any:
+        # Assess data quality
         data_quality = self.run_quality_checks(entries, detection)
 
-        # 5. Optional enrichment
+        # Optional enrichment
         enrichment = self.enrich(entries)
 
-        # 6. Run test battery
+        # Run test battery
         test_output = self.run_tests(entries)
 
-        # 7. Extract test results list for scoring
+        # Extract test results list for scoring
         test_results = self.extract_test_results(test_output)
 
-        # 8. Calculate composite score
+        # Calculate composite score
         composite = self.compute_score(test_results, len(entries))
 
-        # 9. Build final result
-        result = self.build_result(
+        # Build final result
+        return self.build_result(
             composite=composite,
             test_output=test_output,
             data_quality=data_quality,
@@ -149,8 +204,3 @@ class AuditEngineBase(ABC):
             entries=entries,
             enrichment=enrichment,
         )
-
-        # 10. Cleanup
-        self.cleanup(rows)
-
-        return result
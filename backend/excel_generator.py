@@ -2,10 +2,13 @@
 
 import io
 from datetime import UTC, datetime
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.worksheet import Worksheet
 
 from security_utils import log_secure_operation
@@ -115,8 +118,90 @@ def create_unbalanced_style() -> NamedStyle:
     return style
 
 
+class _WriteOnlySheet:
+    """Row-buffered facade that lets the tab builders target a write-only worksheet.
+
+    The builders address cells randomly (``ws["A1"]``, ``ws.cell(row=, column=)``)
+    but always move forward through the rows. This facade keeps only the rows
+    not yet written — in practice the current one — and appends them to the
+    underlying ``WriteOnlyWorksheet`` as soon as a later row is touched, so a
+    10k-row tab never has more than one row of cells in memory. Touching a row
+    that has already been flushed is a programming error and raises.
+
+    Column widths must be set before the first row is flushed (openpyxl writes
+    ``<cols>`` ahead of ``<sheetData>``); the builders apply them up front.
+    """
+
+    def __init__(self, ws: WriteOnlyWorksheet):
+        self._ws = ws
+        self._pending: dict[int, dict[int, WriteOnlyCell]] = {}
+        self._next_row = 1  # first row not yet appended to the worksheet
+
+    @property
+    def column_dimensions(self) -> Any:
+        return self._ws.column_dimensions
+
+    def merge_cells(self, range_string: str) -> None:
+        self._ws.merged_cells.add(range_string)
+
+    def cell(self, row: int, column: int, value: Any = None) -> WriteOnlyCell:
+        self._advance_to(row)
+        cells = self._pending.setdefault(row, {})
+        cell = cells.get(column)
+        if cell is None:
+            cell = WriteOnlyCell(self._ws)
+            cells[column] = cell
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def __getitem__(self, coordinate: str) -> WriteOnlyCell:
+        column_letter, row = coordinate_from_string(coordinate)
+        return self.cell(row=row, column=column_index_from_string(column_letter))
+
+    def __setitem__(self, coordinate: str, value: Any) -> None:
+        self[coordinate].value = value
+
+    def flush(self) -> None:
+        """Append every pending row. Call once the builder for this sheet is done."""
+        if self._pending:
+            self._flush_before(max(self._pending) + 1)
+
+    def _advance_to(self, row: int) -> None:
+        if row < self._next_row:
+            raise RuntimeError(f"row {row} already written to write-only sheet '{self._ws.title}'")
+        if self._pending and row > max(self._pending):
+            self._flush_before(row)
+
+    def _flush_before(self, row: int) -> None:
+        for row_idx in range(self._next_row, row):
+            cells = self._pending.pop(row_idx, None)
+            if not cells:
+                self._ws.append([])
+                continue
+            values: list[Any] = [None] * max(cells)
+            for column, cell in cells.items():
+                values[column - 1] = cell
+            self._ws.append(values)
+        self._next_row = max(self._next_row, row)
+
+
 class PaciolusWorkpaperGenerator:
-    """Generates multi-tab Excel workpapers using BytesIO buffer."""
+    """Generates multi-tab Excel workpapers using BytesIO buffer.
+
+    ``write_only=True`` builds the same tabs into an openpyxl write-only
+    workbook (rows stream to per-sheet temp files as they are produced) for
+    use with ``generate_to`` — the export streaming path for large TBs.
+    """
+
+    # Applied when each tab is created so the write-only path can emit
+    # ``<cols>`` before any row is flushed.
+    _COLUMN_WIDTHS: dict[str, dict[str, float]] = {
+        "Summary": {"A": 25, "B": 20, "C": 15, "D": 15},
+        "Standardized TB": {"A": 35, "B": 15, "C": 15, "D": 15, "E": 15, "F": 15},
+        "Flagged Anomalies": {"A": 35, "B": 15, "C": 45, "D": 15, "E": 12, "F": 15},
+        "Key Ratios": {"A": 25, "B": 15, "C": 15, "D": 50},
+    }
 
     def __init__(
         self,
@@ -126,19 +211,24 @@ class PaciolusWorkpaperGenerator:
         reviewed_by: Optional[str] = None,
         workpaper_date: Optional[str] = None,
         include_signoff: bool = False,
+        write_only: bool = False,
     ):
         self.audit_result = audit_result
         self.filename = filename
-        self.wb = Workbook()
+        self.write_only = write_only
+        self.wb = Workbook(write_only=write_only)
         self.buffer = io.BytesIO()
+        self._write_only_sheets: list[_WriteOnlySheet] = []
         # Sprint 53: Workpaper fields (deprecated Sprint 7 — gated by include_signoff)
         self.prepared_by = prepared_by
         self.reviewed_by = reviewed_by
         self.workpaper_date = workpaper_date or datetime.now().strftime("%Y-%m-%d")
         self.include_signoff = include_signoff
 
-        # Remove default sheet (will create named sheets)
-        self.wb.remove(self.wb.active)
+        # Remove default sheet (will create named sheets); write-only
+        # workbooks start without one.
+        if not write_only:
+            self.wb.remove(self.wb.active)
 
         # Register styles
         self._register_styles()
@@ -170,11 +260,7 @@ class PaciolusWorkpaperGenerator:
         """Generate the Excel workpaper. Returns bytes that can be streamed directly."""
         log_secure_operation("excel_generate_start", "Starting Excel generation")
 
-        # Build all tabs
-        self._build_summary_tab()
-        self._build_standardized_tb_tab()
-        self._build_anomalies_tab()
-        self._build_ratios_tab()
+        self._build_all_tabs()
 
         # Save to buffer
         self.wb.save(self.buffer)
@@ -185,9 +271,36 @@ class PaciolusWorkpaperGenerator:
 
         return excel_bytes
 
+    def generate_to(self, output: IO[bytes]) -> None:
+        """Generate the workpaper directly into ``output`` (no intermediate bytes copy)."""
+        log_secure_operation("excel_generate_start", "Starting Excel generation (streaming)")
+
+        self._build_all_tabs()
+        self.wb.save(output)
+
+        log_secure_operation("excel_generate_complete", "Excel generated (streaming)")
+
+    def _build_all_tabs(self) -> None:
+        self._build_summary_tab()
+        self._build_standardized_tb_tab()
+        self._build_anomalies_tab()
+        self._build_ratios_tab()
+        for sheet in self._write_only_sheets:
+            sheet.flush()
+
+    def _create_sheet(self, title: str, index: int) -> Any:
+        """Create a tab (wrapped for write-only mode) with its column widths applied."""
+        ws: Any = self.wb.create_sheet(title, index)
+        for column, width in self._COLUMN_WIDTHS[title].items():
+            ws.column_dimensions[column].width = width
+        if self.write_only:
+            ws = _WriteOnlySheet(ws)
+            self._write_only_sheets.append(ws)
+        return ws
+
     def _build_summary_tab(self) -> None:
         """Build the Summary tab with executive overview."""
-        ws = self.wb.create_sheet("Summary", 0)
+        ws = self._create_sheet("Summary", 0)
 
         # Title
         ws["A1"] = "Paciolus Diagnostic Summary"
@@ -265,26 +378,19 @@ class PaciolusWorkpaperGenerator:
         else:
             disclaimer_start = 20
 
-        # Legal disclaimer
-        ws[f"A{disclaimer_start}"] = (
-            "DISCLAIMER: This output is generated by an automated analytical system and supports"
-        )
-        ws[f"A{disclaimer_start + 1}"] = (
-            "internal evaluation and professional judgment. It does not constitute an audit, review,"
-        )
-        ws[f"A{disclaimer_start + 2}"] = "or attestation engagement and provides no assurance."
-        for row in [disclaimer_start, disclaimer_start + 1, disclaimer_start + 2]:
-            ws[f"A{row}"].font = Font(color=ExcelColors.OBSIDIAN_500, size=8, italic=True)
-
-        # Column widths
-        ws.column_dimensions["A"].width = 25
-        ws.column_dimensions["B"].width = 20
-        ws.column_dimensions["C"].width = 15
-        ws.column_dimensions["D"].width = 15
+        # Legal disclaimer (row-ordered so the write-only path can stream it)
+        disclaimer_lines = [
+            "DISCLAIMER: This output is generated by an automated analytical system and supports",
+            "internal evaluation and professional judgment. It does not constitute an audit, review,",
+            "or attestation engagement and provides no assurance.",
+        ]
+        for offset, text in enumerate(disclaimer_lines):
+            ws[f"A{disclaimer_start + offset}"] = text
+            ws[f"A{disclaimer_start + offset}"].font = Font(color=ExcelColors.OBSIDIAN_500, size=8, italic=True)
 
     def _build_standardized_tb_tab(self) -> None:
         """Build the Standardized TB tab with formatted trial balance."""
-        ws = self.wb.create_sheet("Standardized TB", 1)
+        ws = self._create_sheet("Standardized TB", 1)
 
         # Title
         ws["A1"] = "Standardized Trial Balance"
@@ -340,17 +446,9 @@ class PaciolusWorkpaperGenerator:
         ws.cell(row=row, column=4).style = "currency_style"
         ws.cell(row=row, column=4).font = Font(bold=True)
 
-        # Column widths
-        ws.column_dimensions["A"].width = 35
-        ws.column_dimensions["B"].width = 15
-        ws.column_dimensions["C"].width = 15
-        ws.column_dimensions["D"].width = 15
-        ws.column_dimensions["E"].width = 15
-        ws.column_dimensions["F"].width = 15
-
     def _build_anomalies_tab(self) -> None:
         """Build the Flagged Anomalies tab with detailed anomaly information."""
-        ws = self.wb.create_sheet("Flagged Anomalies", 2)
+        ws = self._create_sheet("Flagged Anomalies", 2)
 
         # Title
         ws["A1"] = "Flagged Anomalies"
@@ -436,17 +534,9 @@ class PaciolusWorkpaperGenerator:
             ws.cell(row=row, column=1).font = Font(color=ExcelColors.SAGE, size=11, italic=True)
             ws.merge_cells(f"A{row}:F{row}")
 
-        # Column widths
-        ws.column_dimensions["A"].width = 35
-        ws.column_dimensions["B"].width = 15
-        ws.column_dimensions["C"].width = 45
-        ws.column_dimensions["D"].width = 15
-        ws.column_dimensions["E"].width = 12
-        ws.column_dimensions["F"].width = 15
-
     def _build_ratios_tab(self) -> None:
         """Build the Key Ratios tab with financial ratio analysis."""
-        ws = self.wb.create_sheet("Key Ratios", 3)
+        ws = self._create_sheet("Key Ratios", 3)
 
         # Title
         ws["A1"] = "Key Financial Ratios"
@@ -548,12 +638,6 @@ class PaciolusWorkpaperGenerator:
             ws.cell(row=row, column=2).style = "currency_style"
             row += 1
 
-        # Column widths
-        ws.column_dimensions["A"].width = 25
-        ws.column_dimensions["B"].width = 15
-        ws.column_dimensions["C"].width = 15
-        ws.column_dimensions["D"].width = 50
-
 
 def generate_financial_statements_excel(
     statements: Any,
@@ -960,3 +1044,31 @@ def generate_workpaper(
         include_signoff=include_signoff,
     )
     return generator.generate()
+
+
+def write_workpaper(
+    audit_result: dict[str, Any],
+    output: IO[bytes],
+    filename: str = "workpaper",
+    prepared_by: Optional[str] = None,
+    reviewed_by: Optional[str] = None,
+    workpaper_date: Optional[str] = None,
+    include_signoff: bool = False,
+) -> None:
+    """Streaming counterpart of ``generate_workpaper``.
+
+    Builds the same four tabs into a write-only workbook and saves it
+    straight into ``output`` (typically a ``shared.export_spool`` spool), so
+    large standardized-TB and anomaly tabs never exist as a full in-memory
+    worksheet or as an extra ``bytes`` copy.
+    """
+    generator = PaciolusWorkpaperGenerator(
+        audit_result,
+        filename,
+        prepared_by=prepared_by,
+        reviewed_by=reviewed_by,
+        workpaper_date=workpaper_date,
+        include_signoff=include_signoff,
+        write_only=True,
+    )
+    generator.generate_to(output)
@@ -5,10 +5,18 @@ Each public function in this module orchestrates the full export flow:
 validate input -> serialize to bytes -> build streaming response. Route handlers
 call these directly and return the result, making each route a one-liner.
 The pipeline owns all try/except handling via transport.handle_export_error.
+
+Diagnostic PDF / Excel exports whose anomaly list reaches
+``EXPORT_STREAMING_ROW_THRESHOLD`` skip the bytes step: the document is
+rendered into a bounded spool (``shared.export_spool``) and streamed from
+there, so peak memory no longer scales with the document size. Smaller
+PDF / Excel documents go through ``shared.render_cache``, so a repeat
+download of the same input is served without re-rendering.
 """
 
 import logging
-from typing import Optional
+from collections.abc import Callable
+from typing import IO, Optional
 
 from fastapi.responses import StreamingResponse
 
@@ -24,9 +32,10 @@ from export.serializers.excel import (
     serialize_audit_excel,
     serialize_financial_statements_excel,
     serialize_leadsheets_excel,
+    write_audit_excel,
 )
-from export.serializers.pdf import serialize_audit_pdf, serialize_financial_statements_pdf
-from export.transport import build_streaming_response, handle_export_error
+from export.serializers.pdf import serialize_audit_pdf, serialize_financial_statements_pdf, write_audit_pdf
+from export.transport import build_spooled_streaming_response, build_streaming_response, handle_export_error
 from export.validators import validate_financial_statements_input
 from financial_statement_builder import FinancialStatementBuilder
 from security_utils import log_secure_operation
@@ -38,15 +47,46 @@ from shared.export_schemas import (
     PopulationProfileCSVInput,
     PreFlightCSVInput,
 )
+from shared.export_spool import new_export_spool, should_stream_export, spool_size
 from shared.pdf_branding import PDFBrandingContext, apply_pdf_branding
+from shared.render_cache import render_cache
 from shared.schemas import AuditResultInput
 
 logger = logging.getLogger(__name__)
 
 
+def _render_to_spool(
+    audit_result: AuditResultInput,
+    writer: Callable[[AuditResultInput, IO[bytes]], None],
+    *,
+    filename_suffix: str,
+    fmt: str,
+) -> tuple[StreamingResponse, int]:
+    """Render via ``writer`` into a bounded spool and wrap it in a response.
+
+    Returns the response and the rendered size. The spool is closed here if
+    rendering fails; on success the response owns it.
+    """
+    spool = new_export_spool()
+    try:
+        writer(audit_result, spool)
+        size = spool_size(spool)
+        response = build_spooled_streaming_response(
+            spool,
+            source_filename=audit_result.filename or "TrialBalance",
+            filename_suffix=filename_suffix,
+            fmt=fmt,
+        )
+    except BaseException:
+        spool.close()
+        raise
+    return response, size
+
+
 def export_diagnostic_pdf(
     audit_result: AuditResultInput,
     *,
+    user_id: int,
     branding: Optional[PDFBrandingContext] = None,
 ) -> StreamingResponse:
     """Full pipeline: audit result -> PDF bytes -> streaming response.
@@ -60,8 +100,21 @@ def export_diagnostic_pdf(
     """
     log_secure_operation("pdf_export_start", f"Generating PDF report for: {audit_result.filename}")
     try:
-        with apply_pdf_branding(branding):
-            pdf_bytes = serialize_audit_pdf(audit_result)
+        if should_stream_export(len(audit_result.abnormal_balances)):
+            with apply_pdf_branding(branding):
+                response, size = _render_to_spool(
+                    audit_result, write_audit_pdf, filename_suffix="Diagnostic", fmt="pdf"
+                )
+            log_secure_operation("pdf_export_complete", f"PDF generated (spooled): {size} bytes")
+            return response
+
+        def _render() -> bytes:
+            with apply_pdf_branding(branding):
+                return serialize_audit_pdf(audit_result)
+
+        pdf_bytes = render_cache.get_or_render(
+            "diagnostic_pdf", audit_result, _render, user_id=user_id, branding=branding
+        )
         response = build_streaming_response(
             pdf_bytes,
             source_filename=audit_result.filename or "TrialBalance",
@@ -74,7 +127,7 @@ def export_diagnostic_pdf(
         handle_export_error(e, log_prefix="PDF export", error_code="pdf_export_error")
 
 
-def export_diagnostic_excel(audit_result: AuditResultInput) -> StreamingResponse:
+def export_diagnostic_excel(audit_result: AuditResultInput, *, user_id: int) -> StreamingResponse:
     """Full pipeline: audit result -> Excel bytes -> streaming response.
 
     Excel exports don't apply PDF branding (logo / header / footer live
@@ -82,7 +135,14 @@ def export_diagnostic_excel(audit_result: AuditResultInput) -> StreamingResponse
     """
     log_secure_operation("excel_export_start", f"Generating Excel workpaper for: {audit_result.filename}")
     try:
-        excel_bytes = serialize_audit_excel(audit_result)
+        if should_stream_export(len(audit_result.abnormal_balances)):
+            response, size = _render_to_spool(audit_result, write_audit_excel, filename_suffix="Workpaper", fmt="xlsx")
+            log_secure_operation("excel_export_complete", f"Excel generated (spooled): {size} bytes")
+            return response
+
+        excel_bytes = render_cache.get_or_render(
+            "diagnostic_excel", audit_result, lambda: serialize_audit_excel(audit_result), user_id=user_id
+        )
         response = build_streaming_response(
             excel_bytes,
             source_filename=audit_result.filename or "TrialBalance",
@@ -129,11 +189,13 @@ def export_csv_anomalies(audit_result: AuditResultInput) -> StreamingResponse:
         handle_export_error(e, log_prefix="CSV anomaly export", error_code="csv_anomaly_export_error")
 
 
-def export_leadsheets(payload: LeadSheetInput) -> StreamingResponse:
+def export_leadsheets(payload: LeadSheetInput, *, user_id: int) -> StreamingResponse:
     """Full pipeline: lead sheet input -> Excel bytes -> streaming response."""
     log_secure_operation("leadsheet_export", f"Exporting lead sheets for {len(payload.flux.items)} items")
     try:
-        excel_bytes = serialize_leadsheets_excel(payload)
+        excel_bytes = render_cache.get_or_render(
+            "leadsheets", payload, lambda: serialize_leadsheets_excel(payload), user_id=user_id
+        )
         response = build_streaming_response(
             excel_bytes,
             source_filename=payload.filename,
@@ -150,6 +212,7 @@ def export_financial_statements(
     payload: FinancialStatementsInput,
     fmt: str = "pdf",
     *,
+    user_id: int,
     branding: Optional[PDFBrandingContext] = None,
 ) -> StreamingResponse:
     """Full pipeline: financial statements input -> PDF or Excel bytes -> streaming response.
@@ -157,6 +220,7 @@ def export_financial_statements(
     Args:
         payload: Validated FinancialStatementsInput with lead_sheet_grouping.
         fmt: Output format — "pdf" (default) or "excel".
+        user_id: The requesting user; cached renders are scoped to them.
         branding: Optional Enterprise branding context, applied via
             ``apply_pdf_branding`` for the PDF path. Excel ignores it.
             Sprint 748b extension.
@@ -166,17 +230,27 @@ def export_financial_statements(
     )
     validate_financial_statements_input(payload)
 
-    try:
-        builder = FinancialStatementBuilder(
+    def _render() -> bytes:
+        statements = FinancialStatementBuilder(
             payload.lead_sheet_grouping,
             entity_name=payload.entity_name or "",
             period_end=payload.period_end or "",
             prior_lead_sheet_grouping=payload.prior_lead_sheet_grouping,
-        )
-        statements = builder.build()
+        ).build()
+        if fmt == "excel":
+            return serialize_financial_statements_excel(payload, statements)
+        with apply_pdf_branding(branding):
+            return serialize_financial_statements_pdf(payload, statements)
 
+    try:
+        file_bytes = render_cache.get_or_render(
+            f"financial_statements_{fmt}",
+            payload,
+            _render,
+            user_id=user_id,
+            branding=None if fmt == "excel" else branding,
+        )
         if fmt == "excel":
-            file_bytes = serialize_financial_statements_excel(payload, statements)
             response = build_streaming_response(
                 file_bytes,
                 source_filename=payload.filename or "FinancialStatements",
@@ -184,8 +258,6 @@ def export_financial_statements(
                 fmt="xlsx",
             )
         else:
-            with apply_pdf_branding(branding):
-                file_bytes = serialize_financial_statements_pdf(payload, statements)
             response = build_streaming_response(
                 file_bytes,
                 source_filename=payload.filename or "FinancialStatements",
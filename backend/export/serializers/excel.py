@@ -3,17 +3,31 @@ Excel serializers for Paciolus diagnostic exports.
 
 Converts audit result payloads into Excel (.xlsx) byte streams by delegating
 to the underlying Excel generator modules (generate_workpaper,
-generate_financial_statements_excel, generate_leadsheets).
+generate_financial_statements_excel, generate_leadsheets). ``write_audit_excel``
+streams the workpaper into a caller-supplied file instead of returning bytes.
+
+The generators are referenced through ``shared.lazy_import.lazy_callable`` so
+``excel_generator`` / ``leadsheet_generator`` import on the first export rather
+than when the export routes register.
 """
 
-from excel_generator import generate_financial_statements_excel, generate_workpaper
+from collections.abc import Callable
+from typing import IO
+
 from flux_engine import FluxItem, FluxResult
-from leadsheet_generator import generate_leadsheets
 from recon_engine import ReconResult, ReconScore
 from shared.export_schemas import FinancialStatementsInput, LeadSheetInput
 from shared.helpers import try_parse_risk, try_parse_risk_band
+from shared.lazy_import import lazy_callable
 from shared.schemas import AuditResultInput
 
+generate_financial_statements_excel: Callable[..., bytes] = lazy_callable(
+    "excel_generator:generate_financial_statements_excel"
+)
+generate_workpaper: Callable[..., bytes] = lazy_callable("excel_generator:generate_workpaper")
+write_workpaper: Callable[..., None] = lazy_callable("excel_generator:write_workpaper")
+generate_leadsheets: Callable[..., bytes] = lazy_callable("leadsheet_generator:generate_leadsheets")
+
 
 def serialize_audit_excel(audit_result: AuditResultInput) -> bytes:
     """Render an audit diagnostic result as an Excel workpaper.
@@ -31,6 +45,19 @@ def serialize_audit_excel(audit_result: AuditResultInput) -> bytes:
     )
 
 
+def write_audit_excel(audit_result: AuditResultInput, output: IO[bytes]) -> None:
+    """Render an audit diagnostic result as a write-only Excel workpaper into ``output``."""
+    write_workpaper(
+        audit_result.model_dump(),
+        output,
+        audit_result.filename,
+        prepared_by=audit_result.prepared_by,
+        reviewed_by=audit_result.reviewed_by,
+        workpaper_date=audit_result.workpaper_date,
+        include_signoff=audit_result.include_signoff,
+    )
+
+
 def serialize_financial_statements_excel(payload: FinancialStatementsInput, statements: object) -> bytes:
     """Render financial statements as an Excel workbook.
 
@@ -3,13 +3,28 @@ PDF serializers for Paciolus diagnostic exports.
 
 Converts audit result payloads into PDF byte streams by delegating to the
 underlying PDF generator modules (generate_audit_report, generate_financial_statements_pdf).
-Each function accepts a typed payload and returns raw PDF bytes.
+Each function accepts a typed payload and returns raw PDF bytes; the
+``write_*`` variants render into a caller-supplied stream instead (used by the
+bounded-memory export path in ``export.pipeline``).
+
+The generators are referenced through ``shared.lazy_import.lazy_callable`` so
+``pdf_generator`` (and ReportLab behind it) imports on the first export rather
+than when the export routes register.
 """
 
-from pdf_generator import generate_audit_report, generate_financial_statements_pdf
+from collections.abc import Callable
+from typing import IO
+
 from shared.export_schemas import FinancialStatementsInput
+from shared.lazy_import import lazy_callable
 from shared.schemas import AuditResultInput
 
+generate_audit_report: Callable[..., bytes] = lazy_callable("pdf_generator:generate_audit_report")
+generate_financial_statements_pdf: Callable[..., bytes] = lazy_callable(
+    "pdf_generator:generate_financial_statements_pdf"
+)
+write_audit_report: Callable[..., None] = lazy_callable("pdf_generator:write_audit_report")
+
 
 def serialize_audit_pdf(audit_result: AuditResultInput) -> bytes:
     """Render an audit diagnostic result as a PDF report.
@@ -27,6 +42,19 @@ def serialize_audit_pdf(audit_result: AuditResultInput) -> bytes:
     )
 
 
+def write_audit_pdf(audit_result: AuditResultInput, output: IO[bytes]) -> None:
+    """Render an audit diagnostic result as a PDF report into ``output``."""
+    write_audit_report(
+        audit_result.model_dump(),
+        output,
+        audit_result.filename,
+        prepared_by=audit_result.prepared_by,
+        reviewed_by=audit_result.reviewed_by,
+        workpaper_date=audit_result.workpaper_date,
+        include_signoff=audit_result.include_signoff,
+    )
+
+
 def serialize_financial_statements_pdf(payload: FinancialStatementsInput, statements: object) -> bytes:
     """Render financial statements as a PDF report.
 
@@ -8,13 +8,20 @@ HTTP response construction directly.
 """
 
 import logging
-from typing import NoReturn
+from typing import IO, NoReturn
 
 from fastapi import HTTPException
 from fastapi.responses import StreamingResponse
 
 from shared.error_messages import sanitize_error
-from shared.export_helpers import streaming_csv_response, streaming_excel_response, streaming_pdf_response
+from shared.export_helpers import (
+    MEDIA_EXCEL,
+    MEDIA_PDF,
+    streaming_csv_response,
+    streaming_excel_response,
+    streaming_pdf_response,
+)
+from shared.export_spool import streaming_spool_response
 from shared.filenames import safe_download_filename
 
 logger = logging.getLogger(__name__)
@@ -51,6 +58,35 @@ def build_streaming_response(
         raise ValueError(f"Unsupported export format: {fmt}")
 
 
+def build_spooled_streaming_response(
+    spool: IO[bytes],
+    *,
+    source_filename: str,
+    filename_suffix: str,
+    fmt: str,
+) -> StreamingResponse:
+    """Streaming-path counterpart of ``build_streaming_response``.
+
+    Args:
+        spool: Spool the document was rendered into (see ``shared.export_spool``).
+            The response takes ownership and closes it after the last chunk.
+        source_filename: The original filename from the client (used as prefix).
+        filename_suffix: Descriptive suffix (e.g. "Diagnostic", "Workpaper").
+        fmt: Output format — "pdf" or "xlsx".
+    """
+    if fmt == "pdf":
+        media_type = MEDIA_PDF
+    elif fmt in ("xlsx", "excel"):
+        media_type = MEDIA_EXCEL
+        fmt = "xlsx"
+    else:
+        spool.close()
+        raise ValueError(f"Unsupported streaming export format: {fmt}")
+
+    download_filename = safe_download_filename(source_filename, filename_suffix, fmt)
+    return streaming_spool_response(spool, download_filename, media_type)
+
+
 def handle_export_error(exc: Exception, *, log_prefix: str, error_code: str) -> NoReturn:
     """Standardized error handling for export operations.
 
@@ -0,0 +1,367 @@
+"""
+Financing Portfolio Engine — loan books and lease portfolios in one request.
+
+``loan_amortization_engine`` and ``lease_accounting_engine`` each schedule a
+single instrument. A retail client with hundreds of store leases, or a lender
+reviewing a loan book, would otherwise call the API once per instrument. This
+engine takes the whole portfolio:
+
+- validates every instrument up front and reports the first bad one by
+  position and name, before any schedule is computed;
+- schedules the instruments with the existing single-instrument engines, so
+  each schedule is identical to the form endpoint's. Portfolios of at least
+  ``FINANCING_PORTFOLIO_POOL_THRESHOLD`` instruments are split into chunks
+  and run on the engine worker pool (``shared.engine_pool``);
+- aggregates a portfolio maturity analysis (loans and leases side by side)
+  and portfolio-level journal-entry templates.
+
+Maturity buckets are "Year 1" … "Year 5" and "Thereafter". With ``as_of``
+set, a payment falls in "Year N" when it is due in the N-th twelve months
+after ``as_of``. Payments on or before ``as_of`` are excluded. Instruments
+without a start date, or every instrument when ``as_of`` is omitted, are
+bucketed by the instrument's own year index, matching the single-lease
+disclosure table. Amounts come from the cent-rounded schedules, so the
+buckets tie to the exported schedule rows.
+
+Form-input only — zero-storage compliant.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Optional, TypeVar
+
+from dateutil.relativedelta import relativedelta
+
+from lease_accounting_engine import (
+    LeaseAccountingResult,
+    LeaseClassification,
+    LeaseConfig,
+    LeaseInputError,
+    compute_lease_accounting,
+)
+from loan_amortization_engine import (
+    PERIODS_PER_YEAR,
+    ZERO,
+    AmortizationResult,
+    JournalEntryTemplate,
+    LoanConfig,
+    LoanInputError,
+    generate_amortization_schedule,
+)
+
+MATURITY_LABELS: tuple[str, ...] = ("Year 1", "Year 2", "Year 3", "Year 4", "Year 5", "Thereafter")
+
+C = TypeVar("C")
+R = TypeVar("R")
+
+
+class PortfolioInputError(ValueError):
+    """Raised when an instrument in the portfolio is invalid."""
+
+
+# =============================================================================
+# Inputs and results
+# =============================================================================
+
+
+@dataclass
+class PortfolioLoan:
+    """A named loan. ``LoanConfig`` has no name of its own."""
+
+    name: str
+    config: LoanConfig
+
+
+@dataclass
+class PortfolioMaturityBucket:
+    label: str
+    loan_payments: Decimal
+    lease_payments: Decimal
+
+    @property
+    def total(self) -> Decimal:
+        return self.loan_payments + self.lease_payments
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "label": self.label,
+            "loan_payments": str(self.loan_payments),
+            "lease_payments": str(self.lease_payments),
+            "total": str(self.total),
+        }
+
+
+@dataclass
+class FinancingPortfolioResult:
+    loans: list[PortfolioLoan]
+    loan_results: list[AmortizationResult]
+    lease_results: list[LeaseAccountingResult]
+    maturity_analysis: list[PortfolioMaturityBucket]
+    journal_entry_templates: list[JournalEntryTemplate]
+    as_of: Optional[date] = None
+
+    @property
+    def instrument_count(self) -> int:
+        return len(self.loan_results) + len(self.lease_results)
+
+    @property
+    def total_loan_principal(self) -> Decimal:
+        return sum((loan.config.principal for loan in self.loans), ZERO)
+
+    @property
+    def total_loan_interest(self) -> Decimal:
+        return sum((r.total_interest for r in self.loan_results), ZERO)
+
+    @property
+    def total_lease_liability(self) -> Decimal:
+        return sum((r.initial_lease_liability for r in self.lease_results), ZERO)
+
+    @property
+    def total_rou_asset(self) -> Decimal:
+        return sum((r.initial_rou_asset for r in self.lease_results), ZERO)
+
+    @property
+    def total_lease_interest(self) -> Decimal:
+        return sum((r.total_interest_expense for r in self.lease_results), ZERO)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "as_of": self.as_of.isoformat() if self.as_of else None,
+            "instrument_count": self.instrument_count,
+            "loans": [
+                {
+                    "name": loan.name,
+                    "principal": str(loan.config.principal),
+                    "total_interest": str(result.total_interest),
+                    "total_payments": str(result.total_payments),
+                    "payoff_date": result.payoff_date.isoformat() if result.payoff_date else None,
+                    "periods": len(result.schedule),
+                }
+                for loan, result in zip(self.loans, self.loan_results)
+            ],
+            "leases": [
+                {
+                    "name": result.config.lease_name,
+                    "classification": result.classification_result.classification.value,
+                    "initial_lease_liability": str(result.initial_lease_liability),
+                    "initial_rou_asset": str(result.initial_rou_asset),
+                    "total_lease_cost": str(result.total_lease_cost),
+                    "total_interest_expense": str(result.total_interest_expense),
+                    "periods": len(result.liability_schedule),
+                }
+                for result in self.lease_results
+            ],
+            "maturity_analysis": [b.to_dict() for b in self.maturity_analysis],
+            "journal_entry_templates": [t.to_dict() for t in self.journal_entry_templates],
+            "total_loan_principal": str(self.total_loan_principal),
+            "total_loan_interest": str(self.total_loan_interest),
+            "total_lease_liability": str(self.total_lease_liability),
+            "total_rou_asset": str(self.total_rou_asset),
+            "total_lease_interest": str(self.total_lease_interest),
+        }
+
+
+# =============================================================================
+# Scheduling (worker-pool entry points must stay module-level)
+# =============================================================================
+
+
+def _amortize_chunk(configs: list[LoanConfig]) -> list[AmortizationResult]:
+    return [generate_amortization_schedule(c) for c in configs]
+
+
+def _lease_chunk(configs: list[LeaseConfig]) -> list[LeaseAccountingResult]:
+    return [compute_lease_accounting(c) for c in configs]
+
+
+def _run_chunked(fn: Callable[[list[C]], list[R]], configs: list[C], threshold: int) -> list[R]:
+    """Run ``fn`` over ``configs`` — inline when small, else in pool-sized chunks."""
+    from config import ENGINE_POOL_WORKERS
+    from shared.engine_pool import map_engine_pool
+
+    if len(configs) < threshold or ENGINE_POOL_WORKERS <= 0:
+        return fn(configs)
+    size = math.ceil(len(configs) / (ENGINE_POOL_WORKERS * 4))
+    chunks = [configs[i : i + size] for i in range(0, len(configs), size)]
+    return [result for chunk_results in map_engine_pool(fn, chunks) for result in chunk_results]
+
+
+# =============================================================================
+# Aggregation
+# =============================================================================
+
+
+def _bucket_index(
+    period_number: int,
+    payment_date: Optional[date],
+    periods_per_year: int,
+    as_of: Optional[date],
+) -> Optional[int]:
+    """0-based maturity bucket for one payment, or None if already paid."""
+    if as_of is None or payment_date is None:
+        return min((period_number - 1) // periods_per_year, len(MATURITY_LABELS) - 1)
+    if payment_date <= as_of:
+        return None
+    elapsed = relativedelta(payment_date, as_of)
+    whole_years = int(elapsed.years) - (1 if elapsed.months == 0 and elapsed.days == 0 else 0)
+    return min(whole_years, len(MATURITY_LABELS) - 1)
+
+
+def _maturity_analysis(
+    loan_results: list[AmortizationResult],
+    lease_results: list[LeaseAccountingResult],
+    as_of: Optional[date],
+) -> list[PortfolioMaturityBucket]:
+    loan_totals = [ZERO] * len(MATURITY_LABELS)
+    lease_totals = [ZERO] * len(MATURITY_LABELS)
+    for loan in loan_results:
+        per_year = PERIODS_PER_YEAR[loan.config.frequency]
+        for entry in loan.schedule:
+            idx = _bucket_index(entry.period_number, entry.payment_date, per_year, as_of)
+            if idx is not None:
+                loan_totals[idx] += entry.scheduled_payment + entry.extra_principal
+    for lease in lease_results:
+        per_year = PERIODS_PER_YEAR[lease.config.frequency]
+        for item in lease.liability_schedule:
+            idx = _bucket_index(item.period_number, item.payment_date, per_year, as_of)
+            if idx is not None:
+                lease_totals[idx] += item.payment
+    return [
+        PortfolioMaturityBucket(label=label, loan_payments=loan_totals[i], lease_payments=lease_totals[i])
+        for i, label in enumerate(MATURITY_LABELS)
+    ]
+
+
+def _lines(pairs: list[tuple[str, Decimal]]) -> list[tuple[str, Decimal]]:
+    return [(account, amount) for account, amount in pairs if amount != 0]
+
+
+def _journal_entry_templates(
+    loan_results: list[AmortizationResult],
+    lease_results: list[LeaseAccountingResult],
+) -> list[JournalEntryTemplate]:
+    """Portfolio-level versions of the per-instrument entries, amounts summed."""
+    templates: list[JournalEntryTemplate] = []
+
+    loans = [r for r in loan_results if r.schedule]
+    if loans:
+        principal = sum((r.config.principal for r in loans), ZERO)
+        interest = sum((r.schedule[0].interest for r in loans), ZERO)
+        reduction = sum((r.schedule[0].principal + r.schedule[0].extra_principal for r in loans), ZERO)
+        cash = sum((r.schedule[0].scheduled_payment + r.schedule[0].extra_principal for r in loans), ZERO)
+        templates.append(
+            JournalEntryTemplate(
+                description=f"Loan inception — record loan proceeds ({len(loans)} loans)",
+                debits=[("Cash", principal)],
+                credits=[("Notes Payable", principal)],
+            )
+        )
+        templates.append(
+            JournalEntryTemplate(
+                description=f"First-period loan payments — split interest and principal ({len(loans)} loans)",
+                debits=[("Interest Expense", interest), ("Notes Payable", reduction)],
+                credits=[("Cash", cash)],
+            )
+        )
+
+    if lease_results:
+        templates.append(
+            JournalEntryTemplate(
+                description=f"Lease commencement — recognize ROU assets and lease liabilities ({len(lease_results)} leases)",
+                debits=_lines(
+                    [
+                        ("Right-of-Use Asset", sum((r.initial_rou_asset for r in lease_results), ZERO)),
+                        (
+                            "Cash — lease incentives received",
+                            sum((r.config.lease_incentives for r in lease_results), ZERO),
+                        ),
+                    ]
+                ),
+                credits=_lines(
+                    [
+                        ("Lease Liability", sum((r.initial_lease_liability for r in lease_results), ZERO)),
+                        ("Prepaid Rent", sum((r.config.prepaid_lease_payments for r in lease_results), ZERO)),
+                        (
+                            "Cash — initial direct costs",
+                            sum((r.config.initial_direct_costs for r in lease_results), ZERO),
+                        ),
+                    ]
+                ),
+            )
+        )
+
+    for classification in (LeaseClassification.OPERATING, LeaseClassification.FINANCE):
+        group = [
+            r
+            for r in lease_results
+            if r.classification_result.classification == classification and r.liability_schedule
+        ]
+        if not group:
+            continue
+        payment = sum((r.liability_schedule[0].payment for r in group), ZERO)
+        principal = sum((r.liability_schedule[0].principal for r in group), ZERO)
+        interest = sum((r.liability_schedule[0].interest for r in group), ZERO)
+        rou_amortization = sum((r.rou_schedule[0].rou_amortization for r in group), ZERO)
+        if classification == LeaseClassification.OPERATING:
+            lease_cost = sum((r.rou_schedule[0].period_lease_cost for r in group), ZERO)
+            expense = [("Operating Lease Cost", lease_cost)]
+        else:
+            expense = [("Interest Expense", interest), ("ROU Amortization Expense", rou_amortization)]
+        templates.append(
+            JournalEntryTemplate(
+                description=f"First-period {classification.value} lease payments ({len(group)} leases)",
+                debits=_lines([*expense, ("Lease Liability", principal)]),
+                credits=_lines([("Cash", payment), ("Right-of-Use Asset", rou_amortization)]),
+            )
+        )
+    return templates
+
+
+# =============================================================================
+# Public engine
+# =============================================================================
+
+
+def _validate(loans: Sequence[PortfolioLoan], leases: Sequence[LeaseConfig]) -> None:
+    for i, loan in enumerate(loans, start=1):
+        try:
+            loan.config.validate()
+        except LoanInputError as e:
+            raise PortfolioInputError(f"Loan {i} ({loan.name}): {e}") from e
+    for i, lease in enumerate(leases, start=1):
+        try:
+            lease.validate()
+        except LeaseInputError as e:
+            raise PortfolioInputError(f"Lease {i} ({lease.lease_name}): {e}") from e
+
+
+def generate_financing_portfolio(
+    loans: Sequence[PortfolioLoan] = (),
+    leases: Sequence[LeaseConfig] = (),
+    *,
+    as_of: Optional[date] = None,
+) -> FinancingPortfolioResult:
+    """Schedule every loan and lease, then aggregate maturities and entries."""
+    from config import FINANCING_PORTFOLIO_POOL_THRESHOLD
+
+    if not loans and not leases:
+        raise PortfolioInputError("Portfolio must contain at least one loan or lease.")
+    _validate(loans, leases)
+
+    threshold = FINANCING_PORTFOLIO_POOL_THRESHOLD
+    loan_results = _run_chunked(_amortize_chunk, [loan.config for loan in loans], threshold) if loans else []
+    lease_results = _run_chunked(_lease_chunk, list(leases), threshold) if leases else []
+
+    return FinancingPortfolioResult(
+        loans=list(loans),
+        loan_results=loan_results,
+        lease_results=lease_results,
+        maturity_analysis=_maturity_analysis(loan_results, lease_results, as_of),
+        journal_entry_templates=_journal_entry_templates(loan_results, lease_results),
+        as_of=as_of,
+    )
@@ -0,0 +1,217 @@
+"""CSV and XLSX exports for the financing portfolio tool.
+
+Both formats carry the same content:
+  - Schedule         One row per instrument-period. Loans fill the payment,
+                     interest, principal and balance columns; leases also
+                     fill the ROU columns.
+  - Maturity         Portfolio maturity analysis, loans and leases side by side
+  - Journal Entries  Portfolio-level journal-entry templates
+
+The CSV is yielded one instrument at a time. The XLSX is built as an openpyxl
+write-only workbook straight into the caller's spool, so neither format holds
+the whole rendered document in memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import IO, Any, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+
+from excel_generator import ExcelColors
+from financing_portfolio_engine import FinancingPortfolioResult
+
+CURRENCY_FORMAT = '"$"#,##0.00'
+
+SCHEDULE_HEADERS = [
+    "Type",
+    "Instrument",
+    "Period",
+    "Payment Date",
+    "Payment",
+    "Interest",
+    "Principal",
+    "Ending Balance",
+    "ROU Amortization",
+    "Period Lease Cost",
+    "Ending ROU Balance",
+]
+
+_HEADER_FILL = PatternFill("solid", fgColor=ExcelColors.OBSIDIAN)
+_HEADER_FONT = Font(bold=True, color=ExcelColors.OATMEAL, size=11)
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+_TOTAL_FONT = Font(bold=True, color=ExcelColors.OBSIDIAN, size=11)
+
+
+def _schedule_rows(result: FinancingPortfolioResult) -> Iterator[list[list[Any]]]:
+    """Yield each instrument's schedule rows (Decimal amounts, ISO dates)."""
+    for loan, amortization in zip(result.loans, result.loan_results):
+        yield [
+            [
+                "Loan",
+                loan.name,
+                entry.period_number,
+                entry.payment_date.isoformat() if entry.payment_date else "",
+                entry.scheduled_payment + entry.extra_principal,
+                entry.interest,
+                entry.principal + entry.extra_principal,
+                entry.ending_balance,
+                None,
+                None,
+                None,
+            ]
+            for entry in amortization.schedule
+        ]
+    for lease in result.lease_results:
+        yield [
+            [
+                "Lease",
+                lease.config.lease_name,
+                liability.period_number,
+                liability.payment_date.isoformat() if liability.payment_date else "",
+                liability.payment,
+                liability.interest,
+                liability.principal,
+                liability.ending_liability,
+                rou.rou_amortization,
+                rou.period_lease_cost,
+                rou.ending_rou_balance,
+            ]
+            for liability, rou in zip(lease.liability_schedule, lease.rou_schedule)
+        ]
+
+
+def _maturity_rows(result: FinancingPortfolioResult) -> list[list[Any]]:
+    rows: list[list[Any]] = [[b.label, b.loan_payments, b.lease_payments, b.total] for b in result.maturity_analysis]
+    rows.append(
+        [
+            "Total",
+            sum((b.loan_payments for b in result.maturity_analysis), Decimal("0")),
+            sum((b.lease_payments for b in result.maturity_analysis), Decimal("0")),
+            sum((b.total for b in result.maturity_analysis), Decimal("0")),
+        ]
+    )
+    return rows
+
+
+def _journal_rows(result: FinancingPortfolioResult) -> list[list[Any]]:
+    rows: list[list[Any]] = []
+    for template in result.journal_entry_templates:
+        rows.extend([template.description, account, amount, None] for account, amount in template.debits)
+        rows.extend([template.description, account, None, amount] for account, amount in template.credits)
+    return rows
+
+
+# =============================================================================
+# CSV
+# =============================================================================
+
+
+def _csv_value(value: Any) -> Any:
+    return "" if value is None else f"{value}" if isinstance(value, Decimal) else value
+
+
+def iter_portfolio_csv(result: FinancingPortfolioResult) -> Iterator[str]:
+    """Yield the portfolio CSV, one instrument's schedule per chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(SCHEDULE_HEADERS)
+    for rows in _schedule_rows(result):
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+        yield flush()
+
+    writer.writerow([])
+    label = (
+        f"MATURITY ANALYSIS (UNDISCOUNTED, AS OF {result.as_of.isoformat()})"
+        if result.as_of
+        else ("MATURITY ANALYSIS (UNDISCOUNTED, BY INSTRUMENT YEAR)")
+    )
+    writer.writerow([label])
+    writer.writerow(["Bucket", "Loan Payments", "Lease Payments", "Total"])
+    writer.writerows([_csv_value(v) for v in row] for row in _maturity_rows(result))
+
+    writer.writerow([])
+    writer.writerow(["JOURNAL ENTRY TEMPLATES"])
+    writer.writerow(["Entry", "Account", "Debit", "Credit"])
+    writer.writerows([_csv_value(v) for v in row] for row in _journal_rows(result))
+    yield flush()
+
+
+# =============================================================================
+# XLSX
+# =============================================================================
+
+
+def _header(ws: Any, headers: list[str]) -> list[WriteOnlyCell]:
+    cells = []
+    for text in headers:
+        cell = WriteOnlyCell(ws, value=text)
+        cell.font = _HEADER_FONT
+        cell.fill = _HEADER_FILL
+        cell.alignment = _HEADER_ALIGN
+        cells.append(cell)
+    return cells
+
+
+def _row(ws: Any, values: list[Any], bold: bool = False) -> list[Any]:
+    cells: list[Any] = []
+    for value in values:
+        if isinstance(value, Decimal):
+            cell = WriteOnlyCell(ws, value=float(value))
+            cell.number_format = CURRENCY_FORMAT
+        else:
+            cell = WriteOnlyCell(ws, value=value)
+        if bold:
+            cell.font = _TOTAL_FONT
+        cells.append(cell)
+    return cells
+
+
+def _widths(ws: Any, widths: list[int]) -> None:
+    for idx, width in enumerate(widths):
+        ws.column_dimensions[chr(ord("A") + idx)].width = width
+
+
+def write_portfolio_workbook(result: FinancingPortfolioResult, output: IO[bytes]) -> None:
+    """Render the three-sheet XLSX workbook into ``output``."""
+    wb = Workbook(write_only=True)
+
+    schedule_ws: Any = wb.create_sheet("Schedule")
+    _widths(schedule_ws, [8, 28, 8, 12, 14, 14, 14, 16, 16, 16, 18])
+    schedule_ws.freeze_panes = "A2"
+    schedule_ws.append(_header(schedule_ws, SCHEDULE_HEADERS))
+    for rows in _schedule_rows(result):
+        for row in rows:
+            schedule_ws.append(_row(schedule_ws, row))
+
+    maturity_ws: Any = wb.create_sheet("Maturity")
+    _widths(maturity_ws, [14, 18, 18, 18])
+    maturity_ws.append(_header(maturity_ws, ["Bucket", "Loan Payments", "Lease Payments", "Total"]))
+    maturity_rows = _maturity_rows(result)
+    for row in maturity_rows[:-1]:
+        maturity_ws.append(_row(maturity_ws, row))
+    maturity_ws.append(_row(maturity_ws, maturity_rows[-1], bold=True))
+    as_of: Optional[str] = result.as_of.isoformat() if result.as_of else None
+    maturity_ws.append([])
+    maturity_ws.append([f"As of {as_of}" if as_of else "Bucketed by instrument year"])
+
+    journal_ws: Any = wb.create_sheet("Journal Entries")
+    _widths(journal_ws, [60, 34, 16, 16])
+    journal_ws.append(_header(journal_ws, ["Entry", "Account", "Debit", "Credit"]))
+    for row in _journal_rows(result):
+        journal_ws.append(_row(journal_ws, row))
+
+    wb.save(output)
@@ -48,9 +48,9 @@ FA_TEST_DESCRIPTIONS = {
     ),
     "depreciation_recalc": (
         "Sprint 682: Recalculates expected depreciation from cost, residual value, "
-        "useful life, and depreciation method. Flags variance >5% (straight-line) "
-        "or >15% (double-declining balance) from expected accumulated depreciation "
-        "per IAS 16 / ASC 360."
+        "useful life, and depreciation method using the exact book schedule "
+        "(straight-line, declining balance, sum-of-the-years' digits). Flags variance "
+        ">5% from expected accumulated depreciation per IAS 16 / ASC 360."
     ),
 }
 
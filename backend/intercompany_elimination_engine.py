@@ -12,6 +12,12 @@ before consolidation can complete.
 Zero-storage: form-input only. The engine does NOT assert elimination
 is complete; it shows the gaps so the accountant can reconcile them.
 
+``ConsolidationMode.SCALABLE`` (``ConsolidationBuilder`` /
+``run_streaming_consolidation``) is for large groups: entity TBs are
+consumed one at a time, worksheet columns are built as each arrives, and
+reciprocal pairs are matched by hash lookup on (entity, counterparty,
+direction, amount in cents) rather than by scanning each group.
+
 Complementary to the existing single-TB ``detect_intercompany_imbalances``
 in ``audit/rules/relationships.py``. That rule flags within-entity
 intercompany balance weirdness; this engine handles the multi-entity
@@ -22,6 +28,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
@@ -51,6 +58,11 @@ class MismatchKind(str, Enum):
     DIRECTION_MISMATCH = "direction_mismatch"  # Same direction on both sides
 
 
+class ConsolidationMode(str, Enum):
+    STANDARD = "standard"  # Every IC line against every reciprocal line in its group
+    SCALABLE = "scalable"  # Streamed entities, hash-matched exact pairs (see ConsolidationBuilder)
+
+
 class IntercompanyInputError(ValueError):
     """Raised for invalid intercompany inputs."""
 
@@ -85,6 +97,7 @@ class EntityTrialBalance:
 class IntercompanyConfig:
     entities: list[EntityTrialBalance]
     tolerance: Decimal = DEFAULT_TOLERANCE
+    mode: ConsolidationMode = ConsolidationMode.STANDARD
 
 
 # =============================================================================
@@ -337,8 +350,25 @@ def _parse_counterparty(account: str) -> str | None:
     return None
 
 
+# Any direction pattern, or "intercompany" on its own — one regex search
+# instead of a ``_parse_direction`` call per TB account.
+_IC_MARKER = re.compile(
+    "|".join(
+        re.escape(p)
+        for p in (
+            *_DUE_FROM_PATTERNS,
+            *_DUE_TO_PATTERNS,
+            *_IC_REVENUE_PATTERNS,
+            *_IC_EXPENSE_PATTERNS,
+            *_INVESTMENT_PATTERNS,
+            "intercompany",
+        )
+    )
+)
+
+
 def _is_intercompany(account: str) -> bool:
-    return _parse_direction(account) != IntercompanyDirection.UNKNOWN or "intercompany" in account.lower()
+    return _IC_MARKER.search(account.lower()) is not None
 
 
 # =============================================================================
@@ -354,41 +384,45 @@ RECIPROCAL_DIRECTIONS: dict[IntercompanyDirection, IntercompanyDirection] = {
 }
 
 
+def _entity_lines(entity_id: str, accounts: Iterable[EntityAccount]) -> list[IntercompanyLine]:
+    lines: list[IntercompanyLine] = []
+    for account in accounts:
+        if not _is_intercompany(account.account):
+            continue
+        direction = _parse_direction(account.account)
+        counterparty = account.counterparty_entity or _parse_counterparty(account.account)
+        net = account.debit - account.credit
+        lines.append(
+            IntercompanyLine(
+                entity_id=entity_id,
+                account=account.account,
+                direction=direction,
+                counterparty_entity=counterparty,
+                net_balance=_quantise(net),
+                debit=_quantise(account.debit),
+                credit=_quantise(account.credit),
+            )
+        )
+    return lines
+
+
 def _extract_lines(config: IntercompanyConfig) -> list[IntercompanyLine]:
     lines: list[IntercompanyLine] = []
     for entity in config.entities:
-        for account in entity.accounts:
-            if not _is_intercompany(account.account):
-                continue
-            direction = _parse_direction(account.account)
-            counterparty = account.counterparty_entity or _parse_counterparty(account.account)
-            net = account.debit - account.credit
-            lines.append(
-                IntercompanyLine(
-                    entity_id=entity.entity_id,
-                    account=account.account,
-                    direction=direction,
-                    counterparty_entity=counterparty,
-                    net_balance=_quantise(net),
-                    debit=_quantise(account.debit),
-                    credit=_quantise(account.credit),
-                )
-            )
+        lines.extend(_entity_lines(entity.entity_id, entity.accounts))
     return lines
 
 
-def _match_pairs(
+def _group_lines(
     lines: list[IntercompanyLine],
-    entities_by_id: dict[str, EntityTrialBalance],
-    tolerance: Decimal,
-) -> tuple[list[EliminationPair], list[Mismatch]]:
-    # Group lines by (entity_id, counterparty_entity). Normalise
-    # counterparty lookup by both name and id.
-    entity_name_to_id: dict[str, str] = {e.entity_name.lower(): e.entity_id for e in entities_by_id.values()}
-    for e in entities_by_id.values():
-        entity_name_to_id[e.entity_id.lower()] = e.entity_id
+    entity_name_to_id: dict[str, str],
+) -> tuple[dict[tuple[str, str], list[IntercompanyLine]], list[IntercompanyLine]]:
+    """Group lines by (entity_id, counterparty_entity_id).
 
-    # Organise by (entity_id, counterparty_entity_id) -> list of lines.
+    ``entity_name_to_id`` maps lower-cased entity names *and* ids to the id,
+    so a counterparty may be given either way. Lines whose counterparty is
+    missing or not in the consolidation are returned separately.
+    """
     grouped: dict[tuple[str, str], list[IntercompanyLine]] = defaultdict(list)
     unresolved_counterparty: list[IntercompanyLine] = []
 
@@ -401,137 +435,244 @@ def _match_pairs(
             unresolved_counterparty.append(line)
             continue
         grouped[(line.entity_id, counterparty_id)].append(line)
+    return grouped, unresolved_counterparty
 
-    pairs: list[EliminationPair] = []
-    mismatches: list[Mismatch] = []
-    seen: set[tuple[str, str, str, str]] = set()
 
-    for (entity_a, entity_b), a_lines in grouped.items():
-        b_lines = grouped.get((entity_b, entity_a), [])
-        if not b_lines:
-            # No reciprocal side booked.
-            for line in a_lines:
+def _match_group(
+    entity_a: str,
+    entity_b: str,
+    a_lines: list[IntercompanyLine],
+    b_lines: list[IntercompanyLine],
+    tolerance: Decimal,
+    seen: set[tuple[str, str, str, str]],
+    pairs: list[EliminationPair],
+    mismatches: list[Mismatch],
+) -> None:
+    """Match one (entity, counterparty) group against its reciprocal group."""
+    if not b_lines:
+        # No reciprocal side booked.
+        for line in a_lines:
+            mismatches.append(
+                Mismatch(
+                    kind=MismatchKind.NO_RECIPROCAL,
+                    entity=line.entity_id,
+                    counterparty=line.counterparty_entity,
+                    account=line.account,
+                    direction=line.direction.value,
+                    amount=line.net_balance,
+                    message=(
+                        f"{line.entity_id} booked {line.direction.value} "
+                        f"of ${abs(line.net_balance):,.2f} against "
+                        f"{line.counterparty_entity} but no reciprocal "
+                        "entry was found."
+                    ),
+                )
+            )
+        return
+
+    # Match by reciprocal direction where possible.
+    for a in a_lines:
+        expected_b_direction = RECIPROCAL_DIRECTIONS.get(a.direction)
+        matches = [b for b in b_lines if b.direction == expected_b_direction]
+        if not matches and expected_b_direction is None:
+            matches = b_lines  # UNKNOWN direction — match any
+        if not matches:
+            for b in b_lines:
+                pair_key = tuple(sorted([entity_a, entity_b]) + [a.account, b.account])
+                key = (pair_key[0], pair_key[1], pair_key[2], pair_key[3])
+                if key in seen:
+                    continue
+                seen.add(key)
                 mismatches.append(
                     Mismatch(
-                        kind=MismatchKind.NO_RECIPROCAL,
-                        entity=line.entity_id,
-                        counterparty=line.counterparty_entity,
-                        account=line.account,
-                        direction=line.direction.value,
-                        amount=line.net_balance,
+                        kind=MismatchKind.DIRECTION_MISMATCH,
+                        entity=a.entity_id,
+                        counterparty=a.counterparty_entity,
+                        account=a.account,
+                        direction=a.direction.value,
+                        amount=a.net_balance,
                         message=(
-                            f"{line.entity_id} booked {line.direction.value} "
-                            f"of ${abs(line.net_balance):,.2f} against "
-                            f"{line.counterparty_entity} but no reciprocal "
-                            "entry was found."
+                            f"{a.entity_id}.{a.account} is "
+                            f"{a.direction.value} but {b.entity_id}."
+                            f"{b.account} is {b.direction.value} — "
+                            "expected reciprocal direction."
                         ),
                     )
                 )
             continue
 
-        # Match by reciprocal direction where possible.
-        for a in a_lines:
-            expected_b_direction = RECIPROCAL_DIRECTIONS.get(a.direction)
-            matches = [b for b in b_lines if b.direction == expected_b_direction]
-            if not matches and expected_b_direction is None:
-                matches = b_lines  # UNKNOWN direction — match any
-            if not matches:
-                for b in b_lines:
-                    pair_key = tuple(sorted([entity_a, entity_b]) + [a.account, b.account])
-                    key = (pair_key[0], pair_key[1], pair_key[2], pair_key[3])
-                    if key in seen:
-                        continue
-                    seen.add(key)
-                    mismatches.append(
-                        Mismatch(
-                            kind=MismatchKind.DIRECTION_MISMATCH,
-                            entity=a.entity_id,
-                            counterparty=a.counterparty_entity,
-                            account=a.account,
-                            direction=a.direction.value,
-                            amount=a.net_balance,
-                            message=(
-                                f"{a.entity_id}.{a.account} is "
-                                f"{a.direction.value} but {b.entity_id}."
-                                f"{b.account} is {b.direction.value} — "
-                                "expected reciprocal direction."
-                            ),
-                        )
-                    )
+        for b in matches:
+            # Sort the entity+account pairs together so we collapse
+            # (A, B, acctA, acctB) and (B, A, acctB, acctA) to the
+            # same key — otherwise both directions of the group
+            # iteration create duplicate pairs.
+            key_pair = tuple(
+                sorted(
+                    [
+                        (a.entity_id, a.account),
+                        (b.entity_id, b.account),
+                    ]
+                )
+            )
+            key = (key_pair[0][0], key_pair[0][1], key_pair[1][0], key_pair[1][1])
+            if key in seen:
                 continue
-
-            for b in matches:
-                # Sort the entity+account pairs together so we collapse
-                # (A, B, acctA, acctB) and (B, A, acctB, acctA) to the
-                # same key — otherwise both directions of the group
-                # iteration create duplicate pairs.
-                key_pair = tuple(
-                    sorted(
-                        [
-                            (a.entity_id, a.account),
-                            (b.entity_id, b.account),
-                        ]
-                    )
+            seen.add(key)
+            # Net residual: A's receivable (positive net) should equal
+            # B's payable (negative net). So A.net + B.net should ~= 0.
+            residual = a.net_balance + b.net_balance
+            reconciles = abs(residual) <= tolerance
+            pairs.append(
+                EliminationPair(
+                    entity_a=a.entity_id,
+                    entity_b=b.entity_id,
+                    account_a=a.account,
+                    account_b=b.account,
+                    direction_a=a.direction.value,
+                    direction_b=b.direction.value,
+                    amount_a=abs(a.net_balance),
+                    amount_b=abs(b.net_balance),
+                    net_residual=_quantise(residual),
+                    reconciles=reconciles,
                 )
-                key = (key_pair[0][0], key_pair[0][1], key_pair[1][0], key_pair[1][1])
-                if key in seen:
-                    continue
-                seen.add(key)
-                # Net residual: A's receivable (positive net) should equal
-                # B's payable (negative net). So A.net + B.net should ~= 0.
-                residual = a.net_balance + b.net_balance
-                reconciles = abs(residual) <= tolerance
-                pairs.append(
-                    EliminationPair(
-                        entity_a=a.entity_id,
-                        entity_b=b.entity_id,
-                        account_a=a.account,
-                        account_b=b.account,
-                        direction_a=a.direction.value,
-                        direction_b=b.direction.value,
-                        amount_a=abs(a.net_balance),
-                        amount_b=abs(b.net_balance),
-                        net_residual=_quantise(residual),
-                        reconciles=reconciles,
+            )
+            if not reconciles:
+                mismatches.append(
+                    Mismatch(
+                        kind=MismatchKind.AMOUNT_MISMATCH,
+                        entity=a.entity_id,
+                        counterparty=b.entity_id,
+                        account=a.account,
+                        direction=a.direction.value,
+                        amount=_quantise(residual),
+                        message=(
+                            f"Intercompany residual of ${residual:,.2f} between "
+                            f"{a.entity_id}.{a.account} and "
+                            f"{b.entity_id}.{b.account} exceeds the "
+                            f"${tolerance:,.2f} tolerance."
+                        ),
                     )
                 )
-                if not reconciles:
-                    mismatches.append(
-                        Mismatch(
-                            kind=MismatchKind.AMOUNT_MISMATCH,
-                            entity=a.entity_id,
-                            counterparty=b.entity_id,
-                            account=a.account,
-                            direction=a.direction.value,
-                            amount=_quantise(residual),
-                            message=(
-                                f"Intercompany residual of ${residual:,.2f} between "
-                                f"{a.entity_id}.{a.account} and "
-                                f"{b.entity_id}.{b.account} exceeds the "
-                                f"${tolerance:,.2f} tolerance."
-                            ),
-                        )
-                    )
 
-    # Unresolved counterparty — counterparty name didn't match any entity.
-    for line in unresolved_counterparty:
-        mismatches.append(
-            Mismatch(
-                kind=MismatchKind.NO_RECIPROCAL,
-                entity=line.entity_id,
-                counterparty=line.counterparty_entity,
-                account=line.account,
-                direction=line.direction.value,
-                amount=line.net_balance,
-                message=(
-                    f"{line.entity_id} booked {line.direction.value} "
-                    f"of ${abs(line.net_balance):,.2f} but the counterparty "
-                    f"({line.counterparty_entity or 'unspecified'}) was not "
-                    "found among the entities in this consolidation."
-                ),
-            )
+
+def _unresolved_mismatches(unresolved_counterparty: list[IntercompanyLine]) -> list[Mismatch]:
+    """Counterparty name didn't match any entity in the consolidation."""
+    return [
+        Mismatch(
+            kind=MismatchKind.NO_RECIPROCAL,
+            entity=line.entity_id,
+            counterparty=line.counterparty_entity,
+            account=line.account,
+            direction=line.direction.value,
+            amount=line.net_balance,
+            message=(
+                f"{line.entity_id} booked {line.direction.value} "
+                f"of ${abs(line.net_balance):,.2f} but the counterparty "
+                f"({line.counterparty_entity or 'unspecified'}) was not "
+                "found among the entities in this consolidation."
+            ),
+        )
+        for line in unresolved_counterparty
+    ]
+
+
+def _entity_lookup(entities: Iterable[tuple[str, str]]) -> dict[str, str]:
+    """Lower-cased entity name and id -> entity id, from (id, name) tuples."""
+    lookup: dict[str, str] = {}
+    ids: list[str] = []
+    for entity_id, entity_name in entities:
+        lookup[entity_name.lower()] = entity_id
+        ids.append(entity_id)
+    for entity_id in ids:
+        lookup[entity_id.lower()] = entity_id
+    return lookup
+
+
+def _match_pairs(
+    lines: list[IntercompanyLine],
+    entities_by_id: dict[str, EntityTrialBalance],
+    tolerance: Decimal,
+) -> tuple[list[EliminationPair], list[Mismatch]]:
+    entity_name_to_id = _entity_lookup((e.entity_id, e.entity_name) for e in entities_by_id.values())
+    grouped, unresolved_counterparty = _group_lines(lines, entity_name_to_id)
+
+    pairs: list[EliminationPair] = []
+    mismatches: list[Mismatch] = []
+    seen: set[tuple[str, str, str, str]] = set()
+
+    for (entity_a, entity_b), a_lines in grouped.items():
+        _match_group(
+            entity_a, entity_b, a_lines, grouped.get((entity_b, entity_a), []), tolerance, seen, pairs, mismatches
         )
 
+    mismatches.extend(_unresolved_mismatches(unresolved_counterparty))
+    return pairs, mismatches
+
+
+def _cents(value: Decimal) -> int:
+    return int(value * 100)
+
+
+def _match_pairs_indexed(
+    grouped: dict[tuple[str, str], list[IntercompanyLine]],
+    unresolved_counterparty: list[IntercompanyLine],
+    tolerance: Decimal,
+) -> tuple[list[EliminationPair], list[Mismatch]]:
+    """Scalable-mode matching: exact reciprocal pairs by hash, the rest as standard.
+
+    Every line with a known direction is indexed under
+    (entity, counterparty, direction, net cents). For each line the exact
+    reciprocal — the counterparty's line in the reciprocal direction with
+    the opposite net — is a dict lookup, and each line joins at most one
+    exact pair. Only the lines left over (timing differences, direction
+    errors, unknown directions) go through ``_match_group``, so the
+    per-group scan is over exceptions rather than every intercompany line.
+    """
+    index: dict[tuple[str, str, IntercompanyDirection, int], list[IntercompanyLine]] = defaultdict(list)
+    for (entity_id, counterparty_id), group in grouped.items():
+        for line in group:
+            if line.direction in RECIPROCAL_DIRECTIONS:
+                index[(entity_id, counterparty_id, line.direction, _cents(line.net_balance))].append(line)
+    for bucket in index.values():
+        bucket.reverse()  # pop() from the end takes lines in booking order
+
+    pairs: list[EliminationPair] = []
+    mismatches: list[Mismatch] = []
+    seen: set[tuple[str, str, str, str]] = set()
+    paired: set[int] = set()
+
+    for (entity_a, entity_b), a_lines in grouped.items():
+        for a in a_lines:
+            if id(a) in paired or a.direction not in RECIPROCAL_DIRECTIONS:
+                continue
+            candidates = index.get((entity_b, entity_a, RECIPROCAL_DIRECTIONS[a.direction], -_cents(a.net_balance)))
+            while candidates and id(candidates[-1]) in paired:
+                candidates.pop()
+            if not candidates:
+                continue
+            b = candidates.pop()
+            paired.update((id(a), id(b)))
+            pairs.append(
+                EliminationPair(
+                    entity_a=a.entity_id,
+                    entity_b=b.entity_id,
+                    account_a=a.account,
+                    account_b=b.account,
+                    direction_a=a.direction.value,
+                    direction_b=b.direction.value,
+                    amount_a=abs(a.net_balance),
+                    amount_b=abs(b.net_balance),
+                    net_residual=_quantise(a.net_balance + b.net_balance),
+                    reconciles=True,
+                )
+            )
+
+        leftover_a = [line for line in a_lines if id(line) not in paired]
+        if leftover_a:
+            leftover_b = [line for line in grouped.get((entity_b, entity_a), []) if id(line) not in paired]
+            _match_group(entity_a, entity_b, leftover_a, leftover_b, tolerance, seen, pairs, mismatches)
+
+    mismatches.extend(_unresolved_mismatches(unresolved_counterparty))
     return pairs, mismatches
 
 
@@ -632,25 +773,98 @@ def _elimination_journal_entries(pairs: list[EliminationPair]) -> list[Eliminati
 # =============================================================================
 
 
-def run_intercompany_elimination(config: IntercompanyConfig) -> IntercompanyEliminationResult:
-    if len(config.entities) < 2:
-        raise IntercompanyInputError(
-            f"At least two entities are required for multi-entity consolidation (got {len(config.entities)})."
+class ConsolidationBuilder:
+    """Scalable-mode consolidation, fed one entity trial balance at a time.
+
+    ``add_entity`` makes a single pass over an entity's accounts: it sums
+    the worksheet column, keeps only the intercompany lines and drops the
+    rest, so at most one full entity TB is in memory however many entities
+    the group has. ``finish`` matches the retained lines with
+    ``_match_pairs_indexed`` — one-to-one exact pairs by hash lookup, with
+    the standard per-group matching applied only to what is left over.
+
+    Where the two modes differ, it is because exact pairs are taken out
+    first: with several lines per direction the standard mode pairs every
+    line with every reciprocal line, while this mode pairs equal-and-opposite
+    lines once each, which is what the elimination entries need; and a line
+    already eliminated is never reported again as the other half of a
+    direction or amount mismatch.
+    """
+
+    def __init__(self, tolerance: Decimal = DEFAULT_TOLERANCE) -> None:
+        self.tolerance = tolerance
+        self._columns: list[ConsolidationColumn] = []
+        self._entity_ids: set[str] = set()
+        self._entity_keys: list[tuple[str, str]] = []
+        self._lines: list[IntercompanyLine] = []
+        self._total_debits = ZERO
+        self._total_credits = ZERO
+
+    def add_entity(self, entity_id: str, entity_name: str, accounts: Iterable[EntityAccount]) -> ConsolidationColumn:
+        """Consume one entity's accounts and append its worksheet column."""
+        if entity_id in self._entity_ids:
+            raise IntercompanyInputError("Entity IDs must be unique across the consolidation.")
+        debit_sum = ZERO
+        credit_sum = ZERO
+        retained: list[EntityAccount] = []
+        for account in accounts:
+            debit_sum += account.debit
+            credit_sum += account.credit
+            if _is_intercompany(account.account):
+                retained.append(account)
+        lines = _entity_lines(entity_id, retained)
+        column = ConsolidationColumn(
+            entity_id=entity_id,
+            entity_name=entity_name,
+            debit_total=_quantise(debit_sum),
+            credit_total=_quantise(credit_sum),
+            intercompany_gross=_quantise(sum((abs(line.net_balance) for line in lines), ZERO)),
+        )
+        self._entity_ids.add(entity_id)
+        self._entity_keys.append((entity_id, entity_name))
+        self._lines.extend(lines)
+        self._columns.append(column)
+        self._total_debits += column.debit_total
+        self._total_credits += column.credit_total
+        return column
+
+    def finish(self) -> IntercompanyEliminationResult:
+        """Match the retained intercompany lines and close the worksheet."""
+        _require_two_entities(len(self._columns))
+        grouped, unresolved = _group_lines(self._lines, _entity_lookup(self._entity_keys))
+        pairs, mismatches = _match_pairs_indexed(grouped, unresolved, self.tolerance)
+        jes = _elimination_journal_entries(pairs)
+        elim_amount = _quantise(sum((je.amount for je in jes), ZERO))
+        worksheet = ConsolidationWorksheet(
+            columns=list(self._columns),
+            total_entity_debits=_quantise(self._total_debits),
+            total_entity_credits=_quantise(self._total_credits),
+            elimination_debits=elim_amount,
+            elimination_credits=elim_amount,
+            consolidated_debits=_quantise(self._total_debits - elim_amount),
+            consolidated_credits=_quantise(self._total_credits - elim_amount),
         )
+        return _build_result(len(self._columns), self._lines, pairs, mismatches, jes, worksheet)
 
-    entity_ids = [e.entity_id for e in config.entities]
-    if len(entity_ids) != len(set(entity_ids)):
-        raise IntercompanyInputError("Entity IDs must be unique across the consolidation.")
 
-    entities_by_id = {e.entity_id: e for e in config.entities}
-    lines = _extract_lines(config)
-    pairs, mismatches = _match_pairs(lines, entities_by_id, config.tolerance)
-    jes = _elimination_journal_entries(pairs)
-    worksheet = _consolidation_worksheet(config.entities, lines, pairs)
+def _require_two_entities(count: int) -> None:
+    if count < 2:
+        raise IntercompanyInputError(
+            f"At least two entities are required for multi-entity consolidation (got {count})."
+        )
 
+
+def _build_result(
+    entity_count: int,
+    lines: list[IntercompanyLine],
+    pairs: list[EliminationPair],
+    mismatches: list[Mismatch],
+    jes: list[EliminationJE],
+    worksheet: ConsolidationWorksheet,
+) -> IntercompanyEliminationResult:
     reconciling_pairs = sum(1 for p in pairs if p.reconciles)
     summary = {
-        "entity_count": len(config.entities),
+        "entity_count": entity_count,
         "intercompany_line_count": len(lines),
         "matched_pair_count": len(pairs),
         "reconciling_pair_count": reconciling_pairs,
@@ -667,3 +881,36 @@ def run_intercompany_elimination(config: IntercompanyConfig) -> IntercompanyElim
         worksheet=worksheet,
         summary=summary,
     )
+
+
+def run_streaming_consolidation(
+    entities: Iterable[EntityTrialBalance],
+    tolerance: Decimal = DEFAULT_TOLERANCE,
+) -> IntercompanyEliminationResult:
+    """Scalable-mode consolidation over an iterable of entity TBs.
+
+    ``entities`` may be a generator that loads each TB on demand; each one
+    is released once ``ConsolidationBuilder.add_entity`` has consumed it.
+    """
+    builder = ConsolidationBuilder(tolerance)
+    for entity in entities:
+        builder.add_entity(entity.entity_id, entity.entity_name, entity.accounts)
+    return builder.finish()
+
+
+def run_intercompany_elimination(config: IntercompanyConfig) -> IntercompanyEliminationResult:
+    if config.mode == ConsolidationMode.SCALABLE:
+        return run_streaming_consolidation(config.entities, config.tolerance)
+
+    _require_two_entities(len(config.entities))
+
+    entity_ids = [e.entity_id for e in config.entities]
+    if len(entity_ids) != len(set(entity_ids)):
+        raise IntercompanyInputError("Entity IDs must be unique across the consolidation.")
+
+    entities_by_id = {e.entity_id: e for e in config.entities}
+    lines = _extract_lines(config)
+    pairs, mismatches = _match_pairs(lines, entities_by_id, config.tolerance)
+    jes = _elimination_journal_entries(pairs)
+    worksheet = _consolidation_worksheet(config.entities, lines, pairs)
+    return _build_result(len(config.entities), lines, pairs, mismatches, jes, worksheet)
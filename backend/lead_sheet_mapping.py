@@ -35,6 +35,7 @@ from typing import Optional
 
 from classification_rules import AccountCategory
 from security_utils import log_secure_operation
+from shared.classification_cache import current_classification_cache
 from shared.parsing_helpers import safe_decimal
 
 
@@ -464,6 +465,21 @@ def assign_lead_sheet(
             is_override=True,
         )
 
+    cache = current_classification_cache()
+    cached = cache.get_lead_sheet(account_name) if cache is not None else None
+    if cached is not None:
+        if cached.lead_sheet is not None:
+            sheet = LeadSheet(cached.lead_sheet)
+            return LeadSheetAssignment(
+                account_name=account_name,
+                lead_sheet=sheet,
+                lead_sheet_name=LEAD_SHEET_NAMES[sheet],
+                confidence=cached.confidence,
+                matched_keywords=list(cached.matched_keywords),
+                is_override=False,
+            )
+        return _fallback_lead_sheet(account_name, account_category)
+
     account_lower = account_name.lower().strip()
     best_match: Optional[LeadSheetRule] = None
     best_weight = 0.0
@@ -489,6 +505,14 @@ def assign_lead_sheet(
                 elif rule.weight == best_weight and rule.keyword not in matched_keywords:
                     matched_keywords.append(rule.keyword)
 
+    if cache is not None:
+        cache.put_lead_sheet(
+            account_name,
+            best_match.lead_sheet.value if best_match is not None else None,
+            best_weight,
+            matched_keywords,
+        )
+
     # If we found a match, use it
     if best_match is not None:
         return LeadSheetAssignment(
@@ -500,6 +524,11 @@ def assign_lead_sheet(
             is_override=False,
         )
 
+    return _fallback_lead_sheet(account_name, account_category)
+
+
+def _fallback_lead_sheet(account_name: str, account_category: Optional[AccountCategory]) -> LeadSheetAssignment:
+    """Category-based assignment used when no keyword rule matched."""
     # Fallback to category-based assignment
     if account_category is not None and account_category in CATEGORY_FALLBACK_MAP:
         fallback_sheet = CATEGORY_FALLBACK_MAP[account_category]
@@ -43,6 +43,8 @@ from typing import Literal, Optional
 
 from dateutil.relativedelta import relativedelta
 
+from loan_amortization_engine import MONTHS_PER_PERIOD, PERIODS_PER_YEAR
+
 CENT = Decimal("0.01")
 ZERO = Decimal("0")
 ONE = Decimal("1")
@@ -53,8 +55,6 @@ PV_FV_THRESHOLD = Decimal("0.90")  # ASC 842-10-25-2(d): PV of payments ≥ 90%
 LIFE_PERCENT_THRESHOLD = Decimal("0.75")  # ASC 842-10-25-2(c): term ≥ 75% of useful life
 
 PaymentFrequency = Literal["monthly", "quarterly", "semi-annual", "annual"]
-PERIODS_PER_YEAR: dict[str, int] = {"monthly": 12, "quarterly": 4, "semi-annual": 2, "annual": 1}
-MONTHS_PER_PERIOD: dict[str, int] = {"monthly": 1, "quarterly": 3, "semi-annual": 6, "annual": 12}
 
 
 class LeaseClassification(str, Enum):
@@ -154,3 +154,7 @@ def _attach_loki_handler(root_logger: logging.Logger) -> None:
     if os.environ.get("REDACT_LOG_TRACEBACKS", "true").lower() != "false":
         handler.addFilter(TracebackRedactionFilter())
     root_logger.addHandler(handler)
+
+    from shared.parser_metrics import observe_loki_handler
+
+    observe_loki_handler(handler)
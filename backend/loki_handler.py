@@ -7,30 +7,40 @@ with self-hosted Loki behind Basic Auth.
 
 Design constraints
 ------------------
-- Zero new dependencies — uses stdlib ``urllib.request``. The request runs on a
+- Zero new dependencies — uses stdlib ``http.client``. The request runs on a
   background daemon thread so emit() is non-blocking.
+- One persistent (keep-alive) connection per handler, so pushes don't pay a
+  TLS handshake each; a connection the server has closed is reopened once.
+- Request bodies are gzip-compressed (``Content-Encoding: gzip``, which the
+  Loki push API accepts).
+- Batches are bounded by both record count and formatted bytes, so a burst of
+  short lines ships in few pushes and a burst of long ones stays under the
+  server's body limit. Records are grouped into one stream per label set.
 - Fail-open: if Loki is unreachable or returns non-2xx, the batch is dropped and
   a rate-limited warning is written to stderr. Logging never recurses back into
   the application logger (which would loop).
 - Backpressure: emits land in a bounded in-memory queue. When the queue is full
-  (e.g., Loki is down and traffic is heavy) further emits are silently dropped
-  rather than blocking request handlers.
+  (e.g., Loki is down and traffic is heavy) further emits are dropped rather
+  than blocking request handlers. Drops, failures and bytes shipped are counted
+  (see ``LokiHandler.stats``) so saturation is visible on /metrics.
 """
 
 from __future__ import annotations
 
+import gzip
+import http.client
 import json
 import logging
 import queue
 import sys
 import threading
 import time
-import urllib.error
-import urllib.request
 from base64 import b64encode
 from typing import Any
+from urllib.parse import urlsplit
 
 _STDERR_WARN_COOLDOWN_SECONDS = 300.0  # Print push errors at most once per 5 min
+_GZIP_LEVEL = 6
 
 
 class LokiHandler(logging.Handler):
@@ -39,6 +49,10 @@ class LokiHandler(logging.Handler):
     Buffers log records in memory and flushes in batches to a Loki push endpoint
     on a daemon thread. emit() is non-blocking; flush failures are logged to
     stderr at most once per ``_STDERR_WARN_COOLDOWN_SECONDS`` to avoid log spam.
+
+    A batch closes after ``batch_size`` records, ``batch_bytes`` of formatted
+    lines, or ``flush_interval`` seconds, whichever comes first. Records may
+    carry extra stream labels in ``extra={"loki_labels": {...}}``.
     """
 
     def __init__(
@@ -47,21 +61,42 @@ class LokiHandler(logging.Handler):
         user: str,
         token: str,
         labels: dict[str, str],
-        batch_size: int = 100,
+        batch_size: int = 1000,
+        batch_bytes: int = 512 * 1024,
         flush_interval: float = 2.0,
         queue_maxsize: int = 10_000,
         timeout: float = 5.0,
+        compress: bool = True,
     ) -> None:
         super().__init__()
-        self._url = url
+        parts = urlsplit(url)
+        self._https = parts.scheme == "https"
+        self._netloc = parts.netloc
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
         self._auth = "Basic " + b64encode(f"{user}:{token}".encode()).decode()
         self._static_labels = dict(labels)
         self._batch_size = batch_size
+        self._batch_bytes = batch_bytes
         self._flush_interval = flush_interval
         self._timeout = timeout
+        self._compress = compress
+        self._conn: http.client.HTTPConnection | None = None
         self._queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_maxsize)
         self._stop = threading.Event()
         self._last_warn = 0.0
+
+        # Counters. ``_dropped`` is bumped from emitting threads; the rest
+        # only from the flush thread.
+        self._counter_lock = threading.Lock()
+        self._dropped = 0
+        self._format_errors = 0
+        self._sent = 0
+        self._failed = 0
+        self._pushes = 0
+        self._push_errors = 0
+        self._bytes_uncompressed = 0
+        self._bytes_sent = 0
+
         self._thread = threading.Thread(
             target=self._run,
             name="LokiHandlerFlush",
@@ -73,86 +108,162 @@ class LokiHandler(logging.Handler):
         try:
             self._queue.put_nowait(record)
         except queue.Full:
-            pass
+            with self._counter_lock:
+                self._dropped += 1
 
     def close(self) -> None:
         self._stop.set()
         self._thread.join(timeout=self._flush_interval + self._timeout + 1.0)
         super().close()
 
+    def stats(self) -> dict[str, int]:
+        """Shipping counters since the handler started.
+
+        ``dropped`` records never queued (queue full); ``format_errors``
+        records discarded because formatting raised; ``failed`` records lost
+        to a failed push; ``sent`` records Loki accepted. ``bytes_sent`` is the
+        on-the-wire (compressed) body size, ``bytes_uncompressed`` the JSON size.
+        """
+        with self._counter_lock:
+            dropped = self._dropped
+        return {
+            "queued": self._queue.qsize(),
+            "dropped": dropped,
+            "format_errors": self._format_errors,
+            "sent": self._sent,
+            "failed": self._failed,
+            "pushes": self._pushes,
+            "push_errors": self._push_errors,
+            "bytes_uncompressed": self._bytes_uncompressed,
+            "bytes_sent": self._bytes_sent,
+        }
+
     def _run(self) -> None:
         while not self._stop.is_set():
-            batch = self._collect_batch()
-            if batch:
-                self._flush(batch)
+            records, lines = self._collect_batch()
+            if records:
+                self._flush(records, lines)
 
-        drain: list[logging.LogRecord] = []
-        while True:
-            try:
-                drain.append(self._queue.get_nowait())
-            except queue.Empty:
+        # Drain what is left, still honouring the batch limits.
+        while not self._queue.empty():
+            records, lines = self._collect_batch(wait=False)
+            if not records:
                 break
-        if drain:
-            self._flush(drain)
+            self._flush(records, lines)
+        self._close_connection()
 
-    def _collect_batch(self) -> list[logging.LogRecord]:
-        batch: list[logging.LogRecord] = []
+    def _collect_batch(self, wait: bool = True) -> tuple[list[logging.LogRecord], list[str]]:
+        records: list[logging.LogRecord] = []
+        lines: list[str] = []
+        size = 0
         deadline = time.monotonic() + self._flush_interval
-        while len(batch) < self._batch_size:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                break
+        while len(records) < self._batch_size and size < self._batch_bytes:
             try:
-                batch.append(self._queue.get(timeout=remaining))
+                if wait:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    record = self._queue.get(timeout=remaining)
+                else:
+                    record = self._queue.get_nowait()
             except queue.Empty:
                 break
-        return batch
-
-    def _flush(self, records: list[logging.LogRecord]) -> None:
-        payload = self._build_payload(records)
-        self._post(payload)
-
-    def _build_payload(self, records: list[logging.LogRecord]) -> dict[str, Any]:
-        # Group by (level, logger) so each stream has coherent labels. Loki
-        # requires values to be sorted ascending by timestamp within a stream.
-        streams: dict[tuple[str, str], list[tuple[str, str]]] = {}
-        for r in records:
-            key = (r.levelname, r.name)
+            try:
+                line = self.format(record)
+            except Exception:
+                self._format_errors += 1
+                continue
+            records.append(record)
+            lines.append(line)
+            size += len(line)
+        return records, lines
+
+    def _flush(self, records: list[logging.LogRecord], lines: list[str] | None = None) -> None:
+        payload = self._build_payload(records, lines)
+        if self._post(payload):
+            self._sent += len(records)
+        else:
+            self._failed += len(records)
+
+    def _stream_labels(self, record: logging.LogRecord) -> tuple[tuple[str, str], ...]:
+        labels = {**self._static_labels, "level": record.levelname, "logger": record.name}
+        extra = getattr(record, "loki_labels", None)
+        if isinstance(extra, dict):
+            labels.update({str(k): str(v) for k, v in extra.items()})
+        return tuple(sorted(labels.items()))
+
+    def _build_payload(self, records: list[logging.LogRecord], lines: list[str] | None = None) -> dict[str, Any]:
+        # One stream per distinct label set. Loki requires values to be sorted
+        # ascending by timestamp within a stream.
+        if lines is None:
+            lines = [self.format(r) for r in records]
+        streams: dict[tuple[tuple[str, str], ...], list[tuple[str, str]]] = {}
+        for r, line in zip(records, lines, strict=True):
             ts_ns = str(int(r.created * 1_000_000_000))
-            line = self.format(r)
-            streams.setdefault(key, []).append((ts_ns, line))
+            streams.setdefault(self._stream_labels(r), []).append((ts_ns, line))
 
         return {
             "streams": [
                 {
-                    "stream": {
-                        **self._static_labels,
-                        "level": level,
-                        "logger": logger_name,
-                    },
+                    "stream": dict(labels),
                     "values": sorted(values, key=lambda v: v[0]),
                 }
-                for (level, logger_name), values in streams.items()
+                for labels, values in streams.items()
             ]
         }
 
-    def _post(self, payload: dict[str, Any]) -> None:
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            self._url,
-            data=data,
-            method="POST",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": self._auth,
-            },
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=self._timeout) as resp:  # nosec B310 — fixed https URL from config
-                if resp.status >= 300:
-                    self._warn_stderr(f"Loki push returned HTTP {resp.status}")
-        except (urllib.error.URLError, OSError) as exc:
-            self._warn_stderr(f"Loki push failed: {exc}")
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            if self._https:
+                self._conn = http.client.HTTPSConnection(self._netloc, timeout=self._timeout)
+            else:
+                self._conn = http.client.HTTPConnection(self._netloc, timeout=self._timeout)
+        return self._conn
+
+    def _close_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _post(self, payload: dict[str, Any]) -> bool:
+        """Push one payload; True when Loki accepted it."""
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": self._auth,
+        }
+        body = data
+        if self._compress:
+            body = gzip.compress(data, compresslevel=_GZIP_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+
+        self._pushes += 1
+        self._bytes_uncompressed += len(data)
+        self._bytes_sent += len(body)
+        for attempt in range(2):
+            reused = self._conn is not None
+            conn = self._connection()
+            try:
+                conn.request("POST", self._path, body=body, headers=headers)
+                resp = conn.getresponse()
+                resp.read()  # the connection is only reusable once the body is consumed
+            except (http.client.HTTPException, OSError) as exc:
+                self._close_connection()
+                # A kept-alive connection the server has since closed fails on
+                # first use; retry once on a fresh one.
+                if attempt == 0 and reused and isinstance(exc, (ConnectionError, http.client.RemoteDisconnected)):
+                    continue
+                self._push_errors += 1
+                self._warn_stderr(f"Loki push failed: {exc}")
+                return False
+            if resp.will_close:
+                self._close_connection()
+            if resp.status >= 300:
+                self._push_errors += 1
+                self._warn_stderr(f"Loki push returned HTTP {resp.status}")
+                return False
+            return True
+        return False
 
     def _warn_stderr(self, msg: str) -> None:
         now = time.monotonic()
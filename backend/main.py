@@ -5,6 +5,7 @@ Application entry point — creates the FastAPI app, registers middleware,
 and includes all route modules.
 """
 
+import asyncio
 import json
 import logging
 from collections.abc import AsyncIterator
@@ -26,6 +27,7 @@ from config import (
     CORS_ORIGINS,
     DEBUG,
     ENV_MODE,
+    LAZY_IMPORT_WARMUP,
     SENTRY_DSN,
     SENTRY_TRACES_SAMPLE_RATE,
     STRIPE_ENABLED,
@@ -229,6 +231,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     elif _rl_backend == "redis":
         log_secure_operation("rate_limit_verified", "Redis rate-limit backend confirmed at startup")
 
+    # Resolve deferred generator imports before serving traffic when the
+    # deployment prefers a slower boot over a slow first request.
+    if LAZY_IMPORT_WARMUP:
+        from shared.lazy_import import warm_up
+
+        await asyncio.to_thread(warm_up)
+
     logger.info("Paciolus API v%s started (debug=%s)", __version__, DEBUG)
     log_secure_operation("app_startup", "Paciolus API started")
 
@@ -237,6 +246,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # --- Shutdown ---
     shutdown_scheduler()
 
+    from shared.analysis_jobs import shutdown_analysis_jobs
+    from shared.engine_pool import shutdown_engine_pool
+    from shared.export_render_pool import shutdown_render_pool
+
+    shutdown_analysis_jobs()
+    shutdown_engine_pool()
+    shutdown_render_pool()
+
 
 app = FastAPI(
     title="Paciolus API",
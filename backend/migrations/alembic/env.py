@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from admin_audit_model import AdminAuditLog  # noqa: F401  # Sprint 590
 from analytical_expectations_model import AnalyticalExpectation  # noqa: F401  # Sprint 728a
+from classification_cache_model import ClientClassificationCache  # noqa: F401  # per-client classification cache
 from config import DATABASE_URL
 from database import Base
 from dunning_model import DunningEpisode  # noqa: F401  # Sprint 591
@@ -27,6 +28,7 @@ from scheduler_lock_model import SchedulerLock  # noqa: F401  # AUDIT-06 FIX 3
 from subscription_model import BillingEvent, Subscription  # noqa: F401  # Sprint 363 + Sprint 439
 from team_activity_model import TeamActivityLog  # noqa: F401  # Phase LXIX (Phase 7)
 from tool_session_model import ToolSession  # noqa: F401  # Sprint 262
+from trend_series_model import ClientTrendSeries  # noqa: F401  # derived client trend series
 from uncorrected_misstatements_model import UncorrectedMisstatement  # noqa: F401  # Sprint 729a
 from upload_dedup_model import UploadDedup  # noqa: F401  # AUDIT-06 FIX 4
 
@@ -0,0 +1,47 @@
+"""add client_classification_cache table
+
+Revision ID: c6d7e8f9a0b1
+Revises: b5c6d7e8f9a0
+Create Date: 2026-10-18 00:00:00.000000
+
+Per-client cache of account-name -> category / lead-sheet / confidence
+mappings keyed by classifier rule-version hash. Account names are stored
+only as SHA-256 digests; no balances (zero-storage).
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c6d7e8f9a0b1"
+down_revision = "b5c6d7e8f9a0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "client_classification_cache",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("client_id", sa.Integer(), sa.ForeignKey("clients.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("rule_version", sa.String(16), nullable=False),
+        sa.Column("account_key", sa.String(64), nullable=False),
+        sa.Column("category", sa.String(20), nullable=True),
+        sa.Column("confidence", sa.Float(), nullable=True),
+        sa.Column("matched_keywords", sa.String(500), nullable=True),
+        sa.Column("lead_sheet", sa.String(2), nullable=True),
+        sa.Column("lead_sheet_confidence", sa.Float(), nullable=True),
+        sa.Column("lead_sheet_keywords", sa.String(500), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.UniqueConstraint("client_id", "rule_version", "account_key", name="uq_client_classification_cache_key"),
+    )
+    op.create_index(
+        "ix_client_classification_cache_client_id",
+        "client_classification_cache",
+        ["client_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_client_classification_cache_client_id", table_name="client_classification_cache")
+    op.drop_table("client_classification_cache")
@@ -0,0 +1,43 @@
+"""add audit_chain_checkpoints table
+
+Revision ID: d7e8f9a0b1c2
+Revises: c6d7e8f9a0b1
+Create Date: 2026-10-18 00:00:00.000000
+
+Signed anchors into each user's ActivityLog hash chain, written every
+AUDIT_CHAIN_CHECKPOINT_INTERVAL links so chain verification can start from
+the nearest checkpoint.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d7e8f9a0b1c2"
+down_revision = "c6d7e8f9a0b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_chain_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("activity_log_id", sa.Integer(), sa.ForeignKey("activity_logs.id"), nullable=False),
+        sa.Column("chain_hash", sa.String(128), nullable=False),
+        sa.Column("link_count", sa.Integer(), nullable=False),
+        sa.Column("signature", sa.String(128), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.UniqueConstraint("activity_log_id"),
+    )
+    op.create_index(
+        "ix_audit_chain_checkpoints_user_record",
+        "audit_chain_checkpoints",
+        ["user_id", "activity_log_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_chain_checkpoints_user_record", table_name="audit_chain_checkpoints")
+    op.drop_table("audit_chain_checkpoints")
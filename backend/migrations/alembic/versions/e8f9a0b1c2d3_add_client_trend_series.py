@@ -0,0 +1,46 @@
+"""add client_trend_series table
+
+Revision ID: e8f9a0b1c2d3
+Revises: d7e8f9a0b1c2
+Create Date: 2026-10-18 00:00:00.000000
+
+Derived trend / rolling-window series per (client, user, period type),
+maintained incrementally as diagnostic summaries are written. Aggregate
+totals and ratios only (zero-storage).
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e8f9a0b1c2d3"
+down_revision = "d7e8f9a0b1c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "client_trend_series",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("client_id", sa.Integer(), sa.ForeignKey("clients.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("period_type", sa.String(16), nullable=False),
+        sa.Column("latest_summary_id", sa.Integer(), nullable=True),
+        sa.Column("summary_count", sa.Integer(), nullable=False),
+        sa.Column("snapshots_json", sa.Text(), nullable=False),
+        sa.Column("trend_json", sa.Text(), nullable=True),
+        sa.Column("rolling_json", sa.Text(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.UniqueConstraint("client_id", "user_id", "period_type", name="uq_client_trend_series_key"),
+    )
+    op.create_index(
+        "ix_client_trend_series_client_id",
+        "client_trend_series",
+        ["client_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_client_trend_series_client_id", table_name="client_trend_series")
+    op.drop_table("client_trend_series")
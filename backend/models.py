@@ -222,6 +222,30 @@ class ActivityLog(SoftDeleteMixin, Base):
         }
 
 
+class AuditChainCheckpoint(Base):
+    """Signed anchor into a user's ActivityLog hash chain.
+
+    Written by ``POST /activity/log`` every ``AUDIT_CHAIN_CHECKPOINT_INTERVAL``
+    links. ``signature`` is an HMAC over (user_id, activity_log_id,
+    chain_hash), so verification can start from the nearest checkpoint
+    instead of trusting an unsigned predecessor hash.
+    """
+
+    __tablename__ = "audit_chain_checkpoints"
+    __table_args__ = (Index("ix_audit_chain_checkpoints_user_record", "user_id", "activity_log_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    activity_log_id: Mapped[int] = mapped_column(Integer, ForeignKey("activity_logs.id"), nullable=False, unique=True)
+    chain_hash: Mapped[str] = mapped_column(String(128), nullable=False)
+    link_count: Mapped[int] = mapped_column(Integer, nullable=False)  # Links since the previous checkpoint
+    signature: Mapped[str] = mapped_column(String(128), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<AuditChainCheckpoint(user_id={self.user_id}, activity_log_id={self.activity_log_id})>"
+
+
 class ToolActivity(Base):
     """Lightweight tool activity log for unified dashboard feed.
 
@@ -0,0 +1,437 @@
+"""
+Multi-Period Panel Engine — N trial balances side by side.
+
+``compare_trial_balances`` handles two periods and ``compare_three_periods``
+three; a 12–36 month review built from pairwise calls re-normalizes every
+account name and rebuilds every lookup once per pair. The panel engine
+instead:
+
+- normalizes each distinct account name once across all periods (names
+  repeat month to month) and coalesces duplicates within a period exactly
+  as ``match_accounts`` does;
+- aligns the periods into an accounts × periods balance matrix, with a
+  presence mask distinguishing "absent" from "zero balance";
+- computes period-over-period movements, movement types and significance
+  tiers for every adjacent pair of periods as array operations, using the
+  same rules as ``calculate_movement`` / ``classify_significance``;
+- rolls the matrix up to lead sheets with one grouped sum.
+
+Each account carries one display name and type — those of the latest period
+it appears in — so its lead sheet is stable across the panel. Within that
+convention, each adjacent pair of columns reproduces the two-period
+comparison's movement type, significance and dormancy.
+
+ZERO-STORAGE COMPLIANCE: trial balances are processed in memory only.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Optional
+
+import numpy as np
+
+from multi_period_comparison import (
+    NEAR_ZERO,
+    VARIANCE_BASIS,
+    VARIANCE_FORMULA,
+    MovementType,
+    SignificanceThresholds,
+    SignificanceTier,
+    _get_lead_sheet_info,
+    _money,
+    normalize_account_name,
+)
+from shared.parsing_helpers import safe_decimal
+
+MAX_PANEL_PERIODS = 36
+
+# Code order for ``PanelResult.movement_codes`` / ``significance_codes``.
+# -1 marks an account absent from both periods of a step.
+MOVEMENT_TYPES: tuple[MovementType, ...] = tuple(MovementType)
+SIGNIFICANCE_TIERS: tuple[SignificanceTier, ...] = tuple(SignificanceTier)
+ABSENT = -1
+
+_NEW = MOVEMENT_TYPES.index(MovementType.NEW_ACCOUNT)
+_CLOSED = MOVEMENT_TYPES.index(MovementType.CLOSED_ACCOUNT)
+_SIGN_CHANGE = MOVEMENT_TYPES.index(MovementType.SIGN_CHANGE)
+_INCREASE = MOVEMENT_TYPES.index(MovementType.INCREASE)
+_DECREASE = MOVEMENT_TYPES.index(MovementType.DECREASE)
+_UNCHANGED = MOVEMENT_TYPES.index(MovementType.UNCHANGED)
+_MATERIAL = SIGNIFICANCE_TIERS.index(SignificanceTier.MATERIAL)
+_SIGNIFICANT = SIGNIFICANCE_TIERS.index(SignificanceTier.SIGNIFICANT)
+_MINOR = SIGNIFICANCE_TIERS.index(SignificanceTier.MINOR)
+
+
+class PanelInputError(ValueError):
+    """Raised for an invalid panel request (too few / too many periods)."""
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+
+@dataclass
+class PanelPeriod:
+    """One trial balance in the panel. Account dicts as in ``compare_trial_balances``."""
+
+    label: str
+    accounts: list[dict]
+
+
+@dataclass
+class PanelAccount:
+    account_name: str
+    account_type: str
+    lead_sheet: str
+    lead_sheet_name: str
+    lead_sheet_category: str
+
+
+@dataclass
+class PanelLeadSheetRollup:
+    lead_sheet: str
+    lead_sheet_name: str
+    lead_sheet_category: str
+    account_count: int
+    totals: list[float]
+    net_changes: list[float]
+    change_percents: list[Optional[float]]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "lead_sheet": self.lead_sheet,
+            "lead_sheet_name": self.lead_sheet_name,
+            "lead_sheet_category": self.lead_sheet_category,
+            "account_count": self.account_count,
+            "totals": [_money(v) for v in self.totals],
+            "net_changes": [_money(v) for v in self.net_changes],
+            "change_percents": self.change_percents,
+        }
+
+
+@dataclass
+class PanelResult:
+    """Accounts × periods panel.
+
+    Arrays are indexed ``[account, period]``; movement arrays are indexed
+    ``[account, step]`` where step ``t`` compares period ``t`` to ``t + 1``.
+    """
+
+    period_labels: list[str]
+    accounts: list[PanelAccount]
+    balances: np.ndarray  # float64, debit-positive net; 0.0 where absent
+    present: np.ndarray  # bool
+    change_amounts: np.ndarray  # float64
+    change_percents: np.ndarray  # float64, NaN where the prior balance is ~0
+    movement_codes: np.ndarray  # int8 index into MOVEMENT_TYPES, ABSENT
+    significance_codes: np.ndarray  # int8 index into SIGNIFICANCE_TIERS, ABSENT
+    dormant: np.ndarray  # bool
+    lead_sheet_rollups: list[PanelLeadSheetRollup]
+    total_debits: list[float]
+    total_credits: list[float]
+    duplicate_account_warnings: list[dict] = field(default_factory=list)
+    active_thresholds: Optional[dict] = None
+
+    @property
+    def step_labels(self) -> list[str]:
+        return [f"{a} → {b}" for a, b in zip(self.period_labels, self.period_labels[1:])]
+
+    def movement_counts(self) -> list[dict[str, Any]]:
+        """Per-step counts by movement type and significance tier."""
+        counts = []
+        for step, label in enumerate(self.step_labels):
+            types = np.bincount(
+                self.movement_codes[:, step][self.movement_codes[:, step] >= 0], minlength=len(MOVEMENT_TYPES)
+            )
+            tiers = np.bincount(
+                self.significance_codes[:, step][self.significance_codes[:, step] >= 0],
+                minlength=len(SIGNIFICANCE_TIERS),
+            )
+            counts.append(
+                {
+                    "step": label,
+                    "movements_by_type": {mt.value: int(types[i]) for i, mt in enumerate(MOVEMENT_TYPES)},
+                    "movements_by_significance": {st.value: int(tiers[i]) for i, st in enumerate(SIGNIFICANCE_TIERS)},
+                }
+            )
+        return counts
+
+    def account_rows(self) -> list[dict[str, Any]]:
+        rows = []
+        balances = self.balances.tolist()
+        present = self.present.tolist()
+        changes = self.change_amounts.tolist()
+        percents = self.change_percents.tolist()
+        movements = self.movement_codes.tolist()
+        tiers = self.significance_codes.tolist()
+        dormant = self.dormant.tolist()
+        for i, account in enumerate(self.accounts):
+            rows.append(
+                {
+                    "account_name": account.account_name,
+                    "account_type": account.account_type,
+                    "lead_sheet": account.lead_sheet,
+                    "lead_sheet_name": account.lead_sheet_name,
+                    "lead_sheet_category": account.lead_sheet_category,
+                    "balances": [_money(b) if p else None for b, p in zip(balances[i], present[i])],
+                    "movements": [
+                        None
+                        if movements[i][t] == ABSENT
+                        else {
+                            "change_amount": _money(changes[i][t]),
+                            "change_percent": None if percents[i][t] != percents[i][t] else percents[i][t],
+                            "movement_type": MOVEMENT_TYPES[movements[i][t]].value,
+                            "significance": SIGNIFICANCE_TIERS[tiers[i][t]].value,
+                            "is_dormant": dormant[i][t],
+                        }
+                        for t in range(len(changes[i]))
+                    ],
+                }
+            )
+        return rows
+
+    def to_dict(self) -> dict[str, Any]:
+        significant = np.isin(self.significance_codes, (_MATERIAL, _SIGNIFICANT))
+        return {
+            "period_labels": self.period_labels,
+            "step_labels": self.step_labels,
+            "total_accounts": len(self.accounts),
+            "accounts": self.account_rows(),
+            "lead_sheet_rollups": [r.to_dict() for r in self.lead_sheet_rollups],
+            "movement_counts": self.movement_counts(),
+            "significant_movement_count": int(significant.sum()),
+            "total_debits": [_money(v) for v in self.total_debits],
+            "total_credits": [_money(v) for v in self.total_credits],
+            "duplicate_account_warnings": self.duplicate_account_warnings,
+            "active_thresholds": self.active_thresholds,
+            "variance_basis": VARIANCE_BASIS,
+            "variance_formula": VARIANCE_FORMULA,
+        }
+
+
+# =============================================================================
+# ALIGNMENT
+# =============================================================================
+
+
+def _align(
+    periods: Sequence[PanelPeriod],
+) -> tuple[list[dict], np.ndarray, np.ndarray, list[dict], list[Decimal], list[Decimal]]:
+    """Normalize once per distinct name and fill the balance matrix.
+
+    Returns (latest account dict per normalized name, balances, present,
+    duplicate warnings, per-period debit totals, per-period credit totals).
+    """
+    norm_of: dict[str, str] = {}
+    row_of: dict[str, int] = {}
+    latest: list[dict] = []
+    columns: list[dict[int, Decimal]] = []
+    warnings: list[dict] = []
+    debit_totals: list[Decimal] = []
+    credit_totals: list[Decimal] = []
+
+    for period in periods:
+        column: dict[int, Decimal] = {}
+        names_by_row: dict[int, list[str]] = {}
+        debit_total = Decimal("0")
+        credit_total = Decimal("0")
+        for acct in period.accounts:
+            name = acct.get("account", "")
+            norm = norm_of.get(name)
+            if norm is None:
+                norm = norm_of[name] = normalize_account_name(name)
+            row = row_of.get(norm)
+            if row is None:
+                row = row_of[norm] = len(latest)
+                latest.append(acct)
+            debit = safe_decimal(acct.get("debit", 0))
+            credit = safe_decimal(acct.get("credit", 0))
+            debit_total += debit
+            credit_total += credit
+            if row in column:
+                column[row] += debit - credit
+                names_by_row[row].append(name)
+            else:
+                column[row] = debit - credit
+                names_by_row[row] = [name]
+                # First row under this norm in the latest period wins,
+                # matching ``match_accounts``' preference for current names.
+                latest[row] = acct
+        columns.append(column)
+        debit_totals.append(debit_total)
+        credit_totals.append(credit_total)
+        for row, names in names_by_row.items():
+            unique_names = sorted(set(names))
+            if len(unique_names) > 1:
+                norm = norm_of[names[0]]
+                warnings.append(
+                    {
+                        "normalized_name": norm,
+                        "original_accounts": unique_names,
+                        "period": period.label,
+                        "description": (
+                            f"Accounts {', '.join(repr(n) for n in unique_names)} share the "
+                            f"normalized name '{norm}' and were combined for comparison purposes"
+                        ),
+                    }
+                )
+
+    balances = np.zeros((len(latest), len(periods)), dtype=np.float64)
+    present = np.zeros((len(latest), len(periods)), dtype=bool)
+    for p, column in enumerate(columns):
+        if column:
+            rows = np.fromiter(column.keys(), dtype=np.intp, count=len(column))
+            balances[rows, p] = np.fromiter((float(v) for v in column.values()), dtype=np.float64, count=len(column))
+            present[rows, p] = True
+    return latest, balances, present, warnings, debit_totals, credit_totals
+
+
+# =============================================================================
+# MOVEMENTS AND SIGNIFICANCE
+# =============================================================================
+
+
+def _movements(
+    balances: np.ndarray,
+    present: np.ndarray,
+    materiality_threshold: float,
+    thresholds: SignificanceThresholds,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized ``calculate_movement`` + ``classify_significance`` for every step."""
+    prior = balances[:, :-1]
+    current = balances[:, 1:]
+    prior_present = present[:, :-1]
+    current_present = present[:, 1:]
+
+    change = current - prior
+    prior_nonzero = np.abs(prior) > NEAR_ZERO
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = np.where(prior_nonzero, change / np.abs(prior) * 100, np.nan)
+
+    is_new = ~prior_present & current_present
+    is_closed = prior_present & ~current_present
+    sign_change = prior_nonzero & (np.abs(current) > NEAR_ZERO) & ((prior > 0) != (current > 0))
+    unchanged = np.abs(change) < 0.01
+
+    codes = np.select(
+        [is_new, is_closed, sign_change, unchanged, change > 0],
+        [_NEW, _CLOSED, _SIGN_CHANGE, _UNCHANGED, _INCREASE],
+        default=_DECREASE,
+    ).astype(np.int8)
+    plain_unchanged = codes == _UNCHANGED
+    change = np.where(plain_unchanged, 0.0, change)
+    percent = np.where(plain_unchanged, 0.0, percent)
+
+    abs_change = np.abs(change)
+    material = (abs_change >= materiality_threshold) if materiality_threshold > 0 else np.zeros_like(unchanged)
+    always_significant = (codes == _NEW) | (codes == _CLOSED) | (codes == _SIGN_CHANGE)
+    with np.errstate(invalid="ignore"):
+        over_percent = ~np.isnan(percent) & (np.abs(percent) >= thresholds.variance_percent)
+    significant = always_significant | (abs_change >= thresholds.variance_amount) | over_percent
+    tiers = np.where(material, _MATERIAL, np.where(significant, _SIGNIFICANT, _MINOR)).astype(np.int8)
+
+    dormant = plain_unchanged & (np.abs(current) < 0.01) & (np.abs(prior) < 0.01)
+
+    absent = ~prior_present & ~current_present
+    codes[absent] = ABSENT
+    tiers[absent] = ABSENT
+    dormant &= ~absent
+    return change, percent, codes, tiers, dormant
+
+
+def _lead_sheet_rollups(accounts: list[PanelAccount], balances: np.ndarray) -> list[PanelLeadSheetRollup]:
+    letters = sorted({a.lead_sheet for a in accounts})
+    if not letters:
+        return []
+    position = {letter: i for i, letter in enumerate(letters)}
+    group = np.fromiter((position[a.lead_sheet] for a in accounts), dtype=np.intp, count=len(accounts))
+    totals = np.zeros((len(letters), balances.shape[1]), dtype=np.float64)
+    np.add.at(totals, group, balances)
+    counts = np.bincount(group, minlength=len(letters))
+    net = totals[:, 1:] - totals[:, :-1]
+    prior = totals[:, :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = np.where(np.abs(prior) > NEAR_ZERO, net / np.abs(prior) * 100, np.nan)
+
+    first_of: dict[str, PanelAccount] = {}
+    for account in accounts:
+        first_of.setdefault(account.lead_sheet, account)
+    return [
+        PanelLeadSheetRollup(
+            lead_sheet=letter,
+            lead_sheet_name=first_of[letter].lead_sheet_name,
+            lead_sheet_category=first_of[letter].lead_sheet_category,
+            account_count=int(counts[i]),
+            totals=totals[i].tolist(),
+            net_changes=net[i].tolist(),
+            change_percents=[None if np.isnan(v) else float(v) for v in percent[i]],
+        )
+        for i, letter in enumerate(letters)
+    ]
+
+
+# =============================================================================
+# MAIN ENTRY POINT
+# =============================================================================
+
+
+def build_multi_period_panel(
+    periods: Sequence[PanelPeriod],
+    materiality_threshold: float = 0.0,
+    thresholds: Optional[SignificanceThresholds] = None,
+) -> PanelResult:
+    """
+    Align N trial balances (oldest first) into an accounts × periods panel.
+
+    Args:
+        periods: Two to ``MAX_PANEL_PERIODS`` periods in chronological order.
+        materiality_threshold: Dollar threshold for material classification.
+        thresholds: Optional override for significance thresholds (defaults
+            10% / $10,000), emitted in ``active_thresholds``.
+
+    Returns:
+        PanelResult with balances, per-step movements and lead sheet rollups.
+    """
+    if not 2 <= len(periods) <= MAX_PANEL_PERIODS:
+        raise PanelInputError(f"A panel needs 2 to {MAX_PANEL_PERIODS} periods (got {len(periods)}).")
+    active_thresholds = thresholds or SignificanceThresholds()
+
+    latest, balances, present, warnings, debit_totals, credit_totals = _align(periods)
+
+    accounts: list[PanelAccount] = []
+    for acct in latest:
+        name = acct.get("account", "")
+        account_type = acct.get("type", "unknown")
+        ls_letter, ls_name, ls_category = _get_lead_sheet_info(name, account_type)
+        accounts.append(
+            PanelAccount(
+                account_name=name,
+                account_type=account_type,
+                lead_sheet=ls_letter,
+                lead_sheet_name=ls_name,
+                lead_sheet_category=ls_category,
+            )
+        )
+
+    change, percent, codes, tiers, dormant = _movements(balances, present, materiality_threshold, active_thresholds)
+
+    return PanelResult(
+        period_labels=[p.label for p in periods],
+        accounts=accounts,
+        balances=balances,
+        present=present,
+        change_amounts=change,
+        change_percents=percent,
+        movement_codes=codes,
+        significance_codes=tiers,
+        dormant=dormant,
+        lead_sheet_rollups=_lead_sheet_rollups(accounts, balances),
+        total_debits=[float(v) for v in debit_totals],
+        total_credits=[float(v) for v in credit_totals],
+        duplicate_account_warnings=warnings,
+        active_thresholds=active_thresholds.to_dict(),
+    )
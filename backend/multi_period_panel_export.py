@@ -0,0 +1,193 @@
+"""CSV and XLSX exports for the multi-period panel.
+
+Both formats carry the same three sections:
+  - Balances     One row per account, one column per period (blank = absent)
+  - Movements    One row per account-step with a movement, long format
+  - Lead Sheets  Lead sheet totals per period, then net change per step
+
+The CSV is yielded in chunks of rows and the XLSX is an openpyxl write-only
+workbook written straight into the caller's spool, so a 36-period panel is
+never rendered into a single in-memory document.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+from collections.abc import Iterator
+from typing import IO, Any
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+
+from excel_generator import ExcelColors
+from multi_period_panel import ABSENT, MOVEMENT_TYPES, SIGNIFICANCE_TIERS, PanelResult
+from shared.filenames import sanitize_csv_value
+
+CURRENCY_FORMAT = '"$"#,##0.00'
+PERCENT_FORMAT = '0.0"%"'
+CSV_CHUNK_ROWS = 2000
+
+MOVEMENT_HEADERS = ["Account", "Lead Sheet", "Step", "Change Amount", "Change %", "Movement Type", "Significance"]
+_MOVEMENT_PERCENT_COLUMNS = frozenset({4})
+
+_HEADER_FILL = PatternFill("solid", fgColor=ExcelColors.OBSIDIAN)
+_HEADER_FONT = Font(bold=True, color=ExcelColors.OATMEAL, size=11)
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+
+def _balance_rows(panel: PanelResult) -> Iterator[list[Any]]:
+    balances = panel.balances.tolist()
+    present = panel.present.tolist()
+    for i, account in enumerate(panel.accounts):
+        yield [
+            account.account_name,
+            f"{account.lead_sheet}: {account.lead_sheet_name}",
+            account.lead_sheet_category,
+            *[round(b, 2) if p else None for b, p in zip(balances[i], present[i])],
+        ]
+
+
+def _movement_rows(panel: PanelResult) -> Iterator[list[Any]]:
+    steps = panel.step_labels
+    changes = panel.change_amounts.tolist()
+    percents = panel.change_percents.tolist()
+    codes = panel.movement_codes.tolist()
+    tiers = panel.significance_codes.tolist()
+    for i, account in enumerate(panel.accounts):
+        for t, step in enumerate(steps):
+            if codes[i][t] == ABSENT:
+                continue
+            yield [
+                account.account_name,
+                account.lead_sheet,
+                step,
+                round(changes[i][t], 2),
+                None if math.isnan(percents[i][t]) else round(percents[i][t], 1),
+                MOVEMENT_TYPES[codes[i][t]].value,
+                SIGNIFICANCE_TIERS[tiers[i][t]].value,
+            ]
+
+
+def _lead_sheet_rows(panel: PanelResult) -> Iterator[list[Any]]:
+    for rollup in panel.lead_sheet_rollups:
+        yield [
+            f"{rollup.lead_sheet}: {rollup.lead_sheet_name}",
+            rollup.lead_sheet_category,
+            rollup.account_count,
+            *[round(v, 2) for v in rollup.totals],
+            *[round(v, 2) for v in rollup.net_changes],
+        ]
+
+
+def _balance_headers(panel: PanelResult) -> list[str]:
+    return ["Account", "Lead Sheet", "Category", *panel.period_labels]
+
+
+def _lead_sheet_headers(panel: PanelResult) -> list[str]:
+    return ["Lead Sheet", "Category", "Accounts", *panel.period_labels, *[f"Change {s}" for s in panel.step_labels]]
+
+
+# =============================================================================
+# CSV
+# =============================================================================
+
+
+def _csv_value(value: Any, percent: bool) -> Any:
+    if isinstance(value, str):
+        return sanitize_csv_value(value)
+    if value is None:
+        return "N/A" if percent else ""
+    if isinstance(value, float):
+        return f"{value:.1f}%" if percent else f"{value:.2f}"
+    return value
+
+
+def _csv_row(row: list[Any], percent_columns: frozenset[int]) -> list[Any]:
+    return [_csv_value(v, idx in percent_columns) for idx, v in enumerate(row)]
+
+
+def iter_panel_csv(panel: PanelResult) -> Iterator[str]:
+    """Yield the panel CSV in chunks of ``CSV_CHUNK_ROWS`` rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    sections: tuple[tuple[str, list[str], Iterator[list[Any]], frozenset[int]], ...] = (
+        ("=== BALANCES ===", _balance_headers(panel), _balance_rows(panel), frozenset()),
+        ("=== MOVEMENTS ===", MOVEMENT_HEADERS, _movement_rows(panel), _MOVEMENT_PERCENT_COLUMNS),
+        ("=== LEAD SHEET ROLLUP ===", _lead_sheet_headers(panel), _lead_sheet_rows(panel), frozenset()),
+    )
+    for index, (title, headers, rows, percent_columns) in enumerate(sections):
+        if index:
+            writer.writerow([])
+        writer.writerow([title])
+        writer.writerow([sanitize_csv_value(h) for h in headers])
+        for n, row in enumerate(rows, start=1):
+            writer.writerow(_csv_row(row, percent_columns))
+            if n % CSV_CHUNK_ROWS == 0:
+                yield flush()
+    yield flush()
+
+
+# =============================================================================
+# XLSX
+# =============================================================================
+
+
+def _header(ws: Any, headers: list[str]) -> list[WriteOnlyCell]:
+    cells = []
+    for text in headers:
+        cell = WriteOnlyCell(ws, value=text)
+        cell.font = _HEADER_FONT
+        cell.fill = _HEADER_FILL
+        cell.alignment = _HEADER_ALIGN
+        cells.append(cell)
+    return cells
+
+
+def _row(ws: Any, values: list[Any], percent_columns: frozenset[int] = frozenset()) -> list[Any]:
+    cells: list[Any] = []
+    for idx, value in enumerate(values):
+        cell = WriteOnlyCell(ws, value=value)
+        if isinstance(value, float):
+            cell.number_format = PERCENT_FORMAT if idx in percent_columns else CURRENCY_FORMAT
+        cells.append(cell)
+    return cells
+
+
+def write_panel_workbook(panel: PanelResult, output: IO[bytes]) -> None:
+    """Render the Balances / Movements / Lead Sheets workbook into ``output``."""
+    wb = Workbook(write_only=True)
+
+    balances_ws: Any = wb.create_sheet("Balances")
+    balances_ws.freeze_panes = "D2"
+    balances_ws.column_dimensions["A"].width = 40
+    balances_ws.column_dimensions["B"].width = 28
+    balances_ws.append(_header(balances_ws, _balance_headers(panel)))
+    for row in _balance_rows(panel):
+        balances_ws.append(_row(balances_ws, row))
+
+    movements_ws: Any = wb.create_sheet("Movements")
+    movements_ws.freeze_panes = "A2"
+    movements_ws.column_dimensions["A"].width = 40
+    movements_ws.column_dimensions["C"].width = 24
+    movements_ws.append(_header(movements_ws, MOVEMENT_HEADERS))
+    for row in _movement_rows(panel):
+        movements_ws.append(_row(movements_ws, row, percent_columns=_MOVEMENT_PERCENT_COLUMNS))
+
+    lead_ws: Any = wb.create_sheet("Lead Sheets")
+    lead_ws.freeze_panes = "D2"
+    lead_ws.column_dimensions["A"].width = 36
+    lead_ws.append(_header(lead_ws, _lead_sheet_headers(panel)))
+    for row in _lead_sheet_rows(panel):
+        lead_ws.append(_row(lead_ws, row))
+
+    wb.save(output)
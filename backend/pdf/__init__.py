@@ -15,6 +15,7 @@ from pdf.components import (
 from pdf.orchestrator import (
     generate_audit_report,
     generate_financial_statements_pdf,
+    write_audit_report,
 )
 from pdf.styles import (
     ClassicalColors,
@@ -33,4 +34,5 @@ __all__ = [
     "generate_audit_report",
     "generate_financial_statements_pdf",
     "generate_reference_number",
+    "write_audit_report",
 ]
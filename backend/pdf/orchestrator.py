@@ -3,12 +3,14 @@ Thin orchestrator that assembles complete PDFs by calling section renderers.
 
 Two public entry points mirror the original pdf_generator API:
   - generate_audit_report()      -- diagnostic intelligence summary
+    (write_audit_report() renders the same document into a caller-supplied
+    stream for the bounded-memory export path)
   - generate_financial_statements_pdf() -- balance sheet / income / cash flow
 """
 
 import io
 from datetime import UTC, datetime
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
@@ -57,6 +59,40 @@ def generate_audit_report(
     """
     Generate a PDF diagnostic report from audit results.
 
+    Renders into an in-memory buffer via ``write_audit_report`` and returns
+    its bytes.
+    """
+    buffer = io.BytesIO()
+    try:
+        write_audit_report(
+            audit_result,
+            buffer,
+            filename,
+            prepared_by=prepared_by,
+            reviewed_by=reviewed_by,
+            workpaper_date=workpaper_date,
+            include_signoff=include_signoff,
+        )
+        pdf_bytes = buffer.getvalue()
+    finally:
+        buffer.close()
+
+    log_secure_operation("pdf_generate_complete", f"Classical PDF generated: {len(pdf_bytes)} bytes")
+    return pdf_bytes
+
+
+def write_audit_report(
+    audit_result: dict[str, Any],
+    output: IO[bytes],
+    filename: str = "diagnostic",
+    prepared_by: Optional[str] = None,
+    reviewed_by: Optional[str] = None,
+    workpaper_date: Optional[str] = None,
+    include_signoff: bool = False,
+) -> None:
+    """
+    Render the PDF diagnostic report into ``output`` (any writable binary stream).
+
     Sprint 53: Added workpaper fields for professional documentation.
     Sprint 7: Signoff deprecated -- gated by include_signoff (default False).
     Sprint 679 (completion): reads the active ``PDFBrandingContext`` via
@@ -67,10 +103,9 @@ def generate_audit_report(
     log_secure_operation("pdf_generator_init", f"Initializing Classical PDF generator for: {filename}")
 
     styles = create_classical_styles()
-    buffer = io.BytesIO()
 
     doc = SimpleDocTemplate(
-        buffer,
+        output,
         pagesize=letter,
         rightMargin=0.75 * inch,
         leftMargin=0.75 * inch,
@@ -154,12 +189,6 @@ def generate_audit_report(
     log_secure_operation("pdf_generate_start", "Starting Classical PDF generation")
     doc.build(story, onFirstPage=_on_first_page, onLaterPages=_on_later_pages)
 
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-
-    log_secure_operation("pdf_generate_complete", f"Classical PDF generated: {len(pdf_bytes)} bytes")
-    return pdf_bytes
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Financial Statements PDF
@@ -15,6 +15,22 @@ from reportlab.platypus import KeepTogether, Paragraph, Spacer, Table, TableStyl
 from pdf.components import DoubleRule, LedgerRule, create_leader_dots
 from pdf.styles import ClassicalColors
 
+# Exception tables longer than this are emitted as consecutive Table
+# flowables of at most this many body rows (header repeated on each). A
+# single 5,000-row Table is re-measured and copied on every page split —
+# quadratic in row count — whereas fixed-size chunks keep each split cheap
+# and let the doc template release rendered chunks as it goes. Even, so the
+# alternating row backgrounds stay continuous across chunk boundaries.
+EXCEPTION_TABLE_CHUNK_ROWS = 100
+
+
+def _chunk_rows(rows: list, size: int = EXCEPTION_TABLE_CHUNK_ROWS) -> list[list]:
+    """Split body rows into consecutive chunks (always at least one, possibly empty)."""
+    if not rows:
+        return [[]]
+    return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+
 # ---------------------------------------------------------------------------
 # Table of Contents
 # ---------------------------------------------------------------------------
@@ -615,6 +631,33 @@ def render_anomaly_details(story: list, styles: dict, audit_result: dict) -> Non
         story.append(_create_ledger_table(styles, coverage_findings, is_material=False))
 
 
+def _ledger_table_style(accent_color: object, *, has_total_row: bool) -> list:
+    """Style commands for one ledger table (or chunk); the TOTAL row only closes the last chunk."""
+    body_end = -2 if has_total_row else -1
+    commands = [
+        ("FONTNAME", (0, 0), (-1, 0), "Times-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 9),
+        ("TEXTCOLOR", (0, 0), (-1, 0), ClassicalColors.OBSIDIAN_DEEP),
+        ("LINEBELOW", (0, 0), (-1, 0), 1, ClassicalColors.OBSIDIAN_DEEP),
+        ("LINEBELOW", (0, 1), (-1, body_end), 0.25, ClassicalColors.LEDGER_RULE),
+    ]
+    if has_total_row:
+        commands += [
+            ("LINEABOVE", (0, -1), (-1, -1), 1, ClassicalColors.OBSIDIAN_600),
+            ("FONTNAME", (-2, -1), (-1, -1), "Times-Bold"),
+        ]
+    commands += [
+        ("LINEBEFORE", (0, 1), (0, -1), 2, accent_color),
+        ("ALIGN", (-1, 0), (-1, -1), "RIGHT"),
+        ("TOPPADDING", (0, 0), (-1, -1), 6),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ("LEFTPADDING", (0, 0), (0, -1), 8),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ROWBACKGROUNDS", (0, 1), (-1, body_end), [ClassicalColors.WHITE, ClassicalColors.OATMEAL_PAPER]),
+    ]
+    return commands
+
+
 def _create_ledger_table(styles: dict, anomalies: list, is_material: bool) -> KeepTogether:
     """Create a ledger-style table with horizontal rules only."""
     from shared.tb_diagnostic_constants import get_concentration_benchmark, get_tb_suggested_procedure
@@ -703,31 +746,21 @@ def _create_ledger_table(styles: dict, anomalies: list, is_material: bool) -> Ke
         ]
     )
 
-    table = Table(data, colWidths=[0.5 * inch, 0.6 * inch, 1.3 * inch, 2.6 * inch, 1.0 * inch], repeatRows=1)
-
-    table_elements = []
-
+    header_row, body_rows, total_row = data[0], data[1:-1], data[-1]
     accent_color = ClassicalColors.CLAY if is_material else ClassicalColors.OBSIDIAN_500
 
-    style_commands = [
-        ("FONTNAME", (0, 0), (-1, 0), "Times-Bold"),
-        ("FONTSIZE", (0, 0), (-1, 0), 9),
-        ("TEXTCOLOR", (0, 0), (-1, 0), ClassicalColors.OBSIDIAN_DEEP),
-        ("LINEBELOW", (0, 0), (-1, 0), 1, ClassicalColors.OBSIDIAN_DEEP),
-        ("LINEBELOW", (0, 1), (-1, -2), 0.25, ClassicalColors.LEDGER_RULE),
-        ("LINEABOVE", (0, -1), (-1, -1), 1, ClassicalColors.OBSIDIAN_600),
-        ("FONTNAME", (-2, -1), (-1, -1), "Times-Bold"),
-        ("LINEBEFORE", (0, 1), (0, -1), 2, accent_color),
-        ("ALIGN", (-1, 0), (-1, -1), "RIGHT"),
-        ("TOPPADDING", (0, 0), (-1, -1), 6),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-        ("LEFTPADDING", (0, 0), (0, -1), 8),
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -2), [ClassicalColors.WHITE, ClassicalColors.OATMEAL_PAPER]),
-    ]
-
-    table.setStyle(TableStyle(style_commands))
-    table_elements.append(table)
+    table_elements = []
+    chunks = _chunk_rows(body_rows)
+    for chunk_idx, chunk in enumerate(chunks):
+        is_last = chunk_idx == len(chunks) - 1
+        chunk_data = [header_row, *chunk, total_row] if is_last else [header_row, *chunk]
+        table = Table(
+            chunk_data,
+            colWidths=[0.5 * inch, 0.6 * inch, 1.3 * inch, 2.6 * inch, 1.0 * inch],
+            repeatRows=1,
+        )
+        table.setStyle(TableStyle(_ledger_table_style(accent_color, has_total_row=is_last)))
+        table_elements.append(table)
 
     table_elements.append(Spacer(1, 2))
     table_elements.append(
@@ -785,7 +818,6 @@ def _create_informational_table(styles: dict, anomalies: list) -> KeepTogether:
             ]
         )
 
-    table = Table(data, colWidths=[0.6 * inch, 1.5 * inch, 3.0 * inch, 0.9 * inch], repeatRows=1)
     style_commands = [
         ("FONTNAME", (0, 0), (-1, 0), "Times-Bold"),
         ("FONTSIZE", (0, 0), (-1, 0), 8),
@@ -799,8 +831,12 @@ def _create_informational_table(styles: dict, anomalies: list) -> KeepTogether:
         ("VALIGN", (0, 0), (-1, -1), "TOP"),
         ("ROWBACKGROUNDS", (0, 1), (-1, -1), [ClassicalColors.WHITE, ClassicalColors.OATMEAL_PAPER]),
     ]
-    table.setStyle(TableStyle(style_commands))
-    return KeepTogether([table])
+    tables = []
+    for chunk in _chunk_rows(data[1:]):
+        table = Table([data[0], *chunk], colWidths=[0.6 * inch, 1.5 * inch, 3.0 * inch, 0.9 * inch], repeatRows=1)
+        table.setStyle(TableStyle(style_commands))
+        tables.append(table)
+    return KeepTogether(tables)
 
 
 # ---------------------------------------------------------------------------
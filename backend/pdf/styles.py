@@ -4,9 +4,11 @@ Classical color palette and paragraph style definitions for Renaissance Ledger P
 All PDF generators share this single source of truth for colors, fonts, and
 ParagraphStyle objects.  The ClassicalColors class extends Oat & Obsidian with
 institutional warmth; create_classical_styles() returns a fully-populated
-ReportLab stylesheet ready for any Paciolus report.
+ReportLab stylesheet ready for any Paciolus report, built once per process.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from reportlab.lib import colors
@@ -94,7 +96,16 @@ def create_classical_styles() -> dict:
     - Section: Times-Bold 12pt, title case
     - Body: Times-Roman 10pt
     - Financial: Courier for tabular figures
+
+    The stylesheet is built once per process and its ParagraphStyle objects
+    are shared by every report; each call returns a fresh dict over them.
+    Callers may add keys but must not mutate a style.
     """
+    return dict(_classical_style_registry())
+
+
+@lru_cache(maxsize=1)
+def _classical_style_registry() -> MappingProxyType:
     styles = getSampleStyleSheet()
 
     # ===================================================================
@@ -306,4 +317,4 @@ def create_classical_styles() -> dict:
         ),
     )
 
-    return {name: styles[name] for name in styles.byName}
+    return MappingProxyType({name: styles[name] for name in styles.byName})
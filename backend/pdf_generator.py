@@ -19,6 +19,7 @@ from pdf import (  # noqa: F401 -- re-exports for backward compatibility
     generate_audit_report,
     generate_financial_statements_pdf,
     generate_reference_number,
+    write_audit_report,
 )
 
 # Keep the class available for any code that references it directly
@@ -35,4 +36,5 @@ __all__ = [
     "generate_audit_report",
     "generate_financial_statements_pdf",
     "generate_reference_number",
+    "write_audit_report",
 ]
@@ -11,18 +11,30 @@ suggested procedures, and data quality scoring.
 Feeds the Statistical Sampling module (Tool 12) for parameter design
 and helps auditors understand balance distribution before planning procedures.
 
-Pure-Python engine (stdlib stats + math). Takes pre-aggregated account_balances
-dict or raw parsed data from parse_uploaded_file().
+Takes pre-aggregated account_balances dict or raw parsed data from
+parse_uploaded_file(). The per-account balances are laid out once as NumPy
+columns; the Gini coefficient, magnitude buckets, top-N, stratification and
+exception flags are each one vectorized pass over them.
+
+PopulationProfileAccumulator is the streaming variant: it folds chunks of
+account balances into running totals, exact top-N candidates and a mergeable
+quantile sketch (shared/quantile_sketch.py), so a population can be profiled
+without holding every balance. Only the median, quartiles and Gini are
+approximate in that mode.
 """
 
 import statistics
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Optional
 
+import numpy as np
+
 from column_detector import detect_columns
-from shared.benford import analyze_benford
+from shared.benford import analyze_benford, analyze_benford_counts, count_digits
 from shared.parsing_helpers import safe_decimal
+from shared.quantile_sketch import DEFAULT_RELATIVE_ACCURACY, QuantileSketch
 
 # ═══════════════════════════════════════════════════════════════
 # Constants
@@ -63,6 +75,9 @@ DOMINANT_ACCOUNT_PCT = 10.0
 # Account type display order
 ACCOUNT_TYPE_ORDER = ["asset", "liability", "equity", "revenue", "expense"]
 
+# Relaxed Benford minimum for population profiles
+BENFORD_MIN_ENTRIES = 10
+
 
 # ═══════════════════════════════════════════════════════════════
 # Dataclasses
@@ -315,6 +330,8 @@ class PopulationProfileReport:
     exception_flags: Optional[ExceptionFlags] = None
     suggested_procedures: list[SuggestedProcedure] = field(default_factory=list)
     data_quality: Optional[DataQualityScore] = None
+    # Set when median/p25/p75/Gini come from a quantile sketch (streaming mode)
+    quantile_relative_error: Optional[float] = None
 
     def to_dict(self) -> dict:
         result = {
@@ -346,15 +363,164 @@ class PopulationProfileReport:
             result["suggested_procedures"] = [p.to_dict() for p in self.suggested_procedures]
         if self.data_quality is not None:
             result["data_quality"] = self.data_quality.to_dict()
+        if self.quantile_relative_error is not None:
+            result["quantile_relative_error"] = self.quantile_relative_error
         return result
 
 
+# ═══════════════════════════════════════════════════════════════
+# Per-account columns
+# ═══════════════════════════════════════════════════════════════
+
+Entry = tuple[str, float, float, str, str]  # (account, net, abs, category, account_number)
+
+
+@dataclass
+class _ProfileArrays:
+    """A population as position-aligned columns.
+
+    Categories are factorized: ``categories`` lists each distinct category
+    string once and ``codes`` maps every account to its index there, so
+    per-category work runs once per distinct category, not per account.
+    """
+
+    accounts: list[str]
+    account_numbers: list[str]
+    categories: list[str]
+    codes: np.ndarray
+    net: np.ndarray
+    abs_balance: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        account_balances: dict[str, dict[str, Any]],
+        classified_accounts: Optional[dict[str, str]] = None,
+        account_numbers: Optional[dict[str, str]] = None,
+    ) -> "_ProfileArrays":
+        classified = classified_accounts or {}
+        numbers = account_numbers or {}
+        accounts = list(account_balances)
+        n = len(accounts)
+        net = np.fromiter(
+            (float(safe_decimal(b["debit"]) - safe_decimal(b["credit"])) for b in account_balances.values()),
+            dtype=np.float64,
+            count=n,
+        )
+        index: dict[str, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(classified.get(acct, "Unknown"), len(index)) for acct in accounts),
+            dtype=np.int64,
+            count=n,
+        )
+        return cls(
+            accounts=accounts,
+            account_numbers=[numbers.get(acct, "") for acct in accounts],
+            categories=list(index),
+            codes=codes,
+            net=net,
+            abs_balance=np.abs(net),
+        )
+
+    @classmethod
+    def from_entries(cls, entries: list[Entry]) -> "_ProfileArrays":
+        index: dict[str, int] = {}
+        codes = [index.setdefault(e[3], len(index)) for e in entries]
+        return cls(
+            accounts=[e[0] for e in entries],
+            account_numbers=[e[4] for e in entries],
+            categories=list(index),
+            codes=np.asarray(codes, dtype=np.int64),
+            net=np.asarray([e[1] for e in entries], dtype=np.float64),
+            abs_balance=np.asarray([e[2] for e in entries], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def per_category(self, values: Optional[np.ndarray] = None) -> np.ndarray:
+        """Count (or sum ``values``) per distinct category, indexed like ``categories``."""
+        return np.bincount(self.codes, weights=values, minlength=len(self.categories))
+
+
+def _as_arrays(population: "_ProfileArrays | list[Entry]") -> _ProfileArrays:
+    return population if isinstance(population, _ProfileArrays) else _ProfileArrays.from_entries(population)
+
+
+def _normalize_type(category: str) -> Optional[str]:
+    """The standard account type a category string names, if any."""
+    cat_lower = category.lower() if category else "unknown"
+    for valid in ACCOUNT_TYPE_ORDER:
+        if valid in cat_lower:
+            return valid
+    return None
+
+
+def _top_indices(values: np.ndarray, k: int, tiebreak: Optional[np.ndarray] = None) -> np.ndarray:
+    """Indices of the ``k`` largest values, largest first.
+
+    Equal values keep ascending ``tiebreak`` order (position by default), the
+    order a stable descending sort gives — including for ties straddling the
+    k-th place, which ``argpartition`` alone would pick arbitrarily.
+    """
+    n = values.size
+    if tiebreak is None:
+        tiebreak = np.arange(n)
+    if k <= 0 or n == 0:
+        return np.zeros(0, dtype=np.int64)
+    if n > k:
+        kth = values[np.argpartition(values, n - k)[n - k]]
+        above = np.flatnonzero(values > kth)
+        ties = np.flatnonzero(values == kth)
+        ties = ties[np.argsort(tiebreak[ties], kind="stable")][: k - above.size]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(n)
+    return candidates[np.lexsort((tiebreak[candidates], -values[candidates]))]
+
+
+def _magnitude_buckets(abs_balance: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-bucket (count, sum) over MAGNITUDE_BUCKETS in one pass."""
+    uppers = np.array([upper for _label, _lower, upper in MAGNITUDE_BUCKETS[:-1]])
+    slots = np.searchsorted(uppers, abs_balance, side="right")
+    return (
+        np.bincount(slots, minlength=len(MAGNITUDE_BUCKETS)),
+        np.bincount(slots, weights=abs_balance, minlength=len(MAGNITUDE_BUCKETS)),
+    )
+
+
+def _bucket_breakdowns(counts: np.ndarray, sums: np.ndarray, n: int) -> list[BucketBreakdown]:
+    return [
+        BucketBreakdown(
+            label=label,
+            lower=lower,
+            upper=upper,
+            count=int(counts[i]),
+            sum_abs=float(sums[i]),
+            percent_count=(int(counts[i]) / n * 100) if n > 0 else 0.0,
+        )
+        for i, (label, lower, upper) in enumerate(MAGNITUDE_BUCKETS)
+    ]
+
+
+def _exclusive_quartiles(sorted_values: np.ndarray) -> tuple[float, float]:
+    """P25 and P75 exactly as ``statistics.quantiles(n=4)`` (exclusive method)."""
+    ld = sorted_values.size
+    m = ld + 1
+    result = []
+    for i in (1, 3):
+        j = min(max(i * m // 4, 1), ld - 1)
+        delta = i * m - j * 4
+        result.append(float((sorted_values[j - 1] * (4 - delta) + sorted_values[j] * delta) / 4))
+    return result[0], result[1]
+
+
 # ═══════════════════════════════════════════════════════════════
 # Helper: Gini coefficient
 # ═══════════════════════════════════════════════════════════════
 
 
-def _compute_gini(sorted_values: list[float]) -> float:
+def _compute_gini(sorted_values: "list[float] | np.ndarray") -> float:
     """Compute Gini coefficient from already-sorted non-negative values.
 
     Uses the standard formula:
@@ -363,17 +529,17 @@ def _compute_gini(sorted_values: list[float]) -> float:
 
     Returns 0.0 for empty or single-element lists.
     """
-    n = len(sorted_values)
+    values = np.asarray(sorted_values, dtype=np.float64)
+    n = values.size
     if n < 2:
         return 0.0
 
-    dec_values = [Decimal(str(v)) if isinstance(v, float) else v for v in sorted_values]
-    total = sum(dec_values, Decimal("0"))
+    total = values.sum()
     if total == 0:
         return 0.0
 
-    weighted_sum = sum(((i + 1) * v for i, v in enumerate(dec_values)), Decimal("0"))
-    return float(Decimal(2) * weighted_sum / (n * total) - Decimal(n + 1) / n)
+    weighted_sum = np.dot(np.arange(1, n + 1, dtype=np.float64), values)
+    return float(2.0 * weighted_sum / (n * total) - (n + 1) / n)
 
 
 def _interpret_gini(gini: float) -> str:
@@ -390,66 +556,55 @@ def _interpret_gini(gini: float) -> str:
 
 
 def _compute_account_type_stratification(
-    entries: list[tuple[str, float, float, str, str]],
+    population: "_ProfileArrays | list[Entry]",
     total_abs: float,
 ) -> list[AccountTypeStratum]:
     """Compute per-account-type count, balance, and percentages.
 
     Args:
-        entries: List of (account, net_balance, abs_balance, category, account_number)
+        population: Per-account columns, or a list of
+            (account, net_balance, abs_balance, category, account_number).
         total_abs: Total absolute balance of all accounts.
 
     Returns:
         List of AccountTypeStratum, one per account type present.
     """
-    type_data: dict[str, dict] = {}
-    n_total = len(entries)
-    total_abs_dec = safe_decimal(total_abs)
-
-    for _acct, _net, abs_bal, category, _acct_num in entries:
-        cat_lower = category.lower() if category else "unknown"
-        # Normalize to standard types
-        for valid in ACCOUNT_TYPE_ORDER:
-            if valid in cat_lower:
-                cat_lower = valid
-                break
-
-        if cat_lower not in type_data:
-            type_data[cat_lower] = {"count": 0, "total_balance": Decimal("0")}
-        type_data[cat_lower]["count"] += 1
-        type_data[cat_lower]["total_balance"] += safe_decimal(abs_bal)
-
-    strata: list[AccountTypeStratum] = []
-    for acct_type in ACCOUNT_TYPE_ORDER:
-        data = type_data.get(acct_type)
-        if data is None:
-            continue
-        strata.append(
-            AccountTypeStratum(
-                account_type=acct_type.capitalize(),
-                count=data["count"],
-                pct_of_accounts=round(data["count"] / n_total * 100, 2) if n_total > 0 else 0.0,
-                total_balance=float(data["total_balance"]),
-                pct_of_population=float(round(data["total_balance"] / total_abs_dec * 100, 2))
-                if total_abs_dec > 0
-                else 0.0,
-            )
+    arrays = _as_arrays(population)
+    return _stratify(arrays.categories, arrays.per_category(), arrays.per_category(arrays.abs_balance), total_abs)
+
+
+def _stratify(
+    categories: list[str],
+    counts: "np.ndarray | list[int]",
+    sums: "np.ndarray | list[float]",
+    total_abs: float,
+) -> list[AccountTypeStratum]:
+    """Stratify from per-category counts and absolute-balance sums."""
+    type_data: dict[str, list] = {}
+    for category, count, total in zip(categories, counts, sums, strict=True):
+        # Normalize to standard types; other non-standard categories are counted but not reported
+        key = _normalize_type(category) or (category.lower() if category else "unknown")
+        data = type_data.setdefault(key, [0, 0.0])
+        data[0] += int(count)
+        data[1] += float(total)
+    n_total = sum(data[0] for data in type_data.values())
+
+    def stratum(label: str, data: list) -> AccountTypeStratum:
+        count, total_balance = data
+        return AccountTypeStratum(
+            account_type=label,
+            count=count,
+            pct_of_accounts=round(count / n_total * 100, 2) if n_total > 0 else 0.0,
+            total_balance=total_balance,
+            pct_of_population=round(total_balance / total_abs * 100, 2) if total_abs > 0 else 0.0,
         )
 
+    strata = [stratum(t.capitalize(), type_data[t]) for t in ACCOUNT_TYPE_ORDER if t in type_data]
+
     # Add "Unknown" if present
     unknown = type_data.get("unknown")
-    if unknown and unknown["count"] > 0:
-        strata.append(
-            AccountTypeStratum(
-                account_type="Unknown",
-                count=unknown["count"],
-                pct_of_accounts=round(unknown["count"] / n_total * 100, 2) if n_total > 0 else 0.0,
-                total_balance=float(unknown["total_balance"]),
-                pct_of_population=float(round(unknown["total_balance"] / total_abs_dec * 100, 2))
-                if total_abs_dec > 0
-                else 0.0,
-            )
-        )
+    if unknown and unknown[0] > 0:
+        strata.append(stratum("Unknown", unknown))
 
     return strata
 
@@ -460,84 +615,112 @@ def _compute_account_type_stratification(
 
 
 def _compute_exception_flags(
-    entries: list[tuple[str, float, float, str, str]],
+    population: "_ProfileArrays | list[Entry]",
     total_abs: float,
 ) -> ExceptionFlags:
     """Compute normal balance violations, zero/near-zero, and dominant accounts.
 
     Args:
-        entries: List of (account, net_balance, abs_balance, category, account_number)
+        population: Per-account columns, or a list of
+            (account, net_balance, abs_balance, category, account_number).
         total_abs: Total absolute balance of all accounts.
     """
+    arrays = _as_arrays(population)
     flags = ExceptionFlags()
+    _append_balance_flags(arrays, flags)
+    if total_abs > 0:
+        dominant = np.flatnonzero(arrays.abs_balance / total_abs * 100 > DOMINANT_ACCOUNT_PCT)
+        flags.dominant_accounts = _dominant_flags(
+            [
+                (arrays.accounts[i], arrays.account_numbers[i], float(arrays.net[i]), float(arrays.abs_balance[i]))
+                for i in dominant
+            ],
+            total_abs,
+        )
+    return flags
 
-    for acct, net, abs_bal, category, acct_num in entries:
-        cat_lower = category.lower() if category else "unknown"
-        # Normalize category
-        normalized = "unknown"
-        for valid in ACCOUNT_TYPE_ORDER:
-            if valid in cat_lower:
-                normalized = valid
-                break
-
-        # V-A: Normal balance violations
-        expected_sign = NORMAL_BALANCE_SIGN.get(normalized)
-        if expected_sign and net != 0.0:
-            actual_sign = "debit" if net > 0 else "credit"
-            if actual_sign != expected_sign:
-                flags.normal_balance_violations.append(
-                    NormalBalanceViolation(
-                        account_number=acct_num,
-                        account=acct,
-                        account_type=normalized.capitalize(),
-                        expected=expected_sign.capitalize(),
-                        actual=actual_sign.capitalize(),
-                        balance=net,
-                    )
-                )
 
-        # V-B: Zero and near-zero balances
-        if abs_bal == 0.0:
-            flags.zero_balance_accounts.append(
+def _type_labels(categories: list[str]) -> list[str]:
+    return [(_normalize_type(c) or "unknown").capitalize() for c in categories]
+
+
+def _append_balance_flags(arrays: _ProfileArrays, flags: ExceptionFlags) -> None:
+    """Append V-A normal balance violations and V-B zero/near-zero accounts."""
+    labels = _type_labels(arrays.categories)
+    net, abs_balance, codes = arrays.net, arrays.abs_balance, arrays.codes
+
+    # V-A: Normal balance violations — +1 debit-normal, -1 credit-normal, 0 unknown
+    expected = np.array(
+        [
+            {"debit": 1, "credit": -1}.get(NORMAL_BALANCE_SIGN.get(_normalize_type(c) or "", ""), 0)
+            for c in arrays.categories
+        ],
+        dtype=np.int8,
+    )
+    account_expected = expected[codes] if codes.size else np.zeros(0, dtype=np.int8)
+    violations = np.flatnonzero((account_expected != 0) & (net != 0.0) & (np.sign(net) != account_expected))
+    # Pull the flagged rows out as Python scalars once; indexing NumPy arrays
+    # element by element in the loops below would dominate on large populations.
+    for i, balance, code, sign in zip(
+        violations.tolist(),
+        net[violations].tolist(),
+        codes[violations].tolist(),
+        account_expected[violations].tolist(),
+        strict=True,
+    ):
+        flags.normal_balance_violations.append(
+            NormalBalanceViolation(
+                account_number=arrays.account_numbers[i],
+                account=arrays.accounts[i],
+                account_type=labels[code],
+                expected="Debit" if sign > 0 else "Credit",
+                actual="Debit" if balance > 0 else "Credit",
+                balance=balance,
+            )
+        )
+
+    # V-B: Zero and near-zero balances
+    for target, mask, is_zero in (
+        (flags.zero_balance_accounts, abs_balance == 0.0, True),
+        (flags.near_zero_accounts, (abs_balance > 0.0) & (abs_balance <= NEAR_ZERO_THRESHOLD), False),
+    ):
+        flagged = np.flatnonzero(mask)
+        for i, balance, code in zip(flagged.tolist(), net[flagged].tolist(), codes[flagged].tolist(), strict=True):
+            target.append(
                 ZeroBalanceAccount(
-                    account_number=acct_num,
-                    account=acct,
-                    account_type=normalized.capitalize(),
-                    balance=net,
-                    is_zero=True,
+                    account_number=arrays.account_numbers[i],
+                    account=arrays.accounts[i],
+                    account_type=labels[code],
+                    balance=balance,
+                    is_zero=is_zero,
                 )
             )
-        elif abs_bal <= NEAR_ZERO_THRESHOLD:
-            flags.near_zero_accounts.append(
-                ZeroBalanceAccount(
-                    account_number=acct_num,
+
+
+def _dominant_flags(
+    candidates: list[tuple[str, str, float, float]],
+    total_abs: float,
+) -> list[DominantAccountFlag]:
+    """V-C: dominant account risk flags from (account, number, net, abs) candidates."""
+    flags: list[DominantAccountFlag] = []
+    for acct, acct_num, net, abs_bal in candidates:
+        pct = abs_bal / total_abs * 100
+        if pct > DOMINANT_ACCOUNT_PCT:
+            flags.append(
+                DominantAccountFlag(
                     account=acct,
-                    account_type=normalized.capitalize(),
+                    account_number=acct_num,
                     balance=net,
-                    is_zero=False,
+                    pct_of_total=pct,
+                    risk_note=(
+                        f"Account represents {pct:.1f}% of total population value. "
+                        "Apply substantive procedures and obtain management representation."
+                    ),
                 )
             )
 
-        # V-C: Dominant account risk flags
-        if total_abs > 0:
-            pct = abs_bal / total_abs * 100
-            if pct > DOMINANT_ACCOUNT_PCT:
-                flags.dominant_accounts.append(
-                    DominantAccountFlag(
-                        account=acct,
-                        account_number=acct_num,
-                        balance=net,
-                        pct_of_total=pct,
-                        risk_note=(
-                            f"Account represents {pct:.1f}% of total population value. "
-                            "Apply substantive procedures and obtain management representation."
-                        ),
-                    )
-                )
-
     # Sort dominant accounts by pct descending
-    flags.dominant_accounts.sort(key=lambda d: d.pct_of_total, reverse=True)
-
+    flags.sort(key=lambda d: d.pct_of_total, reverse=True)
     return flags
 
 
@@ -661,7 +844,7 @@ def _generate_suggested_procedures(
 
 
 def _compute_data_quality(
-    entries: list[tuple[str, float, float, str, str]],
+    population: "_ProfileArrays | list[Entry]",
     exception_flags: ExceptionFlags,
     missing_names: int = 0,
     missing_balances: int = 0,
@@ -673,7 +856,32 @@ def _compute_data_quality(
     - Normal balance violation rate: Penalize for balance sign violations
     - Zero-balance account rate: Penalize for zero-balance accounts
     """
-    n = len(entries)
+    arrays = _as_arrays(population)
+    return _data_quality(
+        len(arrays),
+        _classified_count(arrays.categories, arrays.per_category()),
+        exception_flags,
+        missing_names,
+        missing_balances,
+    )
+
+
+def _classified_count(categories: list[str], counts: "np.ndarray | list[int]") -> int:
+    """Accounts whose category is exactly one of the normal-balance types."""
+    return sum(
+        int(count)
+        for category, count in zip(categories, counts, strict=True)
+        if category.lower() in NORMAL_BALANCE_SIGN
+    )
+
+
+def _data_quality(
+    n: int,
+    classified: int,
+    exception_flags: ExceptionFlags,
+    missing_names: int,
+    missing_balances: int,
+) -> DataQualityScore:
     if n == 0:
         return DataQualityScore(
             overall_score=0.0,
@@ -688,7 +896,6 @@ def _compute_data_quality(
     completeness = max(0.0, (total_fields - missing) / total_fields * 100) if total_fields > 0 else 100.0
 
     # Violation rate (35% weight): normal balance violations as % of classified accounts
-    classified = sum(1 for _, _, _, cat, _ in entries if cat.lower() in NORMAL_BALANCE_SIGN)
     violation_count = len(exception_flags.normal_balance_violations)
     if classified > 0:
         violation_rate = violation_count / classified
@@ -711,6 +918,26 @@ def _compute_data_quality(
     )
 
 
+def _top_account(
+    rank: int,
+    account: str,
+    category: str,
+    net: float,
+    abs_bal: float,
+    account_number: str,
+    total_abs: float,
+) -> TopAccount:
+    return TopAccount(
+        rank=rank,
+        account=account,
+        category=category,
+        net_balance=net,
+        abs_balance=abs_bal,
+        percent_of_total=float(abs_bal / total_abs * 100) if total_abs > 0 else 0.0,
+        account_number=account_number,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════
 # Core computation
 # ═══════════════════════════════════════════════════════════════
@@ -752,103 +979,75 @@ def compute_population_profile(
             gini_interpretation="Low",
         )
 
-    # Build list of (account, net_balance, abs_balance, category, account_number)
-    entries: list[tuple[str, float, float, str, str]] = []
-    for acct, bals in account_balances.items():
-        net = safe_decimal(bals["debit"]) - safe_decimal(bals["credit"])
-        abs_bal = abs(net)
-        category = (classified_accounts or {}).get(acct, "Unknown")
-        acct_num = (account_numbers or {}).get(acct, "")
-        entries.append((acct, float(net), float(abs_bal), category, acct_num))
-
-    abs_values = [e[2] for e in entries]
-    n = len(abs_values)
+    arrays = _ProfileArrays.build(account_balances, classified_accounts, account_numbers)
+    abs_values = arrays.abs_balance
+    n = len(arrays)
+    sorted_abs = np.sort(abs_values)
 
     # Descriptive statistics
-    total_abs = sum(abs_values)
+    total_abs = float(abs_values.sum())
     mean_abs = total_abs / n if n > 0 else 0.0
-    median_abs = statistics.median(abs_values)
+    half = n // 2
+    median_abs = float(sorted_abs[half]) if n % 2 else float((sorted_abs[half - 1] + sorted_abs[half]) / 2)
 
     if n >= 2:
-        std_dev = statistics.stdev(abs_values)
+        std_dev = float(abs_values.std(ddof=1))
     else:
         std_dev = 0.0
 
-    min_abs = min(abs_values)
-    max_abs = max(abs_values)
+    min_abs = float(sorted_abs[0])
+    max_abs = float(sorted_abs[-1])
 
     # Percentiles (P25, P75)
     if n >= 2:
-        quantiles = statistics.quantiles(abs_values, n=4)
-        p25 = quantiles[0]
-        p75 = quantiles[2]
+        p25, p75 = _exclusive_quartiles(sorted_abs)
     else:
-        p25 = abs_values[0] if n == 1 else 0.0
-        p75 = abs_values[0] if n == 1 else 0.0
+        p25 = p75 = min_abs
 
     # Gini coefficient
-    sorted_abs = sorted(abs_values)
     gini = _compute_gini(sorted_abs)
     gini_interp = _interpret_gini(gini)
 
     # Magnitude buckets
-    buckets: list[BucketBreakdown] = []
-    for label, lower, upper in MAGNITUDE_BUCKETS:
-        bucket_items = [v for v in abs_values if lower <= v < upper]
-        count = len(bucket_items)
-        sum_abs_bucket = sum(bucket_items)
-        pct = (count / n * 100) if n > 0 else 0.0
-        buckets.append(
-            BucketBreakdown(
-                label=label,
-                lower=lower,
-                upper=upper,
-                count=count,
-                sum_abs=sum_abs_bucket,
-                percent_count=pct,
-            )
-        )
+    buckets = _bucket_breakdowns(*_magnitude_buckets(abs_values), n)
 
     # Top-N accounts by absolute balance
-    sorted_entries = sorted(entries, key=lambda e: e[2], reverse=True)
-    top_accounts: list[TopAccount] = []
-    for rank_idx, (acct_name, net_bal, abs_bal_f, cat, acct_num) in enumerate(sorted_entries[:top_n]):
-        pct_of_total = (abs_bal_f / total_abs * 100) if total_abs > 0 else 0.0
-        top_accounts.append(
-            TopAccount(
-                rank=rank_idx + 1,
-                account=acct_name,
-                category=cat,
-                net_balance=net_bal,
-                abs_balance=abs_bal_f,
-                percent_of_total=float(pct_of_total),
-                account_number=acct_num,
-            )
+    top_accounts = [
+        _top_account(
+            rank_idx + 1,
+            arrays.accounts[i],
+            arrays.categories[arrays.codes[i]],
+            float(arrays.net[i]),
+            float(abs_values[i]),
+            arrays.account_numbers[i],
+            total_abs,
         )
+        for rank_idx, i in enumerate(_top_indices(abs_values, top_n))
+    ]
 
     # Account type stratification
-    stratification = _compute_account_type_stratification(entries, total_abs)
+    stratification = _compute_account_type_stratification(arrays, total_abs)
 
     # Benford's Law analysis (use shared module with relaxed prechecks for populations)
-    net_values = [abs(e[1]) for e in entries if e[1] != 0.0]
+    net_values = abs_values[arrays.net != 0.0].tolist()
     benford_result = None
     if net_values:
         benford = analyze_benford(
             net_values,
             total_count=n,
-            min_entries=10,  # Relaxed for population profiles
+            min_entries=BENFORD_MIN_ENTRIES,
             min_amount=0.01,
         )
         benford_result = benford.to_dict()
 
     # Exception flags
-    exception_flags = _compute_exception_flags(entries, total_abs)
+    exception_flags = _compute_exception_flags(arrays, total_abs)
 
     # Suggested procedures
     procedures = _generate_suggested_procedures(gini, gini_interp, top_accounts, exception_flags, benford_result)
 
     # Data quality score (BUG-006: pass missing field counts for accurate completeness)
-    data_quality = _compute_data_quality(entries, exception_flags, missing_names, missing_balances)
+    data_quality = _compute_data_quality(arrays, exception_flags, missing_names, missing_balances)
 
     return PopulationProfileReport(
         account_count=n,
@@ -872,6 +1071,231 @@ def compute_population_profile(
     )
 
 
+# ═══════════════════════════════════════════════════════════════
+# Streaming computation
+# ═══════════════════════════════════════════════════════════════
+
+
+class PopulationProfileAccumulator:
+    """Population profile over chunks of account balances.
+
+    Each ``add`` folds one chunk ({account: {"debit", "credit"}}, the
+    ``compute_population_profile`` input shape) into running state; chunks
+    must hold distinct accounts, i.e. balances already aggregated per account.
+    Accumulators built over separate chunk streams can be combined with
+    ``merge`` (the argument's chunks count as arriving after this one's).
+
+    Exact: count, total, mean, std dev, min/max, magnitude buckets, top-N,
+    stratification, exception flags, Benford and data quality. Median, P25,
+    P75 and Gini come from a QuantileSketch within ``relative_accuracy``.
+    """
+
+    def __init__(self, top_n: int = 10, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        self.top_n = top_n
+        self._sketch = QuantileSketch(relative_accuracy)
+        self._count = 0
+        self._total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0  # sum of squared deviations from the mean (Chan et al. merge)
+        self._bucket_counts = np.zeros(len(MAGNITUDE_BUCKETS), dtype=np.int64)
+        self._bucket_sums = np.zeros(len(MAGNITUDE_BUCKETS), dtype=np.float64)
+        self._category_counts: dict[str, list] = {}  # category -> [count, abs sum]
+        self._flags = ExceptionFlags()
+        # Top-N candidates. Dominant accounts each exceed 10% of the total, so
+        # there are at most nine and they are always among the nine largest.
+        self._keep = max(top_n, int(100 // DOMINANT_ACCOUNT_PCT))
+        self._top_abs = np.zeros(0, dtype=np.float64)
+        self._top_seq = np.zeros(0, dtype=np.int64)
+        self._top_rows: list[tuple[str, str, float, str]] = []  # (account, category, net, account_number)
+        self._benford_counts = dict.fromkeys(range(1, 10), 0)
+        self._benford_eligible = 0
+        self._benford_min = float("inf")
+        self._benford_max = 0.0
+
+    def add(
+        self,
+        account_balances: dict[str, dict[str, Any]],
+        classified_accounts: Optional[dict[str, str]] = None,
+        account_numbers: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Fold one chunk of per-account balances into the profile."""
+        if account_balances:
+            self._add_arrays(_ProfileArrays.build(account_balances, classified_accounts, account_numbers))
+
+    def _add_arrays(self, arrays: _ProfileArrays) -> None:
+        abs_values = arrays.abs_balance
+        n = len(arrays)
+        chunk_total = float(abs_values.sum())
+        chunk_mean = chunk_total / n
+        chunk_m2 = float(np.square(abs_values - chunk_mean).sum())
+        self._merge_moments(n, chunk_total, chunk_mean, chunk_m2)
+        self._sketch.add(abs_values)
+
+        counts, sums = _magnitude_buckets(abs_values)
+        self._bucket_counts += counts
+        self._bucket_sums += sums
+
+        for category, count, total in zip(
+            arrays.categories, arrays.per_category(), arrays.per_category(abs_values), strict=True
+        ):
+            entry = self._category_counts.setdefault(category, [0, 0.0])
+            entry[0] += int(count)
+            entry[1] += float(total)
+
+        _append_balance_flags(arrays, self._flags)
+
+        top = _top_indices(abs_values, self._keep)
+        self._merge_top(
+            abs_values[top],
+            self._count - n + top,
+            [
+                (
+                    arrays.accounts[i],
+                    arrays.categories[arrays.codes[i]],
+                    float(arrays.net[i]),
+                    arrays.account_numbers[i],
+                )
+                for i in top
+            ],
+        )
+
+        nonzero = abs_values[arrays.net != 0.0]
+        if nonzero.size:
+            for digit, count in count_digits(nonzero.tolist()).items():
+                self._benford_counts[digit] += count
+            self._benford_eligible += int(nonzero.size)
+            self._benford_min = min(self._benford_min, float(nonzero.min()))
+            self._benford_max = max(self._benford_max, float(nonzero.max()))
+
+    def _merge_moments(self, n: int, total: float, mean: float, m2: float) -> None:
+        combined = self._count + n
+        delta = mean - self._mean
+        self._m2 += m2 + delta * delta * self._count * n / combined
+        self._mean += delta * n / combined
+        self._count = combined
+        self._total += total
+
+    def _merge_top(self, abs_values: np.ndarray, seq: np.ndarray, rows: list[tuple[str, str, float, str]]) -> None:
+        all_abs = np.concatenate([self._top_abs, abs_values])
+        all_seq = np.concatenate([self._top_seq, seq])
+        all_rows = self._top_rows + rows
+        keep = _top_indices(all_abs, self._keep, tiebreak=all_seq)
+        self._top_abs, self._top_seq = all_abs[keep], all_seq[keep]
+        self._top_rows = [all_rows[i] for i in keep]
+
+    def merge(self, other: "PopulationProfileAccumulator") -> None:
+        """Fold another accumulator's chunks into this one."""
+        if other._count == 0:
+            return
+        offset = self._count
+        self._merge_moments(other._count, other._total, other._mean, other._m2)
+        self._sketch.merge(other._sketch)
+        self._bucket_counts += other._bucket_counts
+        self._bucket_sums += other._bucket_sums
+        for category, (count, total) in other._category_counts.items():
+            entry = self._category_counts.setdefault(category, [0, 0.0])
+            entry[0] += count
+            entry[1] += total
+        self._flags.normal_balance_violations.extend(other._flags.normal_balance_violations)
+        self._flags.zero_balance_accounts.extend(other._flags.zero_balance_accounts)
+        self._flags.near_zero_accounts.extend(other._flags.near_zero_accounts)
+        self._merge_top(other._top_abs, other._top_seq + offset, other._top_rows)
+        for digit, count in other._benford_counts.items():
+            self._benford_counts[digit] += count
+        self._benford_eligible += other._benford_eligible
+        self._benford_min = min(self._benford_min, other._benford_min)
+        self._benford_max = max(self._benford_max, other._benford_max)
+
+    def finalize(self, missing_names: int = 0, missing_balances: int = 0) -> PopulationProfileReport:
+        """Build the report from everything added so far."""
+        n = self._count
+        if n == 0:
+            return compute_population_profile({})
+        total_abs = self._total
+        sketch = self._sketch
+
+        gini = sketch.gini()
+        gini_interp = _interpret_gini(gini)
+        top_accounts = [
+            _top_account(rank + 1, acct, category, net, float(abs_bal), acct_num, total_abs)
+            for rank, ((acct, category, net, acct_num), abs_bal) in enumerate(
+                zip(self._top_rows[: self.top_n], self._top_abs[: self.top_n], strict=True)
+            )
+        ]
+
+        categories = list(self._category_counts)
+        counts = [self._category_counts[c][0] for c in categories]
+        sums = [self._category_counts[c][1] for c in categories]
+
+        flags = ExceptionFlags(
+            normal_balance_violations=list(self._flags.normal_balance_violations),
+            zero_balance_accounts=list(self._flags.zero_balance_accounts),
+            near_zero_accounts=list(self._flags.near_zero_accounts),
+        )
+        if total_abs > 0:
+            flags.dominant_accounts = _dominant_flags(
+                [
+                    (acct, acct_num, net, float(abs_bal))
+                    for (acct, _c, net, acct_num), abs_bal in zip(self._top_rows, self._top_abs, strict=True)
+                ],
+                total_abs,
+            )
+
+        benford_result = None
+        if self._benford_eligible:
+            benford_result = analyze_benford_counts(
+                dict(self._benford_counts),
+                eligible_count=self._benford_eligible,
+                min_amount_seen=self._benford_min,
+                max_amount_seen=self._benford_max,
+                total_count=n,
+                min_entries=BENFORD_MIN_ENTRIES,
+            ).to_dict()
+
+        return PopulationProfileReport(
+            account_count=n,
+            total_abs_balance=total_abs,
+            mean_abs_balance=total_abs / n,
+            median_abs_balance=sketch.quantile(0.5),
+            std_dev_abs_balance=float(np.sqrt(self._m2 / (n - 1))) if n >= 2 else 0.0,
+            min_abs_balance=sketch.min,
+            max_abs_balance=sketch.max,
+            p25=sketch.quantile(0.25),
+            p75=sketch.quantile(0.75),
+            gini_coefficient=gini,
+            gini_interpretation=gini_interp,
+            buckets=_bucket_breakdowns(self._bucket_counts, self._bucket_sums, n),
+            top_accounts=top_accounts,
+            account_type_stratification=_stratify(categories, counts, sums, total_abs),
+            benford_analysis=benford_result,
+            exception_flags=flags,
+            suggested_procedures=_generate_suggested_procedures(gini, gini_interp, top_accounts, flags, benford_result),
+            data_quality=_data_quality(
+                n, _classified_count(categories, counts), flags, missing_names, missing_balances
+            ),
+            quantile_relative_error=sketch.relative_accuracy,
+        )
+
+
+def compute_population_profile_streaming(
+    chunks: Iterable[dict[str, dict[str, Any]]],
+    classified_accounts: Optional[dict[str, str]] = None,
+    account_numbers: Optional[dict[str, str]] = None,
+    top_n: int = 10,
+    missing_names: int = 0,
+    missing_balances: int = 0,
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+) -> PopulationProfileReport:
+    """``compute_population_profile`` over an iterable of account-balance chunks.
+
+    See PopulationProfileAccumulator for which statistics are approximate.
+    """
+    accumulator = PopulationProfileAccumulator(top_n=top_n, relative_accuracy=relative_accuracy)
+    for chunk in chunks:
+        accumulator.add(chunk, classified_accounts, account_numbers)
+    return accumulator.finalize(missing_names=missing_names, missing_balances=missing_balances)
+
+
 # ═══════════════════════════════════════════════════════════════
 # Section density computation
 # ═══════════════════════════════════════════════════════════════
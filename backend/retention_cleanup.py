@@ -9,10 +9,21 @@ configured retention window by setting ``archived_at``.
 ZERO-STORAGE NOTE: These tables store only aggregate metadata
 (counts, totals, hashes) — never raw financial data. Retention
 cleanup is a privacy/hygiene measure, not a data-loss risk.
+
+Batched archival: when ``RETENTION_BATCH_SIZE`` > 0 (the default) rows are
+archived in keyset-paginated id ranges with one commit per batch, so the
+first run after enabling a policy never holds row locks on millions of rows
+in one transaction. Progress is durable per batch — an interrupted run, or
+one capped by ``RETENTION_MAX_BATCHES_PER_RUN``, resumes on the next run
+because already-archived rows no longer match ``archived_at IS NULL``.
 """
 
 import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Session
 
@@ -26,24 +37,132 @@ logger = logging.getLogger(__name__)
 # Default: 365 days (1 year).  Override via RETENTION_DAYS env var.
 RETENTION_DAYS = int(_load_optional("RETENTION_DAYS", "365"))
 
+# Rows archived per transaction.  0 (or negative) restores the legacy
+# single unbounded UPDATE.
+RETENTION_BATCH_SIZE = int(_load_optional("RETENTION_BATCH_SIZE", "5000"))
+# Pause between batches so replication / autovacuum can keep up.
+RETENTION_BATCH_SLEEP_MS = int(_load_optional("RETENTION_BATCH_SLEEP_MS", "0"))
+# Upper bound on batches per table per run (0 = unlimited).  The remainder
+# is picked up by the next scheduled run.
+RETENTION_MAX_BATCHES_PER_RUN = int(_load_optional("RETENTION_MAX_BATCHES_PER_RUN", "0"))
 
-def cleanup_expired_activity_logs(db: Session, *, cutoff: datetime | None = None) -> int:
-    """Archive activity_logs older than the retention cutoff (soft-delete).
 
-    Returns the number of rows archived.  Idempotent: repeated calls
-    with the same cutoff archive nothing on second run (already-archived
-    rows are skipped).
+@dataclass(frozen=True)
+class RetentionBatch:
+    """Outcome of one committed archival batch (aggregate metadata only)."""
+
+    table: str
+    batch_number: int
+    rows_archived: int
+    first_id: int
+    last_id: int
+    duration_ms: float
+
+
+BatchCallback = Callable[[RetentionBatch], None]
+
+if TYPE_CHECKING:
+    from models import ActivityLog, DiagnosticSummary
+
+# The soft-deleted tables: both carry ``timestamp`` / ``archived_at`` / ``archive_reason``.
+RetainedModel = type["ActivityLog"] | type["DiagnosticSummary"]
+
+
+def _archive_in_batches(
+    db: Session,
+    model: RetainedModel,
+    cutoff: datetime,
+    *,
+    batch_size: int,
+    sleep_seconds: float = 0.0,
+    max_batches: int = 0,
+    on_batch: BatchCallback | None = None,
+) -> int:
+    """Archive expired rows of ``model`` in ascending id ranges of ``batch_size``.
+
+    Each batch selects the next ``batch_size`` candidate ids after the last
+    one processed (keyset pagination — no OFFSET scans), archives that id
+    range and commits.  Returns the total number of rows archived.
     """
-    from models import ActivityLog
+    table = model.__tablename__
+    expired = (model.timestamp < cutoff, model.archived_at.is_(None))
+    archived_total = 0
+    last_id = 0
+    batch_number = 0
 
-    if cutoff is None:
-        cutoff = datetime.now(UTC) - timedelta(days=RETENTION_DAYS)
+    while not max_batches or batch_number < max_batches:
+        t0 = time.perf_counter()
+        ids = [
+            row_id
+            for (row_id,) in db.query(model.id)
+            .filter(*expired, model.id > last_id)
+            .order_by(model.id)
+            .limit(batch_size)
+        ]
+        if not ids:
+            break
+
+        archived = (
+            db.query(model)
+            .filter(*expired, model.id >= ids[0], model.id <= ids[-1])
+            .update(
+                {
+                    "archived_at": cutoff,
+                    "archive_reason": "retention_policy",
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+
+        batch_number += 1
+        archived_total += archived
+        last_id = ids[-1]
+        if on_batch is not None:
+            on_batch(
+                RetentionBatch(
+                    table=table,
+                    batch_number=batch_number,
+                    rows_archived=archived,
+                    first_id=ids[0],
+                    last_id=last_id,
+                    duration_ms=(time.perf_counter() - t0) * 1000,
+                )
+            )
+        if len(ids) < batch_size:
+            break
+        if sleep_seconds > 0:
+            time.sleep(sleep_seconds)
+
+    return archived_total
+
+
+def _archive_expired(
+    db: Session,
+    model: RetainedModel,
+    cutoff: datetime,
+    *,
+    batch_size: int | None,
+    on_batch: BatchCallback | None,
+) -> int:
+    if batch_size is None:
+        batch_size = RETENTION_BATCH_SIZE
+    if batch_size > 0:
+        return _archive_in_batches(
+            db,
+            model,
+            cutoff,
+            batch_size=batch_size,
+            sleep_seconds=RETENTION_BATCH_SLEEP_MS / 1000,
+            max_batches=RETENTION_MAX_BATCHES_PER_RUN,
+            on_batch=on_batch,
+        )
 
     archived = (
-        db.query(ActivityLog)
+        db.query(model)
         .filter(
-            ActivityLog.timestamp < cutoff,
-            ActivityLog.archived_at.is_(None),
+            model.timestamp < cutoff,
+            model.archived_at.is_(None),
         )
         .update(
             {
@@ -59,35 +178,49 @@ def cleanup_expired_activity_logs(db: Session, *, cutoff: datetime | None = None
     return archived
 
 
-def cleanup_expired_diagnostic_summaries(db: Session, *, cutoff: datetime | None = None) -> int:
+def cleanup_expired_activity_logs(
+    db: Session,
+    *,
+    cutoff: datetime | None = None,
+    batch_size: int | None = None,
+    on_batch: BatchCallback | None = None,
+) -> int:
+    """Archive activity_logs older than the retention cutoff (soft-delete).
+
+    Returns the number of rows archived.  Idempotent: repeated calls
+    with the same cutoff archive nothing on second run (already-archived
+    rows are skipped).
+
+    ``batch_size`` overrides ``RETENTION_BATCH_SIZE`` (0 = single UPDATE);
+    ``on_batch`` is called after each committed batch.
+    """
+    from models import ActivityLog
+
+    if cutoff is None:
+        cutoff = datetime.now(UTC) - timedelta(days=RETENTION_DAYS)
+
+    return _archive_expired(db, ActivityLog, cutoff, batch_size=batch_size, on_batch=on_batch)
+
+
+def cleanup_expired_diagnostic_summaries(
+    db: Session,
+    *,
+    cutoff: datetime | None = None,
+    batch_size: int | None = None,
+    on_batch: BatchCallback | None = None,
+) -> int:
     """Archive diagnostic_summaries older than the retention cutoff (soft-delete).
 
     Returns the number of rows archived.  Idempotent: repeated calls
-    with the same cutoff archive nothing on second run.
+    with the same cutoff archive nothing on second run.  Batching as in
+    ``cleanup_expired_activity_logs``.
     """
     from models import DiagnosticSummary
 
     if cutoff is None:
         cutoff = datetime.now(UTC) - timedelta(days=RETENTION_DAYS)
 
-    archived = (
-        db.query(DiagnosticSummary)
-        .filter(
-            DiagnosticSummary.timestamp < cutoff,
-            DiagnosticSummary.archived_at.is_(None),
-        )
-        .update(
-            {
-                "archived_at": cutoff,
-                "archive_reason": "retention_policy",
-            },
-            synchronize_session=False,
-        )
-    )
-
-    if archived > 0:
-        db.commit()
-    return archived
+    return _archive_expired(db, DiagnosticSummary, cutoff, batch_size=batch_size, on_batch=on_batch)
 
 
 def cleanup_legacy_passcode_shares(db: Session) -> int:
@@ -116,16 +249,17 @@ def cleanup_legacy_passcode_shares(db: Session) -> int:
         return 0
 
 
-def run_retention_cleanup(db: Session) -> dict[str, int]:
+def run_retention_cleanup(db: Session, *, on_batch: BatchCallback | None = None) -> dict[str, int]:
     """Run all retention cleanup tasks.  Called from app lifespan.
 
     Returns a dict of {table_name: archived_count} for logging.
-    Only logs aggregate counts — no sensitive data.
+    Only logs aggregate counts — no sensitive data.  ``on_batch`` receives
+    per-batch progress for the archival tables (scheduler telemetry).
     """
     results: dict[str, int] = {}
 
-    results["activity_logs"] = cleanup_expired_activity_logs(db)
-    results["diagnostic_summaries"] = cleanup_expired_diagnostic_summaries(db)
+    results["activity_logs"] = cleanup_expired_activity_logs(db, on_batch=on_batch)
+    results["diagnostic_summaries"] = cleanup_expired_diagnostic_summaries(db, on_batch=on_batch)
     results["legacy_passcode_shares"] = cleanup_legacy_passcode_shares(db)
 
     total = sum(results.values())
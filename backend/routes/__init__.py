@@ -6,6 +6,7 @@ from routes.account_risk_heatmap import router as account_risk_heatmap_router
 from routes.activity import router as activity_router
 from routes.adjustments import router as adjustments_router
 from routes.admin_dashboard import router as admin_dashboard_router
+from routes.analysis_jobs import router as analysis_jobs_router
 from routes.analytical_expectations import router as analytical_expectations_router
 from routes.ap_testing import router as ap_testing_router
 from routes.ar_aging import router as ar_aging_router
@@ -27,6 +28,7 @@ from routes.diagnostics import router as diagnostics_router
 from routes.engagements import router as engagements_router
 from routes.export import router as export_router
 from routes.export_sharing import router as export_sharing_router
+from routes.financing_portfolio import router as financing_portfolio_router
 from routes.fixed_asset_testing import router as fixed_asset_testing_router
 from routes.follow_up_items import router as follow_up_items_router
 from routes.form_1099 import router as form_1099_router
@@ -74,6 +76,7 @@ all_routers = [
     book_to_tax_router,
     depreciation_router,
     lease_accounting_router,
+    financing_portfolio_router,
     ap_testing_router,
     bank_reconciliation_router,
     payroll_testing_router,
@@ -97,6 +100,7 @@ all_routers = [
     admin_dashboard_router,
     branding_router,
     bulk_upload_router,
+    analysis_jobs_router,
     composite_risk_router,
     account_risk_heatmap_router,
     sod_router,
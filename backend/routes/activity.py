@@ -19,9 +19,10 @@ from security_utils import log_secure_operation
 
 logger = logging.getLogger(__name__)
 from auth import require_current_user, require_verified_user
-from database import get_db
+from config import AUDIT_CHAIN_VERIFY_WORKERS
+from database import SessionLocal, get_db
 from models import ActivityLog, Client, ToolActivity, User
-from shared.audit_chain import GENESIS_HASH, compute_chain_hash, verify_audit_chain
+from shared.audit_chain import GENESIS_HASH, compute_chain_hash, maybe_write_checkpoint, verify_audit_chain_parallel
 from shared.db_unit_of_work import db_transaction
 from shared.filenames import (
     get_filename_display,
@@ -162,6 +163,7 @@ def log_activity(
         )
         previous_hash = previous_record.chain_hash if previous_record else GENESIS_HASH
         db_activity.chain_hash = compute_chain_hash(previous_hash or GENESIS_HASH, db_activity)
+        maybe_write_checkpoint(db, db_activity)
 
     db.refresh(db_activity)
 
@@ -568,7 +570,8 @@ def verify_chain(
     """Verify the integrity of the audit log hash chain between two record IDs.
 
     Traverses the chain from start_id to end_id and recomputes each HMAC-SHA512
-    hash to detect tampering. Requires a verified user account.
+    hash to detect tampering. Requires a verified user account. Ranges spanning
+    signed checkpoints are verified as parallel segments.
 
     Sprint 461: Cryptographic audit log chaining (SOC 2 CC7.4).
     """
@@ -583,7 +586,14 @@ def verify_chain(
         f"User {current_user.id} verifying chain integrity (IDs {start_id}-{end_id})",
     )
 
-    result = verify_audit_chain(db, start_id, end_id, user_id=current_user.id)
+    result = verify_audit_chain_parallel(
+        db,
+        start_id,
+        end_id,
+        current_user.id,
+        session_factory=SessionLocal,
+        max_workers=AUDIT_CHAIN_VERIFY_WORKERS,
+    )
 
     return ChainVerifyResponse(
         is_valid=result.is_valid,
@@ -0,0 +1,127 @@
+"""
+Analysis Job Routes — status, progress stream and one-time result retrieval
+for uploads submitted with ``async_job=true`` (see shared/analysis_jobs.py).
+
+Route group prefix: /jobs
+
+    GET /jobs/{job_id}          poll status (the fallback for clients without SSE)
+    GET /jobs/{job_id}/events   text/event-stream of status changes until the job ends
+    GET /jobs/{job_id}/result   the finished result; deleted once returned
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from auth import require_verified_user
+from models import User
+from shared.analysis_job_schemas import AnalysisJobStatusResponse
+from shared.analysis_jobs import (
+    JOB_STATUS_COMPLETE,
+    JOB_STATUS_FAILED,
+    TERMINAL_STATUSES,
+    get_job,
+    job_status_payload,
+    take_job_result,
+)
+
+router = APIRouter(prefix="/jobs", tags=["analysis-jobs"])
+
+# How often the event stream re-reads the job, and how long it may stay
+# silent before sending a keep-alive comment (proxies drop idle streams).
+_EVENT_POLL_SECONDS = 0.5
+_EVENT_KEEPALIVE_SECONDS = 15.0
+
+
+def _owned_job(job_id: str, user: User) -> dict[str, Any]:
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    if job["user_id"] != user.id:
+        raise HTTPException(status_code=403, detail="Access denied.")
+    return job
+
+
+@router.get("/{job_id}", response_model=AnalysisJobStatusResponse)
+async def get_analysis_job(
+    job_id: str,
+    user: User = Depends(require_verified_user),
+) -> dict[str, Any]:
+    """Poll an analysis job's status and progress."""
+    return job_status_payload(_owned_job(job_id, user))
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get("/{job_id}/events")
+async def stream_analysis_job(
+    job_id: str,
+    request: Request,
+    user: User = Depends(require_verified_user),
+) -> StreamingResponse:
+    """Stream status changes as server-sent events.
+
+    Each change is a ``progress`` event; the stream ends with one ``complete``
+    or ``failed`` event (or ``expired`` if the job disappears meanwhile).
+    Every event's data is the same object ``GET /jobs/{job_id}`` returns.
+    """
+    job = _owned_job(job_id, user)
+
+    async def events() -> AsyncIterator[str]:
+        current: dict[str, Any] | None = job
+        last_sent: str | None = None
+        idle = 0.0
+        while True:
+            if current is None:
+                yield _sse("expired", {"job_id": job_id})
+                return
+            if current["status"] in TERMINAL_STATUSES:
+                yield _sse(current["status"], job_status_payload(current))
+                return
+            if current["updated_at"] != last_sent:
+                last_sent = current["updated_at"]
+                idle = 0.0
+                yield _sse("progress", job_status_payload(current))
+            elif idle >= _EVENT_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(_EVENT_POLL_SECONDS)
+            idle += _EVENT_POLL_SECONDS
+            if await request.is_disconnected():
+                return
+            current = get_job(job_id)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{job_id}/result")
+async def get_analysis_job_result(
+    job_id: str,
+    user: User = Depends(require_verified_user),
+) -> JSONResponse:
+    """Return a finished job's result, once.
+
+    409 while the job is still running; a failed job answers with the status
+    and detail the synchronous call would have; 410 once the result has been
+    fetched or has expired.
+    """
+    job = _owned_job(job_id, user)
+    if job["status"] == JOB_STATUS_FAILED:
+        error = job["error"] or {}
+        raise HTTPException(status_code=error.get("status_code", 500), detail=error.get("detail"))
+    if job["status"] != JOB_STATUS_COMPLETE:
+        raise HTTPException(status_code=409, detail="The analysis is still running.")
+    result = take_job_result(job_id)
+    if result is None:
+        raise HTTPException(status_code=410, detail="The result was already retrieved or has expired.")
+    return JSONResponse(content=result)
@@ -1,16 +1,19 @@
 """
 Paciolus API — AP Testing Routes
 """
+from functools import partial
 from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
-from ap_testing_engine import run_ap_testing
 from auth import require_verified_user
 from database import get_db
 from models import User
+from services.audit.ap_testing.analysis import run_ap_testing_chunked
 from shared.account_extractors import extract_ap_accounts
+from shared.analysis_job_schemas import ASYNC_JOB_RESPONSES
 from shared.rate_limits import RATE_LIMIT_AUDIT, limiter
 from shared.testing_response_schemas import APTestingResponse
 from shared.testing_route import run_single_file_testing
@@ -18,7 +21,7 @@ from shared.testing_route import run_single_file_testing
 router = APIRouter(tags=["ap_testing"])
 
 
-@router.post("/audit/ap-payments", response_model=APTestingResponse)
+@router.post("/audit/ap-payments", response_model=APTestingResponse, responses=ASYNC_JOB_RESPONSES)
 @limiter.limit(RATE_LIMIT_AUDIT)
 async def audit_ap_payments(
     request: Request,
@@ -26,9 +29,11 @@ async def audit_ap_payments(
     file: UploadFile = File(...),
     column_mapping: Optional[str] = Form(default=None),
     engagement_id: Optional[int] = Form(default=None),
+    async_job: bool = Form(default=False),
+    store_result: bool = Form(default=False),
     current_user: User = Depends(require_verified_user),
     db: Session = Depends(get_db),
-) -> dict[str, object]:
+) -> dict[str, object] | JSONResponse:
     """Run automated AP payment testing on an accounts payable extract."""
     return await run_single_file_testing(
         file=file, column_mapping=column_mapping,
@@ -36,8 +41,10 @@ async def audit_ap_payments(
         background_tasks=background_tasks,
         tool_name="ap_testing", mapping_key="ap_testing",
         log_label="AP", error_key="ap_testing_error",
-        run_engine=lambda rows, cols, mapping, fn: run_ap_testing(
-            rows=rows, column_names=cols, config=None, column_mapping=mapping,
-        ),
+        engine=partial(run_ap_testing_chunked, config=None),
+        chunked=True,
         extract_accounts=extract_ap_accounts,
+        async_job=async_job,
+        store_result=store_result,
+        response_model=APTestingResponse,
     )
@@ -14,7 +14,6 @@ logger = logging.getLogger(__name__)
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, UploadFile
 from sqlalchemy.orm import Session
 
-from ar_aging_engine import ARAgingConfig, run_ar_aging
 from auth import require_verified_user
 from database import get_db
 from models import User
@@ -98,6 +97,8 @@ async def audit_ar_aging(
                 sl_bytes = await validate_file_size(subledger_file)
                 sl_filename = subledger_file.filename or ""
 
+            from ar_aging_engine import ARAgingConfig, run_ar_aging
+
             # Build config from form params
             config = ARAgingConfig(
                 prior_period_dso=prior_period_dso,
@@ -2,27 +2,27 @@
 Paciolus API — Audit Pipeline Routes (Trial Balance Analysis)
 """
 
-import asyncio
 import hashlib
 import json
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
-from audit_engine import (
-    DEFAULT_CHUNK_SIZE,
-    audit_trial_balance_multi_sheet,
-    audit_trial_balance_streaming,
-)
+from audit_engine import DEFAULT_CHUNK_SIZE
 from auth import require_verified_user
 from database import get_db
 from models import User
 from security_utils import log_secure_operation
 from shared.account_extractors import extract_tb_accounts
-from shared.diagnostic_response_schemas import TrialBalanceResponse
+from shared.analysis_job_schemas import ASYNC_JOB_RESPONSES
+from shared.analysis_jobs import start_analysis_job
+from shared.classification_cache import load_engagement_classification_cache
+from shared.diagnostic_response_schemas import TrialBalanceBundleResponse, TrialBalanceResponse
+from shared.engine_pool import run_engine_job
 from shared.entitlement_checks import check_diagnostic_limit, enforce_format_access
 from shared.error_messages import sanitize_error
 from shared.helpers import (
@@ -31,19 +31,23 @@ from shared.helpers import (
 )
 from shared.materiality_resolver import resolve_materiality
 from shared.rate_limits import RATE_LIMIT_AUDIT, limiter
-from shared.tb_post_processor import apply_currency_conversion, apply_lead_sheet_grouping
+from shared.tb_bundle import TB_BUNDLE_ANALYSES, TBBundleOptions, analyze_trial_balance_bundle
+from shared.tb_post_processor import analyze_trial_balance_upload, apply_currency_conversion
 from shared.tool_run_recorder import maybe_record_tool_run
 from shared.upload_pipeline import (
     memory_cleanup,
     validate_file_size,
 )
 
+if TYPE_CHECKING:
+    from shared.classification_cache import ClassificationCache
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["audit"])
 
 
-@router.post("/audit/trial-balance", response_model=TrialBalanceResponse)
+@router.post("/audit/trial-balance", response_model=TrialBalanceResponse, responses=ASYNC_JOB_RESPONSES)
 @limiter.limit(RATE_LIMIT_AUDIT)
 async def audit_trial_balance(
     request: Request,
@@ -56,11 +60,16 @@ async def audit_trial_balance(
     engagement_id: Optional[int] = Form(default=None),
     preflight_token: Optional[str] = Form(default=None),
     force_resubmit: bool = Form(default=False),
+    async_job: bool = Form(default=False),
     current_user: User = Depends(check_diagnostic_limit),
     _verified: User = Depends(require_verified_user),
     db: Session = Depends(get_db),
-) -> TrialBalanceResponse:
-    """Analyze a trial balance file for balance validation using streaming processing."""
+) -> TrialBalanceResponse | JSONResponse:
+    """Analyze a trial balance file for balance validation using streaming processing.
+
+    With ``async_job=true`` the analysis is queued as a background job and the
+    response is 202 with its id; follow it at ``/jobs/{job_id}``.
+    """
 
     # Sprint 678: tier-gate the upload by file extension. Free tier is limited
     # to csv/xlsx/xls/tsv/txt; paid tiers accept ofx/qbo/iif/pdf/ods too.
@@ -159,6 +168,9 @@ async def audit_trial_balance(
         db,
     )
 
+    # Reuse this client's account classifications from earlier runs
+    classification_cache = load_engagement_classification_cache(db, current_user.id, engagement_id)
+
     log_secure_operation(
         "audit_upload_streaming",
         f"Processing file: {file.filename} (threshold: ${materiality_threshold:,.2f}, source: {materiality_source}, chunk_size: {DEFAULT_CHUNK_SIZE})",
@@ -174,32 +186,37 @@ async def audit_trial_balance(
                 file_bytes = await validate_file_size(file)
                 filename = file.filename or ""
 
-            def _analyze() -> dict[str, Any]:
-                if selected_sheets_list and len(selected_sheets_list) > 0:
-                    result = audit_trial_balance_multi_sheet(
-                        file_bytes=file_bytes,
-                        filename=filename,
-                        selected_sheets=selected_sheets_list,
-                        materiality_threshold=materiality_threshold,
-                        chunk_size=DEFAULT_CHUNK_SIZE,
-                        account_type_overrides=overrides_dict,
-                        column_mapping=column_mapping_dict,
-                    )
-                else:
-                    result = audit_trial_balance_streaming(
-                        file_bytes=file_bytes,
-                        filename=filename,
-                        materiality_threshold=materiality_threshold,
-                        chunk_size=DEFAULT_CHUNK_SIZE,
-                        account_type_overrides=overrides_dict,
-                        column_mapping=column_mapping_dict,
-                    )
-
-                apply_lead_sheet_grouping(result, materiality_threshold)
-
-                return result
-
-            analysis_result: dict[str, Any] = await asyncio.to_thread(_analyze)
+            if async_job:
+                return JSONResponse(
+                    status_code=202,
+                    content=_start_trial_balance_job(
+                        current_user.id,
+                        engagement_id,
+                        file_bytes,
+                        filename,
+                        selected_sheets_list,
+                        materiality_threshold,
+                        materiality_source,
+                        overrides_dict,
+                        column_mapping_dict,
+                        classification_cache,
+                    ),
+                )
+
+            analysis_result: dict[str, Any]
+            analysis_result, classification_cache = await run_engine_job(
+                "trial_balance",
+                analyze_trial_balance_upload,
+                file_bytes,
+                filename,
+                selected_sheets_list,
+                materiality_threshold,
+                overrides_dict,
+                column_mapping_dict,
+                classification_cache,
+            )
+            if classification_cache is not None:
+                background_tasks.add_task(classification_cache.save, db)
 
             # Sprint 258: Auto-convert if user has rate table in session
             apply_currency_conversion(analysis_result, current_user.id, db)
@@ -242,3 +259,169 @@ async def audit_trial_balance(
             )
             maybe_record_tool_run(db, engagement_id, current_user.id, "trial_balance", False)
             raise HTTPException(status_code=400, detail=sanitize_error(e, "upload", "audit_error"))
+
+
+def _start_trial_balance_job(
+    user_id: int,
+    engagement_id: Optional[int],
+    file_bytes: bytes,
+    filename: str,
+    selected_sheets: Optional[list[str]],
+    materiality_threshold: float,
+    materiality_source: str,
+    overrides: Optional[dict[str, str]],
+    column_mapping: Optional[dict[str, str]],
+    classification_cache: Optional["ClassificationCache"],
+) -> dict[str, Any]:
+    """Queue the TB analysis as a background job; the post-processing the
+    synchronous path does after the engine run happens in ``_finalize``."""
+
+    def _finalize(raw: tuple[dict[str, Any], Optional["ClassificationCache"]], job_db: Session) -> dict[str, Any]:
+        analysis_result, learned_cache = raw
+        if learned_cache is not None:
+            learned_cache.save(job_db)
+        apply_currency_conversion(analysis_result, user_id, job_db)
+        analysis_result["materiality_source"] = materiality_source
+        maybe_record_tool_run(
+            job_db,
+            engagement_id,
+            user_id,
+            "trial_balance",
+            True,
+            None,
+            extract_tb_accounts(analysis_result),
+            filename,
+            analysis_result.get("record_count"),
+            {
+                "was_balanced": analysis_result.get("was_balanced"),
+                "anomaly_count": analysis_result.get("anomaly_count", 0),
+            },
+        )
+        return analysis_result
+
+    return start_analysis_job(
+        user_id=user_id,
+        tool="trial_balance",
+        filename=filename,
+        fn=analyze_trial_balance_upload,
+        file_bytes=file_bytes,
+        args=(filename, selected_sheets, materiality_threshold, overrides, column_mapping, classification_cache),
+        finalize=_finalize,
+        on_failure=lambda job_db: maybe_record_tool_run(job_db, engagement_id, user_id, "trial_balance", False),
+        response_model=TrialBalanceResponse,
+        error_operation="upload",
+        error_key="audit_error",
+    )
+
+
+@router.post("/audit/trial-balance/bundle", response_model=TrialBalanceBundleResponse)
+@limiter.limit(RATE_LIMIT_AUDIT)
+async def audit_trial_balance_bundle(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    analyses: Optional[str] = Form(default=None),
+    materiality_threshold: float = Form(default=0.0, ge=0.0),
+    account_type_overrides: Optional[str] = Form(default=None),
+    column_mapping: Optional[str] = Form(default=None),
+    prior_cogs: Optional[float] = Form(default=None),
+    prior_opex: Optional[float] = Form(default=None),
+    prior_total_expenses: Optional[float] = Form(default=None),
+    prior_revenue: Optional[float] = Form(default=None),
+    prior_operating_expenses: Optional[float] = Form(default=None),
+    threshold_pct: float = Form(default=50.0),
+    total_revenue: Optional[float] = Form(default=None),
+    engagement_id: Optional[int] = Form(default=None),
+    current_user: User = Depends(check_diagnostic_limit),
+    _verified: User = Depends(require_verified_user),
+    db: Session = Depends(get_db),
+) -> TrialBalanceBundleResponse:
+    """Run several trial balance analyses off one upload parse.
+
+    ``analyses`` is a JSON array naming any of TB_BUNDLE_ANALYSES (all of them
+    when omitted). Expense-category and accrual parameters match the
+    standalone endpoints' form fields.
+    """
+    enforce_format_access(current_user, db, file.filename)
+
+    requested = parse_json_list(analyses, "tb_bundle_analyses") or list(TB_BUNDLE_ANALYSES)
+    unknown = sorted({str(name) for name in requested} - set(TB_BUNDLE_ANALYSES))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown analyses: {', '.join(unknown)}. Choose from: {', '.join(TB_BUNDLE_ANALYSES)}.",
+        )
+
+    overrides_dict = parse_json_mapping(account_type_overrides, "audit_overrides")
+    materiality_threshold, materiality_source = resolve_materiality(
+        materiality_threshold,
+        engagement_id,
+        current_user.id,
+        db,
+    )
+    options = TBBundleOptions(
+        materiality_threshold=materiality_threshold,
+        account_type_overrides=overrides_dict,
+        column_mapping=parse_json_mapping(column_mapping, "audit_column"),
+        prior_cogs=prior_cogs,
+        prior_opex=prior_opex,
+        prior_total_expenses=prior_total_expenses,
+        prior_revenue=prior_revenue,
+        prior_operating_expenses=prior_operating_expenses,
+        accrual_threshold_pct=threshold_pct,
+        total_revenue=total_revenue,
+    )
+    classification_cache = load_engagement_classification_cache(db, current_user.id, engagement_id)
+
+    log_secure_operation("audit_bundle_upload", f"TB bundle ({', '.join(requested)}) for file: {file.filename}")
+
+    with memory_cleanup():
+        try:
+            file_bytes = await validate_file_size(file)
+            filename = file.filename or ""
+
+            bundle: dict[str, Any]
+            bundle, classification_cache = await run_engine_job(
+                "trial_balance",
+                analyze_trial_balance_bundle,
+                file_bytes,
+                filename,
+                requested,
+                options,
+                classification_cache,
+            )
+            if classification_cache is not None:
+                background_tasks.add_task(classification_cache.save, db)
+
+            bundle["materiality_source"] = materiality_source
+            diagnostic = bundle.get("diagnostic")
+            if diagnostic is not None:
+                apply_currency_conversion(diagnostic, current_user.id, db)
+                diagnostic["materiality_source"] = materiality_source
+                background_tasks.add_task(
+                    maybe_record_tool_run,
+                    db,
+                    engagement_id,
+                    current_user.id,
+                    "trial_balance",
+                    True,
+                    None,
+                    extract_tb_accounts(diagnostic),
+                    filename,
+                    diagnostic.get("record_count"),
+                    {
+                        "was_balanced": diagnostic.get("was_balanced"),
+                        "anomaly_count": diagnostic.get("anomaly_count", 0),
+                    },
+                )
+
+            return bundle  # type: ignore[return-value]
+
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "Trial balance bundle rejected [%s]: %s",
+                type(e).__name__,
+                e,
+                exc_info=True,
+            )
+            raise HTTPException(status_code=400, detail=sanitize_error(e, "upload", "audit_error"))
@@ -10,20 +10,20 @@ from fastapi import Path as PathParam
 from pydantic import BaseModel
 
 from auth import require_verified_user
-from benchmark_engine import (
-    calculate_overall_score,
-    compare_ratios_to_benchmarks,
-    get_available_industries,
-    get_benchmark_set,
-    get_benchmark_sources,
-    get_percentile_band,
-)
 from models import Industry, User
 from security_utils import log_secure_operation
+from shared.lazy_import import lazy_callable
 from shared.rate_limits import RATE_LIMIT_DEFAULT, limiter
 
 router = APIRouter(tags=["benchmarks"])
 
+calculate_overall_score = lazy_callable("benchmark_engine:calculate_overall_score")
+compare_ratios_to_benchmarks = lazy_callable("benchmark_engine:compare_ratios_to_benchmarks")
+get_available_industries = lazy_callable("benchmark_engine:get_available_industries")
+get_benchmark_set = lazy_callable("benchmark_engine:get_benchmark_set")
+get_benchmark_sources = lazy_callable("benchmark_engine:get_benchmark_sources")
+get_percentile_band = lazy_callable("benchmark_engine:get_percentile_band")
+
 
 class BenchmarkDataResponse(BaseModel):
     ratio_name: str
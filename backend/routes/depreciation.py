@@ -3,6 +3,8 @@ Depreciation Routes (Sprint 626).
 
 Form-input only — zero-storage compliant. Generates book + MACRS depreciation
 schedules with optional book-vs-tax timing reconciliation, and a CSV export.
+The register endpoints run a whole asset list through the batch engine
+(``depreciation_register_engine``) in one request.
 """
 
 from __future__ import annotations
@@ -10,6 +12,7 @@ from __future__ import annotations
 import csv
 import io
 import logging
+from collections.abc import Iterator
 from decimal import Decimal, InvalidOperation
 from typing import Literal, Optional
 
@@ -26,6 +29,7 @@ from depreciation_engine import (
     MacrsSystem,
     generate_depreciation_schedule,
 )
+from depreciation_register_engine import DepreciationRegisterResult, generate_depreciation_register
 from shared.error_messages import sanitize_error
 from shared.rate_limits import RATE_LIMIT_AUDIT, limiter
 
@@ -33,6 +37,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["depreciation"])
 
+MAX_REGISTER_ASSETS = 5000
+
 
 # =============================================================================
 # Request / response schemas
@@ -72,6 +78,18 @@ class DepreciationResponse(BaseModel):
     cumulative_deferred_tax: str
 
 
+class DepreciationRegisterRequest(BaseModel):
+    assets: list[DepreciationRequest] = Field(..., min_length=1, max_length=MAX_REGISTER_ASSETS)
+
+
+class DepreciationRegisterResponse(BaseModel):
+    asset_count: int
+    assets: list[DepreciationResponse]
+    total_book_depreciation: str
+    total_tax_depreciation: str
+    cumulative_deferred_tax: str
+
+
 # =============================================================================
 # Helpers
 # =============================================================================
@@ -105,6 +123,82 @@ def _build_config(payload: DepreciationRequest) -> AssetConfig:
     )
 
 
+def _run_register(payload: DepreciationRegisterRequest) -> DepreciationRegisterResult:
+    configs: list[AssetConfig] = []
+    for i, asset in enumerate(payload.assets, start=1):
+        try:
+            configs.append(_build_config(asset))
+        except HTTPException as e:
+            raise HTTPException(status_code=400, detail=f"Asset {i} ({asset.asset_name}): {e.detail}")
+    try:
+        return generate_depreciation_register(configs)
+    except DepreciationInputError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _register_csv_rows(register: DepreciationRegisterResult) -> Iterator[str]:
+    """Yield the register CSV one asset at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(
+        [
+            "Asset",
+            "Schedule",
+            "Year",
+            "Calendar Year",
+            "Beginning Value",
+            "Depreciation",
+            "Accumulated Depreciation",
+            "Ending Value",
+        ]
+    )
+    for result in register.results:
+        for label, schedule in (("Book", result.book_schedule), ("Tax", result.tax_schedule)):
+            for entry in schedule:
+                writer.writerow(
+                    [
+                        result.config.asset_name,
+                        label,
+                        entry.year_index,
+                        entry.calendar_year if entry.calendar_year else "",
+                        f"{entry.beginning_book_value}",
+                        f"{entry.depreciation}",
+                        f"{entry.accumulated_depreciation}",
+                        f"{entry.ending_book_value}",
+                    ]
+                )
+        yield flush()
+
+    writer.writerow([])
+    writer.writerow(["ASSET TOTALS"])
+    writer.writerow(["Asset", "Total Book Depreciation", "Total Tax Depreciation", "Cumulative Deferred Tax"])
+    for result in register.results:
+        writer.writerow(
+            [
+                result.config.asset_name,
+                f"{result.total_book_depreciation}",
+                f"{result.total_tax_depreciation}",
+                f"{result.cumulative_deferred_tax}",
+            ]
+        )
+    writer.writerow(
+        [
+            "Register Total",
+            f"{register.total_book_depreciation}",
+            f"{register.total_tax_depreciation}",
+            f"{register.cumulative_deferred_tax}",
+        ]
+    )
+    yield flush()
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -233,3 +327,40 @@ def export_depreciation_csv(
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename=depreciation_{safe_name}.csv"},
     )
+
+
+@router.post("/audit/depreciation/register", response_model=DepreciationRegisterResponse)
+@limiter.limit(RATE_LIMIT_AUDIT)
+def calculate_depreciation_register(
+    request: Request,
+    payload: DepreciationRegisterRequest,
+    current_user: User = Depends(require_verified_user),
+) -> dict:
+    """Book + MACRS schedules for up to ``MAX_REGISTER_ASSETS`` assets in one call.
+
+    Each asset's schedules are identical to ``POST /audit/depreciation`` for
+    the same inputs; the response adds register-level totals.
+    """
+    register = _run_register(payload)
+    logger.info(
+        "Depreciation register: %d assets (%d on the Decimal path)",
+        len(register.results),
+        register.decimal_fallbacks,
+    )
+    return register.to_dict()
+
+
+@router.post("/audit/depreciation/register/export.csv")
+@limiter.limit(RATE_LIMIT_AUDIT)
+def export_depreciation_register_csv(
+    request: Request,
+    payload: DepreciationRegisterRequest,
+    current_user: User = Depends(require_verified_user),
+) -> StreamingResponse:
+    """CSV export of every asset's book and tax schedule plus register totals."""
+    register = _run_register(payload)
+    return StreamingResponse(
+        _register_csv_rows(register),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=depreciation_register.csv"},
+    )
@@ -24,6 +24,7 @@ from shared.filenames import (
 )
 from shared.monetary import quantize_monetary
 from shared.rate_limits import RATE_LIMIT_WRITE, limiter
+from shared.trend_series import record_diagnostic_summary
 
 router = APIRouter(tags=["diagnostics"])
 
@@ -280,8 +281,10 @@ async def save_diagnostic_summary(
     ):
         db.add(db_summary)
     db.refresh(db_summary)
+    response = _summary_to_response(db_summary)
+    record_diagnostic_summary(db, db_summary)
 
-    return _summary_to_response(db_summary)
+    return response
 
 
 @router.get("/diagnostics/summary/{client_id}/previous", response_model=Optional[DiagnosticSummaryResponse])
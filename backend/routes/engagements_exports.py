@@ -11,21 +11,27 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from analytical_expectation_memo_generator import AnalyticalExpectationMemoGenerator
-from anomaly_summary_generator import AnomalySummaryGenerator
 from auth import require_current_user, require_verified_user
 from database import get_db
-from engagement_export import EngagementExporter
 from engagement_manager import EngagementManager
 from models import User
 from security_utils import log_secure_operation
 from shared.entitlement_checks import check_export_access
+from shared.lazy_import import lazy_callable
 from shared.pdf_branding import apply_pdf_branding, load_pdf_branding_context
 from shared.rate_limits import RATE_LIMIT_EXPORT, limiter
-from sum_schedule_memo_generator import SumScheduleMemoGenerator
 
 router = APIRouter(tags=["engagements"])
 
+# PDF / ZIP builders import ReportLab; defer them to the first export request.
+AnalyticalExpectationMemoGenerator = lazy_callable(
+    "analytical_expectation_memo_generator:AnalyticalExpectationMemoGenerator"
+)
+AnomalySummaryGenerator = lazy_callable("anomaly_summary_generator:AnomalySummaryGenerator")
+EngagementExporter = lazy_callable("engagement_export:EngagementExporter")
+iter_package_zip = lazy_callable("engagement_export:iter_package_zip")
+SumScheduleMemoGenerator = lazy_callable("sum_schedule_memo_generator:SumScheduleMemoGenerator")
+
 
 @router.post(
     "/engagements/{engagement_id}/export/anomaly-summary",
@@ -89,23 +95,17 @@ def export_engagement_package(
 
     exporter = EngagementExporter(db)
 
+    # All DB work happens here, before the response starts; the ZIP body is
+    # rendered and compressed while it streams (see engagement_export).
     try:
-        zip_bytes, filename = exporter.generate_zip(current_user.id, engagement_id)
+        package = exporter.prepare_package(current_user.id, engagement_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Engagement not found")
 
-    def iter_zip() -> Iterator[bytes]:
-        chunk_size = 8192
-        for i in range(0, len(zip_bytes), chunk_size):
-            yield zip_bytes[i : i + chunk_size]
-
     return StreamingResponse(
-        iter_zip(),
+        iter_package_zip(package),
         media_type="application/zip",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Length": str(len(zip_bytes)),
-        },
+        headers={"Content-Disposition": f'attachment; filename="{package.download_filename}"'},
     )
 
 
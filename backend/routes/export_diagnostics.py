@@ -80,7 +80,7 @@ def export_pdf_report(
     Sprint 748b: delegates to ``export.pipeline`` with branding plumbed through.
     """
     branding = load_pdf_branding_context(current_user, db)
-    return pipeline_export_diagnostic_pdf(audit_result, branding=branding)
+    return pipeline_export_diagnostic_pdf(audit_result, user_id=current_user.id, branding=branding)
 
 
 # --- Excel Export ---
@@ -96,7 +96,7 @@ def export_excel_workpaper(
     Sprint 748b: delegates to ``export.pipeline``. No branding —
     Excel exports don't apply Enterprise PDF branding.
     """
-    return pipeline_export_diagnostic_excel(audit_result)
+    return pipeline_export_diagnostic_excel(audit_result, user_id=current_user.id)
 
 
 # --- CSV Trial Balance ---
@@ -137,7 +137,7 @@ def export_leadsheets(
     domain-object assembly previously inline here lives in
     ``export.serializers.excel.serialize_leadsheets_excel``.
     """
-    return pipeline_export_leadsheets(payload)
+    return pipeline_export_leadsheets(payload, user_id=current_user.id)
 
 
 # --- Financial Statements Export ---
@@ -159,7 +159,7 @@ def export_financial_statements(
     branding context through; Excel path ignores it.
     """
     branding = load_pdf_branding_context(current_user, db) if format == "pdf" else None
-    return pipeline_export_financial_statements(payload, fmt=format, branding=branding)
+    return pipeline_export_financial_statements(payload, fmt=format, user_id=current_user.id, branding=branding)
 
 
 # --- Pre-Flight Issues CSV (Sprint 283) ---
@@ -2,6 +2,16 @@
 Paciolus API — Memo PDF Export Routes (all 18 testing/tool memo endpoints).
 Sprint 155: Extracted from routes/export.py.
 Sprint 539: Registry-based refactor — declarative dispatch eliminates per-route boilerplate.
+
+Generators are referenced through ``shared.lazy_import.lazy_callable`` so the
+18 memo modules import on the first export request rather than at API
+startup; the diagnostic serializers in ``export.serializers`` defer their
+generators the same way, which keeps ReportLab out of startup entirely.
+Paths and input schemas still register eagerly.
+
+Memos for the single-file testing tools also accept a ``result_id`` body
+(``StoredResultExportInput``) naming a result kept by the tool run with
+``store_result=true`` — see ``shared/result_store.py``.
 """
 
 import logging
@@ -22,22 +32,6 @@ from shared.memory_budget import track_memo_memory
 from shared.pdf_branding import apply_pdf_branding, load_pdf_branding_context
 
 logger = logging.getLogger(__name__)
-from accrual_completeness_memo import generate_accrual_completeness_memo
-from ap_testing_memo_generator import generate_ap_testing_memo
-from ar_aging_memo_generator import generate_ar_aging_memo
-from bank_reconciliation_memo_generator import generate_bank_rec_memo
-from currency_memo_generator import generate_currency_conversion_memo
-from expense_category_memo import generate_expense_category_memo
-from fixed_asset_testing_memo_generator import generate_fixed_asset_testing_memo
-from flux_expectations_memo import generate_flux_expectations_memo
-from inventory_testing_memo_generator import generate_inventory_testing_memo
-from je_testing_memo_generator import generate_je_testing_memo
-from multi_period_memo_generator import generate_multi_period_memo
-from payroll_testing_memo_generator import generate_payroll_testing_memo
-from population_profile_memo import generate_population_profile_memo
-from preflight_memo_generator import generate_preflight_memo
-from revenue_testing_memo_generator import generate_revenue_testing_memo
-from sampling_memo_generator import generate_sampling_design_memo, generate_sampling_evaluation_memo
 from shared.error_messages import sanitize_error
 from shared.export_helpers import streaming_pdf_response
 from shared.export_schemas import (
@@ -58,11 +52,14 @@ from shared.export_schemas import (
     RevenueTestingExportInput,
     SamplingDesignMemoInput,
     SamplingEvaluationMemoInput,
+    StoredResultExportInput,
     ThreeWayMatchExportInput,
 )
 from shared.filenames import safe_download_filename
+from shared.lazy_import import lazy_callable
 from shared.rate_limits import RATE_LIMIT_EXPORT, limiter
-from three_way_match_memo_generator import generate_three_way_match_memo
+from shared.render_cache import render_cache
+from shared.result_store import resolve_export_input
 
 router = APIRouter(tags=["export"])
 
@@ -83,6 +80,9 @@ class MemoRegistryEntry:
     log_label: str
     error_code: str
     docstring: str
+    # Tool whose stored results (shared/result_store.py) this memo accepts by
+    # result_id; None for memos built from client-side input only.
+    result_tool: str | None = None
 
 
 # Custom pre-processing hooks for non-standard memo types.  Each receives the
@@ -124,8 +124,9 @@ def _memo_export_handler(
     entry: MemoRegistryEntry,
     payload: BaseModel,
     preprocessor: CustomPreprocessor = _standard_preprocessor,
-    current_user: User | None = None,
-    db: Session | None = None,
+    *,
+    current_user: User,
+    db: Session,
 ) -> StreamingResponse:
     """Deserialize -> generate -> stream -> exception handling for any memo type.
 
@@ -133,6 +134,7 @@ def _memo_export_handler(
     branding context via ContextVar. When present, the memo template
     picks up the user's firm logo / header / footer automatically — no
     signature changes needed on the 18 downstream memo generators.
+    ``current_user`` also scopes the render cache entry.
     """
     try:
         result_dict, extra_kwargs = preprocessor(payload)
@@ -153,18 +155,26 @@ def _memo_export_handler(
 
         # Sprint 679: resolve branding for the caller and scope it to the
         # PDF-generation call via ContextVar. Falls back to blank
-        # (Paciolus default) when user/db aren't supplied or the tier
-        # doesn't include custom branding.
-        branding = None
-        if current_user is not None and db is not None:
-            branding = load_pdf_branding_context(current_user, db)
-
-        with apply_pdf_branding(branding), track_memo_memory(entry.log_label):
-            pdf_bytes: bytes = entry.generator(
-                **{entry.result_kwarg: result_dict},
-                **common_kwargs,
-                **extra_kwargs,
-            )
+        # (Paciolus default) when the tier doesn't include custom branding.
+        branding = load_pdf_branding_context(current_user, db)
+
+        def _render() -> bytes:
+            with apply_pdf_branding(branding), track_memo_memory(entry.log_label):
+                rendered: bytes = entry.generator(
+                    **{entry.result_kwarg: result_dict},
+                    **common_kwargs,
+                    **extra_kwargs,
+                )
+            return rendered
+
+        # Repeat downloads of an identical memo skip ReportLab entirely.
+        pdf_bytes = render_cache.get_or_render(
+            entry.route_path,
+            {"result": result_dict, "workpaper": common_kwargs, "extra": extra_kwargs},
+            _render,
+            user_id=current_user.id,
+            branding=branding,
+        )
 
         download_filename = safe_download_filename(
             payload.filename,  # type: ignore[attr-defined]
@@ -188,43 +198,46 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/je-testing-memo",
-            generator=generate_je_testing_memo,
+            generator=lazy_callable("je_testing_memo_generator:generate_je_testing_memo"),
             result_kwarg="je_result",
             filename_template="JETesting_Memo",
             log_label="JE Testing memo",
             error_code="je_memo_export_error",
             docstring="Generate and download a JE Testing Memo PDF.",
+            result_tool="journal_entry_testing",
         ),
         JETestingExportInput,
     ),
     (
         MemoRegistryEntry(
             route_path="/export/ap-testing-memo",
-            generator=generate_ap_testing_memo,
+            generator=lazy_callable("ap_testing_memo_generator:generate_ap_testing_memo"),
             result_kwarg="ap_result",
             filename_template="APTesting_Memo",
             log_label="AP Testing memo",
             error_code="ap_memo_export_error",
             docstring="Generate and download an AP Testing Memo PDF.",
+            result_tool="ap_testing",
         ),
         APTestingExportInput,
     ),
     (
         MemoRegistryEntry(
             route_path="/export/payroll-testing-memo",
-            generator=generate_payroll_testing_memo,
+            generator=lazy_callable("payroll_testing_memo_generator:generate_payroll_testing_memo"),
             result_kwarg="payroll_result",
             filename_template="PayrollTesting_Memo",
             log_label="Payroll Testing memo",
             error_code="payroll_memo_export_error",
             docstring="Generate and download a Payroll Testing Memo PDF.",
+            result_tool="payroll_testing",
         ),
         PayrollTestingExportInput,
     ),
     (
         MemoRegistryEntry(
             route_path="/export/three-way-match-memo",
-            generator=generate_three_way_match_memo,
+            generator=lazy_callable("three_way_match_memo_generator:generate_three_way_match_memo"),
             result_kwarg="twm_result",
             filename_template="TWM_Memo",
             log_label="TWM memo",
@@ -236,19 +249,20 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/revenue-testing-memo",
-            generator=generate_revenue_testing_memo,
+            generator=lazy_callable("revenue_testing_memo_generator:generate_revenue_testing_memo"),
             result_kwarg="revenue_result",
             filename_template="RevenueTesting_Memo",
             log_label="Revenue Testing memo",
             error_code="revenue_memo_export_error",
             docstring="Generate and download a Revenue Testing Memo PDF.",
+            result_tool="revenue_testing",
         ),
         RevenueTestingExportInput,
     ),
     (
         MemoRegistryEntry(
             route_path="/export/ar-aging-memo",
-            generator=generate_ar_aging_memo,
+            generator=lazy_callable("ar_aging_memo_generator:generate_ar_aging_memo"),
             result_kwarg="ar_result",
             filename_template="ARAging_Memo",
             log_label="AR Aging memo",
@@ -260,31 +274,33 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/fixed-asset-memo",
-            generator=generate_fixed_asset_testing_memo,
+            generator=lazy_callable("fixed_asset_testing_memo_generator:generate_fixed_asset_testing_memo"),
             result_kwarg="fa_result",
             filename_template="FixedAsset_Memo",
             log_label="Fixed Asset memo",
             error_code="fa_memo_export_error",
             docstring="Generate and download a Fixed Asset Testing Memo PDF.",
+            result_tool="fixed_asset_testing",
         ),
         FixedAssetExportInput,
     ),
     (
         MemoRegistryEntry(
             route_path="/export/inventory-memo",
-            generator=generate_inventory_testing_memo,
+            generator=lazy_callable("inventory_testing_memo_generator:generate_inventory_testing_memo"),
             result_kwarg="inv_result",
             filename_template="Inventory_Memo",
             log_label="Inventory memo",
             error_code="inv_memo_export_error",
             docstring="Generate and download an Inventory Testing Memo PDF.",
+            result_tool="inventory_testing",
         ),
         InventoryExportInput,
     ),
     (
         MemoRegistryEntry(
             route_path="/export/bank-rec-memo",
-            generator=generate_bank_rec_memo,
+            generator=lazy_callable("bank_reconciliation_memo_generator:generate_bank_rec_memo"),
             result_kwarg="rec_result",
             filename_template="BankRec_Memo",
             log_label="Bank Rec memo",
@@ -296,7 +312,7 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/multi-period-memo",
-            generator=generate_multi_period_memo,
+            generator=lazy_callable("multi_period_memo_generator:generate_multi_period_memo"),
             result_kwarg="comparison_result",
             filename_template="MultiPeriod_Memo",
             log_label="Multi-Period memo",
@@ -308,7 +324,7 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/currency-conversion-memo",
-            generator=generate_currency_conversion_memo,
+            generator=lazy_callable("currency_memo_generator:generate_currency_conversion_memo"),
             result_kwarg="conversion_result",
             filename_template="Currency_Conversion_Memo",
             log_label="Currency conversion memo",
@@ -320,7 +336,7 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/sampling-design-memo",
-            generator=generate_sampling_design_memo,
+            generator=lazy_callable("sampling_memo_generator:generate_sampling_design_memo"),
             result_kwarg="design_result",
             filename_template="Sampling_Design_Memo",
             log_label="Sampling design memo",
@@ -332,7 +348,7 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/preflight-memo",
-            generator=generate_preflight_memo,
+            generator=lazy_callable("preflight_memo_generator:generate_preflight_memo"),
             result_kwarg="preflight_result",
             filename_template="PreFlight_Memo",
             log_label="Pre-flight memo",
@@ -344,7 +360,7 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/population-profile-memo",
-            generator=generate_population_profile_memo,
+            generator=lazy_callable("population_profile_memo:generate_population_profile_memo"),
             result_kwarg="profile_result",
             filename_template="PopProfile_Memo",
             log_label="Population profile memo",
@@ -356,7 +372,7 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/expense-category-memo",
-            generator=generate_expense_category_memo,
+            generator=lazy_callable("expense_category_memo:generate_expense_category_memo"),
             result_kwarg="report_result",
             filename_template="ExpenseCategory_Memo",
             log_label="Expense category memo",
@@ -368,7 +384,7 @@ _STANDARD_REGISTRY: list[tuple[MemoRegistryEntry, type[BaseModel]]] = [
     (
         MemoRegistryEntry(
             route_path="/export/accrual-completeness-memo",
-            generator=generate_accrual_completeness_memo,
+            generator=lazy_callable("accrual_completeness_memo:generate_accrual_completeness_memo"),
             result_kwarg="report_result",
             filename_template="AccrualCompleteness_Memo",
             log_label="Accrual completeness memo",
@@ -395,15 +411,20 @@ def _register_standard_routes() -> None:
         ) -> Callable[..., StreamingResponse]:
             """Factory that captures registry entry per-closure."""
 
+            # Memos for tools with stored results also take a result_id body.
+            _body: Any = _schema if _entry.result_tool is None else StoredResultExportInput | _schema
+
             # We need the concrete schema type in the signature for FastAPI's
             # dependency-injection / OpenAPI generation.  Build a thin wrapper
             # whose annotation FastAPI will introspect.
             def _handler(
                 request: Request,
-                payload: _schema,  # type: ignore[valid-type]
+                payload: _body,
                 current_user: User = Depends(require_verified_user),
                 db: Session = Depends(get_db),
             ) -> StreamingResponse:
+                if _entry.result_tool is not None:
+                    payload = resolve_export_input(payload, _schema, tool=_entry.result_tool, user_id=current_user.id)
                 # Sprint 679: thread user + db for PDF branding.
                 return _memo_export_handler(_entry, payload, current_user=current_user, db=db)
 
@@ -430,7 +451,7 @@ _register_standard_routes()
 
 _SAMPLING_EVAL_ENTRY = MemoRegistryEntry(
     route_path="/export/sampling-evaluation-memo",
-    generator=generate_sampling_evaluation_memo,
+    generator=lazy_callable("sampling_memo_generator:generate_sampling_evaluation_memo"),
     result_kwarg="evaluation_result",
     filename_template="Sampling_Evaluation_Memo",
     log_label="Sampling evaluation memo",
@@ -462,7 +483,7 @@ def export_sampling_evaluation_memo(
 
 _FLUX_ENTRY = MemoRegistryEntry(
     route_path="/export/flux-expectations-memo",
-    generator=generate_flux_expectations_memo,
+    generator=lazy_callable("flux_expectations_memo:generate_flux_expectations_memo"),
     result_kwarg="flux_result",
     filename_template="FluxExpectations_Memo",
     log_label="Flux expectations memo",
@@ -3,6 +3,9 @@ Paciolus API — Testing CSV Export Routes (JE, AP, Payroll, TWM, Revenue, AR, F
 Sprint 155: Extracted from routes/export.py.
 Sprint 539: Schema-driven CSV serializer refactor — shared csv_export_handler.
 Sprint 725: csv_export_handler promoted to backend/shared/csv_export.py for cross-module reuse.
+
+Flagged-entry exports also accept a ``result_id`` body (``StoredResultExportInput``)
+in place of the full result; see ``shared/result_store.py``.
 """
 
 import logging
@@ -17,6 +20,7 @@ from shared.csv_export import ColumnSpec, csv_export_handler, diagnostic_csv_exp
 from shared.entitlement_checks import check_export_access
 from shared.filenames import sanitize_csv_value
 from shared.rate_limits import RATE_LIMIT_EXPORT, limiter
+from shared.result_store import resolve_export_input
 
 logger = logging.getLogger(__name__)
 from shared.export_schemas import (
@@ -28,6 +32,7 @@ from shared.export_schemas import (
     PayrollTestingExportInput,
     RevenueTestingExportInput,
     SamplingSelectionCSVInput,
+    StoredResultExportInput,
     ThreeWayMatchExportInput,
 )
 
@@ -208,10 +213,13 @@ def _ar_aging_summary_writer(writer: Any, composite_score: dict[str, Any]) -> No
 @limiter.limit(RATE_LIMIT_EXPORT)
 def export_csv_je_testing(
     request: Request,
-    je_input: JETestingExportInput,
+    je_input: StoredResultExportInput | JETestingExportInput,
     current_user: User = Depends(require_verified_user),
 ) -> StreamingResponse:
     """Export flagged journal entries as CSV."""
+    je_input = resolve_export_input(
+        je_input, JETestingExportInput, tool="journal_entry_testing", user_id=current_user.id
+    )
     return csv_export_handler(
         test_results=je_input.test_results,
         schema=JE_COLUMNS,
@@ -228,10 +236,11 @@ def export_csv_je_testing(
 @limiter.limit(RATE_LIMIT_EXPORT)
 def export_csv_ap_testing(
     request: Request,
-    ap_input: APTestingExportInput,
+    ap_input: StoredResultExportInput | APTestingExportInput,
     current_user: User = Depends(require_verified_user),
 ) -> StreamingResponse:
     """Export flagged AP payments as CSV."""
+    ap_input = resolve_export_input(ap_input, APTestingExportInput, tool="ap_testing", user_id=current_user.id)
     return csv_export_handler(
         test_results=ap_input.test_results,
         schema=AP_COLUMNS,
@@ -248,10 +257,13 @@ def export_csv_ap_testing(
 @limiter.limit(RATE_LIMIT_EXPORT)
 def export_csv_payroll_testing(
     request: Request,
-    payroll_input: PayrollTestingExportInput,
+    payroll_input: StoredResultExportInput | PayrollTestingExportInput,
     current_user: User = Depends(require_verified_user),
 ) -> StreamingResponse:
     """Export flagged payroll entries as CSV."""
+    payroll_input = resolve_export_input(
+        payroll_input, PayrollTestingExportInput, tool="payroll_testing", user_id=current_user.id
+    )
     return csv_export_handler(
         test_results=payroll_input.test_results,
         schema=PAYROLL_COLUMNS,
@@ -268,10 +280,13 @@ def export_csv_payroll_testing(
 @limiter.limit(RATE_LIMIT_EXPORT)
 def export_csv_revenue_testing(
     request: Request,
-    revenue_input: RevenueTestingExportInput,
+    revenue_input: StoredResultExportInput | RevenueTestingExportInput,
     current_user: User = Depends(require_verified_user),
 ) -> StreamingResponse:
     """Export flagged revenue entries as CSV."""
+    revenue_input = resolve_export_input(
+        revenue_input, RevenueTestingExportInput, tool="revenue_testing", user_id=current_user.id
+    )
     return csv_export_handler(
         test_results=revenue_input.test_results,
         schema=REVENUE_COLUMNS,
@@ -309,10 +324,13 @@ def export_csv_ar_aging(
 @limiter.limit(RATE_LIMIT_EXPORT)
 def export_csv_fixed_assets(
     request: Request,
-    fa_input: FixedAssetExportInput,
+    fa_input: StoredResultExportInput | FixedAssetExportInput,
     current_user: User = Depends(require_verified_user),
 ) -> StreamingResponse:
     """Export flagged fixed assets as CSV."""
+    fa_input = resolve_export_input(
+        fa_input, FixedAssetExportInput, tool="fixed_asset_testing", user_id=current_user.id
+    )
     return csv_export_handler(
         test_results=fa_input.test_results,
         schema=FA_COLUMNS,
@@ -329,10 +347,11 @@ def export_csv_fixed_assets(
 @limiter.limit(RATE_LIMIT_EXPORT)
 def export_csv_inventory(
     request: Request,
-    inv_input: InventoryExportInput,
+    inv_input: StoredResultExportInput | InventoryExportInput,
     current_user: User = Depends(require_verified_user),
 ) -> StreamingResponse:
     """Export flagged inventory items as CSV."""
+    inv_input = resolve_export_input(inv_input, InventoryExportInput, tool="inventory_testing", user_id=current_user.id)
     return csv_export_handler(
         test_results=inv_input.test_results,
         schema=INVENTORY_COLUMNS,
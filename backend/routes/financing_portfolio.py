@@ -0,0 +1,174 @@
+"""
+Financing Portfolio Routes.
+
+Form-input only — zero-storage compliant. Schedules a whole loan book and/or
+lease portfolio in one request (``financing_portfolio_engine``), returning
+per-instrument totals, a portfolio maturity analysis and journal-entry
+templates, with the combined schedule available as CSV or XLSX.
+
+Instruments use the same request shapes as the single-instrument loan
+amortization and lease accounting endpoints.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
+
+from auth import User, require_verified_user
+from financing_portfolio_engine import (
+    FinancingPortfolioResult,
+    PortfolioInputError,
+    PortfolioLoan,
+    generate_financing_portfolio,
+)
+from routes.lease_accounting import LeaseAccountingRequest
+from routes.lease_accounting import _build_config as _build_lease_config
+from routes.loan_amortization import LoanAmortizationRequest
+from routes.loan_amortization import _build_config as _build_loan_config
+from shared.entitlement_checks import check_export_access
+from shared.export_helpers import MEDIA_CSV, MEDIA_EXCEL
+from shared.export_spool import new_export_spool, streaming_spool_response
+from shared.lazy_import import lazy_callable
+from shared.rate_limits import RATE_LIMIT_AUDIT, limiter
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["financing-portfolio"])
+
+MAX_PORTFOLIO_INSTRUMENTS = 2000
+
+iter_portfolio_csv = lazy_callable("financing_portfolio_export:iter_portfolio_csv")
+write_portfolio_workbook = lazy_callable("financing_portfolio_export:write_portfolio_workbook")
+
+
+# =============================================================================
+# Schemas
+# =============================================================================
+
+
+class PortfolioLoanRequest(LoanAmortizationRequest):
+    name: str = Field(..., min_length=1, max_length=200)
+
+
+class FinancingPortfolioRequest(BaseModel):
+    loans: list[PortfolioLoanRequest] = Field(default_factory=list, max_length=MAX_PORTFOLIO_INSTRUMENTS)
+    leases: list[LeaseAccountingRequest] = Field(default_factory=list, max_length=MAX_PORTFOLIO_INSTRUMENTS)
+    as_of: Optional[date] = None
+
+    @model_validator(mode="after")
+    def _within_limits(self) -> FinancingPortfolioRequest:
+        count = len(self.loans) + len(self.leases)
+        if count == 0:
+            raise ValueError("Portfolio must contain at least one loan or lease.")
+        if count > MAX_PORTFOLIO_INSTRUMENTS:
+            raise ValueError(f"Portfolio exceeds {MAX_PORTFOLIO_INSTRUMENTS} instruments.")
+        return self
+
+
+class FinancingPortfolioResponse(BaseModel):
+    as_of: Optional[str]
+    instrument_count: int
+    loans: list[dict]
+    leases: list[dict]
+    maturity_analysis: list[dict]
+    journal_entry_templates: list[dict]
+    total_loan_principal: str
+    total_loan_interest: str
+    total_lease_liability: str
+    total_rou_asset: str
+    total_lease_interest: str
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _compute_or_400(payload: FinancingPortfolioRequest) -> FinancingPortfolioResult:
+    loans: list[PortfolioLoan] = []
+    for i, loan in enumerate(payload.loans, start=1):
+        try:
+            loans.append(PortfolioLoan(name=loan.name, config=_build_loan_config(loan)))
+        except HTTPException as e:
+            raise HTTPException(status_code=400, detail=f"Loan {i} ({loan.name}): {e.detail}")
+    leases = []
+    for i, lease in enumerate(payload.leases, start=1):
+        try:
+            leases.append(_build_lease_config(lease))
+        except HTTPException as e:
+            raise HTTPException(status_code=400, detail=f"Lease {i} ({lease.lease_name}): {e.detail}")
+    try:
+        return generate_financing_portfolio(loans, leases, as_of=payload.as_of)
+    except PortfolioInputError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+
+@router.post("/audit/financing-portfolio", response_model=FinancingPortfolioResponse)
+@limiter.limit(RATE_LIMIT_AUDIT)
+def calculate_financing_portfolio(
+    request: Request,
+    payload: FinancingPortfolioRequest,
+    current_user: User = Depends(require_verified_user),
+) -> FinancingPortfolioResponse:
+    """Schedule every loan and lease; return totals, maturities and entries.
+
+    Full per-period schedules are in the CSV / XLSX exports.
+    """
+    result = _compute_or_400(payload)
+    logger.info(
+        "Financing portfolio: %d loans, %d leases",
+        len(result.loan_results),
+        len(result.lease_results),
+    )
+    return FinancingPortfolioResponse(**result.to_dict())  # type: ignore[arg-type]
+
+
+@router.post(
+    "/audit/financing-portfolio/export.csv",
+    dependencies=[Depends(check_export_access)],
+)
+@limiter.limit(RATE_LIMIT_AUDIT)
+def export_financing_portfolio_csv(
+    request: Request,
+    payload: FinancingPortfolioRequest,
+    current_user: User = Depends(require_verified_user),
+) -> StreamingResponse:
+    """Combined schedule, maturity analysis and journal entries as CSV."""
+    result = _compute_or_400(payload)
+    return StreamingResponse(
+        iter_portfolio_csv(result),
+        media_type=MEDIA_CSV,
+        headers={"Content-Disposition": "attachment; filename=financing_portfolio.csv"},
+    )
+
+
+@router.post(
+    "/audit/financing-portfolio/export.xlsx",
+    dependencies=[Depends(check_export_access)],
+)
+@limiter.limit(RATE_LIMIT_AUDIT)
+def export_financing_portfolio_xlsx(
+    request: Request,
+    payload: FinancingPortfolioRequest,
+    current_user: User = Depends(require_verified_user),
+) -> StreamingResponse:
+    """Schedule, Maturity and Journal Entries sheets, streamed from a bounded spool."""
+    result = _compute_or_400(payload)
+    spool = new_export_spool()
+    try:
+        write_portfolio_workbook(result, spool)
+    except Exception:
+        spool.close()
+        raise
+    return streaming_spool_response(spool, "financing_portfolio.xlsx", MEDIA_EXCEL)
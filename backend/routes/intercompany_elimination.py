@@ -11,11 +11,13 @@ from __future__ import annotations
 import csv
 import io
 import logging
+from collections.abc import Iterator
 from decimal import Decimal, InvalidOperation
+from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, model_validator
 from sqlalchemy.orm import Session
 
 from auth import User, require_verified_user
@@ -24,8 +26,10 @@ from intercompany_elimination_engine import (
     EntityAccount,
     EntityTrialBalance,
     IntercompanyConfig,
+    IntercompanyEliminationResult,
     IntercompanyInputError,
     run_intercompany_elimination,
+    run_streaming_consolidation,
 )
 from shared.entitlement_checks import check_upload_limit
 from shared.error_messages import sanitize_error
@@ -36,6 +40,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["intercompany-elimination"])
 
+MAX_STANDARD_ENTITIES = 50
+MAX_SCALABLE_ENTITIES = 250
+
 
 class EntityAccountRequest(BaseModel):
     account: str = Field(..., min_length=1, max_length=200)
@@ -51,8 +58,19 @@ class EntityTBRequest(BaseModel):
 
 
 class IntercompanyEliminationRequest(BaseModel):
-    entities: list[EntityTBRequest] = Field(..., min_length=2, max_length=50)
+    entities: list[EntityTBRequest] = Field(..., min_length=2, max_length=MAX_SCALABLE_ENTITIES)
     tolerance: str = Field(default="1.00", max_length=12)
+    # "scalable" streams entities through ConsolidationBuilder and matches
+    # exact reciprocal pairs by hash — for groups beyond a few dozen entities.
+    mode: Literal["standard", "scalable"] = "standard"
+
+    @model_validator(mode="after")
+    def _entity_limit(self) -> IntercompanyEliminationRequest:
+        if self.mode == "standard" and len(self.entities) > MAX_STANDARD_ENTITIES:
+            raise ValueError(
+                f"Standard mode accepts at most {MAX_STANDARD_ENTITIES} entities; use mode='scalable' for larger groups."
+            )
+        return self
 
 
 def _to_decimal(field_name: str, raw: str) -> Decimal:
@@ -62,28 +80,37 @@ def _to_decimal(field_name: str, raw: str) -> Decimal:
         raise HTTPException(status_code=400, detail=f"Invalid numeric value for {field_name}: {raw!r}")
 
 
+def _iter_entities(payload: IntercompanyEliminationRequest) -> Iterator[EntityTrialBalance]:
+    """Convert one entity at a time so only the current TB's Decimals are live."""
+    for e in payload.entities:
+        yield EntityTrialBalance(
+            entity_id=e.entity_id,
+            entity_name=e.entity_name,
+            accounts=[
+                EntityAccount(
+                    account=a.account,
+                    debit=_to_decimal("debit", a.debit),
+                    credit=_to_decimal("credit", a.credit),
+                    counterparty_entity=a.counterparty_entity,
+                )
+                for a in e.accounts
+            ],
+        )
+
+
 def _build_config(payload: IntercompanyEliminationRequest) -> IntercompanyConfig:
     return IntercompanyConfig(
-        entities=[
-            EntityTrialBalance(
-                entity_id=e.entity_id,
-                entity_name=e.entity_name,
-                accounts=[
-                    EntityAccount(
-                        account=a.account,
-                        debit=_to_decimal("debit", a.debit),
-                        credit=_to_decimal("credit", a.credit),
-                        counterparty_entity=a.counterparty_entity,
-                    )
-                    for a in e.accounts
-                ],
-            )
-            for e in payload.entities
-        ],
+        entities=list(_iter_entities(payload)),
         tolerance=_to_decimal("tolerance", payload.tolerance),
     )
 
 
+def _run(payload: IntercompanyEliminationRequest) -> IntercompanyEliminationResult:
+    if payload.mode == "scalable":
+        return run_streaming_consolidation(_iter_entities(payload), _to_decimal("tolerance", payload.tolerance))
+    return run_intercompany_elimination(_build_config(payload))
+
+
 @router.post("/audit/intercompany-elimination")
 @limiter.limit(RATE_LIMIT_AUDIT)
 def run_consolidation(
@@ -97,7 +124,7 @@ def run_consolidation(
     check_upload_limit(current_user, db)
 
     try:
-        result = run_intercompany_elimination(_build_config(payload))
+        result = _run(payload)
     except IntercompanyInputError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except (ValueError, ValidationError) as e:
@@ -121,7 +148,7 @@ def export_consolidation_csv(
     enforce_tool_access(current_user, "intercompany_elimination", db)
 
     try:
-        result = run_intercompany_elimination(_build_config(payload))
+        result = _run(payload)
     except IntercompanyInputError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
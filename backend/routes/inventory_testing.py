@@ -1,15 +1,17 @@
 """
 Paciolus API — Inventory Testing Routes (Sprint 117)
 """
+from functools import partial
 from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from auth import require_verified_user
 from database import get_db
-from inventory_testing_engine import InventoryTestingConfig, run_inventory_testing
 from models import User
+from shared.analysis_job_schemas import ASYNC_JOB_RESPONSES
 from shared.rate_limits import RATE_LIMIT_AUDIT, limiter
 from shared.testing_response_schemas import InvTestingResponse
 from shared.testing_route import run_single_file_testing
@@ -17,7 +19,7 @@ from shared.testing_route import run_single_file_testing
 router = APIRouter(tags=["inventory_testing"])
 
 
-@router.post("/audit/inventory-testing", response_model=InvTestingResponse)
+@router.post("/audit/inventory-testing", response_model=InvTestingResponse, responses=ASYNC_JOB_RESPONSES)
 @limiter.limit(RATE_LIMIT_AUDIT)
 async def audit_inventory(
     request: Request,
@@ -25,23 +27,27 @@ async def audit_inventory(
     file: UploadFile = File(...),
     column_mapping: Optional[str] = Form(default=None),
     engagement_id: Optional[int] = Form(default=None),
+    async_job: bool = Form(default=False),
+    store_result: bool = Form(default=False),
     current_user: User = Depends(require_verified_user),
     db: Session = Depends(get_db),
-) -> dict[str, object]:
+) -> dict[str, object] | JSONResponse:
     """Run automated inventory register testing.
 
     IAS 2/ASC 330: Inventory assertions.
     ISA 501: Audit Evidence — Inventory.
     ISA 540: Auditing accounting estimates (NRV indicators).
     """
+    from inventory_testing_engine import InventoryTestingConfig, run_inventory_testing
+
     return await run_single_file_testing(
         file=file, column_mapping=column_mapping,
         engagement_id=engagement_id, current_user=current_user, db=db,
         background_tasks=background_tasks,
         tool_name="inventory_testing", mapping_key="inventory_testing",
         log_label="inventory", error_key="inventory_testing_error",
-        run_engine=lambda rows, cols, mapping, fn: run_inventory_testing(
-            rows=rows, column_names=cols,
-            config=InventoryTestingConfig(), column_mapping=mapping,
-        ),
+        engine=partial(run_inventory_testing, config=InventoryTestingConfig()),
+        async_job=async_job,
+        store_result=store_result,
+        response_model=InvTestingResponse,
     )
@@ -4,26 +4,29 @@ Paciolus API — Journal Entry Testing Routes
 
 import asyncio
 import logging
+from functools import partial
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from auth import require_verified_user
 from database import get_db
-from je_testing_engine import (
+from models import User
+from security_utils import log_secure_operation
+from services.audit.je_testing.analysis import (
     detect_gl_columns,
     parse_gl_entries,
     preview_sampling_strata,
-    run_je_testing,
+    run_je_testing_chunked,
     run_stratified_sampling,
 )
-from models import User
-from security_utils import log_secure_operation
 from shared.account_extractors import extract_je_accounts
+from shared.analysis_job_schemas import ASYNC_JOB_RESPONSES
 from shared.error_messages import sanitize_error
 from shared.helpers import (
     parse_json_list,
@@ -47,7 +50,7 @@ class SamplingPreviewResponse(BaseModel):
     stratify_by: list[str]
 
 
-@router.post("/audit/journal-entries", response_model=JETestingResponse)
+@router.post("/audit/journal-entries", response_model=JETestingResponse, responses=ASYNC_JOB_RESPONSES)
 @limiter.limit(RATE_LIMIT_AUDIT)
 async def audit_journal_entries(
     request: Request,
@@ -55,9 +58,11 @@ async def audit_journal_entries(
     file: UploadFile = File(...),
     column_mapping: Optional[str] = Form(default=None),
     engagement_id: Optional[int] = Form(default=None),
+    async_job: bool = Form(default=False),
+    store_result: bool = Form(default=False),
     current_user: User = Depends(require_verified_user),
     db: Session = Depends(get_db),
-) -> dict[str, Any]:
+) -> dict[str, Any] | JSONResponse:
     """Run automated journal entry testing on a General Ledger extract."""
     return await run_single_file_testing(
         file=file,
@@ -70,13 +75,12 @@ async def audit_journal_entries(
         mapping_key="je_testing",
         log_label="GL",
         error_key="je_testing_error",
-        run_engine=lambda rows, cols, mapping, fn: run_je_testing(
-            rows=rows,
-            column_names=cols,
-            config=None,
-            column_mapping=mapping,
-        ),
+        engine=partial(run_je_testing_chunked, config=None),
+        chunked=True,
         extract_accounts=extract_je_accounts,
+        async_job=async_job,
+        store_result=store_result,
+        response_model=JETestingResponse,
     )
 
 
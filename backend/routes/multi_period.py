@@ -24,10 +24,13 @@ from multi_period_comparison import (
     compare_trial_balances,
     export_movements_csv,
 )
+from multi_period_panel import MAX_PANEL_PERIODS, PanelInputError, PanelPeriod, PanelResult, build_multi_period_panel
 from security_utils import log_secure_operation
-from shared.account_extractors import extract_multi_period_accounts
+from shared.account_extractors import extract_multi_period_accounts, extract_multi_period_panel_accounts
+from shared.classification_cache import load_engagement_classification_cache, use_classification_cache
 from shared.diagnostic_response_schemas import (
     MovementSummaryResponse,
+    MultiPeriodPanelResponse,
     ThreeWayMovementSummaryResponse,
 )
 from shared.entitlement_checks import check_export_access
@@ -36,12 +39,18 @@ from shared.expectation_evaluation import (
     evaluate_expectations_against_measurements,
     extract_multi_period_measurements,
 )
+from shared.export_helpers import MEDIA_EXCEL
+from shared.export_spool import new_export_spool, streaming_spool_response
+from shared.lazy_import import lazy_callable
 from shared.rate_limits import RATE_LIMIT_AUDIT, RATE_LIMIT_EXPORT, limiter
 from shared.testing_route import enforce_tool_access
 from shared.tool_run_recorder import maybe_record_tool_run
 
 router = APIRouter(tags=["multi_period"])
 
+iter_panel_csv = lazy_callable("multi_period_panel_export:iter_panel_csv")
+write_panel_workbook = lazy_callable("multi_period_panel_export:write_panel_workbook")
+
 
 class AccountEntry(BaseModel):
     """Single account entry in a trial balance."""
@@ -136,6 +145,23 @@ class MovementExportRequest(BaseModel):
     significant_variance_amount: Optional[float] = Field(None, ge=0)
 
 
+class PanelPeriodRequest(BaseModel):
+    """One trial balance in a multi-period panel."""
+
+    label: str = Field(..., min_length=1, max_length=100, description="Period label (e.g. 'Jan 2025')")
+    accounts: list[dict] = Field(..., description="Account list for this period")
+
+
+class MultiPeriodPanelRequest(BaseModel):
+    """Request to align 2–36 trial balances (oldest first) into one panel."""
+
+    periods: list[PanelPeriodRequest] = Field(..., min_length=2, max_length=MAX_PANEL_PERIODS)
+    materiality_threshold: float = Field(0.0, ge=0, description="Materiality threshold in dollars")
+    significant_variance_percent: Optional[float] = Field(None, ge=0, le=100)
+    significant_variance_amount: Optional[float] = Field(None, ge=0)
+    engagement_id: Optional[int] = Field(None, description="Optional engagement whose classification cache to use")
+
+
 @router.post("/audit/compare-periods", response_model=MovementSummaryResponse)
 @limiter.limit(RATE_LIMIT_AUDIT)
 def compare_period_trial_balances(
@@ -154,14 +180,19 @@ def compare_period_trial_balances(
     )
 
     thresholds = _resolve_sig_thresholds(payload.significant_variance_percent, payload.significant_variance_amount)
-    result = compare_trial_balances(
-        prior_accounts=payload.prior_accounts,
-        current_accounts=payload.current_accounts,
-        prior_label=payload.prior_label,
-        current_label=payload.current_label,
-        materiality_threshold=payload.materiality_threshold,
-        thresholds=thresholds,
-    )
+    classification_cache = load_engagement_classification_cache(db, current_user.id, payload.engagement_id)
+    with use_classification_cache(classification_cache):
+        result = compare_trial_balances(
+            prior_accounts=payload.prior_accounts,
+            current_accounts=payload.current_accounts,
+            prior_label=payload.prior_label,
+            current_label=payload.current_label,
+            materiality_threshold=payload.materiality_threshold,
+            thresholds=thresholds,
+        )
+
+    if classification_cache is not None:
+        background_tasks.add_task(classification_cache.save, db)
 
     result_dict = result.to_dict()
     flagged = extract_multi_period_accounts(result_dict)
@@ -200,16 +231,21 @@ def compare_three_way_trial_balances(
     )
 
     thresholds = _resolve_sig_thresholds(payload.significant_variance_percent, payload.significant_variance_amount)
-    result = compare_three_periods(
-        prior_accounts=payload.prior_accounts,
-        current_accounts=payload.current_accounts,
-        budget_accounts=payload.budget_accounts,
-        prior_label=payload.prior_label,
-        current_label=payload.current_label,
-        budget_label=payload.budget_label,
-        materiality_threshold=payload.materiality_threshold,
-        thresholds=thresholds,
-    )
+    classification_cache = load_engagement_classification_cache(db, current_user.id, payload.engagement_id)
+    with use_classification_cache(classification_cache):
+        result = compare_three_periods(
+            prior_accounts=payload.prior_accounts,
+            current_accounts=payload.current_accounts,
+            budget_accounts=payload.budget_accounts,
+            prior_label=payload.prior_label,
+            current_label=payload.current_label,
+            budget_label=payload.budget_label,
+            materiality_threshold=payload.materiality_threshold,
+            thresholds=thresholds,
+        )
+
+    if classification_cache is not None:
+        background_tasks.add_task(classification_cache.save, db)
 
     result_dict = result.to_dict()
     flagged = extract_multi_period_accounts(result_dict)
@@ -290,3 +326,94 @@ def export_csv_movements(
     except (ValueError, KeyError, TypeError, UnicodeEncodeError) as e:
         logger.exception("Multi-period CSV movements export failed")
         raise HTTPException(status_code=500, detail=sanitize_error(e, "export", "csv_movements_export_error"))
+
+
+def _build_panel(
+    payload: MultiPeriodPanelRequest, background_tasks: BackgroundTasks, db: Session, user_id: int
+) -> PanelResult:
+    thresholds = _resolve_sig_thresholds(payload.significant_variance_percent, payload.significant_variance_amount)
+    classification_cache = load_engagement_classification_cache(db, user_id, payload.engagement_id)
+    try:
+        with use_classification_cache(classification_cache):
+            panel = build_multi_period_panel(
+                [PanelPeriod(label=p.label, accounts=p.accounts) for p in payload.periods],
+                materiality_threshold=payload.materiality_threshold,
+                thresholds=thresholds,
+            )
+    except PanelInputError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if classification_cache is not None:
+        background_tasks.add_task(classification_cache.save, db)
+    return panel
+
+
+@router.post("/audit/compare-panel", response_model=MultiPeriodPanelResponse)
+@limiter.limit(RATE_LIMIT_AUDIT)
+def compare_period_panel(
+    request: Request,
+    payload: MultiPeriodPanelRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(require_verified_user),
+    db: Session = Depends(get_db),
+) -> dict[str, object]:
+    """Align 2–36 trial balances into an accounts × periods panel with per-step movements."""
+    enforce_tool_access(current_user, "multi_period", db)
+    log_secure_operation(
+        "compare_period_panel",
+        f"User {current_user.id} panel: {len(payload.periods)} periods, "
+        f"{sum(len(p.accounts) for p in payload.periods)} account rows",
+    )
+    result_dict = _build_panel(payload, background_tasks, db, current_user.id).to_dict()
+    flagged = extract_multi_period_panel_accounts(result_dict)
+    background_tasks.add_task(
+        maybe_record_tool_run, db, payload.engagement_id, current_user.id, "multi_period", True, None, flagged
+    )
+    return result_dict
+
+
+@router.post("/export/csv/panel", dependencies=[Depends(check_export_access)])
+@limiter.limit(RATE_LIMIT_EXPORT)
+def export_csv_panel(
+    request: Request,
+    payload: MultiPeriodPanelRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(require_verified_user),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Export the multi-period panel (balances, movements, lead sheets) as CSV."""
+    enforce_tool_access(current_user, "multi_period", db)
+    log_secure_operation(
+        "csv_panel_export_start", f"User {current_user.id} exporting {len(payload.periods)}-period panel"
+    )
+    panel = _build_panel(payload, background_tasks, db, current_user.id)
+    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    return StreamingResponse(
+        iter_panel_csv(panel),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="Multi_Period_Panel_{timestamp}.csv"'},
+    )
+
+
+@router.post("/export/excel/panel", dependencies=[Depends(check_export_access)])
+@limiter.limit(RATE_LIMIT_EXPORT)
+def export_excel_panel(
+    request: Request,
+    payload: MultiPeriodPanelRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(require_verified_user),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Export the multi-period panel as an XLSX workbook streamed from a bounded spool."""
+    enforce_tool_access(current_user, "multi_period", db)
+    log_secure_operation(
+        "excel_panel_export_start", f"User {current_user.id} exporting {len(payload.periods)}-period panel"
+    )
+    panel = _build_panel(payload, background_tasks, db, current_user.id)
+    spool = new_export_spool()
+    try:
+        write_panel_workbook(panel, spool)
+    except Exception:
+        spool.close()
+        raise
+    timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    return streaming_spool_response(spool, f"Multi_Period_Panel_{timestamp}.xlsx", MEDIA_EXCEL)
@@ -1,15 +1,19 @@
 """
 Paciolus API — Payroll Testing Routes
 """
+from collections.abc import Iterable
+from functools import partial
 from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from auth import require_verified_user
 from database import get_db
 from models import User
-from payroll_testing_engine import run_payroll_testing
+from services.audit.payroll_testing.analysis import PayrollTestingResult, run_payroll_testing_chunked
+from shared.analysis_job_schemas import ASYNC_JOB_RESPONSES
 from shared.rate_limits import RATE_LIMIT_AUDIT, limiter
 from shared.testing_response_schemas import PayrollTestingResponse
 from shared.testing_route import run_single_file_testing
@@ -17,7 +21,20 @@ from shared.testing_route import run_single_file_testing
 router = APIRouter(tags=["payroll_testing"])
 
 
-@router.post("/audit/payroll-testing", response_model=PayrollTestingResponse)
+def _run_payroll_testing(
+    row_chunks: Iterable[list[dict]],
+    column_names: list[str],
+    column_mapping: Optional[dict[str, str]],
+    filename: str,
+) -> PayrollTestingResult:
+    """Adapt the payroll engine (headers first, takes filename) to the testing-route call."""
+    return run_payroll_testing_chunked(
+        headers=column_names, row_chunks=row_chunks, config=None,
+        column_mapping=column_mapping, filename=filename,
+    )
+
+
+@router.post("/audit/payroll-testing", response_model=PayrollTestingResponse, responses=ASYNC_JOB_RESPONSES)
 @limiter.limit(RATE_LIMIT_AUDIT)
 async def audit_payroll_testing(
     request: Request,
@@ -25,9 +42,11 @@ async def audit_payroll_testing(
     file: UploadFile = File(...),
     column_mapping: Optional[str] = Form(default=None),
     engagement_id: Optional[int] = Form(default=None),
+    async_job: bool = Form(default=False),
+    store_result: bool = Form(default=False),
     current_user: User = Depends(require_verified_user),
     db: Session = Depends(get_db),
-) -> dict[str, object]:
+) -> dict[str, object] | JSONResponse:
     """Run automated payroll & employee testing on a payroll register."""
     return await run_single_file_testing(
         file=file, column_mapping=column_mapping,
@@ -35,8 +54,9 @@ async def audit_payroll_testing(
         background_tasks=background_tasks,
         tool_name="payroll_testing", mapping_key="payroll_testing",
         log_label="payroll", error_key="payroll_testing_error",
-        run_engine=lambda rows, cols, mapping, fn: run_payroll_testing(
-            headers=cols, rows=rows, config=None,
-            column_mapping=mapping, filename=fn,
-        ),
+        engine=partial(_run_payroll_testing, filename=file.filename or ""),
+        chunked=True,
+        async_job=async_job,
+        store_result=store_result,
+        response_model=PayrollTestingResponse,
     )
@@ -21,6 +21,7 @@ from prior_period_comparison import compare_periods
 from shared.client_access import require_client_owner
 from shared.diagnostic_response_schemas import PeriodComparisonResponse
 from shared.rate_limits import RATE_LIMIT_AUDIT, RATE_LIMIT_WRITE, limiter
+from shared.trend_series import record_diagnostic_summary
 
 router = APIRouter(tags=["prior_period"])
 
@@ -173,13 +174,15 @@ async def save_prior_period(
     ):
         db.add(db_summary)
     db.refresh(db_summary)
-
-    return {
+    response = {
         "status": "success",
         "message": f"Period '{period_data.period_label}' saved successfully",
         "period_id": db_summary.id,
         "period_label": db_summary.period_label,
     }
+    record_diagnostic_summary(db, db_summary)
+
+    return response
 
 
 @router.get("/clients/{client_id}/periods", response_model=list[PeriodListItemResponse])
@@ -1,16 +1,19 @@
 """
 Paciolus API — Revenue Testing Routes (Sprint 104)
 """
+from functools import partial
 from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from auth import require_verified_user
 from database import get_db
 from models import User
-from revenue_testing_engine import RevenueTestingConfig, run_revenue_testing
+from services.audit.revenue_testing.analysis import RevenueTestingConfig, run_revenue_testing_chunked
 from shared.account_extractors import extract_revenue_accounts
+from shared.analysis_job_schemas import ASYNC_JOB_RESPONSES
 from shared.rate_limits import RATE_LIMIT_AUDIT, limiter
 from shared.testing_response_schemas import RevenueTestingResponse
 from shared.testing_route import run_single_file_testing
@@ -18,7 +21,7 @@ from shared.testing_route import run_single_file_testing
 router = APIRouter(tags=["revenue_testing"])
 
 
-@router.post("/audit/revenue-testing", response_model=RevenueTestingResponse)
+@router.post("/audit/revenue-testing", response_model=RevenueTestingResponse, responses=ASYNC_JOB_RESPONSES)
 @limiter.limit(RATE_LIMIT_AUDIT)
 async def audit_revenue(
     request: Request,
@@ -26,12 +29,14 @@ async def audit_revenue(
     file: UploadFile = File(...),
     column_mapping: Optional[str] = Form(default=None),
     engagement_id: Optional[int] = Form(default=None),
+    async_job: bool = Form(default=False),
+    store_result: bool = Form(default=False),
     prior_period_total: Optional[float] = Form(default=None),
     period_start: Optional[str] = Form(default=None),
     period_end: Optional[str] = Form(default=None),
     current_user: User = Depends(require_verified_user),
     db: Session = Depends(get_db),
-) -> dict[str, object]:
+) -> dict[str, object] | JSONResponse:
     """Run automated revenue recognition testing on a revenue GL extract.
 
     ISA 240: Presumed fraud risk in revenue recognition.
@@ -48,8 +53,10 @@ async def audit_revenue(
         background_tasks=background_tasks,
         tool_name="revenue_testing", mapping_key="revenue_testing",
         log_label="revenue", error_key="revenue_testing_error",
-        run_engine=lambda rows, cols, mapping, fn: run_revenue_testing(
-            rows=rows, column_names=cols, config=config, column_mapping=mapping,
-        ),
+        engine=partial(run_revenue_testing_chunked, config=config),
+        chunked=True,
         extract_accounts=extract_revenue_accounts,
+        async_job=async_job,
+        store_result=store_result,
+        response_model=RevenueTestingResponse,
     )
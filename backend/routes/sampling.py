@@ -16,7 +16,6 @@ from sqlalchemy.orm import Session
 from auth import require_verified_user
 from database import get_db
 from models import User
-from sampling_engine import InsufficientPopulationResult, SamplingConfig, design_sample, evaluate_sample
 from shared.error_messages import sanitize_error
 from shared.helpers import parse_json_mapping
 from shared.rate_limits import RATE_LIMIT_AUDIT, limiter
@@ -44,6 +43,8 @@ def _run_design(
     column_mapping: Optional[dict[str, str]],
 ) -> dict:
     """CPU-bound: parse population, calculate, and select sample."""
+    from sampling_engine import InsufficientPopulationResult, SamplingConfig, design_sample
+
     config = SamplingConfig(
         method=method,
         confidence_level=confidence_level,
@@ -119,6 +120,8 @@ def _run_evaluation(
     column_mapping: Optional[dict[str, str]],
 ) -> dict:
     """CPU-bound: parse completed sample and evaluate."""
+    from sampling_engine import SamplingConfig, evaluate_sample
+
     config = SamplingConfig(
         method=method,
         confidence_level=confidence_level,
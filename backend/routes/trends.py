@@ -2,7 +2,6 @@
 Paciolus API — Trend Analysis & Industry Ratios Routes
 """
 
-from datetime import date as date_type
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -12,14 +11,14 @@ from sqlalchemy.orm import Session
 from auth import require_current_user
 from database import get_db
 from models import Client, DiagnosticSummary, PeriodType, User
-from ratio_engine import (
-    CategoryTotals,
-    PeriodSnapshot,
-    RollingWindowAnalyzer,
-    TrendAnalyzer,
-)
 from security_utils import log_secure_operation
 from shared.client_access import require_client_owner
+from shared.pagination import PaginatedResponse, PaginationParams
+from shared.trend_series import (
+    client_rolling_analysis,
+    client_trend_analysis,
+    portfolio_trends,
+)
 
 router = APIRouter(tags=["trends"])
 
@@ -32,6 +31,14 @@ class ClientTrendsResponse(BaseModel):
     period_type_filter: Optional[str] = None
 
 
+class PortfolioClientTrend(BaseModel):
+    client_id: int
+    client_name: str
+    periods_analyzed: int
+    latest_summary_id: Optional[int] = None
+    analysis: Optional[dict] = None
+
+
 class IndustryRatiosResponse(BaseModel):
     client_id: int
     client_name: str
@@ -53,81 +60,31 @@ class RollingAnalysisResponse(BaseModel):
     period_type_filter: Optional[str] = None
 
 
-def _summaries_to_snapshots(summaries: list[Any]) -> list[PeriodSnapshot]:
-    """Convert DiagnosticSummary list to PeriodSnapshot list."""
-    snapshots = []
-    for summary in summaries:
-        if summary.period_date:
-            snapshot_date = summary.period_date
-        else:
-            snapshot_date = summary.timestamp.date() if summary.timestamp else date_type.today()
-
-        snapshot_period_type = summary.period_type.value if summary.period_type else "monthly"
-
-        totals = CategoryTotals(
-            total_assets=summary.total_assets or 0.0,
-            current_assets=summary.current_assets or 0.0,
-            inventory=summary.inventory or 0.0,
-            total_liabilities=summary.total_liabilities or 0.0,
-            current_liabilities=summary.current_liabilities or 0.0,
-            total_equity=summary.total_equity or 0.0,
-            total_revenue=summary.total_revenue or 0.0,
-            cost_of_goods_sold=summary.cost_of_goods_sold or 0.0,
-            total_expenses=summary.total_expenses or 0.0,
-            operating_expenses=summary.operating_expenses or 0.0,
-        )
+def _parse_period_type(period_type: str | None) -> PeriodType | None:
+    if not period_type:
+        return None
+    try:
+        return PeriodType(period_type)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid period_type. Must be one of: monthly, quarterly, annual")
 
-        ratios = {}
-        if summary.current_ratio is not None:
-            ratios["current_ratio"] = summary.current_ratio
-        if summary.quick_ratio is not None:
-            ratios["quick_ratio"] = summary.quick_ratio
-        if summary.debt_to_equity is not None:
-            ratios["debt_to_equity"] = summary.debt_to_equity
-        if summary.gross_margin is not None:
-            ratios["gross_margin"] = summary.gross_margin
-        if summary.net_profit_margin is not None:
-            ratios["net_profit_margin"] = summary.net_profit_margin
-        if summary.operating_margin is not None:
-            ratios["operating_margin"] = summary.operating_margin
-        if summary.return_on_assets is not None:
-            ratios["return_on_assets"] = summary.return_on_assets
-        if summary.return_on_equity is not None:
-            ratios["return_on_equity"] = summary.return_on_equity
-
-        snapshot = PeriodSnapshot(
-            period_date=snapshot_date,
-            period_type=snapshot_period_type,
-            category_totals=totals,
-            ratios=ratios,
-        )
-        snapshots.append(snapshot)
-    return snapshots
-
-
-def _get_client_summaries(
-    db: Session, client_id: int, user_id: int, period_type: str | None = None, limit: int = 36
-) -> list:
-    """Query historical summaries for a client (active only — excludes archived)."""
-    query = db.query(DiagnosticSummary).filter(
-        DiagnosticSummary.client_id == client_id,
-        DiagnosticSummary.user_id == user_id,
-        DiagnosticSummary.archived_at.is_(None),
-    )
 
-    if period_type:
-        try:
-            pt = PeriodType(period_type)
-            query = query.filter(DiagnosticSummary.period_type == pt)
-        except ValueError:
-            raise HTTPException(
-                status_code=400, detail="Invalid period_type. Must be one of: monthly, quarterly, annual"
-            )
-
-    return (
-        query.order_by(DiagnosticSummary.period_date.asc().nullslast(), DiagnosticSummary.timestamp.asc())
-        .limit(limit)
-        .all()
+@router.get("/clients/portfolio/trends", response_model=PaginatedResponse[PortfolioClientTrend])
+def get_portfolio_trends(
+    pagination: PaginationParams = Depends(),
+    current_user: User = Depends(require_current_user),
+    db: Session = Depends(get_db),
+) -> PaginatedResponse[PortfolioClientTrend]:
+    """Get the default trend analysis for every client the user owns, one page at a time."""
+    log_secure_operation("portfolio_trends_request", f"User {current_user.id} requesting portfolio trends")
+
+    items, total_count = portfolio_trends(db, current_user.id, limit=pagination.page_size, offset=pagination.offset)
+
+    return PaginatedResponse[PortfolioClientTrend](
+        items=[PortfolioClientTrend(**item) for item in items],
+        total_count=total_count,
+        page=pagination.page,
+        page_size=pagination.page_size,
     )
 
 
@@ -143,24 +100,20 @@ def get_client_trends(
     """Get trend analysis for a client's historical diagnostic data."""
     log_secure_operation("trend_analysis_request", f"User {current_user.id} requesting trends for client {client_id}")
 
-    summaries = _get_client_summaries(db, client_id, current_user.id, period_type, limit)
+    analysis, periods = client_trend_analysis(db, client_id, current_user.id, _parse_period_type(period_type), limit)
 
-    if len(summaries) < 2:
+    if analysis is None:
         raise HTTPException(
-            status_code=422, detail=f"Need at least 2 diagnostic summaries for trend analysis, found {len(summaries)}"
+            status_code=422, detail=f"Need at least 2 diagnostic summaries for trend analysis, found {periods}"
         )
 
-    snapshots = _summaries_to_snapshots(summaries)
-    analyzer = TrendAnalyzer(snapshots)
-    analysis = analyzer.get_full_analysis()
-
-    log_secure_operation("trend_analysis_complete", f"Analyzed {len(snapshots)} periods for client {client_id}")
+    log_secure_operation("trend_analysis_complete", f"Analyzed {periods} periods for client {client_id}")
 
     return {
         "client_id": client_id,
         "client_name": client.name,
         "analysis": analysis,
-        "periods_analyzed": len(snapshots),
+        "periods_analyzed": periods,
         "period_type_filter": period_type,
     }
 
@@ -260,17 +213,13 @@ def get_client_rolling_analysis(
     if window is not None and window not in [3, 6, 12]:
         raise HTTPException(status_code=400, detail="Invalid window size. Must be 3, 6, or 12 months.")
 
-    summaries = _get_client_summaries(db, client_id, current_user.id, period_type, 36)
+    analysis, periods = client_rolling_analysis(db, client_id, current_user.id, _parse_period_type(period_type))
 
-    if len(summaries) < 2:
+    if analysis is None:
         raise HTTPException(
-            status_code=422, detail=f"Need at least 2 diagnostic summaries for rolling analysis, found {len(summaries)}"
+            status_code=422, detail=f"Need at least 2 diagnostic summaries for rolling analysis, found {periods}"
         )
 
-    snapshots = _summaries_to_snapshots(summaries)
-    analyzer = RollingWindowAnalyzer(snapshots)
-    analysis = analyzer.get_full_analysis()
-
     if window is not None:
         for key in analysis.get("category_rolling", {}):
             metric = analysis["category_rolling"][key]
@@ -284,13 +233,13 @@ def get_client_rolling_analysis(
                 filtered = {k: v for k, v in metric["rolling_averages"].items() if k == str(window)}
                 metric["rolling_averages"] = filtered
 
-    log_secure_operation("rolling_analysis_complete", f"Analyzed {len(snapshots)} periods for client {client_id}")
+    log_secure_operation("rolling_analysis_complete", f"Analyzed {periods} periods for client {client_id}")
 
     return {
         "client_id": client_id,
         "client_name": client.name,
         "analysis": analysis,
-        "periods_analyzed": len(snapshots),
+        "periods_analyzed": periods,
         "window_filter": window,
         "period_type_filter": period_type,
     }
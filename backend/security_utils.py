@@ -3,7 +3,12 @@
 import gc
 import io
 import re
-from collections.abc import Callable, Generator
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from functools import wraps
 from types import TracebackType
 from typing import Any
@@ -74,6 +79,8 @@ def read_csv_chunked(
     file_bytes: bytes,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     dtype: dict | type | None = None,
+    usecols: list[int] | None = None,
+    thousands: str | None = None,
 ) -> Generator[tuple[pd.DataFrame, int], None, None]:
     """Yield CSV chunks as (DataFrame, rows_processed) tuples."""
     log_secure_operation("read_csv_chunked", f"Starting chunked read (chunk_size={chunk_size})")
@@ -82,7 +89,7 @@ def read_csv_chunked(
     rows_processed = 0
 
     try:
-        for chunk in pd.read_csv(buffer, chunksize=chunk_size, dtype=dtype):
+        for chunk in pd.read_csv(buffer, chunksize=chunk_size, dtype=dtype, usecols=usecols, thousands=thousands):
             rows_processed += len(chunk)
             yield chunk, rows_processed
 
@@ -103,6 +110,7 @@ def read_excel_chunked(
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     sheet_name: int | str = 0,
     dtype: dict | type | None = None,
+    usecols: list[int] | None = None,
 ) -> Generator[tuple[pd.DataFrame, int], None, None]:
     """Yield Excel chunks as (DataFrame, rows_processed) tuples. Reads entire file first."""
     log_secure_operation("read_excel_chunked", f"Starting chunked read (chunk_size={chunk_size}, sheet={sheet_name})")
@@ -112,7 +120,7 @@ def read_excel_chunked(
 
     try:
         # Read Excel file (unfortunately must load entirely due to format limitations)
-        full_df = pd.read_excel(buffer, sheet_name=sheet_name, dtype=dtype)
+        full_df = pd.read_excel(buffer, sheet_name=sheet_name, dtype=dtype, usecols=usecols)
         total_rows = len(full_df)
 
         # Yield in chunks
@@ -212,14 +220,97 @@ def _strip_currency_formatting(value: object) -> object:
     return f"-{cleaned}" if negative else cleaned
 
 
+def parse_amount_column(values: pd.Series) -> pd.Series:
+    """Float amounts from a debit/credit column; unparseable cells become NaN.
+
+    Numeric columns pass through. Text goes through ``pd.to_numeric`` first;
+    only the cells it rejects are retried with the ``_strip_currency_formatting``
+    rules, so ``"$1,234.50"`` and ``"(1,234.56)"`` parse while ``"n/a"`` does not.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype("float64")
+    amounts = pd.to_numeric(values, errors="coerce").astype("float64")
+    retry = amounts.isna() & values.notna()
+    if retry.any():
+        text = values[retry].astype(str).str.strip()
+        shaped = text.str.match(_CURRENCY_NUMERIC_RE)
+        cleaned = text[shaped].str.replace(r"[\s$£€,]", "", regex=True)
+        negative = cleaned.str.startswith("(") & cleaned.str.endswith(")")
+        parsed = pd.to_numeric(cleaned.str.strip("()"), errors="coerce")
+        amounts[parsed.index] = parsed.mask(negative, -parsed)
+    return amounts
+
+
+@dataclass(frozen=True)
+class TBColumnPlan:
+    """How to read a trial balance once its header row has been mapped.
+
+    Positions index ``header`` (the file's header row as pandas reads it).
+    Identifier columns are read as ``str`` so leading-zero codes like
+    ``"0010"`` survive, amount columns are parsed to float at read time,
+    and every other column is skipped.
+    """
+
+    header: tuple[str, ...]
+    text_columns: tuple[int, ...]
+    amount_columns: tuple[int, ...]
+
+    @property
+    def usecols(self) -> list[int]:
+        return sorted({*self.text_columns, *self.amount_columns})
+
+    @property
+    def dtype(self) -> dict[str, type]:
+        return {self.header[i]: str for i in self.text_columns}
+
+    @property
+    def amount_names(self) -> list[str]:
+        return [self.header[i] for i in self.amount_columns]
+
+
+def read_tb_header(file_bytes: bytes, filename: str = "") -> list[str] | None:
+    """Header row of a CSV or Excel trial balance, or None for other formats.
+
+    Unreadable files also return None; the full read then raises the usual
+    parse error.
+    """
+    filename_lower = filename.lower()
+    try:
+        if filename_lower.endswith(".csv"):
+            return list(pd.read_csv(io.BytesIO(file_bytes), nrows=0).columns)
+        if filename_lower.endswith((".xlsx", ".xls")):
+            return list(pd.read_excel(io.BytesIO(file_bytes), nrows=0).columns)
+    except Exception:  # noqa: BLE001
+        # Format errors surface from the full read instead.
+        return None
+    return None
+
+
+def _apply_column_plan(
+    chunks: Iterable[tuple[pd.DataFrame, int]], plan: TBColumnPlan
+) -> Generator[tuple[pd.DataFrame, int], None, None]:
+    """Finish amount parsing for columns the native reader left as text."""
+    for chunk, rows_processed in chunks:
+        for name in plan.amount_names:
+            if name in chunk.columns:
+                chunk[name] = parse_amount_column(chunk[name])
+        yield chunk, rows_processed
+
+
 def process_tb_chunked(
-    file_bytes: bytes, filename: str = "", chunk_size: int = DEFAULT_CHUNK_SIZE
+    file_bytes: bytes,
+    filename: str = "",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    column_plan: TBColumnPlan | None = None,
 ) -> Generator[tuple[pd.DataFrame, int], None, None]:
     """Process trial balance in chunks, auto-detecting format. Yields (chunk, rows_processed).
 
-    All columns are read as ``str`` to preserve account identifiers (e.g.
-    leading-zero codes like ``"0010"``).  Numeric conversion for debit/credit
-    columns happens downstream via ``pd.to_numeric(errors='coerce')``.
+    Without a ``column_plan`` all columns are read as ``str`` to preserve
+    account identifiers (e.g. leading-zero codes like ``"0010"``), and
+    numeric conversion for debit/credit columns happens downstream via
+    ``parse_amount_column``. With one (see
+    ``StreamingAuditor.column_plan``), CSV and Excel reads keep only the
+    planned columns and return the amount columns as float.
 
     Sprint 671 Issue 14: This dispatcher historically only routed CSV and
     Excel. Every other supported format (PDF, DOCX, ODS, OFX, QBO, IIF,
@@ -236,9 +327,19 @@ def process_tb_chunked(
     filename_lower = filename.lower()
 
     if filename_lower.endswith((".xlsx", ".xls")):
+        if column_plan is not None:
+            chunks = read_excel_chunked(file_bytes, chunk_size, dtype=column_plan.dtype, usecols=column_plan.usecols)
+            yield from _apply_column_plan(chunks, column_plan)
+            return
         yield from read_excel_chunked(file_bytes, chunk_size, dtype=str)
         return
     if filename_lower.endswith(".csv"):
+        if column_plan is not None:
+            chunks = read_csv_chunked(
+                file_bytes, chunk_size, dtype=column_plan.dtype, usecols=column_plan.usecols, thousands=","
+            )
+            yield from _apply_column_plan(chunks, column_plan)
+            return
         yield from read_csv_chunked(file_bytes, chunk_size, dtype=str)
         return
 
@@ -318,23 +419,76 @@ def dataframe_to_bytes(df: pd.DataFrame, format: str = "csv") -> bytes:
     return result
 
 
-# Audit trail for security compliance (in-memory only)
-_security_log: list[dict] = []
+# Audit trail for security compliance (in-memory only).
+# A fixed-size ring of raw (epoch seconds, operation, details, sample rate)
+# tuples: deque.append with maxlen drops the oldest entry in O(1) and, like
+# deque.copy, is atomic under the GIL, so the hot path takes no lock.
+# Timestamps are only formatted when the log is read.
+SECURITY_LOG_CAPACITY = 1000
+_security_log: deque[tuple[float, str, str, int]] = deque(maxlen=SECURITY_LOG_CAPACITY)
+
+# Per-operation sampling ("keep every Nth"), parsed from
+# SECURITY_LOG_SAMPLE_RATES on first use. Only sampled operations touch the
+# counter lock.
+_sample_every: dict[str, int] | None = None
+_sample_counts: dict[str, int] = {}
+_sample_lock = threading.Lock()
+
+
+def _parse_sample_rates(spec: str) -> dict[str, int]:
+    """Parse ``"op=N,op2=M"`` into {operation: N}, ignoring malformed or N<=1 entries."""
+    rates: dict[str, int] = {}
+    for item in spec.split(","):
+        name, sep, raw = item.partition("=")
+        if not sep:
+            continue
+        try:
+            every = int(raw.strip())
+        except ValueError:
+            continue
+        if name.strip() and every > 1:
+            rates[name.strip()] = every
+    return rates
+
+
+def _load_sample_rates() -> dict[str, int]:
+    global _sample_every
+    from config import SECURITY_LOG_SAMPLE_RATES
+
+    _sample_every = _parse_sample_rates(SECURITY_LOG_SAMPLE_RATES)
+    return _sample_every
 
 
 def log_secure_operation(operation: str, details: str = "") -> None:
-    """Log a security-relevant operation (in-memory only)."""
-    from datetime import UTC, datetime
+    """Log a security-relevant operation (in-memory only).
 
-    _security_log.append({"timestamp": datetime.now(UTC).isoformat(), "operation": operation, "details": details})
-    # Keep only last 1000 entries in memory
-    if len(_security_log) > 1000:
-        _security_log.pop(0)
+    Operations listed in SECURITY_LOG_SAMPLE_RATES keep only their first call
+    and every Nth after it; the kept entries report ``sampled_every``.
+    """
+    rates = _sample_every if _sample_every is not None else _load_sample_rates()
+    every = rates.get(operation, 1) if rates else 1
+    if every > 1:
+        with _sample_lock:
+            seen = _sample_counts.get(operation, 0)
+            _sample_counts[operation] = seen + 1
+        if seen % every:
+            return
+    _security_log.append((time.time(), operation, details, every))
 
 
 def get_security_log() -> list[dict]:
-    """Retrieve the in-memory security log."""
-    return _security_log.copy()
+    """Retrieve the in-memory security log, oldest entry first."""
+    entries = []
+    for ts, operation, details, every in _security_log.copy():
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(ts, UTC).isoformat(),
+            "operation": operation,
+            "details": details,
+        }
+        if every > 1:
+            entry["sampled_every"] = every
+        entries.append(entry)
+    return entries
 
 
 def process_tb_in_memory(file_bytes: bytes, filename: str = "") -> pd.DataFrame:
@@ -24,6 +24,7 @@ Audit Standards References:
 import re
 import statistics
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from decimal import Decimal
 from difflib import SequenceMatcher
@@ -556,20 +557,22 @@ class APTestingResult:
 def parse_ap_payments(
     rows: list[dict],
     detection: APColumnDetectionResult,
+    row_offset: int = 0,
 ) -> list[APPayment]:
     """Parse raw AP rows into APPayment objects using detected columns.
 
     Args:
         rows: List of dicts (each row from CSV/Excel)
         detection: Column detection result mapping column names
+        row_offset: Rows in earlier chunks, added to each row number
 
     Returns:
         List of APPayment objects
     """
     payments: list[APPayment] = []
 
-    for idx, row in enumerate(rows):
-        payment = APPayment(row_number=idx + 1)
+    for idx, row in enumerate(rows, start=row_offset + 1):
+        payment = APPayment(row_number=idx)
 
         # Required fields
         if detection.vendor_name_column:
@@ -2020,8 +2023,8 @@ class APTestingEngine(AuditEngineBase):
         detection.overall_confidence = 1.0
         return detection
 
-    def parse_data(self, rows: list[dict], detection: Any) -> list:
-        return parse_ap_payments(rows, detection)
+    def parse_data(self, rows: list[dict], detection: Any, row_offset: int = 0) -> list:
+        return parse_ap_payments(rows, detection, row_offset)
 
     def run_quality_checks(self, entries: list, detection: Any) -> Any:
         return assess_ap_data_quality(entries, detection)
@@ -2079,3 +2082,15 @@ def run_ap_testing(
     engine = APTestingEngine(config)
     result: APTestingResult = engine.run_pipeline(rows, column_names, column_mapping)
     return result
+
+
+def run_ap_testing_chunked(
+    row_chunks: Iterable[list[dict]],
+    column_names: list[str],
+    config: Optional[APTestingConfig] = None,
+    column_mapping: Optional[dict] = None,
+) -> APTestingResult:
+    """run_ap_testing() over row chunks (see shared.upload_pipeline.parse_uploaded_file_chunked)."""
+    engine = APTestingEngine(config)
+    result: APTestingResult = engine.run_pipeline_chunked(row_chunks, column_names, column_mapping)
+    return result
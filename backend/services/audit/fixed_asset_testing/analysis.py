@@ -26,6 +26,8 @@ from datetime import date
 from decimal import Decimal
 from typing import Optional
 
+from depreciation_engine import AssetConfig, BookMethod, YearEntry
+from depreciation_register_engine import generate_depreciation_register
 from shared.column_detector import ColumnFieldConfig, detect_columns
 from shared.data_quality import FieldQualityConfig
 from shared.data_quality import assess_data_quality as _shared_assess_dq
@@ -1378,29 +1380,53 @@ def test_lease_indicators(
 # =============================================================================
 
 
+def _recalc_book_method(method: str) -> Optional[tuple[BookMethod, Decimal, str]]:
+    """Map a register's free-text depreciation method onto the engine's."""
+    if "straight" in method or method in ("sl", "s/l", "s-l"):
+        return BookMethod.STRAIGHT_LINE, Decimal("2"), "Straight-Line"
+    if ("sum" in method and "year" in method) or method == "syd":
+        return BookMethod.SUM_OF_YEARS_DIGITS, Decimal("2"), "Sum-of-the-Years' Digits"
+    if "150" in method and "declining" in method:
+        return BookMethod.DECLINING_BALANCE, Decimal("1.5"), "150% Declining Balance"
+    if "declining" in method or "ddb" in method or "double" in method:
+        return BookMethod.DECLINING_BALANCE, Decimal("2"), "Double-Declining Balance"
+    return None
+
+
+def _accumulated_at(schedule: list[YearEntry], years_elapsed: float) -> Decimal:
+    """Accumulated depreciation after ``years_elapsed`` years of ``schedule``.
+
+    Whole years come straight from the schedule; the current partial year is
+    pro-rated from that year's charge.
+    """
+    whole = int(years_elapsed)
+    if whole >= len(schedule):
+        return schedule[-1].accumulated_depreciation
+    accumulated = schedule[whole - 1].accumulated_depreciation if whole else Decimal("0")
+    fraction = Decimal(str(round(years_elapsed - whole, 6)))
+    return accumulated + schedule[whole].depreciation * fraction
+
+
 def test_depreciation_recalculation(
     entries: list[FixedAssetEntry],
     config: FixedAssetTestingConfig,
 ) -> FATestResult:
     """FA-T11: Depreciation Recalculation (IAS 16 / ASC 360).
 
-    Sprint 682 — when cost, residual_value, useful_life, and
-    depreciation_method are all present, recalculate expected annual
-    depreciation and flag entries whose reported accumulated
-    depreciation deviates materially from the expected amount.
-
-    Supported methods:
-      * Straight-Line (SL): annual = (cost − residual) / useful_life
-      * Double-Declining Balance (DDB): annual ≈ 2/useful_life × NBV
-        — approximated here as a one-year average charge on the
-        straight-line baseline; without an acquisition_date-based
-        year count we can't compute compound DDB. Tolerance is wider
-        for DDB to absorb that approximation.
-
-    The test compares the *annual* expected charge against accumulated
-    depreciation / years_elapsed where years_elapsed is derived from
-    acquisition_date. Rows lacking any required input are silently
-    skipped (not flagged) — this test is additive on top of FA-T02
+    Sprint 682 — when cost, residual_value, useful_life,
+    depreciation_method and acquisition_date are all present, recalculate
+    expected accumulated depreciation and flag entries whose reported
+    accumulated depreciation deviates materially from it.
+
+    Every qualifying asset is scheduled in one pass through the register
+    engine (``depreciation_register_engine``), so the expectation is the
+    exact book schedule — straight-line, double / 150% declining balance
+    with the switch to SL, or sum-of-the-years' digits — read at
+    years_elapsed (whole years from the schedule, the current year
+    pro-rated). Useful life is rounded to whole years for the schedule.
+
+    Rows lacking any required input, or whose method cannot be mapped, are
+    silently skipped (not flagged) — this test is additive on top of FA-T02
     missing-required-fields, which is the structural check.
     """
     from datetime import UTC as _UTC
@@ -1409,17 +1435,20 @@ def test_depreciation_recalculation(
     # 5% tolerance — per sprint plan; tighter than typical estimate-
     # based recalcs (10-15%) but loose enough to absorb depreciation-
     # convention noise (half-year, mid-quarter, etc.).
-    SL_TOLERANCE = Decimal("0.05")
-    DDB_TOLERANCE = Decimal("0.15")  # wider to absorb compound vs. linear approx
+    tolerance = Decimal("0.05")
 
     flagged: list[FlaggedFixedAsset] = []
     today = _dt.now(_UTC).date()
+    candidates: list[tuple[FixedAssetEntry, str, float]] = []
+    asset_configs: list[AssetConfig] = []
 
     for e in entries:
         if not e.useful_life or e.useful_life <= 0:
             continue
         if e.cost <= 0:
             continue
+        if e.residual_value < 0 or e.residual_value >= e.cost:
+            continue
         if not e.acquisition_date:
             continue
         if not e.depreciation_method:
@@ -1442,28 +1471,28 @@ def test_depreciation_recalculation(
             # cover those cases — skip to avoid double-flagging.
             continue
 
-        method = (e.depreciation_method or "").lower()
-        expected_annual = Decimal("0")
-        tolerance = SL_TOLERANCE
-        method_used = ""
-        if "straight" in method or method in ("sl", "s/l", "s-l"):
-            depreciable_base = e.cost - e.residual_value
-            expected_annual = depreciable_base / Decimal(str(e.useful_life))
-            method_used = "Straight-Line"
-        elif "declining" in method or "ddb" in method or "double" in method:
-            # DDB approximation: 2/useful_life × (cost − accum_depr).
-            # Use the CURRENT NBV as the DDB basis for one-year charge.
-            nbv = e.cost - e.accumulated_depreciation
-            if nbv <= 0:
-                continue
-            expected_annual = (Decimal("2") / Decimal(str(e.useful_life))) * nbv
-            method_used = "Double-Declining Balance"
-            tolerance = DDB_TOLERANCE
-        else:
-            # Unknown method — skip rather than mis-flag.
+        life_years = int(e.useful_life + 0.5)
+        mapped = _recalc_book_method(e.depreciation_method.lower())
+        if mapped is None or not 1 <= life_years <= 50:
+            # Unknown method or a life the engine can't schedule — skip
+            # rather than mis-flag.
             continue
+        book_method, db_factor, method_used = mapped
+        candidates.append((e, method_used, years_elapsed))
+        asset_configs.append(
+            AssetConfig(
+                asset_name=e.asset_id or f"Row {e.row_number}",
+                cost=e.cost,
+                salvage_value=e.residual_value,
+                useful_life_years=life_years,
+                book_method=book_method,
+                db_factor=db_factor,
+            )
+        )
 
-        expected_accum = expected_annual * Decimal(str(years_elapsed))
+    register = generate_depreciation_register(asset_configs)
+    for (e, method_used, years_elapsed), result in zip(candidates, register.results):
+        expected_accum = _accumulated_at(result.book_schedule, years_elapsed)
         if expected_accum <= 0:
             continue
         variance = abs(e.accumulated_depreciation - expected_accum) / expected_accum
@@ -1508,7 +1537,7 @@ def test_depreciation_recalculation(
         description=(
             "Recalculates expected depreciation (IAS 16 / ASC 360) when "
             "cost, useful life, method, and acquisition date are present; "
-            "flags variance >5% (SL) or >15% (DDB)."
+            "flags variance >5% from the exact book schedule."
         ),
         flagged_entries=flagged,
     )
@@ -8,12 +8,15 @@ inlined in the /audit/flux endpoint handler.
 from audit_engine import DEFAULT_CHUNK_SIZE, StreamingAuditor, process_tb_chunked
 from flux_engine import FluxEngine
 from recon_engine import ReconEngine
+from security_utils import read_tb_header
 
 
 def _process_period(file_bytes: bytes, filename: str, materiality: float) -> dict:
     """Process a single period's TB file into a balance dict."""
     auditor = StreamingAuditor(materiality_threshold=materiality)
-    for chunk, rows in process_tb_chunked(file_bytes, filename, DEFAULT_CHUNK_SIZE):
+    header = read_tb_header(file_bytes, filename)
+    column_plan = auditor.column_plan(header) if header else None
+    for chunk, rows in process_tb_chunked(file_bytes, filename, DEFAULT_CHUNK_SIZE, column_plan=column_plan):
         auditor.process_chunk(chunk, rows)
         del chunk
 
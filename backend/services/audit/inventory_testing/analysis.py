@@ -513,11 +513,12 @@ def _days_since(date_str: Optional[str], reference_date: Optional[date] = None)
 def parse_inv_entries(
     rows: list[dict],
     detection: InvColumnDetection,
+    row_offset: int = 0,
 ) -> list[InventoryEntry]:
     """Parse raw rows into InventoryEntry objects using detected columns."""
     entries: list[InventoryEntry] = []
-    for idx, row in enumerate(rows):
-        entry = InventoryEntry(row_number=idx + 1)
+    for idx, row in enumerate(rows, start=row_offset + 1):
+        entry = InventoryEntry(row_number=idx)
         if detection.item_id_column:
             entry.item_id = safe_str(row.get(detection.item_id_column))
         if detection.description_column:
@@ -1479,8 +1480,8 @@ class InventoryTestingEngine(AuditEngineBase):
         detection.overall_confidence = 1.0
         return detection
 
-    def parse_data(self, rows: list[dict], detection: Any) -> list:
-        return parse_inv_entries(rows, detection)
+    def parse_data(self, rows: list[dict], detection: Any, row_offset: int = 0) -> list:
+        return parse_inv_entries(rows, detection, row_offset)
 
     def run_quality_checks(self, entries: list, detection: Any) -> Any:
         return assess_inv_data_quality(entries, detection)
@@ -45,6 +45,7 @@ import re
 import secrets
 import statistics
 from calendar import monthrange
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
@@ -741,20 +742,22 @@ class JETestingResult:
 def parse_gl_entries(
     rows: list[dict],
     detection: GLColumnDetectionResult,
+    row_offset: int = 0,
 ) -> list[JournalEntry]:
     """Parse raw GL rows into JournalEntry objects using detected columns.
 
     Args:
         rows: List of dicts (each row from CSV/Excel)
         detection: Column detection result mapping column names
+        row_offset: Rows in earlier chunks, added to each row number
 
     Returns:
         List of JournalEntry objects
     """
     entries: list[JournalEntry] = []
 
-    for idx, row in enumerate(rows):
-        entry = JournalEntry(row_number=idx + 1)
+    for idx, row in enumerate(rows, start=row_offset + 1):
+        entry = JournalEntry(row_number=idx)
 
         # Date fields
         if detection.entry_date_column:
@@ -2887,8 +2890,8 @@ class JETestingEngine(AuditEngineBase):
         detection.overall_confidence = 1.0
         return detection
 
-    def parse_data(self, rows: list[dict], detection: Any) -> list:
-        return parse_gl_entries(rows, detection)
+    def parse_data(self, rows: list[dict], detection: Any, row_offset: int = 0) -> list:
+        return parse_gl_entries(rows, detection, row_offset)
 
     def run_quality_checks(self, entries: list, detection: Any) -> Any:
         return assess_data_quality(entries, detection)
@@ -2951,3 +2954,15 @@ def run_je_testing(
     engine = JETestingEngine(config)
     result: JETestingResult = engine.run_pipeline(rows, column_names, column_mapping)
     return result
+
+
+def run_je_testing_chunked(
+    row_chunks: Iterable[list[dict]],
+    column_names: list[str],
+    config: Optional[JETestingConfig] = None,
+    column_mapping: Optional[dict] = None,
+) -> JETestingResult:
+    """run_je_testing() over row chunks (see shared.upload_pipeline.parse_uploaded_file_chunked)."""
+    engine = JETestingEngine(config)
+    result: JETestingResult = engine.run_pipeline_chunked(row_chunks, column_names, column_mapping)
+    return result
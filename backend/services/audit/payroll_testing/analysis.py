@@ -24,6 +24,7 @@ Audit Standards References:
 import re
 import statistics
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
@@ -785,12 +786,13 @@ class PayrollTestingResult:
 def parse_payroll_entries(
     rows: list[dict],
     detection: PayrollColumnDetectionResult,
+    row_offset: int = 0,
 ) -> list[PayrollEntry]:
     """Parse raw rows into PayrollEntry objects using detected column mapping."""
     entries: list[PayrollEntry] = []
 
-    for idx, row in enumerate(rows):
-        entry = PayrollEntry(_row_index=idx + 1)
+    for idx, row in enumerate(rows, start=row_offset + 1):
+        entry = PayrollEntry(_row_index=idx)
 
         if detection.employee_id_column:
             entry.employee_id = safe_str(row.get(detection.employee_id_column, "")) or ""
@@ -2152,8 +2154,8 @@ class PayrollTestingEngine(AuditEngineBase):
         new_detection.overall_confidence = 1.0
         return new_detection
 
-    def parse_data(self, rows: list[dict], detection: Any) -> list:
-        return parse_payroll_entries(rows, detection)
+    def parse_data(self, rows: list[dict], detection: Any, row_offset: int = 0) -> list:
+        return parse_payroll_entries(rows, detection, row_offset)
 
     def run_quality_checks(self, entries: list, detection: Any) -> Any:
         return assess_payroll_data_quality(entries, detection)
@@ -2304,6 +2306,19 @@ def run_payroll_testing(
     return result
 
 
+def run_payroll_testing_chunked(
+    headers: list[str],
+    row_chunks: Iterable[list[dict]],
+    config: Optional[PayrollTestingConfig] = None,
+    column_mapping: Optional[dict[str, str]] = None,
+    filename: str = "",
+) -> PayrollTestingResult:
+    """run_payroll_testing() over row chunks (see shared.upload_pipeline.parse_uploaded_file_chunked)."""
+    engine = PayrollTestingEngine(config, filename)
+    result: PayrollTestingResult = engine.run_pipeline_chunked(row_chunks, headers, column_mapping)
+    return result
+
+
 # =============================================================================
 # Sprint 700/703: Anomaly-framework contract registration
 # =============================================================================
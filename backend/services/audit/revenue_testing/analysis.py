@@ -18,11 +18,13 @@ Audit Standards References:
 """
 
 import statistics
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 from typing import Optional
 
+from engine_framework import parse_row_chunks
 from shared.column_detector import ColumnFieldConfig, detect_columns
 from shared.data_quality import FieldQualityConfig
 from shared.data_quality import assess_data_quality as _shared_assess_dq
@@ -669,11 +671,12 @@ def _is_contra_revenue(desc: Optional[str], account_name: Optional[str], keyword
 def parse_revenue_entries(
     rows: list[dict],
     detection: RevenueColumnDetection,
+    row_offset: int = 0,
 ) -> list[RevenueEntry]:
     """Parse raw rows into RevenueEntry objects using detected columns."""
     entries: list[RevenueEntry] = []
-    for idx, row in enumerate(rows):
-        entry = RevenueEntry(row_number=idx + 1)
+    for idx, row in enumerate(rows, start=row_offset + 1):
+        entry = RevenueEntry(row_number=idx)
         if detection.date_column:
             entry.date = safe_str(row.get(detection.date_column))
         if detection.amount_column:
@@ -2402,30 +2405,8 @@ def calculate_revenue_composite_score(
 # =============================================================================
 
 
-def run_revenue_testing(
-    rows: list[dict],
-    column_names: list[str],
-    config: Optional[RevenueTestingConfig] = None,
-    column_mapping: Optional[dict] = None,
-) -> RevenueTestingResult:
-    """Run the complete revenue testing pipeline.
-
-    Args:
-        rows: List of dicts (raw revenue GL data rows)
-        column_names: List of column header names
-        config: Optional testing configuration
-        column_mapping: Optional manual column mapping override
-
-    Returns:
-        RevenueTestingResult with composite score, test results, data quality.
-    """
-    if config is None:
-        config = RevenueTestingConfig()
-
-    # 1. Detect columns
+def _detect_with_overrides(column_names: list[str], column_mapping: Optional[dict]) -> RevenueColumnDetection:
     detection = detect_revenue_columns(column_names)
-
-    # Apply manual overrides
     if column_mapping:
         for attr in (
             "date_column",
@@ -2446,10 +2427,14 @@ def run_revenue_testing(
             if attr in column_mapping:
                 setattr(detection, attr, column_mapping[attr])
         detection.overall_confidence = 1.0
+    return detection
 
-    # 2. Parse entries
-    entries = parse_revenue_entries(rows, detection)
 
+def _test_revenue_entries(
+    entries: list[RevenueEntry],
+    detection: RevenueColumnDetection,
+    config: RevenueTestingConfig,
+) -> RevenueTestingResult:
     # 3. Assess data quality
     data_quality = assess_revenue_data_quality(entries, detection)
 
@@ -2471,6 +2456,44 @@ def run_revenue_testing(
     )
 
 
+def run_revenue_testing(
+    rows: list[dict],
+    column_names: list[str],
+    config: Optional[RevenueTestingConfig] = None,
+    column_mapping: Optional[dict] = None,
+) -> RevenueTestingResult:
+    """Run the complete revenue testing pipeline.
+
+    Args:
+        rows: List of dicts (raw revenue GL data rows)
+        column_names: List of column header names
+        config: Optional testing configuration
+        column_mapping: Optional manual column mapping override
+
+    Returns:
+        RevenueTestingResult with composite score, test results, data quality.
+    """
+    # 1. Detect columns, apply manual overrides
+    detection = _detect_with_overrides(column_names, column_mapping)
+
+    # 2. Parse entries
+    entries = parse_revenue_entries(rows, detection)
+
+    return _test_revenue_entries(entries, detection, config or RevenueTestingConfig())
+
+
+def run_revenue_testing_chunked(
+    row_chunks: Iterable[list[dict]],
+    column_names: list[str],
+    config: Optional[RevenueTestingConfig] = None,
+    column_mapping: Optional[dict] = None,
+) -> RevenueTestingResult:
+    """run_revenue_testing() over row chunks (see shared.upload_pipeline.parse_uploaded_file_chunked)."""
+    detection = _detect_with_overrides(column_names, column_mapping)
+    entries = parse_row_chunks(row_chunks, lambda chunk, offset: parse_revenue_entries(chunk, detection, offset))
+    return _test_revenue_entries(entries, detection, config or RevenueTestingConfig())
+
+
 # =============================================================================
 # Sprint 700/703: Anomaly-framework contract registration
 # =============================================================================
@@ -49,6 +49,17 @@ def extract_multi_period_accounts(result: dict) -> list[str]:
     return _dedupe_sort(accounts)
 
 
+def extract_multi_period_panel_accounts(result: dict) -> list[str]:
+    """Extract flagged accounts from a Multi-Period panel (any material/significant step)."""
+    accounts = []
+    for row in result.get("accounts", []):
+        if any(m and m.get("significance") in ("material", "significant") for m in row.get("movements", [])):
+            acct = row.get("account_name")
+            if acct:
+                accounts.append(str(acct))
+    return _dedupe_sort(accounts)
+
+
 def _extract_testing_accounts(result: dict, field: str = "account") -> list[str]:
     """Generic extractor for testing tools with test_results[].flagged_entries[].entry[field]."""
     accounts = []
@@ -0,0 +1,51 @@
+"""
+Background analysis job response models (see shared/analysis_jobs.py).
+
+Uploads submitted with ``async_job=true`` answer 202 with
+``AnalysisJobAccepted``; ``/jobs/{job_id}`` and its event stream report
+``AnalysisJobStatusResponse``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class AnalysisJobAccepted(BaseModel):
+    """202 body for an upload submitted with async_job=true."""
+
+    job_id: str
+    status: str
+    status_url: str
+    events_url: str
+    result_url: str
+
+
+class AnalysisJobError(BaseModel):
+    """Why a job failed — the status and detail the synchronous call would have returned."""
+
+    status_code: int
+    detail: Any = None
+
+
+class AnalysisJobStatusResponse(BaseModel):
+    """GET /jobs/{job_id} — poll response, also the data of each SSE event."""
+
+    job_id: str
+    tool: str
+    filename: str
+    status: str
+    stage: str
+    rows_processed: int = 0
+    message: str = ""
+    error: AnalysisJobError | None = None
+    created_at: str
+    updated_at: str
+
+
+# OpenAPI ``responses=`` entry for upload routes that accept async_job.
+ASYNC_JOB_RESPONSES: dict[int | str, dict[str, Any]] = {
+    202: {"model": AnalysisJobAccepted, "description": "Queued as a background job (async_job=true)."},
+}
@@ -0,0 +1,384 @@
+"""Background analysis jobs — upload now, follow progress, fetch the result later.
+
+A large TB or GL upload can run longer than a proxy will hold a request open.
+Routes that accept ``async_job=true`` hand the engine-pool run to
+``start_analysis_job`` instead of awaiting it: admission against the tool's
+limits still happens before the response (a saturated tool still answers 429),
+then the request returns 202 with a job id while the run continues on the
+event loop's side of the pool.
+
+Job state is a small dict in ``shared/bulk_job_store.py`` (Redis with an
+in-memory fallback), so a status poll or event stream served by another API
+worker sees it:
+
+    status           queued → running → complete | failed
+    stage            queued, parsing, analyzing, finalizing, complete, failed
+    rows_processed   rows the engine has reported so far
+    message          latest progress message
+    error            {"status_code", "detail"} once failed
+
+The finished result is stored under its own key for
+``ANALYSIS_JOB_RESULT_TTL_SECONDS`` and removed by the first fetch
+(``take_job_result``).
+
+Engines run in pool worker processes, where the in-memory store is not the
+API process's. The ``JobProgress`` reporter handed to the engine therefore
+sends updates over a ``multiprocessing`` manager queue that a thread in the
+API process drains into the store. With the pool disabled
+(``ENGINE_POOL_WORKERS=0``) the reporter writes to the store directly.
+Repeated row ticks are throttled to one per ``_PROGRESS_INTERVAL_SECONDS``;
+stage changes and other messages always go out.
+
+Like the bulk-upload route, the run itself has single-worker affinity: a
+deploy or crash of the API process loses in-flight jobs, which then expire
+with their TTL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Final, Optional
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+
+from config import ANALYSIS_JOB_RESULT_TTL_SECONDS, ANALYSIS_JOB_TTL_SECONDS
+from shared import bulk_job_store
+from shared.engine_pool import get_engine_pool, submit_engine_job
+from shared.error_messages import sanitize_error
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUS_QUEUED: Final[str] = "queued"
+JOB_STATUS_RUNNING: Final[str] = "running"
+JOB_STATUS_COMPLETE: Final[str] = "complete"
+JOB_STATUS_FAILED: Final[str] = "failed"
+TERMINAL_STATUSES: Final[frozenset[str]] = frozenset({JOB_STATUS_COMPLETE, JOB_STATUS_FAILED})
+
+_KEY_PREFIX: Final[str] = "analysis:"
+_RESULT_SUFFIX: Final[str] = ":result"
+_PROGRESS_INTERVAL_SECONDS: Final[float] = 0.5
+
+# Serializes read-modify-write of job records between the progress drain
+# thread and the job tasks (all writers for a job live in one API process).
+_update_lock = threading.Lock()
+
+# Running job tasks, held so the event loop does not drop them mid-run.
+_tasks: set[asyncio.Task[None]] = set()
+
+_channel_lock = threading.Lock()
+_manager: Any = None
+_progress_queue: Any = None
+_drain_thread: threading.Thread | None = None
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _job_key(job_id: str) -> str:
+    return f"{_KEY_PREFIX}{job_id}"
+
+
+# =============================================================================
+# Job records
+# =============================================================================
+
+
+def get_job(job_id: str) -> dict[str, Any] | None:
+    """Return the job record, or None when unknown or expired."""
+    return bulk_job_store.get(_job_key(job_id))
+
+
+def _update_job(job_id: str, **fields: Any) -> None:
+    """Merge ``fields`` into the job record; progress never reopens a finished job."""
+    with _update_lock:
+        job = bulk_job_store.get(_job_key(job_id))
+        if job is None:
+            return
+        if job["status"] in TERMINAL_STATUSES and fields.get("status") not in TERMINAL_STATUSES:
+            return
+        job.update(fields, updated_at=_now())
+        bulk_job_store.put(_job_key(job_id), job, ttl_seconds=ANALYSIS_JOB_TTL_SECONDS)
+
+
+def take_job_result(job_id: str) -> Any:
+    """Return a finished job's result and delete it; None if taken or expired."""
+    stored = bulk_job_store.pop(_job_key(job_id) + _RESULT_SUFFIX)
+    if stored is None:
+        return None
+    # The in-memory fallback evicts by age only at its 2h cap; enforce the
+    # result TTL here as well.
+    created = datetime.fromisoformat(stored["created_at"])
+    if (datetime.now(UTC) - created).total_seconds() > ANALYSIS_JOB_RESULT_TTL_SECONDS:
+        return None
+    return stored["result"]
+
+
+def job_status_payload(job: dict[str, Any]) -> dict[str, Any]:
+    """The public view of a job record (status poll body and SSE event data)."""
+    return {
+        "job_id": job["job_id"],
+        "tool": job["tool"],
+        "filename": job["filename"],
+        "status": job["status"],
+        "stage": job["stage"],
+        "rows_processed": job["rows_processed"],
+        "message": job["message"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+    }
+
+
+# =============================================================================
+# Progress reporting
+# =============================================================================
+
+
+class JobProgress:
+    """Picklable progress reporter handed to an engine running as a job.
+
+    Call it as ``progress(rows, message)`` — the ``StreamingAuditor``
+    ``progress_callback`` signature — and ``progress.stage(name)`` when the
+    engine moves to a new phase. Repeated ticks of one kind (same text before
+    the colon, e.g. ``"Scanning rows: 40,000"``) are throttled; any other
+    message always goes out.
+    """
+
+    def __init__(self, job_id: str, channel: Any = None):
+        self.job_id = job_id
+        self._channel = channel
+        self._stage = JOB_STATUS_QUEUED
+        self._last_sent = 0.0
+        self._last_kind = ""
+
+    def __call__(self, rows: int, message: str) -> None:
+        now = time.monotonic()
+        kind = message.partition(":")[0]
+        if kind == self._last_kind and now - self._last_sent < _PROGRESS_INTERVAL_SECONDS:
+            return
+        self._send(rows, message, now)
+
+    def stage(self, name: str, message: str = "", rows: int = 0) -> None:
+        """Enter stage ``name``; always published."""
+        self._stage = name
+        self._send(rows, message, time.monotonic())
+
+    def _send(self, rows: int, message: str, now: float) -> None:
+        self._last_sent = now
+        self._last_kind = message.partition(":")[0]
+        fields = {"status": JOB_STATUS_RUNNING, "stage": self._stage, "rows_processed": rows, "message": message}
+        if self._channel is None:
+            _update_job(self.job_id, **fields)
+            return
+        try:
+            self._channel.put((self.job_id, fields))
+        except Exception as exc:  # noqa: BLE001 — progress must never fail the run
+            logger.debug("analysis_jobs.progress_dropped job=%s (%s)", self.job_id, type(exc).__name__)
+
+
+def report_stage(progress: Optional[Callable[[int, str], None]], name: str, message: str = "", rows: int = 0) -> None:
+    """Enter a stage when ``progress`` is a ``JobProgress``; no-op for plain callbacks or None."""
+    if isinstance(progress, JobProgress):
+        progress.stage(name, message, rows)
+
+
+def _drain(queue: Any) -> None:
+    """API-process thread: copy progress sent by pool workers into the job store."""
+    while True:
+        try:
+            item = queue.get()
+        except (EOFError, OSError):
+            return
+        if item is None:
+            return
+        job_id, fields = item
+        try:
+            _update_job(job_id, **fields)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("analysis_jobs.progress_update_failed job=%s (%s)", job_id, type(exc).__name__)
+
+
+def _get_progress_channel() -> Any:
+    """Queue that pool workers report progress on; None when engines run in-process."""
+    global _manager, _progress_queue, _drain_thread
+    if get_engine_pool() is None:
+        return None
+    with _channel_lock:
+        if _progress_queue is None:
+            try:
+                manager = multiprocessing.get_context("spawn").Manager()
+            except (OSError, EOFError) as exc:
+                logger.warning("analysis_jobs.progress_channel_unavailable (%s) — progress limited to stages", exc)
+                return None
+            _manager = manager
+            _progress_queue = manager.Queue()
+            _drain_thread = threading.Thread(
+                target=_drain, args=(_progress_queue,), name="analysis-job-progress", daemon=True
+            )
+            _drain_thread.start()
+        return _progress_queue
+
+
+def shutdown_analysis_jobs() -> None:
+    """Stop the progress channel (no-op if never started)."""
+    global _manager, _progress_queue, _drain_thread
+    with _channel_lock:
+        manager, queue, thread = _manager, _progress_queue, _drain_thread
+        _manager = _progress_queue = _drain_thread = None
+    if queue is not None:
+        with contextlib.suppress(Exception):
+            queue.put(None)
+    if thread is not None:
+        thread.join(timeout=2)
+    if manager is not None:
+        manager.shutdown()
+
+
+# =============================================================================
+# Running jobs
+# =============================================================================
+
+
+@contextlib.contextmanager
+def _job_session() -> Iterator[Session]:
+    """A DB session for work that outlives the request (the request's is closed)."""
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def _run_job(
+    job_id: str,
+    future: asyncio.Future[Any],
+    finalize: Optional[Callable[[Any, Session], Any]],
+    on_failure: Optional[Callable[[Session], None]],
+    response_model: Optional[type[BaseModel]],
+    error_operation: str,
+    error_key: str,
+) -> None:
+    def _finish(raw: Any) -> Any:
+        if finalize is None:
+            result = raw
+        else:
+            with _job_session() as db:
+                result = finalize(raw, db)
+        if response_model is not None:
+            return response_model.model_validate(result).model_dump(mode="json", by_alias=True)
+        return jsonable_encoder(result)
+
+    try:
+        raw = await future
+        _update_job(job_id, stage="finalizing", message="")
+        result = await asyncio.to_thread(_finish, raw)
+    except Exception as exc:  # noqa: BLE001 — every failure is reported on the job
+        if isinstance(exc, HTTPException):
+            error = {"status_code": exc.status_code, "detail": exc.detail}
+        elif isinstance(exc, (ValueError, KeyError, TypeError)):
+            logger.warning("Analysis job %s rejected [%s]", job_id, type(exc).__name__, exc_info=True)
+            error = {"status_code": 400, "detail": sanitize_error(exc, error_operation, error_key)}
+        else:
+            logger.exception("Analysis job %s failed", job_id)
+            error = {"status_code": 500, "detail": sanitize_error(exc, error_operation, error_key)}
+        if on_failure is not None:
+            try:
+                await asyncio.to_thread(_run_failure_hook, on_failure)
+            except Exception as hook_exc:  # noqa: BLE001
+                logger.warning("Analysis job %s failure hook failed: %s", job_id, type(hook_exc).__name__)
+        _update_job(job_id, status=JOB_STATUS_FAILED, stage=JOB_STATUS_FAILED, error=error, message="")
+        return
+
+    bulk_job_store.put(
+        _job_key(job_id) + _RESULT_SUFFIX,
+        {"created_at": _now(), "result": result},
+        ttl_seconds=ANALYSIS_JOB_RESULT_TTL_SECONDS,
+    )
+    _update_job(job_id, status=JOB_STATUS_COMPLETE, stage=JOB_STATUS_COMPLETE, message="")
+
+
+def _run_failure_hook(on_failure: Callable[[Session], None]) -> None:
+    with _job_session() as db:
+        on_failure(db)
+
+
+def start_analysis_job(
+    *,
+    user_id: int,
+    tool: str,
+    filename: str,
+    fn: Callable[..., Any],
+    file_bytes: bytes,
+    args: tuple[Any, ...],
+    finalize: Optional[Callable[[Any, Session], Any]] = None,
+    on_failure: Optional[Callable[[Session], None]] = None,
+    response_model: Optional[type[BaseModel]] = None,
+    error_operation: str = "analysis",
+    error_key: str = "",
+) -> dict[str, Any]:
+    """Start ``fn(file_bytes, *args, progress)`` on the engine pool as a job.
+
+    ``fn`` follows the ``run_engine_job`` rules and takes a trailing
+    ``JobProgress`` argument. ``finalize(raw, db)`` runs in the API process on
+    ``fn``'s return value and produces the stored result (tool-run recording,
+    currency conversion and the like); ``on_failure(db)`` runs when either
+    fails. Both get a fresh session, since the request's is gone by then.
+    The result is stored as ``response_model`` would serialize it for the
+    synchronous route, so both paths return the same body.
+
+    Raises HTTPException(429) when the tool is saturated. Must be called from
+    the event loop. Returns the 202 response body.
+    """
+    job_id = uuid.uuid4().hex
+    now = _now()
+    job = {
+        "job_id": job_id,
+        "user_id": user_id,
+        "tool": tool,
+        "filename": filename,
+        "created_at": now,
+        "updated_at": now,
+        "status": JOB_STATUS_QUEUED,
+        "stage": JOB_STATUS_QUEUED,
+        "rows_processed": 0,
+        "message": "",
+        "error": None,
+    }
+    bulk_job_store.put(_job_key(job_id), job, ttl_seconds=ANALYSIS_JOB_TTL_SECONDS)
+
+    progress = JobProgress(job_id, _get_progress_channel())
+    try:
+        future = submit_engine_job(tool, fn, file_bytes, *args, progress)
+    except HTTPException:
+        bulk_job_store.delete(_job_key(job_id))
+        raise
+
+    task = asyncio.create_task(
+        _run_job(job_id, future, finalize, on_failure, response_model, error_operation, error_key)
+    )
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+    return {
+        "job_id": job_id,
+        "status": JOB_STATUS_QUEUED,
+        "status_url": f"/jobs/{job_id}",
+        "events_url": f"/jobs/{job_id}/events",
+        "result_url": f"/jobs/{job_id}/result",
+    }
@@ -4,20 +4,34 @@ Sprint 461: HMAC-SHA512 hash chain on ActivityLog records.
 Each new record's chain_hash = HMAC(key, previous_chain_hash | serialized_record).
 Verification traverses the chain and recomputes each hash to detect tampering.
 
+Checkpoints: every AUDIT_CHAIN_CHECKPOINT_INTERVAL links of a user's chain,
+``POST /activity/log`` writes an ``AuditChainCheckpoint`` whose HMAC signature
+authenticates that link's hash. Verification of a range starts at the nearest
+checkpoint before it (walking at most one interval of extra links) and
+streams rows with ``yield_per`` rather than loading the range. Ranges that
+span several checkpoints can be verified as independent parallel segments.
+
 Secret domain separation: Uses AUDIT_CHAIN_SECRET_KEY (independent from JWT).
 Backward-compatible verification falls back to JWT_SECRET_KEY for pre-rotation records.
 """
 
 import hashlib
 import hmac
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Optional
 
-from config import AUDIT_CHAIN_SECRET_KEY, JWT_SECRET_KEY
+from sqlalchemy import func
+
+from config import AUDIT_CHAIN_CHECKPOINT_INTERVAL, AUDIT_CHAIN_SECRET_KEY, JWT_SECRET_KEY
 
 # The genesis hash for the first record in the chain (128 hex zeros = SHA-512 output length)
 GENESIS_HASH = "0" * 128
 
+# Rows fetched per round-trip while streaming a range.
+VERIFY_BATCH_SIZE = 1000
+
 
 def _serialize_record(record: Any) -> str:
     """Serialize ActivityLog record fields into a deterministic string for hashing.
@@ -64,6 +78,78 @@ def compute_chain_hash(previous_hash: str, record: Any) -> str:
     return _compute_hash_with_key(AUDIT_CHAIN_SECRET_KEY, previous_hash, record)
 
 
+def _sign_checkpoint_with_key(key: Optional[str], user_id: int, activity_log_id: int, chain_hash: str) -> str:
+    """Compute a checkpoint signature with a specific key."""
+    content = f"checkpoint|{user_id}|{activity_log_id}|{chain_hash}"
+    return hmac.new(
+        (key or "").encode("utf-8"),
+        content.encode("utf-8"),
+        hashlib.sha512,
+    ).hexdigest()
+
+
+def sign_checkpoint(user_id: int, activity_log_id: int, chain_hash: str) -> str:
+    """HMAC-SHA512 signature binding a checkpoint to its user, record and hash."""
+    return _sign_checkpoint_with_key(AUDIT_CHAIN_SECRET_KEY, user_id, activity_log_id, chain_hash)
+
+
+def _checkpoint_signature_valid(checkpoint: Any) -> bool:
+    """Check a checkpoint signature against the current key, then the legacy key.
+
+    Mirrors the per-record fallback in ``verify_audit_chain``: checkpoints
+    signed with JWT_SECRET_KEY before key separation stay valid afterwards.
+    """
+    args = (checkpoint.user_id, checkpoint.activity_log_id, checkpoint.chain_hash)
+    if hmac.compare_digest(checkpoint.signature, sign_checkpoint(*args)):
+        return True
+    if AUDIT_CHAIN_SECRET_KEY != JWT_SECRET_KEY:
+        return hmac.compare_digest(checkpoint.signature, _sign_checkpoint_with_key(JWT_SECRET_KEY, *args))
+    return False
+
+
+def maybe_write_checkpoint(db: Any, record: Any, interval: Optional[int] = None) -> Optional[Any]:
+    """Add a checkpoint for ``record`` if its user's chain reached the interval.
+
+    Call inside the transaction that assigned ``record.chain_hash``. Counts
+    the user's chained links since their last checkpoint (at most one
+    interval of rows). Returns the new checkpoint, or None.
+    """
+    from models import ActivityLog, AuditChainCheckpoint  # Avoid circular import
+
+    interval = AUDIT_CHAIN_CHECKPOINT_INTERVAL if interval is None else interval
+    if interval <= 0 or record.user_id is None or not record.chain_hash:
+        return None
+
+    last_checkpoint_id = (
+        db.query(func.max(AuditChainCheckpoint.activity_log_id))
+        .filter(AuditChainCheckpoint.user_id == record.user_id)
+        .scalar()
+    ) or 0
+    links = (
+        db.query(func.count(ActivityLog.id))
+        .filter(
+            ActivityLog.user_id == record.user_id,
+            ActivityLog.id > last_checkpoint_id,
+            ActivityLog.id <= record.id,
+            ActivityLog.archived_at.is_(None),
+            ActivityLog.chain_hash.isnot(None),
+        )
+        .scalar()
+    )
+    if links < interval:
+        return None
+
+    checkpoint = AuditChainCheckpoint(
+        user_id=record.user_id,
+        activity_log_id=record.id,
+        chain_hash=record.chain_hash,
+        link_count=links,
+        signature=sign_checkpoint(record.user_id, record.id, record.chain_hash),
+    )
+    db.add(checkpoint)
+    return checkpoint
+
+
 @dataclass
 class ChainVerificationResult:
     """Result of audit chain verification."""
@@ -74,54 +160,75 @@ class ChainVerificationResult:
     error_message: Optional[str] = None
 
 
+_EMPTY_RANGE_MESSAGE = "No chained records found in the specified range."
+
+
+def _chain_query(db: Any, user_id: int) -> Any:
+    from models import ActivityLog  # Avoid circular import
+
+    return db.query(ActivityLog).filter(
+        ActivityLog.user_id == user_id,
+        ActivityLog.archived_at.is_(None),
+        ActivityLog.chain_hash.isnot(None),
+    )
+
+
 def verify_audit_chain(db: Any, start_id: int, end_id: int, user_id: int) -> ChainVerificationResult:
     """Verify the integrity of the audit log chain between two record IDs.
 
     SECURITY: Scoped to user_id to prevent cross-tenant information leakage.
     Checks that each record's chain_hash matches the expected HMAC of the
     previous hash + current record content. Returns verification result.
+
+    The walk is anchored at the nearest signed checkpoint before ``start_id``
+    (links between it and ``start_id`` are verified but not counted), or at
+    the preceding record's hash when no checkpoint exists.
     """
-    from models import ActivityLog  # Avoid circular import
+    from models import ActivityLog, AuditChainCheckpoint  # Avoid circular import
 
-    records = (
-        db.query(ActivityLog)
+    checkpoint = (
+        db.query(AuditChainCheckpoint)
         .filter(
-            ActivityLog.id >= start_id,
-            ActivityLog.id <= end_id,
-            ActivityLog.user_id == user_id,
-            ActivityLog.archived_at.is_(None),
-            ActivityLog.chain_hash.isnot(None),
+            AuditChainCheckpoint.user_id == user_id,
+            AuditChainCheckpoint.activity_log_id < start_id,
         )
-        .order_by(ActivityLog.id.asc())
-        .all()
+        .order_by(AuditChainCheckpoint.activity_log_id.desc())
+        .first()
     )
-
-    if not records:
-        return ChainVerificationResult(
-            is_valid=True,
-            records_checked=0,
-            error_message="No chained records found in the specified range.",
+    if checkpoint is not None:
+        if not _checkpoint_signature_valid(checkpoint):
+            return ChainVerificationResult(
+                is_valid=False,
+                records_checked=0,
+                first_broken_id=checkpoint.activity_log_id,
+                error_message=f"Checkpoint at record {checkpoint.activity_log_id} failed signature check.",
+            )
+        previous_hash = checkpoint.chain_hash
+        walk_from = checkpoint.activity_log_id + 1
+    else:
+        # Get the hash of the record immediately before start_id (or genesis)
+        previous_record = (
+            _chain_query(db, user_id).filter(ActivityLog.id < start_id).order_by(ActivityLog.id.desc()).first()
         )
+        previous_hash = previous_record.chain_hash if previous_record else GENESIS_HASH
+        walk_from = start_id
 
-    # Get the hash of the record immediately before start_id (or genesis)
-    previous_record = (
-        db.query(ActivityLog)
-        .filter(
-            ActivityLog.id < records[0].id,
-            ActivityLog.user_id == user_id,
-            ActivityLog.archived_at.is_(None),
-            ActivityLog.chain_hash.isnot(None),
-        )
-        .order_by(ActivityLog.id.desc())
-        .first()
+    records = (
+        _chain_query(db, user_id)
+        .filter(ActivityLog.id >= walk_from, ActivityLog.id <= end_id)
+        .order_by(ActivityLog.id.asc())
+        .yield_per(VERIFY_BATCH_SIZE)
     )
-    previous_hash = previous_record.chain_hash if previous_record else GENESIS_HASH
 
     # Backward-compatible verification: try current AUDIT_CHAIN_SECRET_KEY first,
     # fall back to JWT_SECRET_KEY for records created before key separation.
     _fallback_needed = AUDIT_CHAIN_SECRET_KEY != JWT_SECRET_KEY
 
-    for idx, record in enumerate(records):
+    checked = 0
+    for record in records:
+        in_range = record.id >= start_id
+        if in_range:
+            checked += 1
         expected_hash = compute_chain_hash(previous_hash, record)
         if record.chain_hash != expected_hash:
             # Try legacy JWT_SECRET_KEY for pre-rotation records
@@ -132,13 +239,87 @@ def verify_audit_chain(db: Any, start_id: int, end_id: int, user_id: int) -> Cha
                     continue
             return ChainVerificationResult(
                 is_valid=False,
-                records_checked=idx + 1,
+                records_checked=checked,
                 first_broken_id=record.id,
                 error_message=f"Chain broken at record {record.id}: hash mismatch.",
             )
         previous_hash = record.chain_hash
 
-    return ChainVerificationResult(
-        is_valid=True,
-        records_checked=len(records),
-    )
+    if checked == 0:
+        return ChainVerificationResult(is_valid=True, records_checked=0, error_message=_EMPTY_RANGE_MESSAGE)
+    return ChainVerificationResult(is_valid=True, records_checked=checked)
+
+
+def plan_verification_segments(db: Any, start_id: int, end_id: int, user_id: int) -> list[tuple[int, int]]:
+    """Split [start_id, end_id] at the user's checkpoints into contiguous segments.
+
+    Each segment ends on a checkpointed record, so the next one is anchored
+    by that checkpoint and the segments can be verified independently.
+    """
+    from models import AuditChainCheckpoint  # Avoid circular import
+
+    boundaries = [
+        row.activity_log_id
+        for row in db.query(AuditChainCheckpoint.activity_log_id)
+        .filter(
+            AuditChainCheckpoint.user_id == user_id,
+            AuditChainCheckpoint.activity_log_id >= start_id,
+            AuditChainCheckpoint.activity_log_id < end_id,
+        )
+        .order_by(AuditChainCheckpoint.activity_log_id.asc())
+    ]
+    segments: list[tuple[int, int]] = []
+    segment_start = start_id
+    for boundary in boundaries:
+        segments.append((segment_start, boundary))
+        segment_start = boundary + 1
+    segments.append((segment_start, end_id))
+    return segments
+
+
+def merge_segment_results(results: list[ChainVerificationResult]) -> ChainVerificationResult:
+    """Combine per-segment results (in id order) as if verified in one pass."""
+    checked = 0
+    for result in results:
+        checked += result.records_checked
+        if not result.is_valid:
+            return ChainVerificationResult(
+                is_valid=False,
+                records_checked=checked,
+                first_broken_id=result.first_broken_id,
+                error_message=result.error_message,
+            )
+    if checked == 0:
+        return ChainVerificationResult(is_valid=True, records_checked=0, error_message=_EMPTY_RANGE_MESSAGE)
+    return ChainVerificationResult(is_valid=True, records_checked=checked)
+
+
+def verify_audit_chain_parallel(
+    db: Any,
+    start_id: int,
+    end_id: int,
+    user_id: int,
+    *,
+    session_factory: Callable[[], Any],
+    max_workers: int,
+) -> ChainVerificationResult:
+    """Verify a range as checkpoint-aligned segments on ``max_workers`` threads.
+
+    Segments are planned with ``db``; each worker opens its own session from
+    ``session_factory``. Falls back to a single ``verify_audit_chain`` pass
+    on ``db`` when the range holds fewer than two segments.
+    """
+    segments = plan_verification_segments(db, start_id, end_id, user_id)
+    if len(segments) < 2 or max_workers <= 1:
+        return verify_audit_chain(db, start_id, end_id, user_id)
+
+    def _verify_segment(segment: tuple[int, int]) -> ChainVerificationResult:
+        session = session_factory()
+        try:
+            return verify_audit_chain(session, segment[0], segment[1], user_id)
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(segments))) as pool:
+        results = list(pool.map(_verify_segment, segments))
+    return merge_segment_results(results)
@@ -23,6 +23,7 @@ References:
 """
 
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Literal, Optional
 
@@ -222,35 +223,17 @@ def _conformity_level(mad: float, position: DigitPosition) -> str:
     return "nonconforming"
 
 
-def analyze_benford(
-    amounts: list[float],
+def _precheck(
+    eligible_count: int,
+    min_amt: float,
+    max_amt: float,
     *,
     total_count: int,
-    min_entries: int = 500,
-    min_amount: float = 1.0,
-    min_magnitude_range: float = 2.0,
-    digit_position: DigitPosition = "first",
-) -> BenfordAnalysis:
-    """Run Benford's Law digit analysis on a list of amounts.
-
-    Args:
-        amounts: Pre-filtered list of absolute amounts (>= min_amount).
-        total_count: Total entry count (for reporting; may differ from len(amounts)).
-        min_entries: Minimum eligible entries required.
-        min_amount: Minimum amount threshold (used in precheck message only;
-            caller should pre-filter amounts).
-        min_magnitude_range: Minimum orders of magnitude range required.
-        digit_position: "first" (default, 1–9), "second" (0–9), or
-            "first_two" (10–99). First-two-digit needs ≥1000 entries to be
-            statistically meaningful — the caller should raise `min_entries`
-            accordingly.
-
-    Returns:
-        BenfordAnalysis with statistical results. Does NOT create flagged
-        entries — that is the caller's responsibility.
-    """
-    eligible_count = len(amounts)
-
+    min_entries: int,
+    min_magnitude_range: float,
+    digit_position: DigitPosition,
+) -> Optional[BenfordAnalysis]:
+    """Return the failed-precheck result, or None when the data qualifies."""
     # Pre-check 1: Minimum entry count
     if eligible_count < min_entries:
         return BenfordAnalysis(
@@ -262,8 +245,6 @@ def analyze_benford(
         )
 
     # Pre-check 2: Magnitude range
-    min_amt = min(amounts)
-    max_amt = max(amounts)
     if min_amt > 0 and max_amt > 0:
         magnitude_range = math.log10(max_amt) - math.log10(min_amt)
     else:
@@ -277,15 +258,103 @@ def analyze_benford(
             total_count=total_count,
             digit_position=digit_position,
         )
+    return None
 
-    extractor, expected_dist, digit_range = _digit_extractor(digit_position)
 
-    # Calculate digit distribution
+def count_digits(amounts: Iterable[float], digit_position: DigitPosition = "first") -> dict[int, int]:
+    """Count leading-digit occurrences, keyed over the position's full digit range.
+
+    Counts from separate batches of amounts can be added together and passed
+    to ``analyze_benford_counts``.
+    """
+    extractor, _expected, digit_range = _digit_extractor(digit_position)
     digit_counts: dict[int, int] = {d: 0 for d in digit_range}
     for amt in amounts:
         digit = extractor(amt)
         if digit is not None and digit in digit_counts:
             digit_counts[digit] += 1
+    return digit_counts
+
+
+def analyze_benford(
+    amounts: list[float],
+    *,
+    total_count: int,
+    min_entries: int = 500,
+    min_amount: float = 1.0,
+    min_magnitude_range: float = 2.0,
+    digit_position: DigitPosition = "first",
+) -> BenfordAnalysis:
+    """Run Benford's Law digit analysis on a list of amounts.
+
+    Args:
+        amounts: Pre-filtered list of absolute amounts (>= min_amount).
+        total_count: Total entry count (for reporting; may differ from len(amounts)).
+        min_entries: Minimum eligible entries required.
+        min_amount: Minimum amount threshold (used in precheck message only;
+            caller should pre-filter amounts).
+        min_magnitude_range: Minimum orders of magnitude range required.
+        digit_position: "first" (default, 1–9), "second" (0–9), or
+            "first_two" (10–99). First-two-digit needs ≥1000 entries to be
+            statistically meaningful — the caller should raise `min_entries`
+            accordingly.
+
+    Returns:
+        BenfordAnalysis with statistical results. Does NOT create flagged
+        entries — that is the caller's responsibility.
+    """
+    eligible_count = len(amounts)
+    failed = _precheck(
+        eligible_count,
+        min(amounts) if amounts else 0.0,
+        max(amounts) if amounts else 0.0,
+        total_count=total_count,
+        min_entries=min_entries,
+        min_magnitude_range=min_magnitude_range,
+        digit_position=digit_position,
+    )
+    if failed is not None:
+        return failed
+    return _analyze_counts(count_digits(amounts, digit_position), eligible_count, total_count, digit_position)
+
+
+def analyze_benford_counts(
+    digit_counts: dict[int, int],
+    *,
+    eligible_count: int,
+    min_amount_seen: float,
+    max_amount_seen: float,
+    total_count: int,
+    min_entries: int = 500,
+    min_magnitude_range: float = 2.0,
+    digit_position: DigitPosition = "first",
+) -> BenfordAnalysis:
+    """``analyze_benford`` over digit counts accumulated with ``count_digits``.
+
+    For populations read in chunks: the caller adds up each chunk's digit
+    counts, eligible count and amount range instead of keeping the amounts.
+    """
+    failed = _precheck(
+        eligible_count,
+        min_amount_seen,
+        max_amount_seen,
+        total_count=total_count,
+        min_entries=min_entries,
+        min_magnitude_range=min_magnitude_range,
+        digit_position=digit_position,
+    )
+    if failed is not None:
+        return failed
+    return _analyze_counts(digit_counts, eligible_count, total_count, digit_position)
+
+
+def _analyze_counts(
+    digit_counts: dict[int, int],
+    eligible_count: int,
+    total_count: int,
+    digit_position: DigitPosition,
+) -> BenfordAnalysis:
+    _extractor, expected_dist, digit_range = _digit_extractor(digit_position)
 
     counted_total = sum(digit_counts.values())
     if counted_total == 0:
@@ -135,6 +135,23 @@ def get(job_id: str) -> dict[str, Any] | None:
         return _memory_store.get(job_id)
 
 
+def pop(job_id: str) -> dict[str, Any] | None:
+    """Return the job under ``job_id`` and remove it, so only one caller gets it."""
+    if not job_id:
+        return None
+    client = _get_redis()
+    if client is not None:
+        try:
+            raw = client.getdel(f"{_KEY_PREFIX}{job_id}")
+            return None if raw is None else json.loads(raw)
+        except Exception as exc:  # noqa: BLE001
+            _logger.warning("Bulk-job store: Redis pop failed (%s)", exc)
+            # fall through to memory
+
+    with _memory_lock:
+        return _memory_store.pop(job_id, None)
+
+
 def delete(job_id: str) -> None:
     """Remove ``job_id`` from the store."""
     if not job_id:
@@ -0,0 +1,338 @@
+"""
+Per-client account classification cache.
+
+A client's chart of accounts barely changes between uploads, yet every
+trial-balance run re-scores each account name against ~300 classifier
+keyword rules and ~150 lead-sheet rules. This module remembers, per client,
+the outcome of both for every account name already seen so the next run only
+classifies names that are new.
+
+What is cached (``client_classification_cache`` table):
+  - SHA-256 of the normalized account name — never the name itself;
+  - heuristic category, unrounded confidence and matched rule keywords;
+  - lead-sheet keyword match (or "no keyword match").
+No balances: abnormal-balance flags are recomputed from the live balance on
+every hit, and the category fallback for lead sheets is recomputed from the
+(possibly overridden) category.
+
+Entries are keyed by ``classifier_rule_version()`` — a hash of every rule
+table that feeds the classifier and the lead-sheet mapper. Editing any rule
+changes the hash, old rows stop matching, and ``save`` purges them.
+
+Scope is implicit, mirroring ``shared.pdf_branding``: the route loads the
+cache for the engagement's client and runs the analysis inside
+``use_classification_cache(cache)``. ``AccountClassifier.classify`` and
+``assign_lead_sheet`` consult ``current_classification_cache()`` and fall
+through to the rules when it is None, so engines called outside a route
+behave exactly as before.
+
+Low-confidence classifications (below ``SUGGESTION_THRESHOLD``) are not
+cached — their alternative suggestions depend on fuzzy matching that is
+cheaper to recompute than to store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from classification_cache_model import ClientClassificationCache
+    from classification_rules import AccountCategory
+
+logger = logging.getLogger(__name__)
+
+# Stored in ``lead_sheet`` when the keyword rules matched nothing, so a NULL
+# column still means "lead sheet not looked up yet".
+NO_LEAD_SHEET_MATCH = "-"
+
+_KEYWORD_SEPARATOR = "|"
+
+# Folded into ``classifier_rule_version()``. Bump when the meaning of a stored
+# column changes so rows written under the old meaning stop matching
+# (2: ``confidence`` is stored unrounded).
+_CACHE_FORMAT = 2
+
+
+def normalize_account_key(account_name: str) -> str:
+    """SHA-256 of the lower-cased, stripped account name (the cache key)."""
+    return hashlib.sha256(account_name.lower().strip().encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def classifier_rule_version() -> str:
+    """Short hash over every rule table feeding classification and lead sheets."""
+    from account_classifier import SUGGESTION_THRESHOLD
+    from classification_rules import ACCOUNT_NUMBER_RANGES, CONFIDENCE_HIGH, CONFIDENCE_MEDIUM, DEFAULT_RULES
+    from lead_sheet_mapping import CATEGORY_FALLBACK_MAP, LEAD_SHEET_RULES
+
+    digest = hashlib.sha256(f"format:{_CACHE_FORMAT}\n".encode())
+    for rule in DEFAULT_RULES:
+        digest.update(f"c:{rule.keyword}:{rule.category.value}:{rule.weight}:{rule.is_phrase}\n".encode())
+    for start, end, category, weight in ACCOUNT_NUMBER_RANGES:
+        digest.update(f"n:{start}:{end}:{category.value}:{weight}\n".encode())
+    for ls_rule in LEAD_SHEET_RULES:
+        digest.update(f"l:{ls_rule.keyword}:{ls_rule.lead_sheet.value}:{ls_rule.weight}:{ls_rule.is_phrase}\n".encode())
+    for category, sheet in CATEGORY_FALLBACK_MAP.items():
+        digest.update(f"f:{category.value}:{sheet.value}\n".encode())
+    digest.update(f"t:{CONFIDENCE_HIGH}:{CONFIDENCE_MEDIUM}:{SUGGESTION_THRESHOLD}".encode())
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class CachedClassification:
+    """Cached heuristic classifier outcome for one account name."""
+
+    category: AccountCategory
+    confidence: float
+    matched_keywords: list[str]
+
+
+@dataclass
+class CachedLeadSheet:
+    """Cached lead-sheet keyword match; ``lead_sheet`` is None when nothing matched."""
+
+    lead_sheet: Optional[str]
+    confidence: float
+    matched_keywords: list[str]
+
+
+@dataclass
+class _Entry:
+    classification: Optional[CachedClassification] = None
+    lead_sheet: Optional[CachedLeadSheet] = None
+
+
+class ClassificationCache:
+    """In-memory view of one client's cached classifications.
+
+    ``client_id=None`` gives a run-local cache that is never persisted.
+    Not shared across requests — load one per analysis run.
+    """
+
+    def __init__(self, client_id: Optional[int] = None, rule_version: Optional[str] = None):
+        self.client_id = client_id
+        self.rule_version = rule_version or classifier_rule_version()
+        self._entries: dict[str, _Entry] = {}
+        self._dirty: set[str] = set()
+        self._persisted: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get_classification(self, account_name: str) -> Optional[CachedClassification]:
+        entry = self._entries.get(normalize_account_key(account_name))
+        if entry is None or entry.classification is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.classification
+
+    def put_classification(
+        self, account_name: str, category: AccountCategory, confidence: float, matched_keywords: list[str]
+    ) -> None:
+        key = normalize_account_key(account_name)
+        entry = self._entries.setdefault(key, _Entry())
+        entry.classification = CachedClassification(category, confidence, list(matched_keywords))
+        self._dirty.add(key)
+
+    def get_lead_sheet(self, account_name: str) -> Optional[CachedLeadSheet]:
+        entry = self._entries.get(normalize_account_key(account_name))
+        if entry is None or entry.lead_sheet is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.lead_sheet
+
+    def put_lead_sheet(
+        self, account_name: str, lead_sheet: Optional[str], confidence: float, matched_keywords: list[str]
+    ) -> None:
+        key = normalize_account_key(account_name)
+        entry = self._entries.setdefault(key, _Entry())
+        entry.lead_sheet = CachedLeadSheet(lead_sheet, confidence, list(matched_keywords))
+        self._dirty.add(key)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, db: Session, client_id: int) -> ClassificationCache:
+        """Load every entry for ``client_id`` under the current rule version."""
+        from classification_cache_model import ClientClassificationCache
+        from classification_rules import AccountCategory
+
+        cache = cls(client_id=client_id)
+        rows = (
+            db.query(ClientClassificationCache)
+            .filter(
+                ClientClassificationCache.client_id == client_id,
+                ClientClassificationCache.rule_version == cache.rule_version,
+            )
+            .all()
+        )
+        for row in rows:
+            entry = _Entry()
+            if row.category is not None:
+                try:
+                    category = AccountCategory(row.category)
+                except ValueError:
+                    category = None
+                if category is not None:
+                    entry.classification = CachedClassification(
+                        category, row.confidence or 0.0, _split_keywords(row.matched_keywords)
+                    )
+            if row.lead_sheet is not None:
+                entry.lead_sheet = CachedLeadSheet(
+                    None if row.lead_sheet == NO_LEAD_SHEET_MATCH else row.lead_sheet,
+                    row.lead_sheet_confidence or 0.0,
+                    _split_keywords(row.lead_sheet_keywords),
+                )
+            cache._entries[row.account_key] = entry
+            cache._persisted.add(row.account_key)
+        return cache
+
+    def save(self, db: Session) -> int:
+        """Write new/changed entries and purge rows from older rule versions.
+
+        Best-effort: a failure (e.g. a concurrent run for the same client
+        inserting the same key) is logged and rolled back — the next run
+        simply re-classifies. Returns the number of rows written.
+        """
+        if self.client_id is None or not self._dirty:
+            return 0
+
+        from classification_cache_model import ClientClassificationCache
+
+        dirty = self._dirty
+        try:
+            db.query(ClientClassificationCache).filter(
+                ClientClassificationCache.client_id == self.client_id,
+                ClientClassificationCache.rule_version != self.rule_version,
+            ).delete(synchronize_session=False)
+
+            updates = dirty & self._persisted
+            existing: dict[str, ClientClassificationCache] = {}
+            if updates:
+                existing = {
+                    row.account_key: row
+                    for row in db.query(ClientClassificationCache).filter(
+                        ClientClassificationCache.client_id == self.client_id,
+                        ClientClassificationCache.rule_version == self.rule_version,
+                        ClientClassificationCache.account_key.in_(updates),
+                    )
+                }
+
+            for key in dirty:
+                row = existing.get(key)
+                if row is None:
+                    row = ClientClassificationCache(
+                        client_id=self.client_id, rule_version=self.rule_version, account_key=key
+                    )
+                    db.add(row)
+                _apply_entry(row, self._entries[key])
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            logger.warning(
+                "classification_cache.save_failed client_id=%s entries=%d", self.client_id, len(dirty), exc_info=True
+            )
+            return 0
+
+        self._persisted |= dirty
+        self._dirty = set()
+        logger.info(
+            "classification_cache.saved client_id=%s written=%d hits=%d misses=%d",
+            self.client_id,
+            len(dirty),
+            self.hits,
+            self.misses,
+        )
+        return len(dirty)
+
+
+def _split_keywords(raw: Optional[str]) -> list[str]:
+    return raw.split(_KEYWORD_SEPARATOR) if raw else []
+
+
+def _join_keywords(keywords: list[str]) -> Optional[str]:
+    return _KEYWORD_SEPARATOR.join(keywords)[:500] or None
+
+
+def _apply_entry(row: ClientClassificationCache, entry: _Entry) -> None:
+    if entry.classification is not None:
+        row.category = entry.classification.category.value
+        row.confidence = entry.classification.confidence
+        row.matched_keywords = _join_keywords(entry.classification.matched_keywords)
+    if entry.lead_sheet is not None:
+        row.lead_sheet = entry.lead_sheet.lead_sheet or NO_LEAD_SHEET_MATCH
+        row.lead_sheet_confidence = entry.lead_sheet.confidence
+        row.lead_sheet_keywords = _join_keywords(entry.lead_sheet.matched_keywords)
+
+
+def load_engagement_classification_cache(
+    db: Session, user_id: int, engagement_id: Optional[int]
+) -> Optional[ClassificationCache]:
+    """Load the cache for the client owning ``engagement_id``.
+
+    Returns None when no engagement is given or the user cannot access it
+    (ownership is checked by ``EngagementManager``), in which case the run
+    classifies without a cache.
+    """
+    if engagement_id is None:
+        return None
+    from engagement_manager import EngagementManager
+
+    engagement = EngagementManager(db).get_engagement(user_id, engagement_id)
+    if engagement is None:
+        return None
+    try:
+        return ClassificationCache.load(db, engagement.client_id)
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("classification_cache.load_failed client_id=%s", engagement.client_id, exc_info=True)
+        return None
+
+
+# =============================================================================
+# ContextVar scope (same shape as shared.pdf_branding)
+# =============================================================================
+
+_CLASSIFICATION_CACHE_CV: ContextVar[Optional[ClassificationCache]] = ContextVar(
+    "paciolus_classification_cache",
+    default=None,
+)
+
+
+def current_classification_cache() -> Optional[ClassificationCache]:
+    """Return the cache scoped to this request / task, or None."""
+    return _CLASSIFICATION_CACHE_CV.get()
+
+
+@contextmanager
+def use_classification_cache(cache: Optional[ClassificationCache]) -> Iterator[Optional[ClassificationCache]]:
+    """Scope ``cache`` to the enclosed block (None leaves lookups disabled).
+
+    ``asyncio.to_thread`` copies the current context, so analysis run in a
+    worker thread from inside this block still sees the cache.
+    """
+    token = _CLASSIFICATION_CACHE_CV.set(cache)
+    try:
+        yield cache
+    finally:
+        _CLASSIFICATION_CACHE_CV.reset(token)
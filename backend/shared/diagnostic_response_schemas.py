@@ -6,8 +6,9 @@ Typed Pydantic models replacing response_model=dict for:
 - Trial Balance audit
 - Flux Analysis
 - Prior Period comparison
-- Multi-Period comparison (2-way and 3-way)
+- Multi-Period comparison (2-way, 3-way and the N-period panel)
 - Adjusting Entries
+- Trial Balance analysis bundle
 """
 
 from decimal import Decimal
@@ -314,6 +315,73 @@ class ThreeWayMovementSummaryResponse(BaseModel):
     variance_formula: Optional[str] = None
 
 
+class PanelMovementResponse(BaseModel):
+    """One account's movement across one step (period t → t + 1) of a panel."""
+
+    change_amount: float
+    change_percent: Optional[float] = None
+    movement_type: Literal[
+        "new_account",
+        "closed_account",
+        "sign_change",
+        "increase",
+        "decrease",
+        "unchanged",
+    ]
+    significance: Literal["material", "significant", "minor"]
+    is_dormant: bool
+
+
+class PanelAccountResponse(BaseModel):
+    """One account row of a panel; ``None`` where the account is absent."""
+
+    account_name: str
+    account_type: str
+    lead_sheet: str
+    lead_sheet_name: str
+    lead_sheet_category: str
+    balances: list[Optional[float]]
+    movements: list[Optional[PanelMovementResponse]]
+
+
+class PanelLeadSheetRollupResponse(BaseModel):
+    """Lead sheet totals per period and net change per step."""
+
+    lead_sheet: str
+    lead_sheet_name: str
+    lead_sheet_category: str
+    account_count: int
+    totals: list[float]
+    net_changes: list[float]
+    change_percents: list[Optional[float]]
+
+
+class PanelStepCountsResponse(BaseModel):
+    """Movement counts for one step of a panel."""
+
+    step: str
+    movements_by_type: dict[str, int]
+    movements_by_significance: dict[str, int]
+
+
+class MultiPeriodPanelResponse(BaseModel):
+    """N-period (2–36) accounts × periods panel response."""
+
+    period_labels: list[str]
+    step_labels: list[str]
+    total_accounts: int
+    accounts: list[PanelAccountResponse]
+    lead_sheet_rollups: list[PanelLeadSheetRollupResponse]
+    movement_counts: list[PanelStepCountsResponse]
+    significant_movement_count: int
+    total_debits: list[float]
+    total_credits: list[float]
+    duplicate_account_warnings: list[dict[str, Any]] = []
+    active_thresholds: Optional[dict[str, Any]] = None
+    variance_basis: Optional[str] = None
+    variance_formula: Optional[str] = None
+
+
 # ═══════════════════════════════════════════════════════════════
 # Adjusting Entries
 # ═══════════════════════════════════════════════════════════════
@@ -921,3 +989,31 @@ class PreFlightReportResponse(BaseModel):
     balance_check: Optional[PreFlightBalanceCheckResponse] = None
     score_breakdown: list[PreFlightScoreComponentResponse] = []
     category_completeness: Optional[PreFlightCategoryCompletenessResponse] = None
+
+
+# ═══════════════════════════════════════════════════════════════
+# Trial Balance Analysis Bundle
+# ═══════════════════════════════════════════════════════════════
+
+
+class TrialBalanceBundleResponse(BaseModel):
+    """Every requested TB analysis computed from a single upload parse.
+
+    Only the analyses named in ``analyses`` are populated. When the diagnostic
+    cannot complete, ``failure_reason`` / ``error_message`` explain why and the
+    balance-derived analyses are absent.
+    """
+
+    filename: str
+    analyses: list[str]
+    materiality_source: Optional[str] = None
+    failure_reason: Optional[str] = None
+    error_message: Optional[str] = None
+    diagnostic: Optional[TrialBalanceResponse] = None
+    preflight: Optional[PreFlightReportResponse] = None
+    population_profile: Optional[PopulationProfileResponse] = None
+    expense_category_analytics: Optional[ExpenseCategoryReportResponse] = None
+    accrual_completeness: Optional[AccrualCompletenessReportResponse] = None
+    cutoff_risk: Optional[dict[str, Any]] = None
+    going_concern: Optional[dict[str, Any]] = None
+    risk_heatmap: Optional[dict[str, Any]] = None
@@ -0,0 +1,332 @@
+"""Worker process pool for CPU-bound tool engines.
+
+Upload parsing and the TB / testing-tool engines are pure Python and hold the
+GIL, so on ``asyncio.to_thread`` one 1M-line JE run slows every other request
+served by the same API process. Routes instead ``await
+run_engine_job(tool, fn, file_bytes, *args)``, which:
+
+  - admits the request against the tool's limits — ``ENGINE_POOL_TOOL_CONCURRENCY``
+    runs at once (``ENGINE_POOL_TOOL_LIMITS`` overrides per tool) plus
+    ``ENGINE_POOL_QUEUE_DEPTH`` waiting — and answers 429 with a Retry-After
+    estimate once both are full;
+  - copies the upload into a ``multiprocessing.shared_memory`` segment, so the
+    bytes reach the worker without being pickled through the pool's pipe;
+  - runs ``fn(file_bytes, *args)`` in a worker process. Workers are replaced
+    after ``ENGINE_POOL_MAX_TASKS_PER_CHILD`` runs to cap memory growth.
+
+Rules for ``fn`` are those of ``shared.export_render_pool``: importable at
+module level, plain picklable arguments and results, never a Session or ORM
+instance. Context variables do not cross the process boundary — pass what the
+engine needs (e.g. the classification cache) as an argument and return what
+the route needs back. Prometheus counters incremented inside a worker are not
+visible on the API process's /metrics.
+
+``HTTPException`` cannot be pickled, so one raised in a worker (a parser
+rejecting a disabled format, say) travels back as ``_WorkerHTTPError`` and is
+re-raised here as the original status and detail.
+
+Engines that split one request's work into picklable chunks (the financing
+portfolio) call ``map_engine_pool`` from inside their run instead; it has no
+admission gate of its own, since the request is already admitted or running
+on a thread.
+
+``ENGINE_POOL_WORKERS=0`` runs ``fn`` on a thread instead — admission limits
+still apply — which is also the fallback when the pool cannot accept work. A
+worker dying mid-run (typically out of memory on a huge upload) is reported as
+503 rather than retried inline, where it would take the API process down too.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import math
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Optional, TypeVar
+
+from fastapi import HTTPException
+
+from config import (
+    ENGINE_POOL_MAX_TASKS_PER_CHILD,
+    ENGINE_POOL_QUEUE_DEPTH,
+    ENGINE_POOL_TOOL_CONCURRENCY,
+    ENGINE_POOL_TOOL_LIMITS,
+    ENGINE_POOL_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+A = TypeVar("A")
+
+# Retry-After is estimated from recent run times; a tool with no history
+# assumes this many seconds per run.
+_INITIAL_RUN_SECONDS = 5.0
+_MAX_RETRY_AFTER_SECONDS = 300
+_RUN_TIME_SMOOTHING = 0.3
+
+# Threads that wait for a tool slot and then for the worker's result. They
+# only block, so the bound just has to exceed every tool's admission total.
+_DISPATCH_THREADS = 128
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+_dispatcher: ThreadPoolExecutor | None = None
+_gates: dict[str, _ToolGate] = {}
+_gates_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SharedUpload:
+    """Name and length of the shared-memory segment holding one upload."""
+
+    name: str
+    size: int
+
+
+class _WorkerHTTPError(Exception):
+    """Picklable stand-in for an ``HTTPException`` raised inside a worker."""
+
+    def __init__(self, status_code: int, detail: Any, headers: Optional[Mapping[str, str]] = None):
+        super().__init__(status_code, detail, headers)
+        self.status_code = status_code
+        self.detail = detail
+        self.headers = headers
+
+
+# =============================================================================
+# Per-tool admission
+# =============================================================================
+
+
+class _ToolGate:
+    """Run slots and a bounded wait queue for one tool."""
+
+    def __init__(self, tool: str, limit: int, queue_depth: int):
+        self.tool = tool
+        self.limit = max(1, limit)
+        self.capacity = self.limit + max(0, queue_depth)
+        self.admitted = 0
+        self.run_seconds = _INITIAL_RUN_SECONDS
+        self._slots = threading.BoundedSemaphore(self.limit)
+        self._lock = threading.Lock()
+
+    def admit(self) -> None:
+        """Take an admission or raise 429 when the tool's runs and queue are full."""
+        with self._lock:
+            if self.admitted >= self.capacity:
+                retry_after = self.retry_after()
+                logger.warning(
+                    "engine_pool.saturated tool=%s admitted=%d retry_after=%ds", self.tool, self.admitted, retry_after
+                )
+                raise HTTPException(
+                    status_code=429,
+                    detail="This analysis is busy with other uploads. Please retry shortly.",
+                    headers={"Retry-After": str(retry_after)},
+                )
+            self.admitted += 1
+
+    def retry_after(self) -> int:
+        """Seconds until a queue place should free up (caller holds ``_lock``)."""
+        waves = max(1, math.ceil((self.admitted - self.limit + 1) / self.limit))
+        return max(1, min(_MAX_RETRY_AFTER_SECONDS, math.ceil(waves * self.run_seconds)))
+
+    def run(self, job: Callable[[], T]) -> T:
+        """Wait for a run slot, run ``job``, then give the admission back."""
+        try:
+            with self._slots:
+                started = time.monotonic()
+                result = job()
+                elapsed = time.monotonic() - started
+                with self._lock:
+                    self.run_seconds += _RUN_TIME_SMOOTHING * (elapsed - self.run_seconds)
+                return result
+        finally:
+            with self._lock:
+                self.admitted -= 1
+
+
+def _configured_limit(tool: str) -> int:
+    for pair in ENGINE_POOL_TOOL_LIMITS.split(","):
+        name, sep, value = pair.partition("=")
+        if sep and name.strip() == tool:
+            try:
+                return int(value)
+            except ValueError:
+                logger.warning("engine_pool.invalid_tool_limit %s", pair.strip())
+    return ENGINE_POOL_TOOL_CONCURRENCY
+
+
+def _gate(tool: str) -> _ToolGate:
+    with _gates_lock:
+        gate = _gates.get(tool)
+        if gate is None:
+            gate = _gates[tool] = _ToolGate(tool, _configured_limit(tool), ENGINE_POOL_QUEUE_DEPTH)
+        return gate
+
+
+# =============================================================================
+# Pool lifecycle
+# =============================================================================
+
+
+def get_engine_pool() -> ProcessPoolExecutor | None:
+    """Return the shared pool, creating it on first use. None when disabled."""
+    global _pool
+    if ENGINE_POOL_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=ENGINE_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=ENGINE_POOL_MAX_TASKS_PER_CHILD or None,
+            )
+            logger.info(
+                "engine_pool.started workers=%d max_tasks_per_child=%d",
+                ENGINE_POOL_WORKERS,
+                ENGINE_POOL_MAX_TASKS_PER_CHILD,
+            )
+        return _pool
+
+
+def _get_dispatcher() -> ThreadPoolExecutor:
+    global _dispatcher
+    with _pool_lock:
+        if _dispatcher is None:
+            _dispatcher = ThreadPoolExecutor(max_workers=_DISPATCH_THREADS, thread_name_prefix="engine-dispatch")
+        return _dispatcher
+
+
+def shutdown_engine_pool(wait: bool = True) -> None:
+    """Stop the pool and dispatcher and forget tool gates (no-op if never started)."""
+    global _pool, _dispatcher
+    with _pool_lock:
+        pool, _pool = _pool, None
+        dispatcher, _dispatcher = _dispatcher, None
+    with _gates_lock:
+        _gates.clear()
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+    if dispatcher is not None:
+        dispatcher.shutdown(wait=wait)
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+    logger.warning("engine_pool.broken — a fresh pool starts on the next run")
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+
+
+def _invoke(fn: Callable[..., T], upload: SharedUpload, args: tuple[Any, ...]) -> T:
+    """Worker entry point: read the upload out of shared memory and run ``fn``."""
+    segment = shared_memory.SharedMemory(name=upload.name)
+    try:
+        assert segment.buf is not None  # only None after close()
+        file_bytes = bytes(segment.buf[: upload.size])
+    finally:
+        segment.close()
+    try:
+        return fn(file_bytes, *args)
+    except HTTPException as exc:
+        raise _WorkerHTTPError(exc.status_code, exc.detail, exc.headers) from None
+
+
+def _execute(fn: Callable[..., T], file_bytes: bytes, args: tuple[Any, ...]) -> T:
+    pool = get_engine_pool()
+    if pool is None:
+        return fn(file_bytes, *args)
+
+    try:
+        segment = shared_memory.SharedMemory(create=True, size=max(len(file_bytes), 1))
+    except OSError:
+        logger.warning("engine_pool.shared_memory_unavailable size=%d — running on thread", len(file_bytes))
+        return fn(file_bytes, *args)
+    try:
+        assert segment.buf is not None  # only None after close()
+        segment.buf[: len(file_bytes)] = file_bytes
+        try:
+            future = pool.submit(_invoke, fn, SharedUpload(segment.name, len(file_bytes)), args)
+        except (BrokenProcessPool, RuntimeError):
+            _discard_broken_pool(pool)
+            return fn(file_bytes, *args)
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            _discard_broken_pool(pool)
+            raise HTTPException(
+                status_code=503,
+                detail="The analysis worker stopped unexpectedly. Please retry.",
+                headers={"Retry-After": "5"},
+            ) from None
+        except _WorkerHTTPError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.detail, headers=exc.headers) from None
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def submit_engine_job(tool: str, fn: Callable[..., T], file_bytes: bytes, *args: Any) -> asyncio.Future[T]:
+    """Admit and start ``fn(file_bytes, *args)``; return a future for its result.
+
+    Admission happens before this returns, so a saturated tool raises
+    HTTPException(429) here rather than when the future is awaited — which is
+    what lets a background job (``shared.analysis_jobs``) refuse the upload
+    up front. Must be called from the event loop.
+    """
+    gate = _gate(tool)
+    gate.admit()
+    job = functools.partial(gate.run, functools.partial(_execute, fn, file_bytes, args))
+    future = _get_dispatcher().submit(contextvars.copy_context().run, job)
+    return asyncio.wrap_future(future)
+
+
+async def run_engine_job(tool: str, fn: Callable[..., T], file_bytes: bytes, *args: Any) -> T:
+    """Run ``fn(file_bytes, *args)`` on the engine pool under ``tool``'s limits.
+
+    Raises HTTPException(429) with Retry-After when the tool is saturated.
+    Exceptions raised by ``fn`` propagate unchanged.
+    """
+    return await submit_engine_job(tool, fn, file_bytes, *args)
+
+
+def map_engine_pool(fn: Callable[[A], T], items: Sequence[A]) -> list[T]:
+    """Return ``[fn(item) for item in items]``, computed on the engine pool.
+
+    Runs inline when the pool is disabled or cannot accept work. A worker
+    dying mid-run is a 503, as for ``run_engine_job``.
+    """
+    pool = get_engine_pool()
+    if pool is None:
+        return [fn(item) for item in items]
+    try:
+        futures = [pool.submit(fn, item) for item in items]
+    except (BrokenProcessPool, RuntimeError):
+        _discard_broken_pool(pool)
+        return [fn(item) for item in items]
+    try:
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        _discard_broken_pool(pool)
+        raise HTTPException(
+            status_code=503,
+            detail="The analysis worker stopped unexpectedly. Please retry.",
+            headers={"Retry-After": "5"},
+        ) from None
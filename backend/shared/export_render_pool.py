@@ -0,0 +1,107 @@
+"""Worker process pool for CPU-bound export rendering.
+
+ReportLab layout is pure Python and holds the GIL, so rendering several
+independent documents on threads buys nothing. Multi-document exports (the
+engagement diagnostic package) instead submit their render functions here and
+collect results as they complete.
+
+Rules for anything submitted:
+  - the function must be importable at module level (it is pickled by name);
+  - arguments must be plain picklable data — never a Session or ORM instance.
+    Query first, snapshot, then submit.
+
+Workers use the ``spawn`` start method: forking a process that holds open DB
+connections and scheduler threads is unsafe. The pool is created on first
+use and shared for the life of the process; ``shutdown_render_pool`` is
+called from the app lifespan.
+
+``ENGAGEMENT_EXPORT_WORKERS=0`` disables the pool and runs every render
+inline in the caller, which is also the fallback when the pool breaks.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from config import ENGAGEMENT_EXPORT_WORKERS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> ProcessPoolExecutor | None:
+    """Return the shared pool, creating it on first use. None when disabled."""
+    global _pool
+    if ENGAGEMENT_EXPORT_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=ENGAGEMENT_EXPORT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("export.render_pool.started workers=%d", ENGAGEMENT_EXPORT_WORKERS)
+        return _pool
+
+
+def shutdown_render_pool(wait: bool = True) -> None:
+    """Stop the shared pool (no-op if it was never started)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+    logger.warning("export.render_pool.broken — falling back to inline rendering until restarted")
+
+
+def _run_inline(fn: Callable[..., T], *args: Any) -> Future[T]:
+    future: Future[T] = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def submit_render(fn: Callable[..., T], *args: Any) -> Future[T]:
+    """Schedule ``fn(*args)`` on the pool, or run it inline when the pool is off/broken."""
+    pool = get_render_pool()
+    if pool is None:
+        return _run_inline(fn, *args)
+    try:
+        return pool.submit(fn, *args)
+    except (BrokenProcessPool, RuntimeError):
+        _discard_broken_pool(pool)
+        return _run_inline(fn, *args)
+
+
+def render_result(future: Future[T], fn: Callable[..., T], *args: Any) -> T:
+    """``future.result()``, re-running ``fn`` inline if the worker process died.
+
+    Exceptions raised by ``fn`` itself propagate unchanged.
+    """
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        pool = _pool
+        if pool is not None:
+            _discard_broken_pool(pool)
+        return fn(*args)
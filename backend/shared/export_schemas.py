@@ -120,6 +120,15 @@ class FinancialStatementsInput(BaseModel):
 # --- Testing CSV Models ---
 
 
+class StoredResultExportInput(WorkpaperMetadata):
+    """Export a result kept with ``store_result=true`` (see shared/result_store.py).
+
+    Accepted by testing-tool memo and CSV exports in place of the full result.
+    """
+
+    result_id: str
+
+
 class JETestingExportInput(WorkpaperMetadata):
     """Input model for JE testing exports."""
 
@@ -0,0 +1,114 @@
+"""Bounded spool buffers for large export rendering.
+
+The default export path renders a whole PDF / XLSX into ``bytes`` and then
+hands it to a StreamingResponse — the document, the BytesIO it was written
+into and the ``getvalue()`` copy are all resident at once. For ordinary
+diagnostics that is a few hundred KB and not worth avoiding. For TBs with
+thousands of flagged accounts it is the RSS spike ``track_memo_memory``
+exists to catch.
+
+The streaming path writes the document straight into a
+``tempfile.SpooledTemporaryFile``: it stays in memory up to
+``config.EXPORT_SPOOL_MAX_MEMORY_MB`` and rolls over to an anonymous temp file
+beyond that, so peak memory is bounded regardless of document size. The
+response then streams the spool back in fixed-size chunks and closes (and
+thereby deletes) it once the last chunk is sent — nothing outlives the
+request, consistent with zero-storage.
+
+Which exports take the streaming path is decided by ``should_stream_export``
+against ``config.EXPORT_STREAMING_ROW_THRESHOLD`` (rows in the largest section).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from typing import IO
+
+from fastapi.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPOOL_MAX_MEMORY_MB = 8
+DEFAULT_STREAMING_ROW_THRESHOLD = 500
+SPOOL_READ_CHUNK_BYTES = 64 * 1024
+
+
+def _positive_or_default(name: str, value: int, default: int) -> int:
+    if value > 0:
+        return value
+    logger.warning("export.spool.invalid_setting name=%s value=%d — using %d", name, value, default)
+    return default
+
+
+def spool_max_memory_bytes() -> int:
+    """In-memory ceiling before the spool rolls over to disk (``EXPORT_SPOOL_MAX_MEMORY_MB``)."""
+    from config import EXPORT_SPOOL_MAX_MEMORY_MB
+
+    megabytes = _positive_or_default(
+        "EXPORT_SPOOL_MAX_MEMORY_MB", EXPORT_SPOOL_MAX_MEMORY_MB, DEFAULT_SPOOL_MAX_MEMORY_MB
+    )
+    return megabytes * 1024 * 1024
+
+
+def streaming_row_threshold() -> int:
+    """Row count at or above which exports take the streaming path (``EXPORT_STREAMING_ROW_THRESHOLD``)."""
+    from config import EXPORT_STREAMING_ROW_THRESHOLD
+
+    return _positive_or_default(
+        "EXPORT_STREAMING_ROW_THRESHOLD", EXPORT_STREAMING_ROW_THRESHOLD, DEFAULT_STREAMING_ROW_THRESHOLD
+    )
+
+
+def should_stream_export(row_count: int) -> bool:
+    """True when an export's largest section is big enough to justify spooling."""
+    return row_count >= streaming_row_threshold()
+
+
+def new_export_spool() -> IO[bytes]:
+    """Return an empty binary spool bounded by ``spool_max_memory_bytes()``."""
+    return tempfile.SpooledTemporaryFile(max_size=spool_max_memory_bytes(), mode="w+b")
+
+
+def spool_size(spool: IO[bytes]) -> int:
+    """Total bytes written to ``spool`` (leaves the position at the end)."""
+    spool.seek(0, os.SEEK_END)
+    return spool.tell()
+
+
+def iter_spool(spool: IO[bytes], chunk_size: int = SPOOL_READ_CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield ``spool`` from the start in ``chunk_size`` pieces, closing it when done.
+
+    The close runs in ``finally`` so a client disconnect mid-download (which
+    closes the generator) still releases the temp file.
+    """
+    try:
+        spool.seek(0)
+        while True:
+            chunk = spool.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        spool.close()
+
+
+def streaming_spool_response(spool: IO[bytes], filename: str, media_type: str) -> StreamingResponse:
+    """Build a StreamingResponse that drains (and then closes) a rendered spool.
+
+    Args:
+        spool: Spool the document was written into; ownership passes to the response.
+        filename: Already-sanitized download filename.
+        media_type: Response media type (see ``shared.export_helpers``).
+    """
+    size = spool_size(spool)
+    return StreamingResponse(
+        iter_spool(spool),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+        },
+    )
@@ -0,0 +1,119 @@
+"""Deferred imports for heavy engine / generator modules.
+
+Route modules have to be imported eagerly — FastAPI needs every path,
+dependency and Pydantic schema at ``include_router`` time to build the
+OpenAPI document. What they do *not* need at import time is the code behind
+the handler: the memo generators pull in ReportLab, the engines pull in
+pandas / openpyxl, and the sum of those imports is most of the API's cold
+start on a freshly scaled container.
+
+``lazy_callable("module:attr")`` returns a stand-in that resolves the target
+on first call (thread-safe, cached) and forwards every subsequent call to it.
+Routes keep their declarative registries; only the reference is deferred.
+
+Every stand-in is recorded in a process-wide registry so ``warm_up()`` can
+resolve them all in one go. ``main.lifespan`` calls it when
+``LAZY_IMPORT_WARMUP`` is enabled, trading startup time for a fast first
+request — useful behind a readiness probe, pointless on a dev box.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+from time import perf_counter
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_REGISTRY: dict[str, LazyCallable] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+class LazyCallable:
+    """Callable proxy that imports ``module:attr`` on first use."""
+
+    __slots__ = ("target", "_module_name", "_attr_name", "_resolved", "_lock")
+
+    def __init__(self, target: str) -> None:
+        module_name, sep, attr_name = target.partition(":")
+        if not sep or not module_name or not attr_name:
+            raise ValueError(f"lazy target must be 'module:attr', got {target!r}")
+        self.target = target
+        self._module_name = module_name
+        self._attr_name = attr_name
+        self._resolved: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._resolved is not None
+
+    def resolve(self) -> Any:
+        """Import the target module (once) and return the referenced attribute."""
+        resolved = self._resolved
+        if resolved is not None:
+            return resolved
+        with self._lock:
+            if self._resolved is None:
+                module = importlib.import_module(self._module_name)
+                self._resolved = getattr(module, self._attr_name)
+            return self._resolved
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "resolved" if self.is_resolved else "pending"
+        return f"<LazyCallable {self.target} ({state})>"
+
+
+def lazy_callable(target: str) -> Any:
+    """Return the (shared) lazy proxy for ``module:attr``.
+
+    Typed as ``Any`` so call sites can annotate the proxy with the real
+    callable signature without a cast.
+    """
+    with _REGISTRY_LOCK:
+        proxy = _REGISTRY.get(target)
+        if proxy is None:
+            proxy = LazyCallable(target)
+            _REGISTRY[target] = proxy
+        return proxy
+
+
+def registered_targets() -> list[str]:
+    """All lazy targets declared so far, in registration order."""
+    with _REGISTRY_LOCK:
+        return list(_REGISTRY)
+
+
+def warm_up() -> dict[str, float]:
+    """Resolve every registered lazy target; return per-target import time in ms.
+
+    Failures are logged and skipped — a broken optional generator must not
+    take the whole worker down at startup; the request that needs it will
+    surface the ImportError through the normal error path instead.
+    """
+    with _REGISTRY_LOCK:
+        proxies = list(_REGISTRY.values())
+
+    timings: dict[str, float] = {}
+    started = perf_counter()
+    for proxy in proxies:
+        if proxy.is_resolved:
+            continue
+        t0 = perf_counter()
+        try:
+            proxy.resolve()
+        except Exception:  # noqa: BLE001 — startup warmup is best-effort
+            logger.exception("lazy_import.warmup_failed target=%s", proxy.target)
+            continue
+        timings[proxy.target] = (perf_counter() - t0) * 1000
+    logger.info(
+        "lazy_import.warmup resolved=%d elapsed_ms=%.1f",
+        len(timings),
+        (perf_counter() - started) * 1000,
+    )
+    return timings
@@ -9,10 +9,12 @@ Each memo generator imports these functions and provides only
 domain-specific content (title, test descriptions, conclusion text).
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Optional
 
 from reportlab.lib.enums import TA_CENTER
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     Paragraph,
@@ -25,7 +27,6 @@ from pdf_generator import (
     ClassicalColors,
     DoubleRule,
     LedgerRule,
-    _add_or_replace_style,
     create_leader_dots,
     format_classical_date,
 )
@@ -142,9 +143,18 @@ def format_risk_tier_label(composite: dict) -> tuple[str, Any]:
 
 
 def create_memo_styles() -> dict:
-    """Create the standard memo style set used by all testing memos."""
-    styles = getSampleStyleSheet()
+    """Return the standard memo style set used by all testing memos.
 
+    The ParagraphStyle objects are built once per process and shared by every
+    memo; each call returns a fresh dict over them. Callers may add keys to
+    the dict but must not mutate a style — derive one with
+    ``ParagraphStyle(name, parent=styles[...])`` instead.
+    """
+    return dict(_memo_style_registry())
+
+
+@lru_cache(maxsize=1)
+def _memo_style_registry() -> MappingProxyType:
     memo_styles = [
         ParagraphStyle(
             "MemoTitle",
@@ -233,12 +243,48 @@ def create_memo_styles() -> dict:
         ),
     ]
 
-    style_dict = {}
-    for s in memo_styles:
-        _add_or_replace_style(styles, s)
-        style_dict[s.name] = s
+    return MappingProxyType({style.name: style for style in memo_styles})
+
+
+# =============================================================================
+# Static flowable templates
+# =============================================================================
+
+
+@lru_cache(maxsize=256)
+def _paragraph_template(text: str, style: ParagraphStyle) -> Paragraph:
+    """Parse ``text`` once per (text, style). Never placed in a story itself."""
+    return Paragraph(text, style)
 
-    return style_dict
+
+def static_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    """Paragraph for fixed boilerplate text, cloned from a memoized template.
+
+    Markup parsing is the expensive part of building a Paragraph; the clone
+    reuses the parsed fragments (copied, since layout rewrites them) and
+    skips the parser. Use only for text that does not vary per request —
+    disclaimers, limitations, section headings — so the template cache
+    stays small.
+    """
+    template = _paragraph_template(text, style)
+    return Paragraph(template.text, template.style, frags=[frag.clone() for frag in template.frags])
+
+
+@lru_cache(maxsize=1)
+def _methodology_table_style() -> TableStyle:
+    return TableStyle(
+        [
+            ("FONTNAME", (0, 0), (-1, 0), "Times-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 9),
+            ("TEXTCOLOR", (0, 0), (-1, 0), ClassicalColors.OBSIDIAN_DEEP),
+            ("LINEBELOW", (0, 0), (-1, 0), 1, ClassicalColors.OBSIDIAN_DEEP),
+            ("LINEBELOW", (0, 1), (-1, -1), 0.25, ClassicalColors.LEDGER_RULE),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("TOPPADDING", (0, 0), (-1, -1), 4),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+            ("LEFTPADDING", (0, 0), (0, -1), 0),
+        ]
+    )
 
 
 # =============================================================================
@@ -285,7 +331,7 @@ def build_scope_section(
     If title is present, shown as "Source: <title> (<filename>)".
     If title absent but filename present, shown as "Source: <filename>".
     """
-    story.append(Paragraph("I. Scope", styles["MemoSection"]))
+    story.append(static_paragraph("I. Scope", styles["MemoSection"]))
     story.append(LedgerRule(doc_width))
 
     total_entries = composite.get("total_entries", 0)
@@ -321,7 +367,7 @@ def build_methodology_section(
     intro_text: str,
 ) -> None:
     """Build the Methodology section (II. Methodology)."""
-    story.append(Paragraph("II. Methodology", styles["MemoSection"]))
+    story.append(static_paragraph("II. Methodology", styles["MemoSection"]))
     story.append(LedgerRule(doc_width))
     story.append(Paragraph(intro_text, styles["MemoBody"]))
 
@@ -337,21 +383,7 @@ def build_methodology_section(
         )
 
     method_table = Table(method_data, colWidths=[1.5 * inch, 0.8 * inch, 4.3 * inch], repeatRows=1)
-    method_table.setStyle(
-        TableStyle(
-            [
-                ("FONTNAME", (0, 0), (-1, 0), "Times-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("TEXTCOLOR", (0, 0), (-1, 0), ClassicalColors.OBSIDIAN_DEEP),
-                ("LINEBELOW", (0, 0), (-1, 0), 1, ClassicalColors.OBSIDIAN_DEEP),
-                ("LINEBELOW", (0, 1), (-1, -1), 0.25, ClassicalColors.LEDGER_RULE),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("TOPPADDING", (0, 0), (-1, -1), 4),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                ("LEFTPADDING", (0, 0), (0, -1), 0),
-            ]
-        )
-    )
+    method_table.setStyle(_methodology_table_style())
     story.append(method_table)
     story.append(Spacer(1, 8))
 
@@ -365,7 +397,7 @@ def build_results_summary_section(
     flagged_label: str = "Total Entries Flagged",
 ) -> None:
     """Build the Results Summary section (III. Results Summary)."""
-    story.append(Paragraph("III. Results Summary", styles["MemoSection"]))
+    story.append(static_paragraph("III. Results Summary", styles["MemoSection"]))
     story.append(LedgerRule(doc_width))
 
     tier_label, _ = format_risk_tier_label(composite)
@@ -426,10 +458,10 @@ def build_results_summary_section(
     # Results by test table — wrap cells in Paragraph for word-wrapping (BUG-003)
     results_data = [
         [
-            Paragraph("Test", styles.get("MemoTableHeader", styles.get("MemoBody"))),
-            Paragraph("Flagged", styles.get("MemoTableHeader", styles.get("MemoBody"))),
-            Paragraph("Rate", styles.get("MemoTableHeader", styles.get("MemoBody"))),
-            Paragraph("Severity", styles.get("MemoTableHeader", styles.get("MemoBody"))),
+            static_paragraph("Test", styles.get("MemoTableHeader", styles.get("MemoBody"))),
+            static_paragraph("Flagged", styles.get("MemoTableHeader", styles.get("MemoBody"))),
+            static_paragraph("Rate", styles.get("MemoTableHeader", styles.get("MemoBody"))),
+            static_paragraph("Severity", styles.get("MemoTableHeader", styles.get("MemoBody"))),
         ]
     ]
     cell_style = styles.get("MemoTableCell", styles.get("MemoBody"))
@@ -544,7 +576,7 @@ def build_proof_summary_section(
             1 for tr in test_results if tr.get("entries_flagged", 0) == 0 and not tr.get("skipped", False)
         )
 
-    story.append(Paragraph("Proof Summary", styles["MemoSection"]))
+    story.append(static_paragraph("Proof Summary", styles["MemoSection"]))
     story.append(LedgerRule(doc_width))
 
     proof_data = [
@@ -614,7 +646,7 @@ def build_disclaimer(
     story.append(Spacer(1, 12))
     domain_clause = f"{domain} testing" if not domain.endswith("testing") else domain
     story.append(
-        Paragraph(
+        static_paragraph(
             f"This memo documents automated {domain_clause} procedures with reference to {isa_reference}. "
             "Results represent data anomalies identified through analytics and are not "
             "conclusions regarding internal control effectiveness, fraud, or material "
@@ -644,7 +676,9 @@ def build_limitations_section(
     from pdf_generator import LedgerRule
 
     story.append(Spacer(1, 16))
-    story.append(Paragraph("Limitations", styles.get("MemoSection", styles.get("SectionHeader", styles["MemoBody"]))))
+    story.append(
+        static_paragraph("Limitations", styles.get("MemoSection", styles.get("SectionHeader", styles["MemoBody"])))
+    )
     story.append(LedgerRule(doc_width))
 
     limitation_text = (
@@ -656,7 +690,7 @@ def build_limitations_section(
         "require independent corroboration before conclusions may be drawn."
     )
 
-    story.append(Paragraph(limitation_text, styles.get("MemoBody", styles["MemoBody"])))
+    story.append(static_paragraph(limitation_text, styles.get("MemoBody", styles["MemoBody"])))
     story.append(Spacer(1, 4))
 
     # Part 3: Practitioner liability boundary
@@ -668,7 +702,7 @@ def build_limitations_section(
         "credentials in this report does not constitute a representation by Paciolus regarding "
         "the quality or completeness of any professional engagement."
     )
-    story.append(Paragraph(practitioner_text, styles.get("MemoBody", styles["MemoBody"])))
+    story.append(static_paragraph(practitioner_text, styles.get("MemoBody", styles["MemoBody"])))
     story.append(Spacer(1, 4))
 
     zero_storage_text = (
@@ -676,4 +710,4 @@ def build_limitations_section(
         "analysis session and was not persisted to any storage medium. No client financial "
         "data is retained by Paciolus after the analysis session concludes."
     )
-    story.append(Paragraph(zero_storage_text, styles.get("MemoBodySmall", styles.get("MemoBody"))))
+    story.append(static_paragraph(zero_storage_text, styles.get("MemoBodySmall", styles.get("MemoBody"))))
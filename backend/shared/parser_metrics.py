@@ -18,11 +18,23 @@ Metrics:
 - paciolus_active_subscriptions: Gauge by tier
 - paciolus_http_requests_total: Counter by method/path/status_code
 - paciolus_http_request_duration_seconds: Histogram by method/path/status_code
+- paciolus_preflight_cache_lookups_total: Counter by backend/result
+- paciolus_preflight_cache_evictions_total: Counter by reason
+- paciolus_preflight_cache_bytes: Gauge (in-memory backend, per process)
+- paciolus_result_store_lookups_total: Counter by backend/result
+- paciolus_result_store_evictions_total: Counter by reason
+- paciolus_result_store_bytes: Gauge (in-memory backend, compressed, per process)
+- paciolus_render_cache_lookups_total: Counter by tier/result
+- paciolus_render_cache_bytes: Gauge (in-memory tier, per process)
+- paciolus_loki_shipping: Gauge by counter (Loki handler counters, per process)
 
 Uses a dedicated registry so /metrics only exposes app metrics,
 not the default process/GC collectors.
 """
 
+from functools import partial
+from typing import Any
+
 from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
 
 # Dedicated registry — avoids polluting default registry
@@ -121,3 +133,89 @@ http_request_duration_seconds = Histogram(
     buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
     registry=PARSER_REGISTRY,
 )
+
+# ---------------------------------------------------------------------------
+# Preflight cache (shared/preflight_cache.py)
+# ---------------------------------------------------------------------------
+
+preflight_cache_lookups_total = Counter(
+    "paciolus_preflight_cache_lookups_total",
+    "Preflight token lookups",
+    ["backend", "result"],
+    registry=PARSER_REGISTRY,
+)
+
+preflight_cache_evictions_total = Counter(
+    "paciolus_preflight_cache_evictions_total",
+    "Preflight entries evicted from the in-memory backend",
+    ["reason"],
+    registry=PARSER_REGISTRY,
+)
+
+preflight_cache_bytes = Gauge(
+    "paciolus_preflight_cache_bytes",
+    "Bytes held by the in-memory preflight backend",
+    registry=PARSER_REGISTRY,
+)
+
+# ---------------------------------------------------------------------------
+# Tool result store (shared/result_store.py)
+# ---------------------------------------------------------------------------
+
+result_store_lookups_total = Counter(
+    "paciolus_result_store_lookups_total",
+    "Stored tool result lookups",
+    ["backend", "result"],
+    registry=PARSER_REGISTRY,
+)
+
+result_store_evictions_total = Counter(
+    "paciolus_result_store_evictions_total",
+    "Stored tool results evicted from the in-memory backend",
+    ["reason"],
+    registry=PARSER_REGISTRY,
+)
+
+result_store_bytes = Gauge(
+    "paciolus_result_store_bytes",
+    "Compressed bytes held by the in-memory result store backend",
+    registry=PARSER_REGISTRY,
+)
+
+# ---------------------------------------------------------------------------
+# Rendered-export cache (shared/render_cache.py)
+# ---------------------------------------------------------------------------
+
+render_cache_lookups_total = Counter(
+    "paciolus_render_cache_lookups_total",
+    "Rendered-export cache lookups",
+    ["tier", "result"],
+    registry=PARSER_REGISTRY,
+)
+
+render_cache_bytes = Gauge(
+    "paciolus_render_cache_bytes",
+    "Bytes held by the in-memory rendered-export cache",
+    registry=PARSER_REGISTRY,
+)
+
+# ---------------------------------------------------------------------------
+# Loki log shipping (loki_handler.py)
+# ---------------------------------------------------------------------------
+
+loki_shipping = Gauge(
+    "paciolus_loki_shipping",
+    "Loki handler counters since process start (see LokiHandler.stats)",
+    ["counter"],
+    registry=PARSER_REGISTRY,
+)
+
+
+def observe_loki_handler(handler: Any) -> None:
+    """Read ``handler.stats()`` into paciolus_loki_shipping at scrape time."""
+    for name in handler.stats():
+        loki_shipping.labels(counter=name).set_function(partial(_read_stat, handler, name))
+
+
+def _read_stat(handler: Any, name: str) -> float:
+    return float(handler.stats()[name])
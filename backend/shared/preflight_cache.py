@@ -1,21 +1,48 @@
 """
-Preflight cache — short-lived in-memory store for file bytes parsed during preview/inspection.
+Preflight cache — short-lived store for file bytes parsed during preview/inspection.
 
 Eliminates double upload+parse for the PDF preview → audit and workbook inspect → audit flows.
-Keyed by UUID tokens with a 10-minute TTL and 100-entry LRU cap.
+Keyed by UUID tokens with a 10-minute TTL.
 
-NOTE: In-memory only — suitable for single-process deployments. Should migrate to Redis
-or a shared cache if the backend scales to multiple workers/processes.
+Backends (``PREFLIGHT_CACHE_BACKEND``):
+    - ``memory`` — per-process LRU bounded by total cached bytes
+      (``PREFLIGHT_CACHE_MAX_MB``). O(1) get/put/evict on an OrderedDict.
+    - ``redis`` — one key per token with Redis-side TTL, shared by every
+      worker, so a preview served by worker A can be consumed by an audit on
+      worker B. Redis errors degrade to the memory backend per call.
+    - ``auto`` (default) — Redis when ``REDIS_URL`` is set and reachable,
+      otherwise memory. Same lazy-init pattern as ``shared/bulk_job_store.py``.
+
+Every backend shares the ``put / get / remove`` API. Lookups are counted
+per backend (``paciolus_preflight_cache_lookups_total``) alongside
+in-process counters exposed by ``PreflightCache.stats()``.
 """
 
+from __future__ import annotations
+
+import json
+import logging
+import struct
 import threading
 import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Final, Protocol
+
+from shared.parser_metrics import (
+    preflight_cache_bytes,
+    preflight_cache_evictions_total,
+    preflight_cache_lookups_total,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+TTL_SECONDS: Final[int] = 600  # 10 minutes
 
-MAX_ENTRIES = 100
-TTL_SECONDS = 600  # 10 minutes
+_REDIS_KEY_PREFIX: Final[str] = "preflight:"
+_HEADER_LEN = struct.Struct(">I")
 
 
 @dataclass
@@ -25,55 +52,268 @@ class PreflightEntry:
     created_at: float = field(default_factory=time.monotonic)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def size(self) -> int:
+        return len(self.file_bytes)
 
-class PreflightCache:
-    def __init__(self, max_entries: int = MAX_ENTRIES, ttl_seconds: int = TTL_SECONDS):
-        self._store: dict[str, PreflightEntry] = {}
+
+class PreflightBackend(Protocol):
+    name: str
+
+    def put(self, token: str, entry: PreflightEntry) -> None: ...
+
+    def get(self, token: str) -> PreflightEntry | None: ...
+
+    def remove(self, token: str) -> None: ...
+
+
+# =============================================================================
+# In-memory backend
+# =============================================================================
+
+
+class MemoryPreflightBackend:
+    """Per-process LRU bounded by total ``file_bytes`` size.
+
+    Entries are kept in insertion/access order; eviction pops from the front
+    until the new entry fits. Expired entries are dropped lazily on access
+    and from the front of the order on every insert.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, ttl_seconds: int = TTL_SECONDS):
+        self._store: OrderedDict[str, PreflightEntry] = OrderedDict()
         self._lock = threading.Lock()
-        self._max_entries = max_entries
+        self._max_bytes = max_bytes
         self._ttl = ttl_seconds
+        self._total_bytes = 0
 
-    def put(self, file_bytes: bytes, filename: str, metadata: dict[str, Any] | None = None) -> str:
-        """Cache file data and return a preflight token (UUID hex)."""
-        token = uuid.uuid4().hex
-        entry = PreflightEntry(
-            file_bytes=file_bytes,
-            filename=filename,
-            metadata=metadata or {},
-        )
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._store)
 
+    def put(self, token: str, entry: PreflightEntry) -> None:
+        if entry.size > self._max_bytes:
+            logger.warning(
+                "preflight_cache.entry_too_large size=%d max_bytes=%d — not cached", entry.size, self._max_bytes
+            )
+            return
         with self._lock:
-            self._evict_expired()
-            # LRU eviction if at capacity
-            while len(self._store) >= self._max_entries:
-                oldest_key = min(self._store, key=lambda k: self._store[k].created_at)
-                del self._store[oldest_key]
+            self._evict_expired_head()
+            while self._store and self._total_bytes + entry.size > self._max_bytes:
+                self._pop_oldest("capacity")
             self._store[token] = entry
-
-        return token
+            self._total_bytes += entry.size
+            preflight_cache_bytes.set(self._total_bytes)
 
     def get(self, token: str) -> PreflightEntry | None:
-        """Retrieve cached entry. Returns None if token is unknown or expired."""
         with self._lock:
             entry = self._store.get(token)
             if entry is None:
                 return None
             if time.monotonic() - entry.created_at > self._ttl:
-                del self._store[token]
+                self._discard(token, "expired")
                 return None
+            self._store.move_to_end(token)
             return entry
 
     def remove(self, token: str) -> None:
-        """Explicitly remove an entry (e.g., after successful consumption)."""
         with self._lock:
-            self._store.pop(token, None)
+            if token in self._store:
+                self._discard(token, None)
+
+    def _pop_oldest(self, reason: str) -> None:
+        """Must be called under lock."""
+        token = next(iter(self._store))
+        self._discard(token, reason)
+
+    def _discard(self, token: str, reason: str | None) -> None:
+        """Must be called under lock."""
+        entry = self._store.pop(token)
+        self._total_bytes -= entry.size
+        preflight_cache_bytes.set(self._total_bytes)
+        if reason is not None:
+            preflight_cache_evictions_total.labels(reason=reason).inc()
 
-    def _evict_expired(self) -> None:
-        """Remove all expired entries. Must be called under lock."""
+    def _evict_expired_head(self) -> None:
+        """Drop expired entries from the LRU end. Must be called under lock.
+
+        Stops at the first live entry: a recently-read old entry may sit
+        behind it, but it will be caught by ``get`` or capacity eviction.
+        """
         now = time.monotonic()
-        expired = [k for k, v in self._store.items() if now - v.created_at > self._ttl]
-        for k in expired:
-            del self._store[k]
+        while self._store:
+            oldest = next(iter(self._store.values()))
+            if now - oldest.created_at <= self._ttl:
+                break
+            self._pop_oldest("expired")
+
+
+# =============================================================================
+# Redis backend
+# =============================================================================
+
+
+def _encode_entry(entry: PreflightEntry) -> bytes:
+    header = json.dumps({"filename": entry.filename, "metadata": entry.metadata}).encode("utf-8")
+    return _HEADER_LEN.pack(len(header)) + header + entry.file_bytes
+
+
+def _decode_entry(raw: bytes) -> PreflightEntry:
+    (header_len,) = _HEADER_LEN.unpack_from(raw)
+    start = _HEADER_LEN.size
+    header = json.loads(raw[start : start + header_len])
+    return PreflightEntry(
+        file_bytes=raw[start + header_len :],
+        filename=header["filename"],
+        metadata=header.get("metadata") or {},
+    )
+
+
+class RedisPreflightBackend:
+    """One Redis string per token (header + raw bytes) with ``EX`` TTL."""
+
+    name = "redis"
+
+    def __init__(self, client: Any, ttl_seconds: int = TTL_SECONDS):
+        self._client = client
+        self._ttl = ttl_seconds
+
+    def put(self, token: str, entry: PreflightEntry) -> None:
+        self._client.set(f"{_REDIS_KEY_PREFIX}{token}", _encode_entry(entry), ex=self._ttl)
+
+    def get(self, token: str) -> PreflightEntry | None:
+        raw = self._client.get(f"{_REDIS_KEY_PREFIX}{token}")
+        return None if raw is None else _decode_entry(raw)
+
+    def remove(self, token: str) -> None:
+        self._client.delete(f"{_REDIS_KEY_PREFIX}{token}")
+
+
+def _connect_redis() -> Any | None:
+    """Return a binary-safe Redis client for ``REDIS_URL``, or None."""
+    from config import REDIS_URL
+
+    if not REDIS_URL:
+        return None
+    try:
+        import redis
+
+        client = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=1.0)
+        client.ping()
+        return client
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Preflight cache: Redis unreachable (%s) — using in-memory backend", exc)
+        return None
+
+
+# =============================================================================
+# Facade
+# =============================================================================
+
+
+class PreflightCache:
+    """Token-issuing front end over a ``PreflightBackend``.
+
+    With no explicit backend the one named by ``PREFLIGHT_CACHE_BACKEND`` is
+    chosen on first use. A Redis backend that raises falls back to the
+    in-memory backend for that call.
+    """
+
+    def __init__(self, backend: PreflightBackend | None = None):
+        self._backend = backend
+        self._fallback: MemoryPreflightBackend | None = None
+        self._init_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> PreflightBackend:
+        if self._backend is None:
+            with self._init_lock:
+                if self._backend is None:
+                    self._backend = _select_backend()
+                    logger.info("Preflight cache: %s backend", self._backend.name)
+        return self._backend
+
+    def _memory_fallback(self) -> MemoryPreflightBackend:
+        backend = self.backend
+        if isinstance(backend, MemoryPreflightBackend):
+            return backend
+        with self._init_lock:
+            if self._fallback is None:
+                self._fallback = _new_memory_backend()
+            return self._fallback
+
+    def put(self, file_bytes: bytes, filename: str, metadata: dict[str, Any] | None = None) -> str:
+        """Cache file data and return a preflight token (UUID hex)."""
+        token = uuid.uuid4().hex
+        entry = PreflightEntry(file_bytes=file_bytes, filename=filename, metadata=metadata or {})
+        backend = self.backend
+        try:
+            backend.put(token, entry)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Preflight cache: %s put failed (%s)", backend.name, exc)
+            self._memory_fallback().put(token, entry)
+        return token
+
+    def get(self, token: str) -> PreflightEntry | None:
+        """Retrieve cached entry. Returns None if token is unknown or expired."""
+        backend = self.backend
+        try:
+            entry = backend.get(token)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Preflight cache: %s get failed (%s)", backend.name, exc)
+            entry = None
+        if entry is None and self._fallback is not None:
+            entry = self._fallback.get(token)
+
+        if entry is None:
+            self.misses += 1
+            preflight_cache_lookups_total.labels(backend=backend.name, result="miss").inc()
+        else:
+            self.hits += 1
+            preflight_cache_lookups_total.labels(backend=backend.name, result="hit").inc()
+        return entry
+
+    def remove(self, token: str) -> None:
+        """Explicitly remove an entry (e.g., after successful consumption)."""
+        backend = self.backend
+        try:
+            backend.remove(token)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Preflight cache: %s remove failed (%s)", backend.name, exc)
+        if self._fallback is not None:
+            self._fallback.remove(token)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process (Prometheus has the cross-worker view)."""
+        return {"backend": self.backend.name, "hits": self.hits, "misses": self.misses}
+
+
+def _new_memory_backend() -> MemoryPreflightBackend:
+    from config import PREFLIGHT_CACHE_MAX_MB, PREFLIGHT_CACHE_TTL_SECONDS
+
+    return MemoryPreflightBackend(
+        max_bytes=PREFLIGHT_CACHE_MAX_MB * 1024 * 1024,
+        ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS,
+    )
+
+
+def _select_backend() -> PreflightBackend:
+    from config import PREFLIGHT_CACHE_BACKEND, PREFLIGHT_CACHE_TTL_SECONDS
+
+    if PREFLIGHT_CACHE_BACKEND in ("auto", "redis"):
+        client = _connect_redis()
+        if client is not None:
+            return RedisPreflightBackend(client, ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS)
+        if PREFLIGHT_CACHE_BACKEND == "redis":
+            logger.warning("Preflight cache: PREFLIGHT_CACHE_BACKEND=redis but Redis is unavailable")
+    return _new_memory_backend()
 
 
 # Module-level singleton
@@ -0,0 +1,128 @@
+"""
+Mergeable relative-error quantile sketch.
+
+Values are counted in logarithmically spaced buckets (the DDSketch scheme):
+bucket ``k`` holds values in ``(γ^(k-1), γ^k]`` with ``γ = (1 + α) / (1 - α)``,
+so every quantile is answered within relative error ``α`` of a value in the
+population. Sketches with the same ``α`` merge by adding bucket counts, which
+lets chunks of a population be sketched independently and combined.
+
+Each bucket also keeps the exact sum of its values, so ``gini`` can walk the
+Lorenz curve bucket by bucket; the only error is the inequality *within* a
+bucket, whose values differ by at most a factor of ``γ``.
+
+Non-negative values only (callers sketch absolute balances); zeros are
+counted in a separate bucket below all others.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+class QuantileSketch:
+    """Log-bucket quantile sketch over non-negative values."""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._inv_log_gamma = 1.0 / math.log(self._gamma)
+        # Dense bucket arrays; index i holds key ``_offset + i``.
+        self._offset = 0
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._sums = np.zeros(0, dtype=np.float64)
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @property
+    def total(self) -> float:
+        """Sum of all values added."""
+        return float(self._sums.sum())
+
+    def add(self, values: Iterable[float] | np.ndarray) -> None:
+        """Add a batch of values."""
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        if arr.size == 0:
+            return
+        if np.isnan(arr).any() or (arr < 0).any():
+            raise ValueError("QuantileSketch accepts non-negative values only")
+        self.count += int(arr.size)
+        self.min = min(self.min, float(arr.min()))
+        self.max = max(self.max, float(arr.max()))
+        positive = arr[arr > 0]
+        self.zero_count += int(arr.size - positive.size)
+        if positive.size:
+            keys = np.ceil(np.log(positive) * self._inv_log_gamma).astype(np.int64)
+            low = int(keys.min())
+            self._accumulate(low, np.bincount(keys - low), np.bincount(keys - low, weights=positive))
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Fold ``other`` into this sketch; both must share the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if other._counts.size:
+            self._accumulate(other._offset, other._counts, other._sums)
+
+    def _accumulate(self, low: int, counts: np.ndarray, sums: np.ndarray) -> None:
+        if self._counts.size == 0:
+            self._offset = low
+            self._counts = counts.astype(np.int64)
+            self._sums = sums.astype(np.float64)
+            return
+        start = min(self._offset, low)
+        stop = max(self._offset + self._counts.size, low + counts.size)
+        if start != self._offset or stop != self._offset + self._counts.size:
+            grown_counts = np.zeros(stop - start, dtype=np.int64)
+            grown_sums = np.zeros(stop - start, dtype=np.float64)
+            at = self._offset - start
+            grown_counts[at : at + self._counts.size] = self._counts
+            grown_sums[at : at + self._sums.size] = self._sums
+            self._offset, self._counts, self._sums = start, grown_counts, grown_sums
+        at = low - self._offset
+        self._counts[at : at + counts.size] += counts
+        self._sums[at : at + sums.size] += sums
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q``-quantile (0 ≤ q ≤ 1); 0.0 for an empty sketch."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        cumulative = np.cumsum(self._counts) + self.zero_count
+        index = int(np.searchsorted(cumulative, rank, side="right"))
+        index = min(index, self._counts.size - 1)
+        estimate = 2.0 * self._gamma ** (self._offset + index) / (self._gamma + 1.0)
+        return min(max(estimate, self.min), self.max)
+
+    def gini(self) -> float:
+        """Gini coefficient of the sketched values, treating each bucket as equal values.
+
+        Returns 0.0 for fewer than two values or an all-zero population.
+        """
+        if self.count < 2:
+            return 0.0
+        total = self.total
+        if total == 0:
+            return 0.0
+        occupied = self._counts > 0
+        shares = np.cumsum(self._sums[occupied]) / total
+        previous = np.concatenate(([0.0], shares[:-1]))
+        # Zeros sit at the bottom of the Lorenz curve and contribute no area.
+        fractions = self._counts[occupied] / self.count
+        return float(1.0 - np.sum(fractions * (previous + shares)))
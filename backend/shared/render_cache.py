@@ -0,0 +1,347 @@
+"""
+Rendered-export cache — repeat downloads of the same memo or workpaper are
+served without re-running ReportLab / openpyxl.
+
+Keyed by (requesting user, input payload hash, export type, branding
+fingerprint, generator version, UTC date): any change to the input, to the
+firm's logo/header/footer, or to the rendering code yields a different key, so
+a stale document is never served. The generator version is the platform
+version plus ``RENDER_CACHE_VERSION`` — bump the latter when a template
+changes within a release.
+
+Entries are scoped to the user who rendered them, like ``shared/result_store``
+entries: two firms posting the same payload never share a document (whose
+reference number and "Generated" time would belong to the first), and lookup
+timing reveals nothing about another tenant's exports. Keys are
+``<user_id>/<digest>``, so object-store renders sit under
+``render-cache/<user_id>/``.
+
+Time-varying header fields: memos print a reference number derived from the
+render time and a "Generated <time>" stamp, and memos and workpapers print
+the current date. A cache hit replays the document as first rendered, so a
+repeat download within ``RENDER_CACHE_TTL_SECONDS`` carries the original
+reference number and generation time — it is the same document, downloaded
+again. The UTC date is part of the key, so the printed date is never older
+than the day of the download.
+
+Tiers:
+    - memory — per-process LRU bounded by total rendered bytes
+      (``RENDER_CACHE_MAX_MB``; 0 disables the cache).
+    - object store — optional second tier in the R2/S3 bucket behind
+      ``shared/storage_client.py`` (``RENDER_CACHE_OBJECT_STORE=true``),
+      shared by every worker. Objects carry their creation time and are
+      ignored and deleted once older than ``RENDER_CACHE_TTL_SECONDS``.
+
+ZERO-STORAGE NOTE: like ``shared/export_share_storage.py``, only rendered
+artifacts are cached — never uploaded source files — and only for the TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from typing import Any, Final, Optional, Protocol
+
+from pydantic import BaseModel
+
+from shared.parser_metrics import render_cache_bytes, render_cache_lookups_total
+from shared.pdf_branding import PDFBrandingContext
+
+logger = logging.getLogger(__name__)
+
+# Bump when a memo / workpaper template changes without a platform version bump.
+RENDER_CACHE_VERSION: Final[int] = 1
+
+DEFAULT_MAX_BYTES: Final[int] = 128 * 1024 * 1024
+TTL_SECONDS: Final[int] = 1800
+
+OBJECT_KEY_PREFIX: Final[str] = "render-cache/"
+_HEADER = struct.Struct(">d")  # wall-clock creation time
+
+
+def payload_fingerprint(payload: Any) -> str:
+    """Stable hash of an export input — a pydantic model or JSON-like data."""
+    if isinstance(payload, BaseModel):
+        raw = payload.model_dump_json().encode("utf-8")
+    else:
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def branding_fingerprint(branding: Optional[PDFBrandingContext]) -> str:
+    """Hash of what the branding context actually renders; "default" when it renders nothing."""
+    if branding is None:
+        return "default"
+    logo = branding.effective_logo_bytes()
+    header = branding.effective_header_text()
+    footer = branding.effective_footer_text()
+    if logo is None and header is None and footer is None:
+        return "default"
+    digest = hashlib.sha256()
+    for part in (logo or b"", (header or "").encode("utf-8"), (footer or "").encode("utf-8")):
+        digest.update(struct.pack(">Q", len(part)))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def generator_version() -> str:
+    from version import __version__
+
+    return f"{__version__}+{RENDER_CACHE_VERSION}"
+
+
+def render_cache_key(
+    user_id: int,
+    export_type: str,
+    payload: Any,
+    branding: Optional[PDFBrandingContext] = None,
+    version: Optional[str] = None,
+    day: Optional[date] = None,
+) -> str:
+    parts = (
+        export_type,
+        payload_fingerprint(payload),
+        branding_fingerprint(branding),
+        version or generator_version(),
+        (day or datetime.now(UTC).date()).isoformat(),
+    )
+    return f"{user_id}/{hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()}"
+
+
+@dataclass
+class _CachedRender:
+    data: bytes
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class RenderBackend(Protocol):
+    name: str
+
+    def put(self, key: str, data: bytes) -> None: ...
+
+    def get(self, key: str) -> bytes | None: ...
+
+
+# =============================================================================
+# In-memory tier
+# =============================================================================
+
+
+class MemoryRenderBackend:
+    """Per-process LRU bounded by total rendered bytes, with a TTL."""
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, ttl_seconds: int = TTL_SECONDS):
+        self._store: OrderedDict[str, _CachedRender] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._store:
+                self._discard(key)
+            while self._store and self._total_bytes + len(data) > self._max_bytes:
+                self._discard(next(iter(self._store)))
+            self._store[key] = _CachedRender(data)
+            self._total_bytes += len(data)
+            render_cache_bytes.set(self._total_bytes)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.created_at > self._ttl:
+                self._discard(key)
+                return None
+            self._store.move_to_end(key)
+            return entry.data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self._total_bytes = 0
+            render_cache_bytes.set(0)
+
+    def _discard(self, key: str) -> None:
+        """Must be called under lock."""
+        entry = self._store.pop(key)
+        self._total_bytes -= len(entry.data)
+        render_cache_bytes.set(self._total_bytes)
+
+
+# =============================================================================
+# Object-store tier
+# =============================================================================
+
+
+class ObjectStoreRenderBackend:
+    """Renders kept as objects under ``render-cache/<user_id>/`` in the R2/S3 bucket.
+
+    ``store`` is anything with the ``upload_bytes / download_bytes /
+    delete_key`` functions of ``shared.storage_client`` (the default).
+    """
+
+    name = "object_store"
+
+    def __init__(self, store: Any = None, ttl_seconds: int = TTL_SECONDS):
+        if store is None:
+            from shared import storage_client as store
+        self._store = store
+        self._ttl = ttl_seconds
+
+    def put(self, key: str, data: bytes) -> None:
+        self._store.upload_bytes(
+            f"{OBJECT_KEY_PREFIX}{key}", _HEADER.pack(time.time()) + data, "application/octet-stream"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        raw = self._store.download_bytes(f"{OBJECT_KEY_PREFIX}{key}")
+        if raw is None or len(raw) < _HEADER.size:
+            return None
+        (created_at,) = _HEADER.unpack_from(raw)
+        if time.time() - created_at > self._ttl:
+            self._store.delete_key(f"{OBJECT_KEY_PREFIX}{key}")
+            return None
+        data: bytes = raw[_HEADER.size :]
+        return data
+
+
+# =============================================================================
+# Facade
+# =============================================================================
+
+
+class RenderCache:
+    """Memory tier in front of an optional object-store tier.
+
+    With no explicit tiers they are built from config on first use. Object
+    store errors are logged and treated as misses — a cache problem never
+    fails a download.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryRenderBackend | None = None,
+        object_store: RenderBackend | None = None,
+        *,
+        configured: bool = False,
+    ):
+        self._memory = memory
+        self._object_store = object_store
+        self._configured = configured or memory is not None or object_store is not None
+        self._init_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _tiers(self) -> tuple[MemoryRenderBackend | None, RenderBackend | None]:
+        if not self._configured:
+            with self._init_lock:
+                if not self._configured:
+                    self._memory, self._object_store = _configured_tiers()
+                    self._configured = True
+        return self._memory, self._object_store
+
+    def get(self, key: str) -> bytes | None:
+        memory, object_store = self._tiers()
+        data = memory.get(key) if memory is not None else None
+        tier = "memory"
+        if data is None and object_store is not None:
+            tier = object_store.name
+            try:
+                data = object_store.get(key)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Render cache: %s get failed (%s)", object_store.name, type(exc).__name__)
+                data = None
+            if data is not None and memory is not None:
+                memory.put(key, data)
+
+        if data is None:
+            self.misses += 1
+            render_cache_lookups_total.labels(tier="none", result="miss").inc()
+        else:
+            self.hits += 1
+            render_cache_lookups_total.labels(tier=tier, result="hit").inc()
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        memory, object_store = self._tiers()
+        if memory is not None:
+            memory.put(key, data)
+        if object_store is not None:
+            try:
+                object_store.put(key, data)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Render cache: %s put failed (%s)", object_store.name, type(exc).__name__)
+
+    def get_or_render(
+        self,
+        export_type: str,
+        payload: Any,
+        render: Callable[[], bytes],
+        *,
+        user_id: int,
+        branding: Optional[PDFBrandingContext] = None,
+    ) -> bytes:
+        """Return ``user_id``'s cached rendering of ``payload`` as ``export_type``, rendering it on a miss."""
+        memory, object_store = self._tiers()
+        if memory is None and object_store is None:
+            return render()
+        key = render_cache_key(user_id, export_type, payload, branding)
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def clear(self) -> None:
+        """Drop this process's in-memory renders (the object-store tier expires by TTL)."""
+        if self._memory is not None:
+            self._memory.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process (Prometheus has the cross-worker view)."""
+        memory, object_store = self._tiers()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_bytes": memory.total_bytes if memory is not None else 0,
+            "object_store": object_store is not None,
+        }
+
+
+def _configured_tiers() -> tuple[MemoryRenderBackend | None, RenderBackend | None]:
+    from config import RENDER_CACHE_MAX_MB, RENDER_CACHE_OBJECT_STORE, RENDER_CACHE_TTL_SECONDS
+
+    memory = None
+    if RENDER_CACHE_MAX_MB > 0:
+        memory = MemoryRenderBackend(max_bytes=RENDER_CACHE_MAX_MB * 1024 * 1024, ttl_seconds=RENDER_CACHE_TTL_SECONDS)
+    object_store = None
+    if RENDER_CACHE_OBJECT_STORE:
+        object_store = ObjectStoreRenderBackend(ttl_seconds=RENDER_CACHE_TTL_SECONDS)
+    logger.info("Render cache: memory=%s object_store=%s", memory is not None, object_store is not None)
+    return memory, object_store
+
+
+# Module-level singleton
+render_cache = RenderCache()
@@ -0,0 +1,428 @@
+"""
+Tool result store — short-lived, user-scoped copies of testing-tool results.
+
+A testing upload submitted with ``store_result=true`` keeps its result here
+and answers with a ``result_id``. Memo and CSV export endpoints accept that
+id in place of the full result body, so the client no longer uploads
+megabytes of flagged entries back just to render a PDF, and the export skips
+re-validating them (the result came from our own engine).
+
+Only the tool's output is stored, as the client received it (the route's
+response model applied) — never the uploaded file — and only for
+``RESULT_STORE_TTL_SECONDS``, in memory or Redis, never the database,
+consistent with zero-storage. Results are JSON, compressed with zstd when
+``zstandard`` is installed and gzip otherwise; a result whose compressed size
+exceeds ``RESULT_STORE_MAX_ENTRY_MB`` is not stored (``put`` returns None).
+
+Backends (``RESULT_STORE_BACKEND``) mirror ``shared/preflight_cache.py``:
+    - ``memory`` — per-process LRU bounded by total compressed bytes
+      (``RESULT_STORE_MAX_MB``).
+    - ``redis`` — one key per result with Redis-side TTL, shared by every
+      worker. Redis errors degrade to the memory backend per call.
+    - ``auto`` (default) — Redis when ``REDIS_URL`` is set and reachable,
+      otherwise memory.
+
+A lookup only succeeds for the user who stored the result; anyone else gets
+the same answer as for an unknown or expired id.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Final, Optional, Protocol, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from shared.export_schemas import StoredResultExportInput
+from shared.parser_metrics import (
+    result_store_bytes,
+    result_store_evictions_total,
+    result_store_lookups_total,
+)
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES: Final[int] = 128 * 1024 * 1024
+TTL_SECONDS: Final[int] = 3600
+
+_REDIS_KEY_PREFIX: Final[str] = "result:"
+_HEADER_LEN = struct.Struct(">I")
+
+CODEC_GZIP: Final[str] = "gzip"
+CODEC_ZSTD: Final[str] = "zstd"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def compress_result(result: dict[str, Any]) -> tuple[bytes, str]:
+    """Serialize and compress a JSON-native result; returns (payload, codec)."""
+    raw = json.dumps(result, separators=(",", ":")).encode("utf-8")
+    if ZSTD_AVAILABLE:
+        return zstandard.ZstdCompressor(level=3).compress(raw), CODEC_ZSTD
+    return gzip.compress(raw, compresslevel=6), CODEC_GZIP
+
+
+def decompress_result(payload: bytes, codec: str) -> dict[str, Any]:
+    """Inverse of ``compress_result``."""
+    if codec == CODEC_ZSTD:
+        raw = zstandard.ZstdDecompressor().decompress(payload)
+    elif codec == CODEC_GZIP:
+        raw = gzip.decompress(payload)
+    else:
+        raise ValueError(f"Unknown result codec: {codec}")
+    result: dict[str, Any] = json.loads(raw)
+    return result
+
+
+@dataclass
+class StoredResult:
+    payload: bytes
+    codec: str
+    user_id: int
+    tool: str
+    engagement_id: Optional[int] = None
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        return len(self.payload)
+
+    def result(self) -> dict[str, Any]:
+        return decompress_result(self.payload, self.codec)
+
+
+class ResultBackend(Protocol):
+    name: str
+
+    def put(self, result_id: str, entry: StoredResult) -> None: ...
+
+    def get(self, result_id: str) -> StoredResult | None: ...
+
+    def remove(self, result_id: str) -> None: ...
+
+
+# =============================================================================
+# In-memory backend
+# =============================================================================
+
+
+class MemoryResultBackend:
+    """Per-process LRU bounded by total compressed size.
+
+    Same eviction rules as ``MemoryPreflightBackend``: oldest-first until the
+    new entry fits, expired entries dropped lazily on access and from the
+    front of the order on every insert.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, ttl_seconds: int = TTL_SECONDS):
+        self._store: OrderedDict[str, StoredResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def put(self, result_id: str, entry: StoredResult) -> None:
+        if entry.size > self._max_bytes:
+            logger.warning(
+                "result_store.entry_too_large size=%d max_bytes=%d — not stored", entry.size, self._max_bytes
+            )
+            return
+        with self._lock:
+            self._evict_expired_head()
+            while self._store and self._total_bytes + entry.size > self._max_bytes:
+                self._pop_oldest("capacity")
+            self._store[result_id] = entry
+            self._total_bytes += entry.size
+            result_store_bytes.set(self._total_bytes)
+
+    def get(self, result_id: str) -> StoredResult | None:
+        with self._lock:
+            entry = self._store.get(result_id)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.created_at > self._ttl:
+                self._discard(result_id, "expired")
+                return None
+            self._store.move_to_end(result_id)
+            return entry
+
+    def remove(self, result_id: str) -> None:
+        with self._lock:
+            if result_id in self._store:
+                self._discard(result_id, None)
+
+    def _pop_oldest(self, reason: str) -> None:
+        """Must be called under lock."""
+        self._discard(next(iter(self._store)), reason)
+
+    def _discard(self, result_id: str, reason: str | None) -> None:
+        """Must be called under lock."""
+        entry = self._store.pop(result_id)
+        self._total_bytes -= entry.size
+        result_store_bytes.set(self._total_bytes)
+        if reason is not None:
+            result_store_evictions_total.labels(reason=reason).inc()
+
+    def _evict_expired_head(self) -> None:
+        """Drop expired entries from the LRU end. Must be called under lock."""
+        now = time.monotonic()
+        while self._store:
+            oldest = next(iter(self._store.values()))
+            if now - oldest.created_at <= self._ttl:
+                break
+            self._pop_oldest("expired")
+
+
+# =============================================================================
+# Redis backend
+# =============================================================================
+
+
+def _encode_entry(entry: StoredResult) -> bytes:
+    header = json.dumps(
+        {"codec": entry.codec, "user_id": entry.user_id, "tool": entry.tool, "engagement_id": entry.engagement_id}
+    ).encode("utf-8")
+    return _HEADER_LEN.pack(len(header)) + header + entry.payload
+
+
+def _decode_entry(raw: bytes) -> StoredResult:
+    (header_len,) = _HEADER_LEN.unpack_from(raw)
+    start = _HEADER_LEN.size
+    header = json.loads(raw[start : start + header_len])
+    return StoredResult(
+        payload=raw[start + header_len :],
+        codec=header["codec"],
+        user_id=header["user_id"],
+        tool=header["tool"],
+        engagement_id=header.get("engagement_id"),
+    )
+
+
+class RedisResultBackend:
+    """One Redis string per result (header + compressed JSON) with ``EX`` TTL."""
+
+    name = "redis"
+
+    def __init__(self, client: Any, ttl_seconds: int = TTL_SECONDS):
+        self._client = client
+        self._ttl = ttl_seconds
+
+    def put(self, result_id: str, entry: StoredResult) -> None:
+        self._client.set(f"{_REDIS_KEY_PREFIX}{result_id}", _encode_entry(entry), ex=self._ttl)
+
+    def get(self, result_id: str) -> StoredResult | None:
+        raw = self._client.get(f"{_REDIS_KEY_PREFIX}{result_id}")
+        return None if raw is None else _decode_entry(raw)
+
+    def remove(self, result_id: str) -> None:
+        self._client.delete(f"{_REDIS_KEY_PREFIX}{result_id}")
+
+
+def _connect_redis() -> Any | None:
+    """Return a binary-safe Redis client for ``REDIS_URL``, or None."""
+    from config import REDIS_URL
+
+    if not REDIS_URL:
+        return None
+    try:
+        import redis
+
+        client = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=1.0)
+        client.ping()
+        return client
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Result store: Redis unreachable (%s) — using in-memory backend", exc)
+        return None
+
+
+# =============================================================================
+# Facade
+# =============================================================================
+
+
+class ResultStore:
+    """Id-issuing front end over a ``ResultBackend``.
+
+    With no explicit backend the one named by ``RESULT_STORE_BACKEND`` is
+    chosen on first use. A Redis backend that raises falls back to the
+    in-memory backend for that call.
+    """
+
+    def __init__(self, backend: ResultBackend | None = None, max_entry_bytes: int | None = None):
+        self._backend = backend
+        self._fallback: MemoryResultBackend | None = None
+        self._max_entry_bytes = max_entry_bytes
+        self._init_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+
+    @property
+    def backend(self) -> ResultBackend:
+        if self._backend is None:
+            with self._init_lock:
+                if self._backend is None:
+                    self._backend = _select_backend()
+                    logger.info("Result store: %s backend", self._backend.name)
+        return self._backend
+
+    @property
+    def max_entry_bytes(self) -> int:
+        if self._max_entry_bytes is None:
+            from config import RESULT_STORE_MAX_ENTRY_MB
+
+            self._max_entry_bytes = RESULT_STORE_MAX_ENTRY_MB * 1024 * 1024
+        return self._max_entry_bytes
+
+    def _memory_fallback(self) -> MemoryResultBackend:
+        backend = self.backend
+        if isinstance(backend, MemoryResultBackend):
+            return backend
+        with self._init_lock:
+            if self._fallback is None:
+                self._fallback = _new_memory_backend()
+            return self._fallback
+
+    def put(
+        self,
+        result: dict[str, Any],
+        *,
+        user_id: int,
+        tool: str,
+        engagement_id: Optional[int] = None,
+    ) -> str | None:
+        """Compress and store a tool result; returns its id, or None if over the size cap."""
+        payload, codec = compress_result(result)
+        if len(payload) > self.max_entry_bytes:
+            self.rejected += 1
+            logger.warning(
+                "result_store.entry_too_large tool=%s size=%d max_entry_bytes=%d — not stored",
+                tool,
+                len(payload),
+                self.max_entry_bytes,
+            )
+            return None
+        result_id = uuid.uuid4().hex
+        entry = StoredResult(payload=payload, codec=codec, user_id=user_id, tool=tool, engagement_id=engagement_id)
+        backend = self.backend
+        try:
+            backend.put(result_id, entry)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Result store: %s put failed (%s)", backend.name, exc)
+            self._memory_fallback().put(result_id, entry)
+        return result_id
+
+    def get(self, result_id: str, *, user_id: int) -> StoredResult | None:
+        """Return the stored entry if it exists, is live, and belongs to ``user_id``."""
+        backend = self.backend
+        try:
+            entry = backend.get(result_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Result store: %s get failed (%s)", backend.name, exc)
+            entry = None
+        if entry is None and self._fallback is not None:
+            entry = self._fallback.get(result_id)
+        if entry is not None and entry.user_id != user_id:
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            result_store_lookups_total.labels(backend=backend.name, result="miss").inc()
+        else:
+            self.hits += 1
+            result_store_lookups_total.labels(backend=backend.name, result="hit").inc()
+        return entry
+
+    def remove(self, result_id: str) -> None:
+        backend = self.backend
+        try:
+            backend.remove(result_id)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Result store: %s remove failed (%s)", backend.name, exc)
+        if self._fallback is not None:
+            self._fallback.remove(result_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process (Prometheus has the cross-worker view)."""
+        return {"backend": self.backend.name, "hits": self.hits, "misses": self.misses, "rejected": self.rejected}
+
+
+def _new_memory_backend() -> MemoryResultBackend:
+    from config import RESULT_STORE_MAX_MB, RESULT_STORE_TTL_SECONDS
+
+    return MemoryResultBackend(max_bytes=RESULT_STORE_MAX_MB * 1024 * 1024, ttl_seconds=RESULT_STORE_TTL_SECONDS)
+
+
+def _select_backend() -> ResultBackend:
+    from config import RESULT_STORE_BACKEND, RESULT_STORE_TTL_SECONDS
+
+    if RESULT_STORE_BACKEND in ("auto", "redis"):
+        client = _connect_redis()
+        if client is not None:
+            return RedisResultBackend(client, ttl_seconds=RESULT_STORE_TTL_SECONDS)
+        if RESULT_STORE_BACKEND == "redis":
+            logger.warning("Result store: RESULT_STORE_BACKEND=redis but Redis is unavailable")
+    return _new_memory_backend()
+
+
+# Module-level singleton
+result_store = ResultStore()
+
+
+# =============================================================================
+# Export-side resolution
+# =============================================================================
+
+
+def load_stored_result(result_id: str, *, user_id: int, tool: str) -> dict[str, Any]:
+    """Fetch a stored result for an export, or raise the HTTP error to return.
+
+    404 for an unknown, expired or foreign id; 400 when the id belongs to a
+    different tool than the export.
+    """
+    entry = result_store.get(result_id, user_id=user_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Stored result not found or expired. Re-run the analysis.")
+    if entry.tool != tool:
+        raise HTTPException(status_code=400, detail="Stored result was produced by a different tool.")
+    return entry.result()
+
+
+def resolve_export_input(payload: BaseModel, schema: type[ModelT], *, tool: str, user_id: int) -> ModelT:
+    """Turn a ``StoredResultExportInput`` into ``schema``; pass a full payload through.
+
+    The stored result is merged with the workpaper fields the caller set and
+    built with ``model_construct`` — it is our own engine output, so it is
+    not re-validated. Unset workpaper fields take ``schema``'s defaults
+    (e.g. its per-tool ``filename``).
+    """
+    if not isinstance(payload, StoredResultExportInput):
+        return payload  # type: ignore[return-value]
+    result = load_stored_result(payload.result_id, user_id=user_id, tool=tool)
+    metadata = payload.model_dump(exclude={"result_id"}, exclude_unset=True)
+    return schema.model_construct(**{**result, **metadata})
@@ -0,0 +1,202 @@
+"""
+Trial balance analysis bundle — one upload, one parse, every TB analysis.
+
+Preflight, population profile, expense-category analytics and accrual
+completeness each have their own endpoint that parses the upload again, and
+the main diagnostic parses it once more before cutoff risk, going concern and
+the risk heatmap re-derive balances and classification from its output. The
+bundle reads the upload once — with the string-typed reader
+(``process_tb_chunked``) when preflight is requested, feeding those chunks to
+both the preflight checks and the streaming diagnostic, otherwise with the
+diagnostic's column-plan read — and derives every other analysis from the
+diagnostic's account-balance table and classification. Preflight therefore
+checks string-typed rows where the standalone endpoint checks type-inferred
+ones; ``tests/test_tb_bundle.py`` holds the two reports equal on CSV and
+Excel uploads.
+
+The derived analyses are per-account arithmetic over that table, so they run
+one after another inside the same engine-pool job rather than on threads of
+their own; the single parse and classification are where the time goes.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from shared.tb_post_processor import apply_lead_sheet_grouping
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from shared.classification_cache import ClassificationCache
+
+TB_BUNDLE_ANALYSES: tuple[str, ...] = (
+    "diagnostic",
+    "preflight",
+    "population_profile",
+    "expense_category_analytics",
+    "accrual_completeness",
+    "cutoff_risk",
+    "going_concern",
+    "risk_heatmap",
+)
+
+# Everything except preflight is derived from the diagnostic's balance table.
+_BALANCE_ANALYSES = frozenset(TB_BUNDLE_ANALYSES) - {"preflight"}
+
+
+@dataclass(frozen=True)
+class TBBundleOptions:
+    """Parameters shared by the bundled analyses (mirrors the standalone endpoints' form fields)."""
+
+    materiality_threshold: float = 0.0
+    account_type_overrides: Optional[dict[str, str]] = None
+    column_mapping: Optional[dict[str, str]] = None
+    prior_cogs: Optional[float] = None
+    prior_opex: Optional[float] = None
+    prior_total_expenses: Optional[float] = None
+    prior_revenue: Optional[float] = None
+    prior_operating_expenses: Optional[float] = None
+    accrual_threshold_pct: float = 50.0
+    total_revenue: Optional[float] = None
+
+
+def _run_preflight(frames: list[tuple["pd.DataFrame", int]], file_bytes: bytes, filename: str) -> dict[str, Any]:
+    from preflight_engine import run_preflight
+    from shared.intake_utils import count_raw_data_rows
+
+    column_names = [str(col) for col in frames[0][0].columns] if frames else []
+    rows = [row for frame, _ in frames for row in frame.to_dict("records")]
+    report = run_preflight(column_names, rows, filename, rows_submitted=count_raw_data_rows(file_bytes, filename))
+    return report.to_dict()
+
+
+def _cutoff_flags(cutoff_risk: dict[str, Any]) -> list[dict[str, Any]]:
+    """CutoffFlag dicts in the shape the heatmap adapter reads."""
+    return [
+        {
+            "account_name": flag["account_name"],
+            "issue": flag["description"],
+            "severity": flag["severity"],
+            "amount": flag["balance"],
+        }
+        for flag in cutoff_risk.get("flagged_accounts", [])
+    ]
+
+
+def _derive_analyses(tb_result: dict[str, Any], requested: set[str], options: TBBundleOptions) -> dict[str, Any]:
+    """Build the requested analyses from one diagnostic result without re-reading the upload."""
+    derived: dict[str, Any] = {}
+    balances = tb_result["account_balances"]
+    classified = tb_result["classified_accounts"]
+
+    # Population profile, cutoff risk and going concern take no caller
+    # parameters, so the diagnostic's own copies are the answer.
+    for name in ("population_profile", "cutoff_risk", "going_concern"):
+        if name in requested:
+            derived[name] = tb_result.get(name)
+
+    if "expense_category_analytics" in requested:
+        from expense_category_engine import compute_expense_categories
+
+        derived["expense_category_analytics"] = compute_expense_categories(
+            balances,
+            classified,
+            float(tb_result["category_totals"]["total_revenue"]),
+            options.materiality_threshold,
+            prior_cogs=options.prior_cogs,
+            prior_opex=options.prior_opex,
+            prior_total_expenses=options.prior_total_expenses,
+            prior_revenue=options.prior_revenue,
+        ).to_dict()
+
+    accrual: Optional[dict[str, Any]] = None
+    if requested & {"accrual_completeness", "risk_heatmap"}:
+        from accrual_completeness_engine import compute_accrual_completeness
+
+        accrual = compute_accrual_completeness(
+            balances,
+            classified,
+            prior_operating_expenses=options.prior_operating_expenses,
+            threshold_pct=options.accrual_threshold_pct,
+            total_revenue=options.total_revenue,
+        ).to_dict()
+        if "accrual_completeness" in requested:
+            derived["accrual_completeness"] = accrual
+
+    if "risk_heatmap" in requested and accrual is not None:
+        from account_risk_heatmap_engine import (
+            build_signals_from_accrual_findings,
+            build_signals_from_audit_anomalies,
+            build_signals_from_classification_issues,
+            build_signals_from_cutoff_flags,
+            compute_account_heatmap,
+        )
+
+        signals = build_signals_from_audit_anomalies(tb_result.get("abnormal_balances", []))
+        signals.extend(
+            build_signals_from_classification_issues(tb_result.get("classification_quality", {}).get("issues", []))
+        )
+        signals.extend(build_signals_from_cutoff_flags(_cutoff_flags(tb_result.get("cutoff_risk") or {})))
+        signals.extend(build_signals_from_accrual_findings(accrual.get("findings", [])))
+        derived["risk_heatmap"] = compute_account_heatmap(signals).to_dict()
+
+    return derived
+
+
+def analyze_trial_balance_bundle(
+    file_bytes: bytes,
+    filename: str,
+    analyses: list[str],
+    options: TBBundleOptions,
+    classification_cache: Optional["ClassificationCache"],
+) -> tuple[dict[str, Any], Optional["ClassificationCache"]]:
+    """Engine-pool job: run the requested TB analyses off a single parse.
+
+    ``analyses`` names entries of ``TB_BUNDLE_ANALYSES``; each requested one
+    becomes a key of the returned bundle. When the diagnostic cannot complete
+    (no rows, no debit/credit columns) the derived analyses are omitted and
+    the bundle carries the diagnostic's ``failure_reason`` and
+    ``error_message`` instead. The classification cache is handed back as in
+    ``analyze_trial_balance_upload``.
+    """
+    from audit_engine import DEFAULT_CHUNK_SIZE, audit_trial_balance_streaming
+    from security_utils import process_tb_chunked
+    from shared.classification_cache import use_classification_cache
+
+    requested = set(analyses)
+    bundle: dict[str, Any] = {
+        "filename": filename,
+        "analyses": [name for name in TB_BUNDLE_ANALYSES if name in requested],
+    }
+    # Preflight inspects every column as text, so only a bundle that
+    # includes it reads the whole upload up front; otherwise the diagnostic
+    # reads just the columns it maps.
+    frames = None
+    if "preflight" in requested:
+        frames = list(process_tb_chunked(file_bytes, filename, DEFAULT_CHUNK_SIZE))
+        # Preflight first: the diagnostic normalizes chunk headers in place.
+        bundle["preflight"] = _run_preflight(frames, file_bytes, filename)
+
+    if requested & _BALANCE_ANALYSES:
+        with use_classification_cache(classification_cache):
+            tb_result = audit_trial_balance_streaming(
+                file_bytes=file_bytes,
+                filename=filename,
+                materiality_threshold=options.materiality_threshold,
+                chunk_size=DEFAULT_CHUNK_SIZE,
+                account_type_overrides=options.account_type_overrides,
+                column_mapping=options.column_mapping,
+                chunks=frames,
+            )
+            apply_lead_sheet_grouping(tb_result, options.materiality_threshold)
+        del frames
+
+        if "diagnostic" in requested:
+            bundle["diagnostic"] = tb_result
+        if tb_result.get("analysis_failed"):
+            bundle["failure_reason"] = tb_result.get("failure_reason")
+            bundle["error_message"] = tb_result.get("error_message")
+        else:
+            bundle.update(_derive_analyses(tb_result, requested, options))
+
+    return bundle, classification_cache
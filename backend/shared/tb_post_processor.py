@@ -5,13 +5,20 @@ Extracts post-analysis transforms from routes/audit.py:
 - Lead sheet grouping from abnormal balances
 - Section density computation
 - Currency conversion application
+
+Also holds the engine-pool job for a trial balance upload (analysis plus
+lead sheet grouping), which must be importable at module level.
 """
 
 import logging
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy.orm import Session
 
+if TYPE_CHECKING:
+    from shared.classification_cache import ClassificationCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,6 +70,54 @@ def apply_lead_sheet_grouping(result: dict[str, Any], materiality_threshold: flo
         result["population_profile"]["section_density"] = [s.to_dict() for s in density]
 
 
+def analyze_trial_balance_upload(
+    file_bytes: bytes,
+    filename: str,
+    selected_sheets: Optional[list[str]],
+    materiality_threshold: float,
+    account_type_overrides: Optional[dict[str, str]],
+    column_mapping: Optional[dict[str, str]],
+    classification_cache: Optional["ClassificationCache"],
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> tuple[dict[str, Any], Optional["ClassificationCache"]]:
+    """Engine-pool job: analyze one TB upload and group it by lead sheet.
+
+    The classification cache is passed in and handed back because context
+    variables do not reach a worker process — the route saves the returned
+    copy, which holds whatever the run learned. ``progress`` receives the
+    streaming auditor's row counts (a ``JobProgress`` when run as a job).
+    """
+    from audit_engine import DEFAULT_CHUNK_SIZE, audit_trial_balance_multi_sheet, audit_trial_balance_streaming
+    from shared.analysis_jobs import report_stage
+    from shared.classification_cache import use_classification_cache
+
+    report_stage(progress, "analyzing", "Reading trial balance")
+    with use_classification_cache(classification_cache):
+        if selected_sheets:
+            result = audit_trial_balance_multi_sheet(
+                file_bytes=file_bytes,
+                filename=filename,
+                selected_sheets=selected_sheets,
+                materiality_threshold=materiality_threshold,
+                chunk_size=DEFAULT_CHUNK_SIZE,
+                account_type_overrides=account_type_overrides,
+                column_mapping=column_mapping,
+                progress_callback=progress,
+            )
+        else:
+            result = audit_trial_balance_streaming(
+                file_bytes=file_bytes,
+                filename=filename,
+                materiality_threshold=materiality_threshold,
+                chunk_size=DEFAULT_CHUNK_SIZE,
+                account_type_overrides=account_type_overrides,
+                column_mapping=column_mapping,
+                progress_callback=progress,
+            )
+        apply_lead_sheet_grouping(result, materiality_threshold)
+    return result, classification_cache
+
+
 def apply_currency_conversion(
     result: dict[str, Any],
     user_id: int,
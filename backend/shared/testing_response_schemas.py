@@ -180,6 +180,8 @@ class JETestingResponse(BaseModel):
     column_detection: Optional[GLColumnDetectionResponse] = None
     benford_result: Optional[BenfordAnalysisResponse] = None
     sampling_result: Optional[dict[str, Any]] = None
+    # Set when the upload was submitted with store_result=true (shared/result_store.py).
+    result_id: Optional[str] = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -263,6 +265,8 @@ class APTestingResponse(BaseModel):
     test_results: list[APTestResultResponse]
     data_quality: Optional[DataQualityResponse] = None
     column_detection: Optional[APColumnDetectionResponse] = None
+    # Set when the upload was submitted with store_result=true (shared/result_store.py).
+    result_id: Optional[str] = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -794,6 +798,8 @@ class PayrollTestingResponse(BaseModel):
     data_quality: Optional[DataQualityResponse] = None
     column_detection: Optional[PayrollColumnDetectionResponse] = None
     filename: str
+    # Set when the upload was submitted with store_result=true (shared/result_store.py).
+    result_id: Optional[str] = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -898,6 +904,8 @@ class RevenueTestingResponse(BaseModel):
     data_quality: Optional[DataQualityResponse] = None
     column_detection: Optional[RevenueColumnDetectionResponse] = None
     contract_evidence: Optional[ContractEvidenceLevelResponse] = None
+    # Set when the upload was submitted with store_result=true (shared/result_store.py).
+    result_id: Optional[str] = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -981,6 +989,8 @@ class FATestingResponse(BaseModel):
     test_results: list[FATestResultResponse]
     data_quality: Optional[DataQualityResponse] = None
     column_detection: Optional[FAColumnDetectionResponse] = None
+    # Set when the upload was submitted with store_result=true (shared/result_store.py).
+    result_id: Optional[str] = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -1058,6 +1068,8 @@ class InvTestingResponse(BaseModel):
     test_results: list[InvTestResultResponse]
     data_quality: Optional[DataQualityResponse] = None
     column_detection: Optional[InvColumnDetectionResponse] = None
+    # Set when the upload was submitted with store_result=true (shared/result_store.py).
+    result_id: Optional[str] = None
 
 
 # ═══════════════════════════════════════════════════════════════
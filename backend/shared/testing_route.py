@@ -2,32 +2,42 @@
 Shared single-file testing route factory.
 
 Encapsulates the boilerplate shared by 6 single-file testing endpoints:
-  validate_file_size → parse_uploaded_file → run_engine → cleanup →
+  validate_file_size → parse_uploaded_file → engine → cleanup →
   score extraction → maybe_record_tool_run → to_dict
 
+Parsing, the engine and ``to_dict`` run together on the engine process pool
+(``shared.engine_pool``), so ``engine`` must be picklable: a module-level
+function or a ``functools.partial`` of one with plain-data arguments.
+
 Used by: AP, Payroll, JE (main), Revenue, Fixed Asset, Inventory routes.
 NOT used by: Three-Way Match (3-file), AR Aging (dual-file + config).
 """
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
 from fastapi import BackgroundTasks, HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from models import User, UserTier
 from security_utils import log_secure_operation
+from shared.analysis_jobs import report_stage, start_analysis_job
+from shared.engine_pool import run_engine_job
 from shared.entitlement_checks import check_upload_limit, get_effective_entitlements
 from shared.error_messages import sanitize_error
 from shared.helpers import parse_json_mapping
+from shared.result_store import result_store
 from shared.tool_run_recorder import maybe_record_tool_run
 from shared.upload_pipeline import (
     memory_cleanup,
     parse_uploaded_file,
+    parse_uploaded_file_chunked,
     validate_file_size,
 )
 
@@ -64,6 +74,56 @@ def enforce_tool_access(current_user: User, tool_name: str, db: object = None) -
             )
 
 
+def _counted_chunks(row_chunks: Iterable[list[dict]], progress: Callable[[int, str], None]) -> Iterator[list[dict]]:
+    """Pass chunks through, reporting the running row count as each is handed on."""
+    rows = 0
+    for chunk in row_chunks:
+        rows += len(chunk)
+        progress(rows, f"Testing rows: {rows:,}")
+        yield chunk
+
+
+def _parse_and_test(
+    file_bytes: bytes,
+    filename: str,
+    engine: Callable[..., Any],
+    column_mapping: Optional[dict],
+    chunked: bool,
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> tuple[dict, Optional[float]]:
+    """Engine-pool job: parse the upload, run the engine, return (result dict, score).
+
+    ``progress`` is set when the run is an async job (``shared.analysis_jobs``).
+    """
+    report_stage(progress, "parsing", "Reading upload")
+    if chunked:
+        column_names, row_chunks = parse_uploaded_file_chunked(file_bytes, filename)
+        report_stage(progress, "analyzing", "Testing rows")
+        if progress is not None:
+            row_chunks = _counted_chunks(row_chunks, progress)
+        result = engine(row_chunks=row_chunks, column_names=column_names, column_mapping=column_mapping)
+    else:
+        column_names, rows = parse_uploaded_file(file_bytes, filename)
+        report_stage(progress, "analyzing", f"Testing {len(rows):,} rows", len(rows))
+        result = engine(rows=rows, column_names=column_names, column_mapping=column_mapping)
+    score = result.composite_score.score if getattr(result, "composite_score", None) else None
+    return result.to_dict(), score
+
+
+def _store_result(
+    result_dict: dict,
+    response_model: Optional[type[BaseModel]],
+    *,
+    user_id: int,
+    tool: str,
+    engagement_id: Optional[int],
+) -> Optional[str]:
+    """Keep the result as the client receives it (``response_model`` applied) in the result store."""
+    if response_model is not None:
+        result_dict = response_model.model_validate(result_dict).model_dump(mode="json", by_alias=True)
+    return result_store.put(result_dict, user_id=user_id, tool=tool, engagement_id=engagement_id)
+
+
 async def run_single_file_testing(
     *,
     file: UploadFile,
@@ -76,9 +136,13 @@ async def run_single_file_testing(
     mapping_key: str,
     log_label: str,
     error_key: str,
-    run_engine: Callable,
+    engine: Callable[..., Any],
+    chunked: bool = False,
     extract_accounts: Optional[Callable[[dict], list[str]]] = None,
-) -> dict:
+    async_job: bool = False,
+    response_model: Optional[type[BaseModel]] = None,
+    store_result: bool = False,
+) -> dict | JSONResponse:
     """Run a single-file testing endpoint with standard boilerplate.
 
     Args:
@@ -92,8 +156,19 @@ async def run_single_file_testing(
         mapping_key: Key for parse_json_mapping context.
         log_label: Label for secure operation log (e.g. "AP", "Payroll").
         error_key: Key for error sanitization context.
-        run_engine: Callback(rows, column_names, column_mapping_dict, filename) -> result.
+        engine: Picklable engine entry point, called as
+            engine(rows=..., column_names=..., column_mapping=...) -> result.
+        chunked: Parse CSV/TSV/TXT uploads in chunks and call
+            engine(row_chunks=..., column_names=..., column_mapping=...) instead.
         extract_accounts: Optional callback to extract flagged account names from result dict.
+        async_job: Queue the run as a background job (``shared.analysis_jobs``)
+            and answer 202 with its id instead of waiting for the result.
+        response_model: The route's response model, applied to the job's
+            stored result so it matches the synchronous body.
+        store_result: Keep the result in ``shared.result_store`` and add its
+            ``result_id`` to the response, so memo/CSV exports can refer to
+            it instead of re-sending it. ``result_id`` is None when the
+            result is over the store's size cap.
     """
     # Sprint 367: Entitlement check — verify tool access before processing
     enforce_tool_access(current_user, tool_name, db)
@@ -109,16 +184,47 @@ async def run_single_file_testing(
             file_bytes = await validate_file_size(file)
             filename = file.filename or ""
 
-            def _process() -> Any:
-                column_names, rows = parse_uploaded_file(file_bytes, filename)
-                result = run_engine(rows, column_names, column_mapping_dict, filename)
-                return result
+            if async_job:
+                user_id = current_user.id
+
+                def _finalize(raw: tuple[dict, Optional[float]], job_db: Session) -> dict:
+                    result_dict, score = raw
+                    flagged = extract_accounts(result_dict) if extract_accounts else None
+                    maybe_record_tool_run(
+                        job_db,
+                        engagement_id,
+                        user_id,
+                        tool_name,
+                        True,
+                        score,
+                        flagged,
+                        filename,
+                        result_dict.get("record_count"),
+                    )
+                    response = dict(result_dict)
+                    if store_result:
+                        response["result_id"] = _store_result(
+                            result_dict, response_model, user_id=user_id, tool=tool_name, engagement_id=engagement_id
+                        )
+                    return response
 
-            result = await asyncio.to_thread(_process)
+                accepted = start_analysis_job(
+                    user_id=user_id,
+                    tool=tool_name,
+                    filename=filename,
+                    fn=_parse_and_test,
+                    file_bytes=file_bytes,
+                    args=(filename, engine, column_mapping_dict, chunked),
+                    finalize=_finalize,
+                    on_failure=lambda job_db: maybe_record_tool_run(job_db, engagement_id, user_id, tool_name, False),
+                    response_model=response_model,
+                    error_operation="analysis",
+                    error_key=error_key,
+                )
+                return JSONResponse(status_code=202, content=accepted)
 
-            result_dict = result.to_dict()
-            score = (
-                result.composite_score.score if hasattr(result, "composite_score") and result.composite_score else None
+            result_dict, score = await run_engine_job(
+                tool_name, _parse_and_test, file_bytes, filename, engine, column_mapping_dict, chunked
             )
             flagged = extract_accounts(result_dict) if extract_accounts else None
             background_tasks.add_task(
@@ -134,7 +240,17 @@ async def run_single_file_testing(
                 result_dict.get("record_count"),
             )
 
-            return dict(result_dict)
+            response = dict(result_dict)
+            if store_result:
+                response["result_id"] = await asyncio.to_thread(
+                    _store_result,
+                    result_dict,
+                    response_model,
+                    user_id=current_user.id,
+                    tool=tool_name,
+                    engagement_id=engagement_id,
+                )
+            return response
 
         except (ValueError, KeyError, TypeError) as e:
             logger.exception("%s analysis failed", tool_name)
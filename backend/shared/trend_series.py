@@ -0,0 +1,524 @@
+"""
+Incrementally maintained client trend series.
+
+The trend and rolling-analysis routes used to re-query up to 36
+``DiagnosticSummary`` rows, rebuild every ``PeriodSnapshot`` and re-run
+``TrendAnalyzer`` / ``RollingWindowAnalyzer`` each time a client page was
+opened. The series those analyses read is now a derived aggregate
+(``client_trend_series``):
+
+  - ``record_diagnostic_summary`` runs when a summary is written and inserts
+    the one new period into the stored series (ordered exactly like the
+    route query). Analyses are recomputed only when the new period falls
+    inside their window — the routes analyse the *oldest* N periods, so a
+    period appended past the window leaves the stored results untouched.
+  - Reads check the live (max id, count) of active summaries against the
+    row; a stale or missing row (summary written outside the hook, retention
+    archival) is rebuilt from the summaries in one query.
+  - Rendered analyses are memoised per process, keyed by
+    (client, user, period type, latest summary id, summary count, ...), so
+    a repeat page view costs one aggregate query.
+
+``portfolio_trends`` serves every client of a user from the stored rows in
+one joined query, backfilling any stale rows with one bulk summary query.
+
+Everything stored is aggregate totals and ratios already persisted on
+``diagnostic_summaries`` (zero-storage).
+"""
+
+from __future__ import annotations
+
+import bisect
+import copy
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Any, Final, Optional
+
+from pydantic_core import to_jsonable_python
+from sqlalchemy import and_, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query, Session
+
+from models import Client, DiagnosticSummary, PeriodType
+from ratio_engine import CategoryTotals, PeriodSnapshot, RollingWindowAnalyzer, TrendAnalyzer
+from trend_series_model import ClientTrendSeries
+
+logger = logging.getLogger(__name__)
+
+ALL_PERIOD_TYPES: Final[str] = "all"
+# Periods analysed by the trends endpoint when no ``limit`` is given.
+TREND_DEFAULT_LIMIT: Final[int] = 12
+# Largest window any endpoint analyses (trends ``limit`` max, rolling analysis).
+MAX_SERIES_PERIODS: Final[int] = 36
+
+_TOTAL_FIELDS: Final[tuple[str, ...]] = (
+    "total_assets",
+    "current_assets",
+    "inventory",
+    "total_liabilities",
+    "current_liabilities",
+    "total_equity",
+    "total_revenue",
+    "cost_of_goods_sold",
+    "total_expenses",
+    "operating_expenses",
+)
+_RATIO_FIELDS: Final[tuple[str, ...]] = (
+    "current_ratio",
+    "quick_ratio",
+    "debt_to_equity",
+    "gross_margin",
+    "net_profit_margin",
+    "operating_margin",
+    "return_on_assets",
+    "return_on_equity",
+)
+
+
+# =============================================================================
+# Snapshots
+# =============================================================================
+
+
+def summary_to_snapshot(summary: Any) -> PeriodSnapshot:
+    """Convert a ``DiagnosticSummary`` to the ``PeriodSnapshot`` the analyzers read."""
+    if summary.period_date:
+        snapshot_date = summary.period_date
+    else:
+        snapshot_date = summary.timestamp.date() if summary.timestamp else date.today()
+
+    # Same Decimal(str(...)) coercion CategoryTotals.__post_init__ applies.
+    totals: dict[str, Decimal] = {name: Decimal(str(getattr(summary, name) or 0.0)) for name in _TOTAL_FIELDS}
+    ratios: dict[str, float] = {
+        name: getattr(summary, name) for name in _RATIO_FIELDS if getattr(summary, name) is not None
+    }
+
+    return PeriodSnapshot(
+        period_date=snapshot_date,
+        period_type=summary.period_type.value if summary.period_type else "monthly",
+        category_totals=CategoryTotals(**totals),
+        ratios=ratios,
+    )
+
+
+def _entry_from_summary(summary: Any) -> dict[str, Any]:
+    """Serializable series entry: ordering key plus the snapshot inputs."""
+    snapshot = summary_to_snapshot(summary)
+    return {
+        "id": summary.id,
+        "period_date": summary.period_date.isoformat() if summary.period_date else None,
+        "timestamp": summary.timestamp.isoformat(timespec="microseconds") if summary.timestamp else "",
+        "snapshot_date": snapshot.period_date.isoformat(),
+        "period_type": snapshot.period_type,
+        # str(Decimal) round-trips exactly through CategoryTotals
+        "totals": {name: str(getattr(snapshot.category_totals, name)) for name in _TOTAL_FIELDS},
+        "ratios": snapshot.ratios,
+    }
+
+
+def _snapshot_from_entry(entry: dict[str, Any]) -> PeriodSnapshot:
+    return PeriodSnapshot(
+        period_date=date.fromisoformat(entry["snapshot_date"]),
+        period_type=entry["period_type"],
+        category_totals=CategoryTotals(**entry["totals"]),
+        ratios=dict(entry["ratios"]),
+    )
+
+
+def _sort_key(entry: dict[str, Any]) -> tuple[bool, str, str, int]:
+    """Same order as ``query_client_summaries``: period date (NULLs last), timestamp, id."""
+    return (entry["period_date"] is None, entry["period_date"] or "", entry["timestamp"], entry["id"])
+
+
+def _trend_analysis(entries: list[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    if len(entries) < 2:
+        return None
+    analysis = TrendAnalyzer([_snapshot_from_entry(e) for e in entries]).get_full_analysis()
+    rendered: dict[str, Any] = to_jsonable_python(analysis)
+    return rendered
+
+
+def _rolling_analysis(entries: list[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    if len(entries) < 2:
+        return None
+    analysis = RollingWindowAnalyzer([_snapshot_from_entry(e) for e in entries]).get_full_analysis()
+    rendered: dict[str, Any] = to_jsonable_python(analysis)
+    return rendered
+
+
+# =============================================================================
+# Series
+# =============================================================================
+
+
+@dataclass
+class TrendSeries:
+    """In-memory view of one ``client_trend_series`` row."""
+
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    latest_summary_id: Optional[int] = None
+    summary_count: int = 0
+    trend_analysis: Optional[dict[str, Any]] = None
+    rolling_analysis: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_row(cls, row: ClientTrendSeries) -> TrendSeries:
+        return cls(
+            entries=json.loads(row.snapshots_json or "[]"),
+            latest_summary_id=row.latest_summary_id,
+            summary_count=row.summary_count,
+            trend_analysis=json.loads(row.trend_json) if row.trend_json else None,
+            rolling_analysis=json.loads(row.rolling_json) if row.rolling_json else None,
+        )
+
+    @classmethod
+    def build(cls, summaries: list[Any], latest_summary_id: Optional[int], summary_count: int) -> TrendSeries:
+        """Build from summaries already in ``query_client_summaries`` order."""
+        entries = [_entry_from_summary(s) for s in summaries[:MAX_SERIES_PERIODS]]
+        return cls(
+            entries=entries,
+            latest_summary_id=latest_summary_id,
+            summary_count=summary_count,
+            trend_analysis=_trend_analysis(entries[:TREND_DEFAULT_LIMIT]),
+            rolling_analysis=_rolling_analysis(entries),
+        )
+
+    def is_current(self, latest_summary_id: Optional[int], summary_count: int) -> bool:
+        return self.latest_summary_id == latest_summary_id and self.summary_count == summary_count
+
+    def append(self, summary: Any) -> None:
+        """Add one newly written summary, recomputing only the affected analyses."""
+        entry = _entry_from_summary(summary)
+        self.summary_count += 1
+        if self.latest_summary_id is None or summary.id > self.latest_summary_id:
+            self.latest_summary_id = summary.id
+
+        index = bisect.bisect_right([_sort_key(e) for e in self.entries], _sort_key(entry))
+        if index >= MAX_SERIES_PERIODS:
+            return
+        self.entries.insert(index, entry)
+        del self.entries[MAX_SERIES_PERIODS:]
+        if index < TREND_DEFAULT_LIMIT:
+            self.trend_analysis = _trend_analysis(self.entries[:TREND_DEFAULT_LIMIT])
+        self.rolling_analysis = _rolling_analysis(self.entries)
+
+    def apply_to(self, row: ClientTrendSeries) -> None:
+        row.snapshots_json = json.dumps(self.entries)
+        row.latest_summary_id = self.latest_summary_id
+        row.summary_count = self.summary_count
+        row.trend_json = json.dumps(self.trend_analysis) if self.trend_analysis is not None else None
+        row.rolling_json = json.dumps(self.rolling_analysis) if self.rolling_analysis is not None else None
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+
+
+def _period_key(period_type: Optional[PeriodType]) -> str:
+    return period_type.value if period_type is not None else ALL_PERIOD_TYPES
+
+
+def _active_summaries(
+    db: Session, client_id: int, user_id: int, period_type: Optional[PeriodType]
+) -> Query[DiagnosticSummary]:
+    query = db.query(DiagnosticSummary).filter(
+        DiagnosticSummary.client_id == client_id,
+        DiagnosticSummary.user_id == user_id,
+        DiagnosticSummary.archived_at.is_(None),
+    )
+    if period_type is not None:
+        query = query.filter(DiagnosticSummary.period_type == period_type)
+    return query
+
+
+def _summary_order() -> tuple[Any, ...]:
+    return (
+        DiagnosticSummary.period_date.asc().nullslast(),
+        DiagnosticSummary.timestamp.asc(),
+        DiagnosticSummary.id.asc(),
+    )
+
+
+def query_client_summaries(
+    db: Session, client_id: int, user_id: int, period_type: Optional[PeriodType] = None, limit: int = 36
+) -> list[DiagnosticSummary]:
+    """Oldest-first active summaries for a client (archived rows excluded)."""
+    return _active_summaries(db, client_id, user_id, period_type).order_by(*_summary_order()).limit(limit).all()
+
+
+def _summary_stats(
+    db: Session, client_id: int, user_id: int, period_type: Optional[PeriodType]
+) -> tuple[Optional[int], int]:
+    """(max id, count) of active summaries — the series freshness token."""
+    latest_id, count = (
+        _active_summaries(db, client_id, user_id, period_type)
+        .with_entities(func.max(DiagnosticSummary.id), func.count(DiagnosticSummary.id))
+        .one()
+    )
+    return latest_id, int(count or 0)
+
+
+def _get_row(db: Session, client_id: int, user_id: int, key: str) -> Optional[ClientTrendSeries]:
+    return (
+        db.query(ClientTrendSeries)
+        .filter(
+            ClientTrendSeries.client_id == client_id,
+            ClientTrendSeries.user_id == user_id,
+            ClientTrendSeries.period_type == key,
+        )
+        .first()
+    )
+
+
+def _save(db: Session, rows: list[tuple[Optional[ClientTrendSeries], int, int, str, TrendSeries]]) -> None:
+    """Persist ``(row, client_id, user_id, key, series)`` tuples; best-effort.
+
+    A failure (e.g. two requests creating the same row concurrently) is
+    logged and rolled back — the series is rebuilt on the next read.
+    """
+    try:
+        for row, client_id, user_id, key, series in rows:
+            if row is None:
+                row = ClientTrendSeries(client_id=client_id, user_id=user_id, period_type=key)
+                db.add(row)
+            series.apply_to(row)
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("trend_series.save_failed rows=%d", len(rows), exc_info=True)
+
+
+def _load_series(
+    db: Session,
+    client_id: int,
+    user_id: int,
+    period_type: Optional[PeriodType],
+    latest_summary_id: Optional[int],
+    summary_count: int,
+) -> TrendSeries:
+    key = _period_key(period_type)
+    row = _get_row(db, client_id, user_id, key)
+    if row is not None:
+        series = TrendSeries.from_row(row)
+        if series.is_current(latest_summary_id, summary_count):
+            return series
+
+    summaries = query_client_summaries(db, client_id, user_id, period_type, MAX_SERIES_PERIODS)
+    series = TrendSeries.build(summaries, latest_summary_id, summary_count)
+    _save(db, [(row, client_id, user_id, key, series)])
+    logger.info("trend_series.rebuilt client_id=%s period_type=%s periods=%d", client_id, key, len(series.entries))
+    return series
+
+
+# =============================================================================
+# Write hook
+# =============================================================================
+
+
+def record_diagnostic_summary(db: Session, summary: DiagnosticSummary) -> None:
+    """Fold a newly committed summary into the stored series for its client.
+
+    Updates the unfiltered series and the one for the summary's period type.
+    Missing series are built from scratch so the portfolio view has them.
+    """
+    keys: list[Optional[PeriodType]] = [None]
+    if summary.period_type is not None:
+        keys.append(summary.period_type)
+
+    try:
+        pending = []
+        for period_type in keys:
+            key = _period_key(period_type)
+            row = _get_row(db, summary.client_id, summary.user_id, key)
+            if row is not None:
+                series = TrendSeries.from_row(row)
+                series.append(summary)
+            else:
+                latest_id, count = _summary_stats(db, summary.client_id, summary.user_id, period_type)
+                summaries = query_client_summaries(
+                    db, summary.client_id, summary.user_id, period_type, MAX_SERIES_PERIODS
+                )
+                series = TrendSeries.build(summaries, latest_id, count)
+            pending.append((row, summary.client_id, summary.user_id, key, series))
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("trend_series.record_failed client_id=%s", summary.client_id, exc_info=True)
+        return
+    _save(db, pending)
+
+
+# =============================================================================
+# Read API
+# =============================================================================
+
+
+class _AnalysisCache:
+    """Small per-process LRU of rendered analyses."""
+
+    def __init__(self, maxsize: int = 512):
+        self._data: OrderedDict[tuple, tuple[Optional[dict[str, Any]], int]] = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[tuple[Optional[dict[str, Any]], int]]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: tuple[Optional[dict[str, Any]], int]) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_analysis_cache = _AnalysisCache()
+
+
+def _cached_analysis(
+    db: Session,
+    client_id: int,
+    user_id: int,
+    period_type: Optional[PeriodType],
+    kind: str,
+    limit: int,
+) -> tuple[Optional[dict[str, Any]], int]:
+    latest_id, count = _summary_stats(db, client_id, user_id, period_type)
+    if count < 2:
+        return None, count
+
+    cache_key = (client_id, user_id, _period_key(period_type), latest_id, count, kind, limit)
+    cached = _analysis_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    series = _load_series(db, client_id, user_id, period_type, latest_id, count)
+    entries = series.entries[:limit]
+    if kind == "rolling":
+        analysis = series.rolling_analysis if limit == MAX_SERIES_PERIODS else _rolling_analysis(entries)
+    elif limit == TREND_DEFAULT_LIMIT:
+        analysis = series.trend_analysis
+    else:
+        analysis = _trend_analysis(entries)
+
+    result = (analysis, len(entries))
+    _analysis_cache.put(cache_key, result)
+    return result
+
+
+def client_trend_analysis(
+    db: Session, client_id: int, user_id: int, period_type: Optional[PeriodType], limit: int = TREND_DEFAULT_LIMIT
+) -> tuple[Optional[dict[str, Any]], int]:
+    """``TrendAnalyzer`` output over the oldest ``limit`` periods, and the period count.
+
+    The analysis is None when fewer than two periods exist. Callers must
+    not mutate the returned dict (it is shared with the cache).
+    """
+    return _cached_analysis(db, client_id, user_id, period_type, "trend", limit)
+
+
+def client_rolling_analysis(
+    db: Session, client_id: int, user_id: int, period_type: Optional[PeriodType]
+) -> tuple[Optional[dict[str, Any]], int]:
+    """``RollingWindowAnalyzer`` output over the oldest 36 periods (a private copy)."""
+    analysis, periods = _cached_analysis(db, client_id, user_id, period_type, "rolling", MAX_SERIES_PERIODS)
+    return copy.deepcopy(analysis), periods
+
+
+def portfolio_trends(db: Session, user_id: int, *, limit: int, offset: int) -> tuple[list[dict[str, Any]], int]:
+    """Default trend analysis for a page of the user's clients.
+
+    One joined query reads every client on the page with its stored series
+    and live summary stats; stale or missing series are rebuilt together
+    from a single bulk summary query. Returns ``(items, total_count)``.
+    """
+    stats = (
+        db.query(
+            DiagnosticSummary.client_id.label("client_id"),
+            func.max(DiagnosticSummary.id).label("latest_id"),
+            func.count(DiagnosticSummary.id).label("summary_count"),
+        )
+        .filter(DiagnosticSummary.user_id == user_id, DiagnosticSummary.archived_at.is_(None))
+        .group_by(DiagnosticSummary.client_id)
+        .subquery()
+    )
+    total_count = db.query(func.count(Client.id)).filter(Client.user_id == user_id).scalar() or 0
+    rows = (
+        db.query(Client, ClientTrendSeries, stats.c.latest_id, stats.c.summary_count)
+        .outerjoin(
+            ClientTrendSeries,
+            and_(
+                ClientTrendSeries.client_id == Client.id,
+                ClientTrendSeries.user_id == user_id,
+                ClientTrendSeries.period_type == ALL_PERIOD_TYPES,
+            ),
+        )
+        .outerjoin(stats, stats.c.client_id == Client.id)
+        .filter(Client.user_id == user_id)
+        .order_by(Client.name.asc(), Client.id.asc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+
+    # Read names up front — the backfill commit expires loaded instances.
+    page = [(client.id, client.name) for client, _row, _latest_id, _count in rows]
+    series_by_client: dict[int, TrendSeries] = {}
+    stale: dict[int, tuple[Optional[ClientTrendSeries], Optional[int], int]] = {}
+    for client, row, latest_id, count in rows:
+        count = int(count or 0)
+        series = TrendSeries.from_row(row) if row is not None else None
+        if series is not None and series.is_current(latest_id, count):
+            series_by_client[client.id] = series
+        elif count >= 2:
+            stale[client.id] = (row, latest_id, count)
+        else:
+            series_by_client[client.id] = TrendSeries(latest_summary_id=latest_id, summary_count=count)
+
+    if stale:
+        grouped: dict[int, list[DiagnosticSummary]] = {client_id: [] for client_id in stale}
+        summaries = (
+            db.query(DiagnosticSummary)
+            .filter(
+                DiagnosticSummary.client_id.in_(list(stale)),
+                DiagnosticSummary.user_id == user_id,
+                DiagnosticSummary.archived_at.is_(None),
+            )
+            .order_by(DiagnosticSummary.client_id, *_summary_order())
+            .all()
+        )
+        for summary in summaries:
+            grouped[summary.client_id].append(summary)
+        pending = []
+        for client_id, (row, latest_id, count) in stale.items():
+            series = TrendSeries.build(grouped[client_id], latest_id, count)
+            series_by_client[client_id] = series
+            pending.append((row, client_id, user_id, ALL_PERIOD_TYPES, series))
+        _save(db, pending)
+
+    items = []
+    for client_id, client_name in page:
+        series = series_by_client[client_id]
+        items.append(
+            {
+                "client_id": client_id,
+                "client_name": client_name,
+                "periods_analyzed": min(series.summary_count, TREND_DEFAULT_LIMIT),
+                "latest_summary_id": series.latest_summary_id,
+                "analysis": series.trend_analysis,
+            }
+        )
+    return items, total_count
@@ -25,14 +25,16 @@ Ten-step defense from request ingress through DataFrame materialization:
 
 from __future__ import annotations
 
+import codecs
 import io
 import logging
 import os
 import zipfile
 import zlib
 from collections import Counter
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
+from typing import Any
 
 import pandas as pd
 from fastapi import HTTPException, UploadFile
@@ -44,6 +46,7 @@ from shared.file_formats import (
     XLS_MAGIC,
     XLSX_MAGIC,
     FileFormat,
+    FormatDetectionResult,
     detect_format,
     get_active_extensions_display,
 )
@@ -66,6 +69,12 @@ MAX_ZIP_ENTRIES = 10_000
 MAX_ZIP_UNCOMPRESSED_BYTES = 1_000 * 1024 * 1024  # 1GB
 MAX_COMPRESSION_RATIO = 100
 
+# Rows per chunk handed to engines by parse_uploaded_file_chunked()
+CHUNK_ROW_COUNT = 50_000
+
+_TEXT_FORMATS = frozenset({FileFormat.CSV, FileFormat.TSV, FileFormat.TXT})
+_XLSX_FORMATS = frozenset({FileFormat.XLSX, FileFormat.XLS})
+
 # XML bomb detection (billion laughs / entity expansion attacks)
 _XML_HEADER_SCAN_SIZE = 8192
 _XML_SCAN_EXTENSIONS = (".xml", ".rels", ".vml")
@@ -618,6 +627,40 @@ def _parse_excel(file_bytes: bytes, filename: str) -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 
 
+_IDENTIFIER_HINTS = {"account", "acct", "code", "id", "number", "no", "num", "gl"}
+
+
+def _check_cell_lengths(df: pd.DataFrame) -> None:
+    """Reject any string cell longer than ``MAX_CELL_LENGTH``.
+
+    Cell content length protection (prevent OOM from oversized string operations).
+    pandas 3.0 uses pd.StringDtype() ("str") for string columns instead of object;
+    is_string_dtype() covers both the legacy object dtype and the new str dtype.
+    """
+    for col in df.columns:
+        if pd.api.types.is_string_dtype(df[col]):
+            max_len = df[col].astype(str).str.len().max()
+            if pd.notna(max_len) and max_len > MAX_CELL_LENGTH:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"A cell in column '{col}' exceeds the maximum length of "
+                    f"{MAX_CELL_LENGTH:,} characters. Please reduce cell content size.",
+                )
+
+
+def _stringify_identifier_columns(df: pd.DataFrame) -> None:
+    """Preserve leading zeros in identifier columns (account codes, IDs)."""
+    for col in df.columns:
+        col_lower = str(col).lower().strip()
+        if any(hint in col_lower for hint in _IDENTIFIER_HINTS):
+            if pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = df[col].apply(
+                    lambda x: (
+                        str(int(x)) if pd.notna(x) and float(x) == int(float(x)) else (str(x) if pd.notna(x) else "")
+                    )
+                )
+
+
 def _validate_and_convert_df(
     df: pd.DataFrame,
     max_rows: int,
@@ -652,31 +695,8 @@ def _validate_and_convert_df(
             "Please upload a file with at least one row of data.",
         )
 
-    # Cell content length protection (prevent OOM from oversized string operations).
-    # pandas 3.0 uses pd.StringDtype() ("str") for string columns instead of object;
-    # is_string_dtype() covers both the legacy object dtype and the new str dtype.
-    for col in df.columns:
-        if pd.api.types.is_string_dtype(df[col]):
-            max_len = df[col].astype(str).str.len().max()
-            if pd.notna(max_len) and max_len > MAX_CELL_LENGTH:
-                del df
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"A cell in column '{col}' exceeds the maximum length of "
-                    f"{MAX_CELL_LENGTH:,} characters. Please reduce cell content size.",
-                )
-
-    # Preserve leading zeros in identifier columns (account codes, IDs).
-    _IDENTIFIER_HINTS = {"account", "acct", "code", "id", "number", "no", "num", "gl"}
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        if any(hint in col_lower for hint in _IDENTIFIER_HINTS):
-            if pd.api.types.is_numeric_dtype(df[col]):
-                df[col] = df[col].apply(
-                    lambda x: (
-                        str(int(x)) if pd.notna(x) and float(x) == int(float(x)) else (str(x) if pd.notna(x) else "")
-                    )
-                )
+    _check_cell_lengths(df)
+    _stringify_identifier_columns(df)
 
     column_names = list(df.columns.astype(str))
     rows = df.to_dict("records")
@@ -689,20 +709,15 @@ def _validate_and_convert_df(
 # ---------------------------------------------------------------------------
 
 
-def parse_uploaded_file_by_format(
+def _detect_and_gate(
     file_bytes: bytes,
     filename: str,
-    content_type: str | None = None,
-    max_rows: int = MAX_ROW_COUNT,
-) -> tuple[list[str], list[dict]]:
-    """Parse file bytes using ``detect_format()`` to dispatch to the correct parser."""
+    content_type: str | None,
+    max_rows: int,
+) -> FormatDetectionResult:
+    """Detect the upload's format, reject disabled formats, and apply the pre-parse row gate."""
     from shared.file_formats import is_format_enabled
-    from shared.parser_metrics import (
-        active_parses,
-        parse_duration_seconds,
-        parse_errors_total,
-        parse_total,
-    )
+    from shared.parser_metrics import parse_total
 
     detected = detect_format(filename=filename, content_type=content_type, file_bytes=file_bytes)
     fmt_label = detected.format.value
@@ -717,8 +732,6 @@ def parse_uploaded_file_by_format(
     parse_total.labels(format=fmt_label, stage="detect").inc()
 
     # Pre-parse row-count gate (20% buffer — estimates aren't exact).
-    _TEXT_FORMATS = {FileFormat.CSV, FileFormat.TSV, FileFormat.TXT}
-    _XLSX_FORMATS = {FileFormat.XLSX, FileFormat.XLS}
     row_estimate_limit = int(max_rows * 1.2)
 
     if detected.format in _TEXT_FORMATS:
@@ -746,6 +759,26 @@ def parse_uploaded_file_by_format(
                 f"(estimated {estimated_rows:,} rows). Please reduce the file size.",
             )
 
+    return detected
+
+
+def parse_uploaded_file_by_format(
+    file_bytes: bytes,
+    filename: str,
+    content_type: str | None = None,
+    max_rows: int = MAX_ROW_COUNT,
+) -> tuple[list[str], list[dict]]:
+    """Parse file bytes using ``detect_format()`` to dispatch to the correct parser."""
+    from shared.parser_metrics import (
+        active_parses,
+        parse_duration_seconds,
+        parse_errors_total,
+        parse_total,
+    )
+
+    detected = _detect_and_gate(file_bytes, filename, content_type, max_rows)
+    fmt_label = detected.format.value
+
     active_parses.labels(format=fmt_label).inc()
     try:
         with parse_duration_seconds.labels(format=fmt_label, stage="parse").time():
@@ -810,3 +843,155 @@ def parse_uploaded_file(
     that never supply a content-type.
     """
     return parse_uploaded_file_by_format(file_bytes, filename, max_rows=max_rows)
+
+
+# ---------------------------------------------------------------------------
+# Chunked text parsing
+# ---------------------------------------------------------------------------
+# parse_uploaded_file() materializes the whole DataFrame, scans it, then builds
+# a dict per row — three full copies of the upload before an engine sees a
+# row. For CSV/TSV/TXT the chunked path reads CHUNK_ROW_COUNT rows at a time,
+# applies the same limits to each chunk, and yields each chunk as row dicts.
+# Engines that parse rows into their own entry objects chunk by chunk (see
+# engine_framework.parse_row_chunks) then peak at one chunk of raw rows plus
+# their accumulated entries.
+
+_TEXT_SEPARATORS = {FileFormat.CSV: ",", FileFormat.TSV: "\t"}
+_TEXT_PARSE_ERRORS = {
+    FileFormat.CSV: "The CSV file format is invalid. Please verify it is a properly formatted CSV file.",
+    FileFormat.TSV: "The TSV file format is invalid. Please verify it is a properly formatted tab-separated file.",
+    FileFormat.TXT: "The text file format is invalid. Please verify it has a consistent delimiter.",
+}
+_ENCODING_PROBE_BYTES = 1024 * 1024
+
+
+def _text_encoding(file_bytes: bytes) -> str:
+    """UTF-8 if the whole upload decodes as UTF-8, else Latin-1.
+
+    Same fallback order as the whole-file parsers, decided up front so a bad
+    byte near the end cannot fail the read after earlier chunks were handed
+    out. Decoded in slices so no full text copy is kept.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    view = memoryview(file_bytes)
+    try:
+        for start in range(0, len(view), _ENCODING_PROBE_BYTES):
+            decoder.decode(view[start : start + _ENCODING_PROBE_BYTES])
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8"
+
+
+def _read_text(file_bytes: bytes, fmt: FileFormat, **read_kwargs: object) -> Any:
+    try:
+        return pd.read_csv(io.BytesIO(file_bytes), **read_kwargs)
+    except pd.errors.EmptyDataError:
+        raise HTTPException(
+            status_code=400,
+            detail="The uploaded file appears to be empty or has no readable columns.",
+        )
+    except pd.errors.ParserError:
+        raise HTTPException(status_code=400, detail=_TEXT_PARSE_ERRORS[fmt])
+
+
+def _check_row_limit(row_count: int, max_rows: int) -> None:
+    if row_count > max_rows:
+        raise HTTPException(
+            status_code=400,
+            detail=f"The file contains {row_count:,} rows, which exceeds the maximum of "
+            f"{max_rows:,}. Please reduce the file size or split into smaller files.",
+        )
+
+
+def _iter_text_chunks(
+    file_bytes: bytes,
+    fmt: FileFormat,
+    read_kwargs: dict[str, Any],
+    chunk_rows: int,
+    max_rows: int,
+) -> Iterator[list[dict]]:
+    from shared.parser_metrics import parse_errors_total, parse_total
+
+    fmt_label = fmt.value
+    row_count = 0
+    try:
+        with _read_text(file_bytes, fmt, chunksize=chunk_rows, **read_kwargs) as reader:
+            while True:
+                try:
+                    chunk = next(reader)
+                except StopIteration:
+                    break
+                except pd.errors.ParserError:
+                    raise HTTPException(status_code=400, detail=_TEXT_PARSE_ERRORS[fmt])
+                row_count += len(chunk)
+                _check_row_limit(row_count, max_rows)
+                _check_cell_lengths(chunk)
+                _stringify_identifier_columns(chunk)
+                rows = chunk.to_dict("records")
+                del chunk
+                yield rows
+    except HTTPException as e:
+        parse_errors_total.labels(format=fmt_label, stage="parse", error_code=str(e.status_code)).inc()
+        raise
+    parse_total.labels(format=fmt_label, stage="parse").inc()
+
+
+def _row_slices(rows: list[dict], chunk_rows: int) -> Iterator[list[dict]]:
+    # Drop each slice from ``rows`` as it is handed out, so the parsed rows
+    # are released chunk by chunk instead of outliving the whole iteration.
+    while rows:
+        chunk = rows[:chunk_rows]
+        del rows[:chunk_rows]
+        yield chunk
+
+
+def parse_uploaded_file_chunked(
+    file_bytes: bytes,
+    filename: str,
+    content_type: str | None = None,
+    max_rows: int = MAX_ROW_COUNT,
+    chunk_rows: int = CHUNK_ROW_COUNT,
+) -> tuple[list[str], Iterator[list[dict]]]:
+    """Parse an upload into column names and an iterator of row-dict chunks.
+
+    CSV, TSV and TXT are read ``chunk_rows`` rows at a time. Column count and
+    the zero-row check apply to the first chunk; row count, cell length and
+    identifier-column handling apply per chunk, so a limit breach surfaces as
+    HTTPException(400) from the iterator. Columns read as strings in the first
+    chunk stay strings in every later chunk, so an account code column never
+    flips to numeric (and loses leading zeros) part-way through the file.
+
+    Other formats are parsed whole by :func:`parse_uploaded_file_by_format`
+    and handed out in slices of the same size; peak memory for those is the
+    whole-file parse, and it falls as slices are consumed.
+    """
+    detected = _detect_and_gate(file_bytes, filename, content_type, max_rows)
+    fmt = detected.format
+    if fmt not in _TEXT_FORMATS:
+        column_names, rows = parse_uploaded_file_by_format(file_bytes, filename, content_type, max_rows)
+        return column_names, _row_slices(rows, chunk_rows)
+
+    separator = _TEXT_SEPARATORS.get(fmt) or _detect_delimiter(file_bytes, filename)
+    read_kwargs: dict[str, Any] = {"sep": separator, "encoding": _text_encoding(file_bytes)}
+
+    first = _read_text(file_bytes, fmt, nrows=chunk_rows, **read_kwargs)
+    if len(first.columns) > MAX_COL_COUNT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"The file contains {len(first.columns):,} columns, which exceeds the maximum of "
+            f"{MAX_COL_COUNT:,}. Please reduce the number of columns.",
+        )
+    if len(first) == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="The file has column headers but contains no data rows. "
+            "Please upload a file with at least one row of data.",
+        )
+    column_names = list(first.columns.astype(str))
+    string_columns = {col: str for col in first.columns if pd.api.types.is_string_dtype(first[col])}
+    del first
+    if string_columns:
+        read_kwargs["dtype"] = string_columns
+
+    return column_names, _iter_text_chunks(file_bytes, fmt, read_kwargs, chunk_rows, max_rows)
@@ -274,30 +274,130 @@ def _normalize(value: str) -> str:
     return value.strip().lower().replace(" ", "_")
 
 
-def _build_role_map(role_permissions: Iterable[RolePermission]) -> dict[str, frozenset[str]]:
-    result: dict[str, frozenset[str]] = {}
+# Effective permissions are held as bitsets: every distinct permission string
+# is interned to a bit position, each role becomes one int mask, a user's
+# effective permissions are the OR of their roles' masks, and each rule
+# compiles to a required mask plus an alternate mask. Matching is then two
+# ANDs per rule regardless of how many permissions a role carries. Python
+# ints are arbitrary-precision, so a 10k-permission universe is a 10k-bit int.
+
+
+class _PermissionIndex:
+    """Interns permission strings to bit positions."""
+
+    def __init__(self) -> None:
+        self._bits: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def intern(self, permission: str) -> int:
+        bit = self._bits.get(permission)
+        if bit is None:
+            bit = len(self._names)
+            self._bits[permission] = bit
+            self._names.append(permission)
+        return bit
+
+    def mask(self, permissions: Iterable[str]) -> int:
+        value = 0
+        for perm in permissions:
+            value |= 1 << self.intern(perm)
+        return value
+
+    def known_mask(self, permissions: Iterable[str]) -> Optional[int]:
+        """Mask of ``permissions`` without interning; None if any is unknown."""
+        value = 0
+        for perm in permissions:
+            bit = self._bits.get(perm)
+            if bit is None:
+                return None
+            value |= 1 << bit
+        return value
+
+    def names(self, mask: int) -> list[str]:
+        """Permission names for the set bits in ``mask``, sorted."""
+        found: list[str] = []
+        while mask:
+            low = mask & -mask
+            found.append(self._names[low.bit_length() - 1])
+            mask ^= low
+        return sorted(found)
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    rule: SodRule
+    required_mask: int
+    alternate_mask: int
+    has_alternate: bool
+
+    def matches(self, permission_mask: int) -> bool:
+        if permission_mask & self.required_mask != self.required_mask:
+            return False
+        return not self.has_alternate or bool(permission_mask & self.alternate_mask)
+
+
+def _build_role_map(role_permissions: Iterable[RolePermission], index: _PermissionIndex) -> dict[str, int]:
+    result: dict[str, int] = {}
     for rp in role_permissions:
-        normalized = frozenset(_normalize(p) for p in rp.permissions if p.strip())
-        result[_normalize(rp.role_code)] = normalized
+        result[_normalize(rp.role_code)] = index.mask(_normalize(p) for p in rp.permissions if p.strip())
     return result
 
 
-def _effective_permissions(
-    user: UserRoleAssignment,
-    role_map: dict[str, frozenset[str]],
-) -> tuple[frozenset[str], dict[str, list[str]]]:
-    """Resolve the effective permission set for a user across all assigned
-    roles. Returns (permissions, permission → roles map).
+def _compile_rules(rules: Iterable[SodRule], index: _PermissionIndex) -> list[_CompiledRule]:
+    """Compile rules against the interned universe.
+
+    Rules requiring a permission no role grants can never fire and are
+    dropped; unknown alternates are ignored (an alternate group left with no
+    known members can never be satisfied either).
     """
-    permissions: set[str] = set()
-    perm_to_roles: dict[str, list[str]] = {}
-    for role_code in user.role_codes:
-        normalized_role = _normalize(role_code)
-        role_perms = role_map.get(normalized_role, frozenset())
-        for perm in role_perms:
-            permissions.add(perm)
-            perm_to_roles.setdefault(perm, []).append(normalized_role)
-    return frozenset(permissions), perm_to_roles
+    compiled: list[_CompiledRule] = []
+    for rule in rules:
+        required = index.known_mask(rule.permissions_required)
+        if required is None:
+            continue
+        alternate = 0
+        for perm in rule.permissions_alternate:
+            bit_mask = index.known_mask((perm,))
+            if bit_mask is not None:
+                alternate |= bit_mask
+        if rule.permissions_alternate and not alternate:
+            continue
+        compiled.append(_CompiledRule(rule, required, alternate, bool(rule.permissions_alternate)))
+    return compiled
+
+
+@dataclass(frozen=True)
+class _RuleHit:
+    rule: SodRule
+    triggering_permissions: list[str]
+    triggering_roles: list[str]
+
+
+def _evaluate_role_combination(
+    roles: frozenset[str],
+    role_map: dict[str, int],
+    rules: list[_CompiledRule],
+    index: _PermissionIndex,
+) -> list[_RuleHit]:
+    """Rule hits for one distinct set of assigned roles (shared by every user holding it)."""
+    role_masks = [(role, role_map.get(role, 0)) for role in roles]
+    permission_mask = 0
+    for _role, mask in role_masks:
+        permission_mask |= mask
+
+    hits: list[_RuleHit] = []
+    for compiled in rules:
+        if not compiled.matches(permission_mask):
+            continue
+        triggering = compiled.required_mask | (compiled.alternate_mask & permission_mask)
+        hits.append(
+            _RuleHit(
+                rule=compiled.rule,
+                triggering_permissions=index.names(triggering),
+                triggering_roles=sorted(role for role, mask in role_masks if mask & triggering),
+            )
+        )
+    return hits
 
 
 def _risk_tier(score: float) -> str:
@@ -318,13 +418,17 @@ def analyze_segregation_of_duties(
 
     Returns a SodResult with a per-conflict listing and a per-user risk
     ranking. Users with no conflicts are still included in the per-user
-    summary with a 'low' risk tier.
+    summary with a 'low' risk tier. Users holding the same set of roles are
+    evaluated once.
     """
     rules: list[SodRule] = list(DEFAULT_SOD_RULES)
     if extra_rules:
         rules.extend(extra_rules)
 
-    role_map = _build_role_map(role_permissions)
+    index = _PermissionIndex()
+    role_map = _build_role_map(role_permissions, index)
+    compiled_rules = _compile_rules(rules, index)
+    hits_by_roles: dict[frozenset[str], list[_RuleHit]] = {}
 
     conflicts: list[SodConflict] = []
     summaries: list[UserSodSummary] = []
@@ -334,40 +438,34 @@ def analyze_segregation_of_duties(
 
     for user in user_assignments:
         users_evaluated += 1
-        permissions, perm_to_roles = _effective_permissions(user, role_map)
-        user_conflicts: list[SodConflict] = []
-        for rule in rules:
-            if not rule.matches(permissions):
-                continue
-            triggering_perms = sorted(
-                rule.permissions_required.union(rule.permissions_alternate.intersection(permissions))
-            )
-            triggering_roles_set: set[str] = set()
-            for perm in triggering_perms:
-                for r in perm_to_roles.get(perm, []):
-                    triggering_roles_set.add(r)
-            user_conflicts.append(
+        roles = frozenset(_normalize(r) for r in user.role_codes)
+        hits = hits_by_roles.get(roles)
+        if hits is None:
+            hits = _evaluate_role_combination(roles, role_map, compiled_rules, index)
+            hits_by_roles[roles] = hits
+
+        for hit in hits:
+            conflicts.append(
                 SodConflict(
                     user_id=user.user_id,
                     user_name=user.user_name,
-                    rule_code=rule.code,
-                    rule_title=rule.title,
-                    severity=rule.severity,
-                    triggering_permissions=triggering_perms,
-                    triggering_roles=sorted(triggering_roles_set),
-                    mitigation=rule.mitigation,
-                    rationale=rule.rationale,
+                    rule_code=hit.rule.code,
+                    rule_title=hit.rule.title,
+                    severity=hit.rule.severity,
+                    triggering_permissions=hit.triggering_permissions,
+                    triggering_roles=hit.triggering_roles,
+                    mitigation=hit.rule.mitigation,
+                    rationale=hit.rule.rationale,
                 )
             )
-        conflicts.extend(user_conflicts)
 
-        high_count = sum(1 for c in user_conflicts if c.severity == SodSeverity.HIGH)
-        med_count = sum(1 for c in user_conflicts if c.severity == SodSeverity.MEDIUM)
-        low_count = sum(1 for c in user_conflicts if c.severity == SodSeverity.LOW)
+        high_count = sum(1 for h in hits if h.rule.severity == SodSeverity.HIGH)
+        med_count = sum(1 for h in hits if h.rule.severity == SodSeverity.MEDIUM)
+        low_count = sum(1 for h in hits if h.rule.severity == SodSeverity.LOW)
         score = high_count * 3.0 + med_count * 2.0 + low_count * 1.0
         tier = _risk_tier(score)
 
-        if user_conflicts:
+        if hits:
             users_with_conflicts += 1
         if tier == "high":
             high_risk_users += 1
@@ -376,7 +474,7 @@ def analyze_segregation_of_duties(
             UserSodSummary(
                 user_id=user.user_id,
                 user_name=user.user_name,
-                conflict_count=len(user_conflicts),
+                conflict_count=len(hits),
                 high_severity_count=high_count,
                 medium_severity_count=med_count,
                 low_severity_count=low_count,
@@ -28,6 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from admin_audit_model import AdminAuditLog  # noqa: F401 — Sprint 590: admin audit trail
 from analytical_expectations_model import AnalyticalExpectation  # noqa: F401 — Sprint 728a (ISA 520)
+from classification_cache_model import ClientClassificationCache  # noqa: F401 — needed for FK resolution in create_all
 from database import Base
 from dunning_model import DunningEpisode  # noqa: F401 — Sprint 591: dunning state machine
 from engagement_model import Engagement, EngagementStatus, MaterialityBasis, ToolName, ToolRun, ToolRunStatus
@@ -42,6 +43,7 @@ from subscription_model import (  # noqa: F401 — needed for FK resolution in c
     Subscription,
 )
 from tool_session_model import ToolSession  # noqa: F401 — needed for FK resolution in create_all
+from trend_series_model import ClientTrendSeries  # noqa: F401 — needed for FK resolution in create_all
 from uncorrected_misstatements_model import UncorrectedMisstatement  # noqa: F401 — Sprint 729a (ISA 450)
 from upload_dedup_model import UploadDedup  # noqa: F401 — AUDIT-06 FIX 4
 
@@ -187,12 +189,25 @@ def _disable_cleanup_scheduler():
 def _clear_analytics_caches():
     """Clear engagement analytics caches between tests to prevent cross-test pollution."""
     from engagement_manager import _convergence_cache, _trend_cache
+    from shared.trend_series import _analysis_cache
 
     _convergence_cache.clear()
     _trend_cache.clear()
+    _analysis_cache.clear()
     yield
     _convergence_cache.clear()
     _trend_cache.clear()
+    _analysis_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_render_cache():
+    """Start every test with an empty rendered-export cache so exports really render."""
+    from shared.render_cache import render_cache
+
+    render_cache.clear()
+    yield
+    render_cache.clear()
 
 
 # ---------------------------------------------------------------------------
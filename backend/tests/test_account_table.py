@@ -0,0 +1,118 @@
+"""
+Tests for the shared per-account table (audit.rules.table) and the detectors
+that consume it.
+
+A full diagnostic run must classify each account once, and every detector
+must return the same findings whether it builds its own table or is handed
+the auditor's.
+"""
+
+import csv
+import io
+from decimal import Decimal
+
+import pytest
+
+from account_classifier import AccountClassifier, create_classifier
+from audit.pipeline import audit_trial_balance_streaming
+from audit.rules import build_account_table
+from audit.streaming_auditor import StreamingAuditor
+from classification_rules import AccountCategory
+
+# "Other" is not a recognised type, so those rows fall back to the heuristic.
+TB_ROWS = [
+    ["Account", "Debit", "Credit", "Account Type"],
+    ["1000 Cash", "50000", "", "Asset"],
+    ["1100 Accounts Receivable", "32000", "", "Other"],
+    ["1900 Suspense", "2500", "", "Other"],
+    ["1950 Due from Affiliate - Acme", "10000", "", "Other"],
+    ["2000 Accounts Payable", "", "21000", "Liability"],
+    ["2050 Due to Affiliate - Acme", "", "7000", "Other"],
+    ["2100 Shareholder Loan", "", "5000", "Other"],
+    ["3000 Retained Earnings", "15000", "", "Equity"],
+    ["3100 Dividends Declared", "4000", "", "Other"],
+    ["4000 Sales Revenue", "", "120000", "Revenue"],
+    ["4100 Service Revenue", "", "0", "Other"],
+    ["5000 Cost of Goods Sold", "30000", "", "Expense"],
+    ["6000 Rent Expense", "24000", "", "Other"],
+    ["6100 Salaries Expense", "10000", "", "Other"],
+    ["6200 Utilities", "", "24500", "Other"],
+]
+
+
+def _tb_csv() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(TB_ROWS)
+    return buffer.getvalue().encode()
+
+
+def _auditor() -> StreamingAuditor:
+    import pandas as pd
+
+    auditor = StreamingAuditor(materiality_threshold=1000.0, classifier=create_classifier())
+    auditor.process_chunk(pd.read_csv(io.BytesIO(_tb_csv()), dtype=str), len(TB_ROWS) - 1)
+    auditor.get_balance_result()
+    return auditor
+
+
+DETECTORS = [
+    "get_abnormal_balances",
+    "detect_suspense_accounts",
+    "detect_concentration_risk",
+    "detect_rounding_anomalies",
+    "detect_related_party_accounts",
+    "detect_intercompany_imbalances",
+    "detect_equity_signals",
+    "detect_revenue_concentration",
+    "detect_expense_concentration",
+    "get_classified_accounts",
+]
+
+
+class TestAccountTable:
+    def test_rows_carry_category_and_totals(self):
+        auditor = _auditor()
+        table = build_account_table(
+            auditor.account_balances,
+            auditor.classifier,
+            auditor.provided_account_types,
+            auditor.provided_account_names,
+        )
+        cash = next(row for row in table.rows if row.key == "1000 Cash")
+        assert cash.category == AccountCategory.ASSET
+        assert cash.csv_confidence is not None
+        assert cash.abs_net_dec == Decimal("50000")
+
+        service = next(row for row in table.rows if row.key == "4100 Service Revenue")
+        assert service.is_zero
+        revenue_total = sum((row.abs_net_dec for row in table.in_category(AccountCategory.REVENUE)), Decimal("0"))
+        assert table.category_totals[AccountCategory.REVENUE] == revenue_total
+        assert table.nonzero_category_totals[AccountCategory.REVENUE] == revenue_total
+        assert service not in table.nonzero
+
+    def test_pipeline_classifies_each_account_once(self, monkeypatch: pytest.MonkeyPatch):
+        calls: list[str] = []
+        real = AccountClassifier.classify
+
+        def counting(self, account_name, *args, **kwargs):
+            calls.append(account_name)
+            return real(self, account_name, *args, **kwargs)
+
+        monkeypatch.setattr(AccountClassifier, "classify", counting)
+        audit_trial_balance_streaming(_tb_csv(), "tb.csv", materiality_threshold=1000.0)
+        assert len(calls) == len(set(calls)) == len(TB_ROWS) - 1
+
+    @pytest.mark.parametrize("method", DETECTORS)
+    def test_detectors_match_with_and_without_table(self, method):
+        own = getattr(_auditor(), method)()
+        prepared = _auditor()
+        prepared.prepare_account_table()
+        assert getattr(prepared, method)() == own
+
+    def test_new_chunk_discards_table(self):
+        import pandas as pd
+
+        auditor = _auditor()
+        auditor.prepare_account_table()
+        auditor.process_chunk(pd.DataFrame({"Account": ["7000 Travel Expense"], "Debit": ["900"], "Credit": [""]}), 1)
+        assert "7000 Travel Expense" in auditor.get_classified_accounts()
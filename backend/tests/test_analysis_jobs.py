@@ -0,0 +1,214 @@
+"""
+Tests for background analysis jobs (shared.analysis_jobs and /jobs routes).
+
+An upload submitted with async_job=true must return a job id at once, report
+progress while it runs, and hand back — exactly once — the body the
+synchronous call would have returned.
+"""
+
+import asyncio
+import contextlib
+import csv
+import io
+import queue
+import threading
+import time
+
+import httpx
+import pytest
+
+from shared import analysis_jobs, bulk_job_store
+from shared.analysis_jobs import JobProgress, get_job, take_job_result
+
+TB_ROWS = [
+    ["Account", "Debit", "Credit"],
+    ["1000 Cash", "50000", ""],
+    ["1100 Accounts Receivable", "32000", ""],
+    ["2000 Accounts Payable", "", "21000"],
+    ["3000 Retained Earnings", "", "30000"],
+    ["4000 Sales Revenue", "", "120000"],
+    ["5000 Cost of Goods Sold", "60000", ""],
+    ["6000 Rent Expense", "29000", ""],
+]
+
+
+def _csv(rows: list[list[str]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def _job(job_id: str, user_id: int = 1, status: str = "running") -> dict:
+    now = analysis_jobs._now()
+    return {
+        "job_id": job_id,
+        "user_id": user_id,
+        "tool": "trial_balance",
+        "filename": "tb.csv",
+        "created_at": now,
+        "updated_at": now,
+        "status": status,
+        "stage": status,
+        "rows_processed": 0,
+        "message": "",
+        "error": None,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clean_store():
+    bulk_job_store.reset_all_for_tests()
+    yield
+    bulk_job_store.reset_all_for_tests()
+
+
+class TestJobProgress:
+    def test_repeated_ticks_are_throttled_but_other_messages_are_not(self):
+        bulk_job_store.put("analysis:j1", _job("j1"))
+        progress = JobProgress("j1")
+
+        progress.stage("analyzing", "Reading")
+        progress(100, "Scanning rows: 100")
+        progress(200, "Scanning rows: 200")
+        assert get_job("j1")["rows_processed"] == 100
+
+        progress(200, "Running anomaly detection")
+        assert get_job("j1")["message"] == "Running anomaly detection"
+
+        progress._last_sent -= 1.0
+        progress(500, "Scanning rows: 500")
+        job = get_job("j1")
+        assert (job["stage"], job["rows_processed"], job["status"]) == ("analyzing", 500, "running")
+
+    def test_progress_never_reopens_a_finished_job(self):
+        bulk_job_store.put("analysis:j2", _job("j2", status="complete"))
+        JobProgress("j2").stage("analyzing")
+        assert get_job("j2")["status"] == "complete"
+
+    def test_worker_updates_arrive_through_drain_thread(self):
+        bulk_job_store.put("analysis:j3", _job("j3"))
+        channel: queue.Queue = queue.Queue()
+        drain = threading.Thread(target=analysis_jobs._drain, args=(channel,))
+        drain.start()
+        JobProgress("j3", channel).stage("parsing", "Reading upload")
+        channel.put(None)
+        drain.join(timeout=5)
+        assert get_job("j3")["stage"] == "parsing"
+
+    def test_result_is_taken_once_and_expires(self, monkeypatch: pytest.MonkeyPatch):
+        bulk_job_store.put("analysis:j4:result", {"created_at": analysis_jobs._now(), "result": {"ok": True}})
+        assert take_job_result("j4") == {"ok": True}
+        assert take_job_result("j4") is None
+
+        bulk_job_store.put("analysis:j5:result", {"created_at": analysis_jobs._now(), "result": {"ok": True}})
+        monkeypatch.setattr(analysis_jobs, "ANALYSIS_JOB_RESULT_TTL_SECONDS", -1)
+        assert take_job_result("j5") is None
+
+
+@pytest.fixture
+def job_db(db_session, monkeypatch: pytest.MonkeyPatch):
+    """Run job post-processing on the test session instead of a fresh SessionLocal."""
+
+    @contextlib.contextmanager
+    def _session():
+        yield db_session
+
+    monkeypatch.setattr(analysis_jobs, "_job_session", _session)
+    return db_session
+
+
+@pytest.fixture
+def override_diagnostic_user(override_auth_verified):
+    from main import app
+    from shared.entitlement_checks import check_diagnostic_limit
+
+    app.dependency_overrides[check_diagnostic_limit] = lambda: override_auth_verified
+    yield override_auth_verified
+
+
+async def _wait_for_job(ac: httpx.AsyncClient, job_id: str, timeout: float = 120.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        response = await ac.get(f"/jobs/{job_id}")
+        assert response.status_code == 200, response.text
+        body = response.json()
+        if body["status"] in ("complete", "failed"):
+            return body
+        assert time.monotonic() < deadline, body
+        await asyncio.sleep(0.1)
+
+
+def _without_timestamp(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "timestamp"}
+
+
+@pytest.mark.usefixtures("bypass_csrf", "job_db")
+class TestAnalysisJobRoutes:
+    @pytest.mark.asyncio
+    async def test_trial_balance_job_matches_synchronous_response(self, override_diagnostic_user):
+        from main import app
+
+        data = _csv(TB_ROWS)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            sync = await ac.post(
+                "/audit/trial-balance",
+                files={"file": ("tb.csv", data, "text/csv")},
+                data={"materiality_threshold": "500"},
+            )
+            assert sync.status_code == 200, sync.text
+
+            accepted = await ac.post(
+                "/audit/trial-balance",
+                files={"file": ("tb.csv", data, "text/csv")},
+                data={"materiality_threshold": "500", "async_job": "true", "force_resubmit": "true"},
+            )
+            assert accepted.status_code == 202, accepted.text
+            job_id = accepted.json()["job_id"]
+            assert accepted.json()["result_url"] == f"/jobs/{job_id}/result"
+
+            status = await _wait_for_job(ac, job_id)
+            assert status["status"] == "complete"
+            assert status["stage"] == "complete"
+
+            events = await ac.get(f"/jobs/{job_id}/events")
+            assert events.headers["content-type"].startswith("text/event-stream")
+            assert events.text.startswith("event: complete\ndata: ")
+
+            result = await ac.get(f"/jobs/{job_id}/result")
+            assert result.status_code == 200
+            assert _without_timestamp(result.json()) == _without_timestamp(sync.json())
+
+            again = await ac.get(f"/jobs/{job_id}/result")
+            assert again.status_code == 410
+
+    @pytest.mark.asyncio
+    async def test_testing_tool_job_reports_failure(self, override_auth_verified):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            accepted = await ac.post(
+                "/audit/journal-entries",
+                files={"file": ("gl.csv", b"Entry ID,Debit\n", "text/csv")},
+                data={"async_job": "true"},
+            )
+            assert accepted.status_code == 202, accepted.text
+            job_id = accepted.json()["job_id"]
+
+            status = await _wait_for_job(ac, job_id)
+            assert status["status"] == "failed"
+            assert status["error"]["status_code"] == 400
+
+            result = await ac.get(f"/jobs/{job_id}/result")
+            assert result.status_code == 400
+            assert result.json()["detail"] == status["error"]["detail"]
+
+    @pytest.mark.asyncio
+    async def test_running_and_foreign_jobs(self, override_auth_verified):
+        from main import app
+
+        bulk_job_store.put("analysis:mine", _job("mine", user_id=override_auth_verified.id))
+        bulk_job_store.put("analysis:theirs", _job("theirs", user_id=override_auth_verified.id + 1))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            assert (await ac.get("/jobs/mine/result")).status_code == 409
+            assert (await ac.get("/jobs/theirs")).status_code == 403
+            assert (await ac.get("/jobs/missing")).status_code == 404
@@ -36,7 +36,7 @@ from anomaly_summary_generator import (
     _compute_engagement_risk,
     _generate_reference,
 )
-from engagement_export import PLATFORM_VERSION, EngagementExporter
+from engagement_export import PLATFORM_VERSION, EngagementExporter, iter_package_zip
 from engagement_model import ToolName
 from follow_up_items_model import FollowUpSeverity
 from shared.memo_base import RISK_TIER_DISPLAY, validate_risk_tier_coverage
@@ -635,6 +635,54 @@ class TestEngagementZIP:
         with pytest.raises(ValueError, match="not found or access denied"):
             exporter.generate_zip(other.id, eng.id)
 
+    def test_comment_threads_included_and_hashed(
+        self, db_session, make_engagement, make_follow_up_item, make_comment, make_user
+    ):
+        """Comment threads become follow_up_comments.md and are listed in the manifest."""
+        eng = make_engagement()
+        reviewer = make_user(email="reviewer@example.com")
+        item = make_follow_up_item(engagement=eng, description="Suspense balance")
+        parent = make_comment(follow_up_item=item, user=reviewer, comment_text="Please explain")
+        make_comment(follow_up_item=item, user=reviewer, comment_text="Reclassified", parent_comment_id=parent.id)
+
+        zip_bytes, _ = EngagementExporter(db_session).generate_zip(eng.created_by, eng.id)
+
+        zf = ZipFile(BytesIO(zip_bytes))
+        md = zf.read("follow_up_comments.md").decode("utf-8")
+        assert "Suspense balance" in md
+        assert "Please explain" in md
+        assert "  - **" in md  # reply rendered one level deep
+        manifest = json.loads(zf.read("manifest.json"))
+        assert [f["filename"] for f in manifest["files"]] == [
+            "anomaly_summary.pdf",
+            "workpaper_index.json",
+            "follow_up_comments.md",
+        ]
+
+    def test_manifest_is_last_entry(self, db_session, make_engagement):
+        """Manifest is written after every artifact it describes."""
+        eng = make_engagement()
+        zip_bytes, _ = EngagementExporter(db_session).generate_zip(eng.created_by, eng.id)
+        assert ZipFile(BytesIO(zip_bytes)).namelist()[-1] == "manifest.json"
+
+    def test_package_streams_in_multiple_chunks(self, db_session, make_engagement):
+        """iter_package_zip yields output as artifacts are written, not one blob at the end."""
+        eng = make_engagement()
+        package = EngagementExporter(db_session).prepare_package(eng.created_by, eng.id)
+        chunks = list(iter_package_zip(package))
+        assert len(chunks) > 1
+        assert ZipFile(BytesIO(b"".join(chunks))).testzip() is None
+
+    def test_prepared_package_is_picklable(self, db_session, make_engagement, make_follow_up_item):
+        """Render inputs carry no session/ORM state, so they can cross a process boundary."""
+        import pickle
+
+        eng = make_engagement()
+        make_follow_up_item(engagement=eng)
+        package = EngagementExporter(db_session).prepare_package(eng.created_by, eng.id)
+        restored = pickle.loads(pickle.dumps(package))
+        assert [a.filename for a in restored.artifacts] == [a.filename for a in package.artifacts]
+
     def test_zip_does_not_contain_financial_data(self, db_session, make_engagement):
         """ZIP files contain no financial data (Zero-Storage compliance)."""
         eng = make_engagement()
@@ -9,6 +9,7 @@ Tests cover:
 - Chain verification function (empty range, valid chain, broken chain)
 - GET /audit/chain-verify endpoint (success, broken, auth required, validation)
 - Chain hash integration (set on activity creation, links to previous)
+- Signed checkpoints, streaming verification from checkpoints, parallel segments
 """
 
 import sys
@@ -23,12 +24,17 @@ sys.path.insert(0, "..")
 from auth import require_current_user, require_verified_user
 from database import get_db
 from main import app
-from models import ActivityLog, User, UserTier
+from models import ActivityLog, AuditChainCheckpoint, User, UserTier
 from shared.audit_chain import (
     GENESIS_HASH,
+    ChainVerificationResult,
     _serialize_record,
     compute_chain_hash,
+    maybe_write_checkpoint,
+    merge_segment_results,
+    plan_verification_segments,
     verify_audit_chain,
+    verify_audit_chain_parallel,
 )
 
 # =============================================================================
@@ -418,6 +424,148 @@ class TestChainHashOnCreation:
         assert len(hash2) == 128
 
 
+# =============================================================================
+# Checkpoints + segmented verification
+# =============================================================================
+
+
+def _build_chain(db_session, user, count, interval=None):
+    """Chain ``count`` records, writing checkpoints every ``interval`` links."""
+    records = []
+    previous_hash = GENESIS_HASH
+    for i in range(count):
+        record = _make_activity_log(db_session, user, record_count=i + 1)
+        record.chain_hash = compute_chain_hash(previous_hash, record)
+        if interval:
+            maybe_write_checkpoint(db_session, record, interval=interval)
+        db_session.flush()
+        previous_hash = record.chain_hash
+        records.append(record)
+    return records
+
+
+class TestCheckpoints:
+    def test_written_every_interval_links(self, db_session, mock_user):
+        records = _build_chain(db_session, mock_user, 7, interval=3)
+        checkpoints = (
+            db_session.query(AuditChainCheckpoint)
+            .filter_by(user_id=mock_user.id)
+            .order_by(AuditChainCheckpoint.activity_log_id)
+            .all()
+        )
+        assert [c.activity_log_id for c in checkpoints] == [records[2].id, records[5].id]
+        assert all(c.link_count == 3 for c in checkpoints)
+        assert checkpoints[0].chain_hash == records[2].chain_hash
+
+    def test_disabled_with_zero_interval(self, db_session, mock_user):
+        _build_chain(db_session, mock_user, 3, interval=0)
+        assert db_session.query(AuditChainCheckpoint).filter_by(user_id=mock_user.id).count() == 0
+
+    def test_verification_counts_only_requested_range(self, db_session, mock_user):
+        records = _build_chain(db_session, mock_user, 7, interval=3)
+        result = verify_audit_chain(db_session, records[5].id, records[6].id, user_id=mock_user.id)
+        assert result.is_valid
+        assert result.records_checked == 2
+
+    def test_tampering_between_checkpoint_and_range_detected(self, db_session, mock_user):
+        records = _build_chain(db_session, mock_user, 6, interval=3)
+        records[4].chain_hash = "f" * 128
+        db_session.flush()
+        result = verify_audit_chain(db_session, records[5].id, records[5].id, user_id=mock_user.id)
+        assert result.is_valid is False
+        assert result.first_broken_id == records[4].id
+        assert result.records_checked == 0
+
+    def test_forged_checkpoint_rejected(self, db_session, mock_user):
+        records = _build_chain(db_session, mock_user, 4, interval=3)
+        checkpoint = db_session.query(AuditChainCheckpoint).filter_by(user_id=mock_user.id).one()
+        checkpoint.chain_hash = "e" * 128
+        db_session.flush()
+        result = verify_audit_chain(db_session, records[3].id, records[3].id, user_id=mock_user.id)
+        assert result.is_valid is False
+        assert "signature" in result.error_message
+
+
+class TestSegmentedVerification:
+    def test_segments_split_at_checkpoints(self, db_session, mock_user):
+        records = _build_chain(db_session, mock_user, 7, interval=3)
+        segments = plan_verification_segments(db_session, records[0].id, records[6].id, mock_user.id)
+        assert segments == [
+            (records[0].id, records[2].id),
+            (records[2].id + 1, records[5].id),
+            (records[5].id + 1, records[6].id),
+        ]
+
+    def test_parallel_matches_serial(self, db_session, mock_user, monkeypatch):
+        import shared.audit_chain as chain_mod
+
+        class _InlineExecutor:
+            """Runs segments in order on the test session (SQLite test DB is single-connection)."""
+
+            def __init__(self, max_workers):
+                self.max_workers = max_workers
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def map(self, fn, items):
+                return [fn(item) for item in items]
+
+        class _SharedSession:
+            def __getattr__(self, name):
+                return getattr(db_session, name)
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(chain_mod, "ThreadPoolExecutor", _InlineExecutor)
+        records = _build_chain(db_session, mock_user, 10, interval=3)
+        serial = verify_audit_chain(db_session, records[0].id, records[-1].id, user_id=mock_user.id)
+        parallel = verify_audit_chain_parallel(
+            db_session,
+            records[0].id,
+            records[-1].id,
+            mock_user.id,
+            session_factory=_SharedSession,
+            max_workers=4,
+        )
+        assert parallel == serial
+        assert serial.records_checked == 10
+
+        records[7].record_count = 999
+        db_session.flush()
+        broken = verify_audit_chain_parallel(
+            db_session,
+            records[0].id,
+            records[-1].id,
+            mock_user.id,
+            session_factory=_SharedSession,
+            max_workers=4,
+        )
+        assert broken.first_broken_id == records[7].id
+        assert broken.records_checked == 8
+
+    def test_merge_stops_at_first_broken_segment(self):
+        merged = merge_segment_results(
+            [
+                ChainVerificationResult(is_valid=True, records_checked=3),
+                ChainVerificationResult(is_valid=False, records_checked=2, first_broken_id=5, error_message="x"),
+                ChainVerificationResult(is_valid=False, records_checked=1, first_broken_id=9, error_message="y"),
+            ]
+        )
+        assert merged.is_valid is False
+        assert merged.first_broken_id == 5
+        assert merged.records_checked == 5
+
+    def test_merge_all_empty_reports_no_records(self):
+        merged = merge_segment_results([ChainVerificationResult(is_valid=True, records_checked=0)])
+        assert merged.records_checked == 0
+        assert merged.error_message
+
+
 # =============================================================================
 # Secret Domain Separation Tests
 # =============================================================================
@@ -470,3 +618,25 @@ class TestSecretDomainSeparation:
         result_after = verify_audit_chain(db_session, r1.id, r2.id, mock_user.id)
         assert result_after.is_valid, f"Expected valid after rotation, got: {result_after.error_message}"
         assert result_after.records_checked == 2
+
+    def test_checkpoint_signed_with_old_key_survives_rotation(self, db_session, mock_user, monkeypatch):
+        """Checkpoints signed before key rotation still anchor verification via the fallback."""
+        import shared.audit_chain as chain_mod
+
+        records = _build_chain(db_session, mock_user, 5, interval=3)
+        monkeypatch.setattr(chain_mod, "AUDIT_CHAIN_SECRET_KEY", "rotated_audit_chain_key_for_testing_purposes_32chars")
+
+        result = verify_audit_chain(db_session, records[3].id, records[4].id, mock_user.id)
+        assert result.is_valid, f"Expected valid after rotation, got: {result.error_message}"
+        assert result.records_checked == 2
+
+    def test_checkpoint_signed_with_unknown_key_rejected(self, db_session, mock_user, monkeypatch):
+        import shared.audit_chain as chain_mod
+
+        monkeypatch.setattr(chain_mod, "AUDIT_CHAIN_SECRET_KEY", "a_key_that_is_neither_current_nor_legacy_00000")
+        records = _build_chain(db_session, mock_user, 5, interval=3)
+        monkeypatch.setattr(chain_mod, "AUDIT_CHAIN_SECRET_KEY", "rotated_audit_chain_key_for_testing_purposes_32chars")
+
+        result = verify_audit_chain(db_session, records[3].id, records[4].id, mock_user.id)
+        assert result.is_valid is False
+        assert "signature" in result.error_message
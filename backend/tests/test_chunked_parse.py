@@ -0,0 +1,232 @@
+"""
+Tests for the chunked upload parse path — parse_uploaded_file_chunked() and
+the *_chunked testing-engine entry points.
+
+The chunked path must hand engines exactly the rows the whole-file parser
+would, and each engine's chunked entry point must produce the same result
+as its list entry point.
+"""
+
+import csv
+import io
+import math
+import random
+
+import pytest
+from fastapi import HTTPException
+
+from ap_testing_engine import run_ap_testing, run_ap_testing_chunked
+from je_testing_engine import run_je_testing, run_je_testing_chunked
+from payroll_testing_engine import PayrollTestingEngine, run_payroll_testing, run_payroll_testing_chunked
+from revenue_testing_engine import run_revenue_testing, run_revenue_testing_chunked
+from shared.upload_pipeline import MAX_CELL_LENGTH, parse_uploaded_file, parse_uploaded_file_chunked
+
+
+def _csv_bytes(header: list[str], rows: list[list[object]], delimiter: str = ",", encoding: str = "utf-8") -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode(encoding)
+
+
+def _flatten(chunks) -> list[dict]:
+    return [row for chunk in chunks for row in chunk]
+
+
+def _clean(rows: list[dict]) -> list[dict]:
+    return [{k: None if isinstance(v, float) and math.isnan(v) else v for k, v in row.items()} for row in rows]
+
+
+def _gl_rows(count: int, seed: int = 7) -> list[list[object]]:
+    rnd = random.Random(seed)
+    rows: list[list[object]] = []
+    for i in range(count):
+        amount = rnd.choice([round(rnd.uniform(10, 90000), 2), 1000, 5000, 9999.99])
+        debit, credit = (amount, "") if i % 2 == 0 else ("", amount)
+        rows.append(
+            [
+                f"JE{i // 2:05d}",
+                f"2025-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+                rnd.choice(["1000", "01200", "4000", "5100", "6200"]),
+                debit,
+                credit,
+                rnd.choice(["Accrual", "Manual adj", "Reclass", ""]),
+                rnd.choice(["alice", "bob", "admin"]),
+            ]
+        )
+    return rows
+
+
+GL_HEADER = ["Entry ID", "Date", "Account Number", "Debit", "Credit", "Description", "Posted By"]
+
+
+class TestChunkedParse:
+    @pytest.mark.parametrize(
+        ("filename", "delimiter"),
+        [("gl.csv", ","), ("gl.tsv", "\t"), ("gl.txt", "|")],
+    )
+    def test_rows_match_whole_file_parse(self, filename, delimiter):
+        data = _csv_bytes(GL_HEADER, _gl_rows(1234), delimiter=delimiter)
+        columns, rows = parse_uploaded_file(data, filename)
+        chunk_columns, chunks = parse_uploaded_file_chunked(data, filename, chunk_rows=100)
+        chunk_list = list(chunks)
+        assert chunk_columns == columns
+        assert [len(c) for c in chunk_list] == [100] * 12 + [34]
+        assert _clean(_flatten(chunk_list)) == _clean(rows)
+
+    def test_string_columns_stay_strings_in_later_chunks(self):
+        rows = [["A-100", "1.00"]] * 5 + [["01000", "2.00"]] * 5
+        columns, chunks = parse_uploaded_file_chunked(_csv_bytes(["Code", "Amount"], rows), "t.csv", chunk_rows=5)
+        assert [row["Code"] for row in _flatten(chunks)][-1] == "01000"
+
+    def test_latin1_upload(self):
+        data = _csv_bytes(["Account Name", "Amount"], [["Café", 1], ["Dépôt", 2]], encoding="latin-1")
+        _, chunks = parse_uploaded_file_chunked(data, "t.csv")
+        assert [row["Account Name"] for row in _flatten(chunks)] == ["Café", "Dépôt"]
+
+    def test_row_limit_raised_while_iterating(self):
+        # 28 rows pass the pre-parse estimate gate (20% buffer) but not the exact count.
+        data = _csv_bytes(["A", "B"], [[i, i] for i in range(28)])
+        _, chunks = parse_uploaded_file_chunked(data, "t.csv", max_rows=25, chunk_rows=10)
+        assert len(next(chunks)) == 10
+        with pytest.raises(HTTPException) as exc_info:
+            list(chunks)
+        assert exc_info.value.status_code == 400
+        assert "exceeds the maximum" in exc_info.value.detail
+
+    def test_cell_length_checked_in_later_chunk(self):
+        rows = [["ok"]] * 10 + [["x" * (MAX_CELL_LENGTH + 1)]]
+        _, chunks = parse_uploaded_file_chunked(_csv_bytes(["Memo"], rows), "t.csv", chunk_rows=10)
+        with pytest.raises(HTTPException) as exc_info:
+            list(chunks)
+        assert "maximum length" in exc_info.value.detail
+
+    def test_header_only_rejected_up_front(self):
+        with pytest.raises(HTTPException) as exc_info:
+            parse_uploaded_file_chunked(b"A,B\n", "t.csv")
+        assert "no data rows" in exc_info.value.detail
+
+    def test_excel_falls_back_to_whole_file_slices(self):
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Account", "Amount"])
+        for i in range(25):
+            ws.append([f"Acct {i}", i])
+        output = io.BytesIO()
+        wb.save(output)
+
+        columns, chunks = parse_uploaded_file_chunked(output.getvalue(), "t.xlsx", chunk_rows=10)
+        assert columns == ["Account", "Amount"]
+        assert [len(c) for c in chunks] == [10, 10, 5]
+
+    def test_whole_file_slices_release_rows_as_consumed(self):
+        from shared.upload_pipeline import _row_slices
+
+        rows = [{"n": i} for i in range(25)]
+        slices = _row_slices(rows, 10)
+        assert next(slices) == [{"n": i} for i in range(10)]
+        assert len(rows) == 15
+        assert [len(c) for c in slices] == [10, 5]
+        assert rows == []
+
+
+def _run_both(data: bytes, whole, chunked) -> tuple[dict, dict]:
+    columns, rows = parse_uploaded_file(data, "upload.csv")
+    chunk_columns, chunks = parse_uploaded_file_chunked(data, "upload.csv", chunk_rows=97)
+    return whole(rows, columns).to_dict(), chunked(chunks, chunk_columns).to_dict()
+
+
+class TestChunkedEngines:
+    def test_cleanup_runs_when_a_chunk_fails(self, monkeypatch):
+        engine = PayrollTestingEngine()
+        parse = engine.parse_data
+
+        def parse_first_chunk_only(rows, detection, row_offset=0):
+            if row_offset:
+                raise ValueError("bad chunk")
+            return parse(rows, detection, row_offset)
+
+        monkeypatch.setattr(engine, "parse_data", parse_first_chunk_only)
+        header = ["Employee ID", "Employee Name", "Pay Date", "Gross Pay"]
+        row = {"Employee ID": "E1", "Employee Name": "Ann Lee", "Pay Date": "2025-01-15", "Gross Pay": 1000.0}
+        chunks = [[dict(row)], [dict(row)]]
+        with pytest.raises(ValueError, match="bad chunk"):
+            engine.run_pipeline_chunked(iter(chunks), header)
+        # PayrollTestingEngine.cleanup() clears rows; the failed chunk was never parsed.
+        assert chunks == [[], []]
+
+    def test_je(self):
+        data = _csv_bytes(GL_HEADER, _gl_rows(800))
+        whole, chunked = _run_both(
+            data,
+            lambda rows, cols: run_je_testing(rows, cols),
+            lambda chunks, cols: run_je_testing_chunked(chunks, cols),
+        )
+        assert chunked == whole
+
+    def test_ap(self):
+        rnd = random.Random(3)
+        header = ["Invoice Number", "Vendor Name", "Invoice Date", "Payment Date", "Amount", "Check Number"]
+        rows = [
+            [
+                f"INV{rnd.randint(1, 400)}",
+                rnd.choice(["Acme Corp", "ACME Corporation", "Globex", "Initech"]),
+                f"2025-03-{rnd.randint(1, 28):02d}",
+                f"2025-04-{rnd.randint(1, 28):02d}",
+                rnd.choice([round(rnd.uniform(50, 20000), 2), 5000, 10000]),
+                rnd.randint(1000, 1400),
+            ]
+            for _ in range(600)
+        ]
+        whole, chunked = _run_both(
+            _csv_bytes(header, rows),
+            lambda r, c: run_ap_testing(r, c),
+            lambda ch, c: run_ap_testing_chunked(ch, c),
+        )
+        assert chunked == whole
+
+    def test_payroll(self):
+        rnd = random.Random(5)
+        header = ["Employee ID", "Employee Name", "Department", "Pay Date", "Gross Pay", "Net Pay", "Bank Account"]
+        rows = [
+            [
+                f"E{rnd.randint(1, 150):04d}",
+                rnd.choice(["Ann Lee", "Bo Chan", "Cy Diaz", "Di Eng"]) + f" {rnd.randint(1, 40)}",
+                rnd.choice(["Ops", "Sales", ""]),
+                f"2025-0{rnd.randint(1, 9)}-15",
+                round(rnd.uniform(1000, 9000), 2),
+                round(rnd.uniform(800, 7000), 2),
+                f"{rnd.randint(100, 130)}",
+            ]
+            for _ in range(500)
+        ]
+        whole, chunked = _run_both(
+            _csv_bytes(header, rows),
+            lambda r, c: run_payroll_testing(c, r),
+            lambda ch, c: run_payroll_testing_chunked(c, ch),
+        )
+        assert chunked == whole
+
+    def test_revenue(self):
+        rnd = random.Random(9)
+        header = ["Date", "Amount", "Account Name", "Description", "Entry Type", "Reference"]
+        rows = [
+            [
+                f"2025-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}",
+                rnd.choice([round(rnd.uniform(-5000, 90000), 2), 10000, 25000]),
+                rnd.choice(["Product Revenue", "Service Revenue", "Sales Returns"]),
+                rnd.choice(["Invoice", "Manual entry", "Year-end adjustment"]),
+                rnd.choice(["standard", "manual"]),
+                f"REF{rnd.randint(1, 300)}",
+            ]
+            for _ in range(600)
+        ]
+        whole, chunked = _run_both(
+            _csv_bytes(header, rows),
+            lambda r, c: run_revenue_testing(r, c),
+            lambda ch, c: run_revenue_testing_chunked(ch, c),
+        )
+        assert chunked == whole
@@ -0,0 +1,235 @@
+"""
+Tests for the per-client account classification cache.
+
+Covers ``shared.classification_cache`` (scope, persistence, rule-version
+purge, zero-storage keys), the cache hooks in ``AccountClassifier.classify``
+and ``assign_lead_sheet`` (a hit must be indistinguishable from a fresh
+classification), and the multi-period route populating the cache for the
+engagement's client.
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from account_classifier import AccountClassifier
+from classification_cache_model import ClientClassificationCache
+from classification_rules import AccountCategory, ClassificationRule
+from lead_sheet_mapping import LeadSheet, assign_lead_sheet
+from shared.classification_cache import (
+    ClassificationCache,
+    classifier_rule_version,
+    current_classification_cache,
+    load_engagement_classification_cache,
+    normalize_account_key,
+    use_classification_cache,
+)
+
+
+class TestScope:
+    def test_no_cache_by_default(self):
+        assert current_classification_cache() is None
+
+    def test_context_resets_after_block(self):
+        cache = ClassificationCache()
+        with use_classification_cache(cache):
+            assert current_classification_cache() is cache
+        assert current_classification_cache() is None
+
+    def test_rule_version_is_stable_hash(self):
+        assert classifier_rule_version() == classifier_rule_version()
+        assert len(classifier_rule_version()) == 16
+
+
+class TestClassifierHook:
+    def test_hit_matches_fresh_classification(self):
+        classifier = AccountClassifier()
+        fresh = classifier.classify("1000 Cash - Operating", 5000.0)
+
+        cache = ClassificationCache()
+        with use_classification_cache(cache):
+            first = classifier.classify("1000 Cash - Operating", 5000.0)
+            second = classifier.classify("1000 Cash - Operating", 5000.0)
+
+        assert first == fresh
+        assert second == fresh
+        assert cache.hits == 1
+
+    def test_review_flag_uses_unrounded_confidence_on_hit(self, monkeypatch):
+        # 0.696 rounds to the 0.70 review threshold; a fresh run flags it.
+        classifier = AccountClassifier()
+        scores = {category: 0.0 for category in AccountCategory}
+        scores[AccountCategory.ASSET] = 0.696
+        monkeypatch.setattr(classifier, "_calculate_keyword_scores", lambda name: (dict(scores), ["cash"]))
+        fresh = classifier.classify("Petty Cash", 50.0)
+
+        cache = ClassificationCache()
+        with use_classification_cache(cache):
+            miss = classifier.classify("Petty Cash", 50.0)
+            hit = classifier.classify("Petty Cash", 50.0)
+
+        assert cache.hits == 1
+        assert cache.get_classification("Petty Cash").confidence == 0.696
+        assert fresh.confidence == 0.7 and fresh.requires_review
+        assert miss == fresh
+        assert hit == fresh
+
+    def test_abnormal_flag_recomputed_from_live_balance(self):
+        classifier = AccountClassifier()
+        cache = ClassificationCache()
+        with use_classification_cache(cache):
+            normal = classifier.classify("Accounts Payable", -100.0)
+            abnormal = classifier.classify("Accounts Payable", 100.0)
+        assert cache.hits == 1
+        assert not normal.is_abnormal
+        assert abnormal.is_abnormal
+
+    def test_low_confidence_not_cached(self):
+        classifier = AccountClassifier()
+        cache = ClassificationCache()
+        with use_classification_cache(cache):
+            result = classifier.classify("Zzyzx Miscellany", 10.0)
+            again = classifier.classify("Zzyzx Miscellany", 10.0)
+        assert result.confidence < 0.5
+        assert cache.get_classification("Zzyzx Miscellany") is None
+        assert again.suggestions == result.suggestions
+
+    def test_user_override_bypasses_cache(self):
+        cache = ClassificationCache()
+        cache.put_classification("Cash", AccountCategory.ASSET, 0.9, ["cash"])
+        classifier = AccountClassifier(user_overrides={"Cash": "expense"})
+        with use_classification_cache(cache):
+            result = classifier.classify("Cash", 10.0)
+        assert result.category == AccountCategory.EXPENSE
+        assert result.matched_keywords == ["USER_OVERRIDE"]
+
+    def test_custom_rules_bypass_cache(self):
+        cache = ClassificationCache()
+        cache.put_classification("Widget", AccountCategory.ASSET, 0.9, ["widget"])
+        classifier = AccountClassifier(rules=[ClassificationRule("widget", AccountCategory.REVENUE, 0.9)])
+        with use_classification_cache(cache):
+            result = classifier.classify("Widget", -10.0)
+        assert result.category == AccountCategory.REVENUE
+
+
+class TestLeadSheetHook:
+    def test_keyword_match_cached(self):
+        fresh = assign_lead_sheet("Accounts Receivable - Trade")
+        cache = ClassificationCache()
+        with use_classification_cache(cache):
+            assign_lead_sheet("Accounts Receivable - Trade")
+            hit = assign_lead_sheet("Accounts Receivable - Trade")
+        assert hit == fresh
+        assert cache.hits == 1
+
+    def test_no_match_still_uses_live_category_fallback(self):
+        cache = ClassificationCache()
+        with use_classification_cache(cache):
+            first = assign_lead_sheet("Qwerty", AccountCategory.EQUITY)
+            second = assign_lead_sheet("Qwerty", AccountCategory.REVENUE)
+        assert cache.hits == 1
+        assert first.lead_sheet == LeadSheet.K
+        assert second.lead_sheet == LeadSheet.L
+
+
+class TestPersistence:
+    def test_save_and_load_round_trip(self, db_session, make_client):
+        client = make_client()
+        cache = ClassificationCache(client_id=client.id)
+        cache.put_classification("Cash", AccountCategory.ASSET, 0.95, ["cash", "ACCT#1000"])
+        cache.put_lead_sheet("Cash", "A", 1.0, ["cash"])
+        cache.put_lead_sheet("Qwerty", None, 0.0, [])
+        assert cache.save(db_session) == 2
+
+        loaded = ClassificationCache.load(db_session, client.id)
+        assert len(loaded) == 2
+        assert loaded.get_classification("  CASH ").matched_keywords == ["cash", "ACCT#1000"]
+        assert loaded.get_lead_sheet("Cash").lead_sheet == "A"
+        assert loaded.get_lead_sheet("qwerty").lead_sheet is None
+        assert loaded.get_classification("Qwerty") is None
+
+    def test_account_names_are_not_stored(self, db_session, make_client):
+        client = make_client()
+        cache = ClassificationCache(client_id=client.id)
+        cache.put_classification("Secret Holdings LLC", AccountCategory.ASSET, 0.8, [])
+        cache.save(db_session)
+
+        row = db_session.query(ClientClassificationCache).filter_by(client_id=client.id).one()
+        assert row.account_key == normalize_account_key("Secret Holdings LLC")
+        assert "Secret" not in repr(row.__dict__)
+
+    def test_update_existing_row(self, db_session, make_client):
+        client = make_client()
+        cache = ClassificationCache(client_id=client.id)
+        cache.put_classification("Cash", AccountCategory.ASSET, 0.95, ["cash"])
+        cache.save(db_session)
+
+        loaded = ClassificationCache.load(db_session, client.id)
+        loaded.put_lead_sheet("Cash", "A", 1.0, ["cash"])
+        assert loaded.save(db_session) == 1
+        rows = db_session.query(ClientClassificationCache).filter_by(client_id=client.id).all()
+        assert len(rows) == 1
+        assert rows[0].category == "asset"
+        assert rows[0].lead_sheet == "A"
+
+    def test_save_purges_stale_rule_versions(self, db_session, make_client):
+        client = make_client()
+        stale = ClassificationCache(client_id=client.id, rule_version="0" * 16)
+        stale.put_classification("Cash", AccountCategory.ASSET, 0.95, ["cash"])
+        stale.save(db_session)
+        assert ClassificationCache.load(db_session, client.id).get_classification("Cash") is None
+
+        current = ClassificationCache(client_id=client.id)
+        current.put_classification("Rent Expense", AccountCategory.EXPENSE, 0.9, ["rent"])
+        current.save(db_session)
+        versions = {r.rule_version for r in db_session.query(ClientClassificationCache).filter_by(client_id=client.id)}
+        assert versions == {classifier_rule_version()}
+
+    def test_run_local_cache_never_persists(self, db_session):
+        cache = ClassificationCache()
+        cache.put_classification("Cash", AccountCategory.ASSET, 0.95, ["cash"])
+        assert cache.save(db_session) == 0
+
+
+class TestEngagementLoader:
+    def test_none_without_engagement(self, db_session):
+        assert load_engagement_classification_cache(db_session, 1, None) is None
+
+    def test_inaccessible_engagement_returns_none(self, db_session, make_engagement, make_user):
+        engagement = make_engagement()
+        outsider = make_user(email="outsider@example.com")
+        assert load_engagement_classification_cache(db_session, outsider.id, engagement.id) is None
+
+    def test_loads_for_owning_client(self, db_session, make_engagement):
+        engagement = make_engagement()
+        owner_id = engagement.client.user_id
+        cache = load_engagement_classification_cache(db_session, owner_id, engagement.id)
+        assert cache is not None
+        assert cache.client_id == engagement.client_id
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestMultiPeriodRoute:
+    @pytest.mark.asyncio
+    async def test_compare_periods_populates_client_cache(self, db_session, override_auth_verified, make_engagement):
+        from main import app
+
+        engagement = make_engagement(user=override_auth_verified)
+        accounts = [
+            {"account": "Cash", "debit": 5000, "credit": 0, "type": "asset"},
+            {"account": "Accounts Payable", "debit": 0, "credit": 900, "type": "liability"},
+        ]
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post(
+                "/audit/compare-periods",
+                json={"prior_accounts": accounts, "current_accounts": accounts, "engagement_id": engagement.id},
+            )
+        assert r.status_code == 200, r.text
+
+        cached = ClassificationCache.load(db_session, engagement.client_id)
+        assert cached.get_lead_sheet("Accounts Payable") is not None
+        assert cached.get_lead_sheet("Cash") is not None
@@ -356,6 +356,34 @@ class TestRunCleanupJob:
         assert telemetry_dict["records_processed"] == 8
 
 
+    def test_batch_recorder_reports_batches(self):
+        """Batched jobs log one cleanup_batch event per batch and count them."""
+        from cleanup_scheduler import BatchTelemetryRecorder, _run_cleanup_job
+        from retention_cleanup import RetentionBatch
+
+        recorder = BatchTelemetryRecorder("retention_test")
+
+        def batched(db):
+            for n in (1, 2):
+                recorder(RetentionBatch("activity_logs", n, 100, n * 100 - 99, n * 100, 1.5))
+            return {"activity_logs": 200}
+
+        with (
+            patch("database.SessionLocal", return_value=MagicMock()),
+            patch("cleanup_scheduler.logger") as mock_logger,
+        ):
+            _run_cleanup_job("retention_test", batched, is_retention=True, batch_recorder=recorder)
+
+        logged = [c[0][1] for c in mock_logger.info.call_args_list]
+        batch_events = [d for d in logged if d["event"] == "cleanup_batch"]
+        assert [d["batch_number"] for d in batch_events] == [1, 2]
+        assert batch_events[0]["rows_archived"] == 100
+        job_event = logged[-1]
+        assert job_event["event"] == "cleanup_job"
+        assert job_event["batches"] == 2
+        assert job_event["records_processed"] == 200
+
+
 # ---------------------------------------------------------------------------
 # TestWatchdog
 # ---------------------------------------------------------------------------
@@ -19,6 +19,7 @@ from shared.account_extractors import (
     extract_flux_accounts,
     extract_je_accounts,
     extract_multi_period_accounts,
+    extract_multi_period_panel_accounts,
     extract_revenue_accounts,
     extract_tb_accounts,
 )
@@ -100,6 +101,23 @@ class TestExtractMultiPeriodAccounts:
         assert extract_multi_period_accounts(result) == ["Cash"]
 
 
+class TestExtractMultiPeriodPanelAccounts:
+    """Extract from Multi-Period panel rows — any material/significant step flags the account."""
+
+    def test_empty_result(self):
+        assert extract_multi_period_panel_accounts({}) == []
+
+    def test_flags_any_significant_step(self):
+        result = {
+            "accounts": [
+                {"account_name": "Cash", "movements": [{"significance": "minor"}, {"significance": "material"}]},
+                {"account_name": "Petty Cash", "movements": [{"significance": "minor"}, None]},
+                {"account_name": "AR", "movements": [None, {"significance": "significant"}]},
+            ]
+        }
+        assert extract_multi_period_panel_accounts(result) == ["AR", "Cash"]
+
+
 class TestExtractJeAccounts:
     """Extract from JE Testing test_results."""
 
@@ -0,0 +1,203 @@
+"""Tests for depreciation_register_engine — batch schedules for a whole register.
+
+The contract is entry-for-entry equality with ``generate_depreciation_schedule``,
+so most tests compare ``to_dict()`` output of both paths.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import random
+from decimal import Decimal
+
+import httpx
+import pytest
+
+import depreciation_register_engine as dre
+from depreciation_engine import (
+    AssetConfig,
+    BookMethod,
+    DepreciationInputError,
+    MacrsConvention,
+    MacrsSystem,
+    generate_depreciation_schedule,
+)
+from depreciation_register_engine import generate_depreciation_register
+
+
+def _random_config(rnd: random.Random, i: int) -> AssetConfig:
+    method = rnd.choice(list(BookMethod))
+    cost = Decimal(rnd.choice([rnd.randint(1, 10**8), rnd.randint(1, 1000), 100 * rnd.randint(1, 1000) + 1])) / 100
+    salvage = Decimal(rnd.randint(0, int(cost * 100) - 1)) / 100 if rnd.random() < 0.5 else Decimal("0")
+    kwargs: dict = {}
+    if method == BookMethod.UNITS_OF_PRODUCTION:
+        kwargs["units_total"] = Decimal(rnd.randint(1, 1000))
+        kwargs["units_per_year"] = [Decimal(rnd.randint(0, 300)) for _ in range(rnd.randint(1, 8))]
+    if method == BookMethod.DECLINING_BALANCE:
+        kwargs["db_factor"] = rnd.choice([Decimal("2"), Decimal("1.5"), Decimal("3")])
+    if rnd.random() < 0.7:
+        convention = rnd.choice(list(MacrsConvention))
+        kwargs.update(
+            macrs_system=MacrsSystem.GDS_200,
+            macrs_convention=convention,
+            macrs_property_class=5 if convention != MacrsConvention.HALF_YEAR else rnd.choice([3, 5, 7, 10, 15, 20]),
+            placed_in_service_quarter=rnd.randint(1, 4),
+            placed_in_service_month=rnd.randint(1, 12),
+            tax_rate=rnd.choice([Decimal("0.21"), Decimal("0.25"), Decimal("0"), Decimal("0.3333")]),
+        )
+    return AssetConfig(
+        asset_name=f"Asset {i}",
+        cost=cost,
+        salvage_value=salvage,
+        useful_life_years=rnd.choice([1, 2, 3, 5, 7, 10, 15, 27, 39, 50]),
+        placed_in_service_year=rnd.choice([None, 2020]),
+        book_method=method,
+        **kwargs,
+    )
+
+
+def _assert_matches_single_path(configs: list[AssetConfig]) -> None:
+    register = generate_depreciation_register(configs)
+    assert len(register.results) == len(configs)
+    for config, result in zip(configs, register.results):
+        assert result.to_dict() == generate_depreciation_schedule(config).to_dict(), config.asset_name
+
+
+class TestEquivalence:
+    def test_random_register_matches_single_asset_path(self):
+        rnd = random.Random(626)
+        _assert_matches_single_path([_random_config(rnd, i) for i in range(1500)])
+
+    def test_float_path_matches_without_fallback(self, monkeypatch):
+        # Force every asset through the array path: values away from a
+        # half cent must round identically without the Decimal safety net.
+        configs = [
+            AssetConfig(asset_name="SL", cost=Decimal("12345.67"), useful_life_years=7),
+            AssetConfig(
+                asset_name="DDB",
+                cost=Decimal("98765.43"),
+                salvage_value=Decimal("1234.56"),
+                useful_life_years=9,
+                book_method=BookMethod.DECLINING_BALANCE,
+                macrs_system=MacrsSystem.GDS_200,
+                macrs_property_class=7,
+            ),
+            AssetConfig(
+                asset_name="SYD",
+                cost=Decimal("55555.55"),
+                useful_life_years=11,
+                book_method=BookMethod.SUM_OF_YEARS_DIGITS,
+            ),
+        ]
+        register = generate_depreciation_register(configs)
+        assert register.decimal_fallbacks == 0
+        monkeypatch.setattr(dre, "generate_depreciation_schedule", None)
+        _assert_matches_single_path(configs)
+
+    def test_half_cent_values_fall_back_to_decimal(self):
+        # 0.01 / 6 × 3 is 0.005 in exact arithmetic but 0.00499… in
+        # 28-digit Decimal, so the two paths would round differently.
+        config = AssetConfig(asset_name="tie", cost=Decimal("1.01"), salvage_value=Decimal("1.00"), useful_life_years=6)
+        register = generate_depreciation_register([config])
+        assert register.decimal_fallbacks == 1
+        assert register.results[0].to_dict() == generate_depreciation_schedule(config).to_dict()
+
+    def test_negative_zero_deferred_tax_preserved(self):
+        config = AssetConfig(
+            asset_name="nz",
+            cost=Decimal("100.01"),
+            useful_life_years=3,
+            macrs_system=MacrsSystem.GDS_200,
+            macrs_property_class=3,
+            tax_rate=Decimal("0"),
+        )
+        _assert_matches_single_path([config])
+        comparison = generate_depreciation_register([config]).results[0].book_tax_comparison
+        assert "-0.00" in {str(row.deferred_tax_change) for row in comparison}
+
+    def test_register_totals(self):
+        configs = [
+            AssetConfig(asset_name="A", cost=Decimal("1000"), useful_life_years=4),
+            AssetConfig(asset_name="B", cost=Decimal("600"), useful_life_years=3),
+        ]
+        register = generate_depreciation_register(configs)
+        assert register.total_book_depreciation == Decimal("1600.00")
+        assert register.to_dict()["asset_count"] == 2
+
+
+class TestValidation:
+    def test_invalid_asset_named_in_error(self):
+        configs = [
+            AssetConfig(asset_name="Good", cost=Decimal("100"), useful_life_years=2),
+            AssetConfig(asset_name="Bad", cost=Decimal("100"), salvage_value=Decimal("150")),
+        ]
+        with pytest.raises(DepreciationInputError, match=r"Asset 2 \(Bad\): Salvage value"):
+            generate_depreciation_register(configs)
+
+    def test_empty_register(self):
+        register = generate_depreciation_register([])
+        assert register.results == []
+        assert register.total_book_depreciation == Decimal("0.00")
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestRegisterRoutes:
+    PAYLOAD = {
+        "assets": [
+            {
+                "asset_name": "Truck",
+                "cost": "50000",
+                "useful_life_years": 5,
+                "macrs_system": "gds_200db",
+                "macrs_property_class": 5,
+            },
+            {
+                "asset_name": "Press",
+                "cost": "12000",
+                "salvage_value": "2000",
+                "useful_life_years": 4,
+                "book_method": "sum_of_years_digits",
+            },
+        ]
+    }
+
+    @pytest.mark.asyncio
+    async def test_register_matches_single_endpoint(self, override_auth_verified):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/depreciation/register", json=self.PAYLOAD)
+            single = await ac.post("/audit/depreciation", json=self.PAYLOAD["assets"][0])
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["asset_count"] == 2
+        assert body["assets"][0] == single.json()
+        assert body["total_book_depreciation"] == "60000.00"
+
+    @pytest.mark.asyncio
+    async def test_invalid_numeric_names_asset(self, override_auth_verified):
+        from main import app
+
+        payload = {
+            "assets": [self.PAYLOAD["assets"][0], {"asset_name": "Broken", "cost": "abc", "useful_life_years": 3}]
+        }
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/depreciation/register", json=payload)
+        assert r.status_code == 400
+        assert r.json()["detail"].startswith("Asset 2 (Broken)")
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self, override_auth_verified):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/depreciation/register/export.csv", json=self.PAYLOAD)
+        assert r.status_code == 200
+        rows = list(csv.reader(io.StringIO(r.text)))
+        assert rows[0][:3] == ["Asset", "Schedule", "Year"]
+        # Truck: 5 book + 6 MACRS years; Press: 4 book years.
+        assert sum(1 for row in rows if row[:2] == ["Truck", "Book"]) == 5
+        assert sum(1 for row in rows if row[:2] == ["Truck", "Tax"]) == 6
+        assert sum(1 for row in rows if row[:2] == ["Press", "Book"]) == 4
+        assert rows[-1] == ["Register Total", "60000.00", "50000.00", "0.00"]
@@ -0,0 +1,172 @@
+"""
+Tests for shared.engine_pool — CPU-bound tool engines on worker processes
+with per-tool admission limits.
+"""
+
+import asyncio
+import os
+import threading
+from multiprocessing import shared_memory
+
+import pytest
+from fastapi import HTTPException
+
+from shared import engine_pool
+
+
+def _describe(file_bytes: bytes, suffix: str) -> tuple[int, bytes]:
+    return os.getpid(), file_bytes + suffix.encode()
+
+
+def _reject(file_bytes: bytes) -> None:
+    raise HTTPException(status_code=400, detail={"code": "FORMAT_DISABLED", "size": len(file_bytes)})
+
+
+def _fail(file_bytes: bytes) -> None:
+    raise ValueError("bad upload")
+
+
+def _die(file_bytes: bytes) -> None:
+    os._exit(1)
+
+
+def _chunk_pid(chunk: list[int]) -> tuple[int, list[int]]:
+    return os.getpid(), [value * 2 for value in chunk]
+
+
+def _die_on_chunk(chunk: list[int]) -> None:
+    os._exit(1)
+
+
+def _wait(file_bytes: bytes, started: threading.Event, release: threading.Event) -> bytes:
+    started.set()
+    release.wait(5)
+    return file_bytes
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    engine_pool.shutdown_engine_pool()
+    yield
+    engine_pool.shutdown_engine_pool()
+
+
+class TestInlineMode:
+    def test_disabled_pool_runs_on_thread(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 0)
+        pid, data = asyncio.run(engine_pool.run_engine_job("tool", _describe, b"abc", "!"))
+        assert pid == os.getpid()
+        assert data == b"abc!"
+
+    def test_disabled_pool_maps_inline(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 0)
+        results = engine_pool.map_engine_pool(_chunk_pid, [[1], [2, 3]])
+        assert results == [(os.getpid(), [2]), (os.getpid(), [4, 6])]
+
+    def test_engine_exceptions_propagate(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 0)
+        with pytest.raises(ValueError, match="bad upload"):
+            asyncio.run(engine_pool.run_engine_job("tool", _fail, b""))
+
+
+class TestAdmission:
+    def test_saturated_tool_returns_429_with_retry_after(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 0)
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_TOOL_CONCURRENCY", 1)
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_QUEUE_DEPTH", 1)
+        started, release = threading.Event(), threading.Event()
+
+        async def scenario() -> list:
+            running = asyncio.ensure_future(engine_pool.run_engine_job("je", _wait, b"1", started, release))
+            await asyncio.to_thread(started.wait, 5)
+            queued = asyncio.ensure_future(engine_pool.run_engine_job("je", _describe, b"2", ""))
+            await asyncio.sleep(0)  # let it take the queue place
+            with pytest.raises(HTTPException) as exc_info:
+                await engine_pool.run_engine_job("je", _describe, b"3", "")
+            # Other tools are admitted independently.
+            other = await engine_pool.run_engine_job("ap", _describe, b"4", "")
+            release.set()
+            return [exc_info.value, await running, await queued, other]
+
+        rejected, first, second, other = asyncio.run(scenario())
+        assert rejected.status_code == 429
+        assert int(rejected.headers["Retry-After"]) >= 1
+        assert first == b"1"
+        assert second[1] == b"2"
+        assert other[1] == b"4"
+        assert engine_pool._gate("je").admitted == 0
+
+    def test_per_tool_limit_override(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_TOOL_LIMITS", "journal_entry_testing=1, trial_balance=4,bad=x")
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_TOOL_CONCURRENCY", 2)
+        assert engine_pool._configured_limit("journal_entry_testing") == 1
+        assert engine_pool._configured_limit("trial_balance") == 4
+        assert engine_pool._configured_limit("bad") == 2
+        assert engine_pool._configured_limit("ap_testing") == 2
+
+
+class TestProcessPool:
+    def test_runs_in_worker_via_shared_memory(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 1)
+        created: list[str] = []
+        real = shared_memory.SharedMemory
+
+        def tracking(*args, **kwargs):
+            segment = real(*args, **kwargs)
+            if kwargs.get("create"):
+                created.append(segment.name)
+            return segment
+
+        monkeypatch.setattr(engine_pool.shared_memory, "SharedMemory", tracking)
+        payload = os.urandom(256 * 1024)
+        pid, data = asyncio.run(engine_pool.run_engine_job("tool", _describe, payload, "."))
+        assert pid != os.getpid()
+        assert data == payload + b"."
+        assert len(created) == 1
+        with pytest.raises(FileNotFoundError):
+            real(name=created[0])  # unlinked once the run finished
+
+    def test_http_errors_cross_the_process_boundary(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 1)
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(engine_pool.run_engine_job("tool", _reject, b"xyz"))
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == {"code": "FORMAT_DISABLED", "size": 3}
+
+    def test_workers_recycled_after_max_tasks(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 1)
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_MAX_TASKS_PER_CHILD", 1)
+
+        async def two_runs() -> set[int]:
+            first, _ = await engine_pool.run_engine_job("tool", _describe, b"", "")
+            second, _ = await engine_pool.run_engine_job("tool", _describe, b"", "")
+            return {first, second}
+
+        assert len(asyncio.run(two_runs())) == 2
+
+    def test_empty_upload(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 1)
+        _, data = asyncio.run(engine_pool.run_engine_job("tool", _describe, b"", "x"))
+        assert data == b"x"
+
+    def test_broken_worker_returns_503(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 1)
+        pool = engine_pool.get_engine_pool()
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(engine_pool.run_engine_job("tool", _die, b""))
+        assert exc_info.value.status_code == 503
+        assert engine_pool.get_engine_pool() is not pool
+
+    def test_map_runs_chunks_in_workers_in_order(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 2)
+        results = engine_pool.map_engine_pool(_chunk_pid, [[1], [2, 3], [4]])
+        assert [doubled for _, doubled in results] == [[2], [4, 6], [8]]
+        assert os.getpid() not in {pid for pid, _ in results}
+
+    def test_map_broken_worker_returns_503(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(engine_pool, "ENGINE_POOL_WORKERS", 1)
+        pool = engine_pool.get_engine_pool()
+        with pytest.raises(HTTPException) as exc_info:
+            engine_pool.map_engine_pool(_die_on_chunk, [[1]])
+        assert exc_info.value.status_code == 503
+        assert engine_pool.get_engine_pool() is not pool
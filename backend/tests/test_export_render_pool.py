@@ -0,0 +1,64 @@
+"""
+Tests for shared.export_render_pool — the worker pool behind parallel
+engagement package rendering.
+"""
+
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from shared import export_render_pool
+
+
+def _boom() -> bytes:
+    raise ValueError("render failed")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    export_render_pool.shutdown_render_pool()
+    yield
+    export_render_pool.shutdown_render_pool()
+
+
+class TestInlineMode:
+    def test_disabled_pool_runs_inline(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(export_render_pool, "ENGAGEMENT_EXPORT_WORKERS", 0)
+        assert export_render_pool.get_render_pool() is None
+        future = export_render_pool.submit_render(sorted, [3, 1, 2])
+        assert future.done()
+        assert export_render_pool.render_result(future, sorted, [3, 1, 2]) == [1, 2, 3]
+
+    def test_inline_exceptions_propagate(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(export_render_pool, "ENGAGEMENT_EXPORT_WORKERS", 0)
+        future = export_render_pool.submit_render(_boom)
+        with pytest.raises(ValueError, match="render failed"):
+            export_render_pool.render_result(future, _boom)
+
+
+class TestProcessPool:
+    def test_renders_in_worker_process(self, monkeypatch: pytest.MonkeyPatch):
+        from engagement_export import render_workpaper_index_json
+
+        monkeypatch.setattr(export_render_pool, "ENGAGEMENT_EXPORT_WORKERS", 1)
+        pool = export_render_pool.get_render_pool()
+        assert pool is not None
+        assert export_render_pool.get_render_pool() is pool  # shared, created once
+
+        future = export_render_pool.submit_render(render_workpaper_index_json, {"a": 1})
+        assert export_render_pool.render_result(future, render_workpaper_index_json, {"a": 1}) == b'{\n  "a": 1\n}'
+
+    def test_broken_pool_falls_back_inline(self, monkeypatch: pytest.MonkeyPatch):
+        from concurrent.futures import Future
+
+        monkeypatch.setattr(export_render_pool, "ENGAGEMENT_EXPORT_WORKERS", 1)
+        pool = export_render_pool.get_render_pool()
+        broken: Future = Future()
+        broken.set_exception(BrokenProcessPool("worker died"))
+
+        assert export_render_pool.render_result(broken, sorted, [2, 1]) == [1, 2]
+        assert export_render_pool.get_render_pool() is not pool  # replaced on next use
+
+    def test_shutdown_is_idempotent(self):
+        export_render_pool.shutdown_render_pool()
+        export_render_pool.shutdown_render_pool()
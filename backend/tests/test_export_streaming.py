@@ -0,0 +1,225 @@
+"""
+Tests for the bounded-memory diagnostic export path.
+
+Covers ``shared.export_spool`` (spool sizing, threshold resolution, chunked
+draining), the write-only Excel workpaper (must match the in-memory
+workbook cell-for-cell), chunked ledger tables in the PDF, and the
+pipeline's switch between the bytes path and the spooled path.
+"""
+
+from __future__ import annotations
+
+import io
+from unittest.mock import patch
+
+import pytest
+from openpyxl import load_workbook
+from pypdf import PdfReader
+
+import config
+from excel_generator import generate_workpaper, write_workpaper
+from export.pipeline import export_diagnostic_excel, export_diagnostic_pdf
+from pdf.orchestrator import generate_audit_report, write_audit_report
+from pdf.sections.diagnostic import EXCEPTION_TABLE_CHUNK_ROWS, _chunk_rows
+from shared import export_spool
+from shared.schemas import AuditResultInput
+
+
+def _anomalies(count: int) -> list[dict]:
+    return [
+        {
+            "account": f"{4000 + i} - Account {i}",
+            "type": "Liability" if i % 2 else "Asset",
+            "issue": "Abnormal credit balance" if i % 2 else "Suspense account with material balance",
+            "amount": -100.0 - i if i % 2 else 1500.0 + i,
+            "materiality": "material" if i % 3 else "immaterial",
+        }
+        for i in range(count)
+    ]
+
+
+def _audit_result(count: int) -> dict:
+    return {
+        "status": "balanced",
+        "balanced": True,
+        "total_debits": 100000.0,
+        "total_credits": 100000.0,
+        "difference": 0.0,
+        "row_count": count,
+        "message": "Balanced",
+        "abnormal_balances": _anomalies(count),
+        "has_risk_alerts": count > 0,
+        "materiality_threshold": 1000.0,
+        "material_count": sum(1 for i in range(count) if i % 3),
+        "immaterial_count": sum(1 for i in range(count) if not i % 3),
+        "risk_summary": {},
+        "filename": "LargeTB",
+    }
+
+
+async def _drain(response) -> bytes:
+    chunks = [chunk async for chunk in response.body_iterator]
+    return b"".join(chunks)
+
+
+# ---------------------------------------------------------------------------
+# shared.export_spool
+# ---------------------------------------------------------------------------
+
+
+class TestExportSpoolSettings:
+    def test_defaults(self):
+        assert export_spool.spool_max_memory_bytes() == export_spool.DEFAULT_SPOOL_MAX_MEMORY_MB * 1024 * 1024
+        assert export_spool.streaming_row_threshold() == export_spool.DEFAULT_STREAMING_ROW_THRESHOLD
+
+    @pytest.mark.parametrize("value", [0, -4])
+    def test_invalid_values_fall_back_to_default(self, monkeypatch: pytest.MonkeyPatch, value: int):
+        monkeypatch.setattr(config, "EXPORT_STREAMING_ROW_THRESHOLD", value)
+        assert export_spool.streaming_row_threshold() == export_spool.DEFAULT_STREAMING_ROW_THRESHOLD
+
+    def test_threshold_is_inclusive(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "EXPORT_STREAMING_ROW_THRESHOLD", 10)
+        assert not export_spool.should_stream_export(9)
+        assert export_spool.should_stream_export(10)
+
+
+class TestSpoolDraining:
+    def test_spool_rolls_over_to_disk_beyond_memory_cap(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "EXPORT_SPOOL_MAX_MEMORY_MB", 1)
+        spool = export_spool.new_export_spool()
+        try:
+            spool.write(b"x" * (1024 * 1024 + 1))
+            assert spool._rolled  # type: ignore[attr-defined]
+        finally:
+            spool.close()
+
+    def test_iter_spool_yields_everything_in_bounded_chunks_and_closes(self):
+        spool = export_spool.new_export_spool()
+        payload = bytes(range(256)) * 1000
+        spool.write(payload)
+        chunks = list(export_spool.iter_spool(spool, chunk_size=4096))
+        assert b"".join(chunks) == payload
+        assert max(len(c) for c in chunks) <= 4096
+        assert spool.closed
+
+    def test_abandoned_iteration_still_closes_spool(self):
+        spool = export_spool.new_export_spool()
+        spool.write(b"a" * 10_000)
+        iterator = export_spool.iter_spool(spool, chunk_size=100)
+        next(iterator)
+        iterator.close()
+        assert spool.closed
+
+    def test_response_sets_content_length(self):
+        spool = export_spool.new_export_spool()
+        spool.write(b"%PDF-1.4 spooled")
+        response = export_spool.streaming_spool_response(spool, "Report.pdf", "application/pdf")
+        assert response.headers["content-length"] == str(len(b"%PDF-1.4 spooled"))
+        assert 'filename="Report.pdf"' in response.headers["content-disposition"]
+
+
+# ---------------------------------------------------------------------------
+# Generators
+# ---------------------------------------------------------------------------
+
+
+class TestWriteOnlyWorkpaper:
+    def test_matches_in_memory_workbook(self):
+        result = _audit_result(40)
+        expected = load_workbook(io.BytesIO(generate_workpaper(result, "LargeTB")))
+
+        buffer = io.BytesIO()
+        write_workpaper(result, buffer, "LargeTB")
+        actual = load_workbook(io.BytesIO(buffer.getvalue()))
+
+        assert actual.sheetnames == expected.sheetnames
+        for name in expected.sheetnames:
+            exp_ws, act_ws = expected[name], actual[name]
+            assert act_ws.max_row == exp_ws.max_row, name
+            # The cover sheet carries a generation timestamp; compare the rest.
+            for exp_row, act_row in zip(exp_ws.iter_rows(values_only=True), act_ws.iter_rows(values_only=True)):
+                if any(isinstance(v, str) and "Generated" in v for v in exp_row if v):
+                    continue
+                assert act_row == exp_row, name
+            assert sorted(map(str, act_ws.merged_cells.ranges)) == sorted(map(str, exp_ws.merged_cells.ranges))
+
+
+class TestChunkedLedgerTables:
+    def test_chunk_rows_sizes(self):
+        rows = list(range(EXCEPTION_TABLE_CHUNK_ROWS * 2 + 5))
+        chunks = _chunk_rows(rows)
+        assert [len(c) for c in chunks] == [EXCEPTION_TABLE_CHUNK_ROWS, EXCEPTION_TABLE_CHUNK_ROWS, 5]
+        assert _chunk_rows([]) == [[]]
+
+    def test_chunk_size_is_even_for_continuous_row_banding(self):
+        assert EXCEPTION_TABLE_CHUNK_ROWS % 2 == 0
+
+    def test_large_report_renders_every_anomaly_into_stream(self):
+        count = EXCEPTION_TABLE_CHUNK_ROWS * 2 + 7
+        buffer = io.BytesIO()
+        write_audit_report(_audit_result(count), buffer, "LargeTB")
+
+        text = "\n".join(page.extract_text() or "" for page in PdfReader(io.BytesIO(buffer.getvalue())).pages)
+        assert f"Account {count - 1}" in text
+        assert "TOTAL" in text
+
+    def test_generate_audit_report_wraps_writer(self):
+        pdf_bytes = generate_audit_report(_audit_result(3), "LargeTB")
+        assert pdf_bytes.startswith(b"%PDF")
+
+
+# ---------------------------------------------------------------------------
+# export.pipeline branch selection
+# ---------------------------------------------------------------------------
+
+
+class TestPipelineStreamingBranch:
+    @pytest.mark.asyncio
+    async def test_small_export_uses_bytes_path(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "EXPORT_STREAMING_ROW_THRESHOLD", 100)
+        with (
+            patch("export.serializers.pdf.generate_audit_report", return_value=b"%PDF-1.4 fake") as bytes_path,
+            patch("export.serializers.pdf.write_audit_report") as stream_path,
+        ):
+            response = export_diagnostic_pdf(AuditResultInput(**_audit_result(2)), user_id=1)
+        assert await _drain(response) == b"%PDF-1.4 fake"
+        bytes_path.assert_called_once()
+        stream_path.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_pdf_export_is_spooled(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "EXPORT_STREAMING_ROW_THRESHOLD", 5)
+        response = export_diagnostic_pdf(AuditResultInput(**_audit_result(5)), user_id=1)
+        body = await _drain(response)
+        assert body.startswith(b"%PDF")
+        assert response.headers["content-length"] == str(len(body))
+        assert response.media_type == "application/pdf"
+
+    @pytest.mark.asyncio
+    async def test_large_excel_export_is_spooled(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "EXPORT_STREAMING_ROW_THRESHOLD", 5)
+        with patch("export.serializers.excel.generate_workpaper") as bytes_path:
+            response = export_diagnostic_excel(AuditResultInput(**_audit_result(8)), user_id=1)
+        body = await _drain(response)
+        bytes_path.assert_not_called()
+        wb = load_workbook(io.BytesIO(body))
+        assert len(wb.sheetnames) > 1
+        assert "LargeTB_Workpaper_" in response.headers["content-disposition"]
+
+    def test_spool_closed_when_rendering_fails(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "EXPORT_STREAMING_ROW_THRESHOLD", 1)
+        spools = []
+        real_new = export_spool.new_export_spool
+
+        def _tracking_spool():
+            spool = real_new()
+            spools.append(spool)
+            return spool
+
+        with (
+            patch("export.pipeline.new_export_spool", side_effect=_tracking_spool),
+            patch("export.serializers.excel.write_workpaper", side_effect=ValueError("boom")),
+            pytest.raises(Exception),
+        ):
+            export_diagnostic_excel(AuditResultInput(**_audit_result(3)), user_id=1)
+        assert spools and all(s.closed for s in spools)
@@ -0,0 +1,199 @@
+"""Tests for financing_portfolio_engine — loan books and lease portfolios in one request.
+
+Each instrument's schedule must equal the single-instrument engine's, so the
+equivalence tests compare ``to_dict()`` output of both paths.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from datetime import date
+from decimal import Decimal
+
+import httpx
+import pytest
+
+import config
+import shared.engine_pool as engine_pool
+from financing_portfolio_engine import (
+    MATURITY_LABELS,
+    PortfolioInputError,
+    PortfolioLoan,
+    generate_financing_portfolio,
+)
+from lease_accounting_engine import LeaseConfig, compute_lease_accounting
+from loan_amortization_engine import LoanConfig, generate_amortization_schedule
+
+
+def _loan(name: str = "Term A", principal: str = "120000", term: int = 24, **kwargs) -> PortfolioLoan:
+    return PortfolioLoan(
+        name=name,
+        config=LoanConfig(principal=Decimal(principal), annual_rate=Decimal("0.06"), term_periods=term, **kwargs),
+    )
+
+
+def _lease(name: str = "Store 1", payment: str = "5000", term: int = 36, **kwargs) -> LeaseConfig:
+    return LeaseConfig(
+        lease_name=name,
+        payment_amount=Decimal(payment),
+        term_periods=term,
+        annual_discount_rate=Decimal("0.05"),
+        **kwargs,
+    )
+
+
+class TestEquivalence:
+    def test_schedules_match_single_instrument_engines(self):
+        loans = [_loan(f"L{i}", principal=str(10000 + i * 137), term=12 + i) for i in range(5)]
+        leases = [_lease(f"S{i}", payment=str(1000 + i * 91), term=24 + i) for i in range(5)]
+        result = generate_financing_portfolio(loans, leases)
+        for loan, amortization in zip(loans, result.loan_results):
+            assert amortization.to_dict() == generate_amortization_schedule(loan.config).to_dict()
+        for lease, accounting in zip(leases, result.lease_results):
+            assert accounting.to_dict() == compute_lease_accounting(lease).to_dict()
+        assert result.instrument_count == 10
+
+    def test_chunked_pool_path_matches_inline(self, monkeypatch):
+        loans = [_loan(f"L{i}", principal=str(5000 + i), term=6 + i % 5) for i in range(9)]
+        leases = [_lease(f"S{i}", term=12 + i % 3) for i in range(7)]
+        inline = generate_financing_portfolio(loans, leases).to_dict()
+
+        submitted: list[int] = []
+        real_map = engine_pool.map_engine_pool
+
+        def counting_map(fn, chunks):
+            submitted.extend(len(chunk) for chunk in chunks)
+            return real_map(fn, chunks)
+
+        monkeypatch.setattr(config, "FINANCING_PORTFOLIO_POOL_THRESHOLD", 2)
+        monkeypatch.setattr(config, "ENGINE_POOL_WORKERS", 2)
+        monkeypatch.setattr(engine_pool, "get_engine_pool", lambda: None)
+        monkeypatch.setattr(engine_pool, "map_engine_pool", counting_map)
+
+        assert generate_financing_portfolio(loans, leases).to_dict() == inline
+        # 2 workers × 4 chunks each: 9 loans → chunks of 2, 7 leases → chunks of 1.
+        assert sum(submitted) == 16
+        assert len(submitted) == 5 + 7
+
+
+class TestMaturityAnalysis:
+    def test_instrument_year_buckets_total_to_payments(self):
+        loan = _loan(term=84)
+        lease = _lease(term=36)
+        result = generate_financing_portfolio([loan], [lease])
+        buckets = {b.label: b for b in result.maturity_analysis}
+        assert [b.label for b in result.maturity_analysis] == list(MATURITY_LABELS)
+        assert sum(b.loan_payments for b in result.maturity_analysis) == result.loan_results[0].total_payments
+        assert buckets["Year 4"].lease_payments == Decimal("0")
+        assert buckets["Thereafter"].loan_payments > 0
+        lease_disclosure = result.lease_results[0].disclosure_tables.maturity_analysis
+        for own in lease_disclosure:
+            assert buckets[own.label].lease_payments == own.undiscounted_payments
+
+    def test_as_of_excludes_paid_and_shifts_buckets(self):
+        lease = _lease(term=24, start_date=date(2025, 1, 1))
+        result = generate_financing_portfolio(leases=[lease], as_of=date(2025, 6, 30))
+        buckets = {b.label: b.lease_payments for b in result.maturity_analysis}
+        # Advance payments Jan 2025 … Dec 2026; six are on or before 30 June 2025.
+        assert buckets["Year 1"] == Decimal("60000.00")
+        assert buckets["Year 2"] == Decimal("30000.00")
+        assert buckets["Year 3"] == Decimal("0")
+
+    def test_as_of_without_start_date_uses_instrument_year(self):
+        result = generate_financing_portfolio(leases=[_lease(term=24)], as_of=date(2025, 6, 30))
+        buckets = {b.label: b.lease_payments for b in result.maturity_analysis}
+        assert buckets["Year 1"] == buckets["Year 2"] == Decimal("60000.00")
+
+
+class TestJournalEntries:
+    def test_templates_balance_and_sum_instruments(self):
+        loans = [_loan("A", principal="100000"), _loan("B", principal="50000")]
+        leases = [
+            _lease("Op", lease_incentives=Decimal("1000")),
+            _lease("Fin", transfers_ownership=True, initial_direct_costs=Decimal("500")),
+        ]
+        result = generate_financing_portfolio(loans, leases)
+        for template in result.journal_entry_templates:
+            debits = sum(amount for _, amount in template.debits)
+            credits = sum(amount for _, amount in template.credits)
+            assert debits == credits, template.description
+        inception = result.journal_entry_templates[0]
+        assert inception.debits == [("Cash", Decimal("150000"))]
+        commencement = next(t for t in result.journal_entry_templates if t.description.startswith("Lease commencement"))
+        assert dict(commencement.debits)["Right-of-Use Asset"] == result.total_rou_asset
+        descriptions = [t.description for t in result.journal_entry_templates]
+        assert any("operating lease payments (1 leases)" in d for d in descriptions)
+        assert any("finance lease payments (1 leases)" in d for d in descriptions)
+
+
+class TestValidation:
+    def test_invalid_instrument_named_in_error(self):
+        with pytest.raises(PortfolioInputError, match=r"Lease 2 \(Bad\)"):
+            generate_financing_portfolio([_loan()], [_lease(), _lease("Bad", term=0)])
+
+    def test_empty_portfolio_rejected(self):
+        with pytest.raises(PortfolioInputError):
+            generate_financing_portfolio()
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestFinancingPortfolioRoutes:
+    PAYLOAD = {
+        "loans": [{"name": "Term A", "principal": "120000", "annual_rate": "0.06", "term_periods": 24}],
+        "leases": [
+            {"lease_name": "Store 1", "payment_amount": "5000", "term_periods": 36, "annual_discount_rate": "0.05"},
+            {"lease_name": "Store 2", "payment_amount": "2500", "term_periods": 12, "annual_discount_rate": "0.05"},
+        ],
+    }
+
+    @pytest.mark.asyncio
+    async def test_summary_matches_single_endpoints(self, override_auth_verified):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/financing-portfolio", json=self.PAYLOAD)
+            loan = await ac.post("/audit/loan-amortization", json=self.PAYLOAD["loans"][0])
+            lease = await ac.post("/audit/lease-accounting", json=self.PAYLOAD["leases"][0])
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["instrument_count"] == 3
+        assert body["loans"][0]["total_interest"] == loan.json()["total_interest"]
+        assert body["leases"][0]["initial_lease_liability"] == lease.json()["initial_lease_liability"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_numeric_names_instrument(self, override_auth_verified):
+        from main import app
+
+        payload = {"leases": [{**self.PAYLOAD["leases"][0], "lease_name": "Broken", "payment_amount": "abc"}]}
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/financing-portfolio", json=payload)
+        assert r.status_code == 400
+        assert r.json()["detail"].startswith("Lease 1 (Broken)")
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self, override_auth_verified):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/financing-portfolio/export.csv", json=self.PAYLOAD)
+        assert r.status_code == 200
+        rows = list(csv.reader(io.StringIO(r.text)))
+        assert rows[0][:4] == ["Type", "Instrument", "Period", "Payment Date"]
+        assert sum(1 for row in rows if row[:2] == ["Loan", "Term A"]) == 24
+        assert sum(1 for row in rows if row[:2] == ["Lease", "Store 1"]) == 36
+        assert sum(1 for row in rows if row[:2] == ["Lease", "Store 2"]) == 12
+        assert ["JOURNAL ENTRY TEMPLATES"] in rows
+
+    @pytest.mark.asyncio
+    async def test_xlsx_export(self, override_auth_verified):
+        from openpyxl import load_workbook
+
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/financing-portfolio/export.xlsx", json=self.PAYLOAD)
+        assert r.status_code == 200
+        wb = load_workbook(io.BytesIO(r.content))
+        assert wb.sheetnames == ["Schedule", "Maturity", "Journal Entries"]
+        assert wb["Schedule"].max_row == 1 + 24 + 36 + 12
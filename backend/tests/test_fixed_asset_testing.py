@@ -8,7 +8,7 @@ scoring, battery, full pipeline, serialization, API.
 ~140 tests across 20 test classes.
 """
 
-from datetime import date
+from datetime import date, timedelta
 
 from fixed_asset_testing_engine import (
     FAColumnDetection,
@@ -33,6 +33,9 @@ from fixed_asset_testing_engine import (
 from fixed_asset_testing_engine import (
     test_cost_zscore_outliers as run_zscore_test,
 )
+from fixed_asset_testing_engine import (
+    test_depreciation_recalculation as run_depreciation_recalc_test,
+)
 from fixed_asset_testing_engine import (
     test_duplicate_assets as run_duplicate_test,
 )
@@ -1049,6 +1052,83 @@ class TestResidualValueAnomalies:
         assert result.entries_flagged == 0
 
 
+# =============================================================================
+# FA-T11: DEPRECIATION RECALCULATION
+# =============================================================================
+
+
+def _acquired_years_ago(years: int) -> str:
+    return (date.today() - timedelta(days=round(365.25 * years))).isoformat()
+
+
+class TestDepreciationRecalculation:
+    """FA-T11 recalculates the exact book schedule through the register engine."""
+
+    def test_exact_ddb_accumulation_not_flagged(self):
+        # DDB on 10,000 / 5y: 4,000 + 2,400 + 1,440 after three years.
+        entry = FixedAssetEntry(
+            asset_id="FA-1",
+            cost=10000,
+            accumulated_depreciation=7840,
+            acquisition_date=_acquired_years_ago(3),
+            useful_life=5,
+            depreciation_method="Double Declining Balance",
+        )
+        result = run_depreciation_recalc_test([entry], FixedAssetTestingConfig())
+        assert result.entries_flagged == 0
+
+    def test_straight_line_mismatch_flagged_with_exact_expectation(self):
+        entry = FixedAssetEntry(
+            asset_id="FA-2",
+            cost=12000,
+            residual_value=2000,
+            accumulated_depreciation=1000,
+            acquisition_date=_acquired_years_ago(4),
+            useful_life=10,
+            depreciation_method="Straight-Line",
+        )
+        result = run_depreciation_recalc_test([entry], FixedAssetTestingConfig())
+        assert result.entries_flagged == 1
+        details = result.flagged_entries[0].details
+        assert details["method"] == "Straight-Line"
+        assert abs(details["expected_accum"] - 4000.0) < 1.0
+        assert details["tolerance"] == 0.05
+
+    def test_sum_of_years_digits_supported(self):
+        # SYD on 15,000 / 5y: 5,000 + 4,000 after two years.
+        entry = FixedAssetEntry(
+            asset_id="FA-3",
+            cost=15000,
+            accumulated_depreciation=2000,
+            acquisition_date=_acquired_years_ago(2),
+            useful_life=5,
+            depreciation_method="Sum of Years Digits",
+        )
+        result = run_depreciation_recalc_test([entry], FixedAssetTestingConfig())
+        assert result.entries_flagged == 1
+        # 730 days is a day short of two years — the second year is pro-rated.
+        assert abs(result.flagged_entries[0].details["expected_accum"] - 9000.0) < 10.0
+
+    def test_unmappable_rows_skipped(self):
+        entries = [
+            FixedAssetEntry(
+                cost=5000,
+                acquisition_date=_acquired_years_ago(2),
+                useful_life=5,
+                depreciation_method="Units of production",
+            ),
+            FixedAssetEntry(
+                cost=5000,
+                residual_value=6000,
+                acquisition_date=_acquired_years_ago(2),
+                useful_life=5,
+                depreciation_method="SL",
+            ),
+        ]
+        result = run_depreciation_recalc_test(entries, FixedAssetTestingConfig())
+        assert result.entries_flagged == 0
+
+
 # =============================================================================
 # BATTERY + SCORING TESTS
 # =============================================================================
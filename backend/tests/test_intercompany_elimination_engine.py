@@ -2,7 +2,11 @@
 
 from decimal import Decimal
 
+import pytest
+
 from intercompany_elimination_engine import (
+    ConsolidationBuilder,
+    ConsolidationMode,
     EntityAccount,
     EntityTrialBalance,
     IntercompanyConfig,
@@ -274,3 +278,99 @@ class TestSerialisation:
                 "summary",
             }
         )
+
+
+class TestScalableMode:
+    @staticmethod
+    def _random_group(seed: int, entity_count: int = 30) -> list[EntityTrialBalance]:
+        import random
+
+        rnd = random.Random(seed)
+        accounts: dict[int, list[EntityAccount]] = {
+            i: [EntityAccount(account="1000 Cash", debit=Decimal("1000"))] for i in range(entity_count)
+        }
+        all_pairs = [(i, j) for i in range(entity_count) for j in range(i + 1, entity_count)]
+        for i, j in rnd.sample(all_pairs, 120):
+            a, b = (i, j) if rnd.random() < 0.5 else (j, i)
+            # The counterparty books either all of its side or none of it;
+            # a half-booked group is where the modes deliberately differ.
+            booked_by_b = rnd.random() < 0.9
+            for side_a, side_b in (("Due from", "Due to"), ("Intercompany revenue from", "Intercompany expense to")):
+                if rnd.random() < 0.3:
+                    continue
+                amount = Decimal(rnd.randint(100, 10**7)) / 100
+                roll = rnd.random()
+                other = amount if roll < 0.7 else amount + Decimal("0.50") if roll < 0.85 else amount + 50
+                accounts[a].append(EntityAccount(account=f"{side_a} E{b}", debit=amount))
+                if booked_by_b:
+                    accounts[b].append(EntityAccount(account=f"{side_b} E{a}", credit=other))
+        # One unresolved counterparty.
+        accounts[0].append(EntityAccount(account="Due from Outsider", debit=Decimal("5")))
+        return [
+            EntityTrialBalance(entity_id=f"E{i}", entity_name=f"Entity {i}", accounts=accounts[i])
+            for i in range(entity_count)
+        ]
+
+    def test_matches_standard_mode_with_one_line_per_direction(self):
+        entities = self._random_group(637)
+        standard = run_intercompany_elimination(IntercompanyConfig(entities=entities)).to_dict()
+        scalable = run_intercompany_elimination(
+            IntercompanyConfig(entities=entities, mode=ConsolidationMode.SCALABLE)
+        ).to_dict()
+        assert scalable["worksheet"] == standard["worksheet"]
+        assert scalable["summary"] == standard["summary"]
+        assert scalable["intercompany_lines"] == standard["intercompany_lines"]
+        for key in ("pairs", "mismatches", "elimination_journal_entries"):
+            assert sorted(map(repr, scalable[key])) == sorted(map(repr, standard[key])), key
+        assert standard["summary"]["reconciling_pair_count"] > 0
+        assert standard["summary"]["mismatch_count"] > 0
+
+    def test_repeated_amounts_pair_one_to_one(self):
+        parent = EntityTrialBalance(
+            entity_id="parent",
+            entity_name="Parent Corp",
+            accounts=[
+                EntityAccount(account="Due from Sub - invoice 1", debit=Decimal("100"), counterparty_entity="sub"),
+                EntityAccount(account="Due from Sub - invoice 2", debit=Decimal("100"), counterparty_entity="sub"),
+            ],
+        )
+        sub = EntityTrialBalance(
+            entity_id="sub",
+            entity_name="Sub",
+            accounts=[
+                EntityAccount(account="Due to Parent - invoice 1", credit=Decimal("100"), counterparty_entity="parent"),
+                EntityAccount(account="Due to Parent - invoice 2", credit=Decimal("100"), counterparty_entity="parent"),
+            ],
+        )
+        result = run_intercompany_elimination(
+            IntercompanyConfig(entities=[parent, sub], mode=ConsolidationMode.SCALABLE)
+        )
+        assert [(p.account_a, p.account_b) for p in result.pairs] == [
+            ("Due from Sub - invoice 1", "Due to Parent - invoice 1"),
+            ("Due from Sub - invoice 2", "Due to Parent - invoice 2"),
+        ]
+        assert result.mismatches == []
+        assert result.worksheet.elimination_debits == Decimal("200.00")
+
+    def test_builder_consumes_generators_incrementally(self):
+        builder = ConsolidationBuilder()
+        column = builder.add_entity(
+            "parent",
+            "Parent Corp",
+            (EntityAccount(account=name, debit=Decimal("10")) for name in ("Cash", "Due from Sub")),
+        )
+        assert column.debit_total == Decimal("20.00")
+        assert column.intercompany_gross == Decimal("10.00")
+        builder.add_entity("sub", "Sub", iter([EntityAccount(account="Due to Parent Corp", credit=Decimal("10"))]))
+        result = builder.finish()
+        assert [c.entity_id for c in result.worksheet.columns] == ["parent", "sub"]
+        assert result.worksheet.consolidated_debits == Decimal("10.00")
+        assert result.summary["consolidation_complete"] is True
+
+    def test_builder_validation(self):
+        builder = ConsolidationBuilder()
+        builder.add_entity("a", "A", [])
+        with pytest.raises(IntercompanyInputError, match="unique"):
+            builder.add_entity("a", "A again", [])
+        with pytest.raises(IntercompanyInputError, match="At least two"):
+            builder.finish()
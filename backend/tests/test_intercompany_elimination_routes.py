@@ -154,3 +154,35 @@ class TestIntercompanyEliminationTierGate:
             assert "intercompany_consolidation.csv" in response.headers.get("content-disposition", "")
         finally:
             app.dependency_overrides.clear()
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestIntercompanyEliminationModes:
+    @pytest.mark.asyncio
+    async def test_scalable_mode_accepts_large_groups(self, professional_user, db_session):
+        payload = {
+            "mode": "scalable",
+            "entities": [
+                {
+                    "entity_id": f"E{i}",
+                    "entity_name": f"Entity {i}",
+                    "accounts": [
+                        {"account": "Due From Next", "debit": "10", "counterparty_entity": f"E{(i + 1) % 60}"},
+                        {"account": "Due To Previous", "credit": "10", "counterparty_entity": f"E{(i - 1) % 60}"},
+                    ],
+                }
+                for i in range(60)
+            ],
+        }
+        _override(professional_user, db_session)
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post("/audit/intercompany-elimination", json=payload)
+                standard = await client.post("/audit/intercompany-elimination", json={**payload, "mode": "standard"})
+            assert response.status_code == 200
+            assert response.json()["summary"]["reconciling_pair_count"] == 60
+            assert response.json()["summary"]["consolidation_complete"] is True
+            # Standard mode keeps its original 50-entity ceiling.
+            assert standard.status_code == 422
+        finally:
+            app.dependency_overrides.clear()
@@ -0,0 +1,177 @@
+"""Tests for ``shared.lazy_import`` and the cold-start import budget script.
+
+The prevention story: memo generators and export builders are referenced
+through ``lazy_callable`` so ``import main`` does not pay for ReportLab-heavy
+modules. If someone re-adds an eager import to a route module, the
+``[deferred]`` list in ``backend/import_budget.toml`` catches it in CI; these
+tests pin the proxy semantics and the script's parsing / verdict logic.
+"""
+
+from __future__ import annotations
+
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+from shared import lazy_import
+from shared.lazy_import import LazyCallable, lazy_callable, registered_targets, warm_up
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from check_import_budget import (  # noqa: E402  (path manipulation above)
+    EXIT_USAGE_ERROR,
+    Budget,
+    ImportProfile,
+    check,
+    load_budget,
+    main,
+    parse_importtime,
+)
+
+# ---------------------------------------------------------------------------
+# LazyCallable
+# ---------------------------------------------------------------------------
+
+
+class TestLazyCallable:
+    def test_rejects_malformed_target(self):
+        with pytest.raises(ValueError, match="module:attr"):
+            LazyCallable("json.dumps")
+
+    def test_resolves_on_first_call(self):
+        proxy = LazyCallable("json:dumps")
+        assert not proxy.is_resolved
+        assert proxy({"a": 1}) == '{"a": 1}'
+        assert proxy.is_resolved
+
+    def test_classes_can_be_instantiated_through_proxy(self):
+        proxy = LazyCallable("collections:OrderedDict")
+        instance = proxy(a=1)
+        assert type(instance).__name__ == "OrderedDict"
+
+    def test_missing_attribute_raises_on_call(self):
+        proxy = LazyCallable("json:does_not_exist")
+        with pytest.raises(AttributeError):
+            proxy()
+
+    def test_concurrent_resolution_imports_once(self, monkeypatch: pytest.MonkeyPatch):
+        calls: list[str] = []
+        real_import = lazy_import.importlib.import_module
+
+        def _counting_import(name: str):
+            calls.append(name)
+            return real_import(name)
+
+        monkeypatch.setattr(lazy_import.importlib, "import_module", _counting_import)
+        proxy = LazyCallable("textwrap:dedent")
+        threads = [threading.Thread(target=proxy.resolve) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert calls == ["textwrap"]
+
+
+class TestRegistry:
+    @pytest.fixture(autouse=True)
+    def _isolated_registry(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(lazy_import, "_REGISTRY", {})
+
+    def test_same_target_returns_shared_proxy(self):
+        assert lazy_callable("json:loads") is lazy_callable("json:loads")
+        assert "json:loads" in registered_targets()
+
+    def test_warm_up_resolves_pending_targets(self):
+        proxy = lazy_callable("string:capwords")
+        timings = warm_up()
+        assert proxy.is_resolved
+        assert set(timings) == {"string:capwords"}
+
+    def test_warm_up_survives_broken_target(self):
+        broken = lazy_callable("nonexistent_module_for_warmup_test:thing")
+        timings = warm_up()
+        assert broken.target not in timings
+        assert not broken.is_resolved
+
+
+# ---------------------------------------------------------------------------
+# Route wiring
+# ---------------------------------------------------------------------------
+
+
+class TestMemoRoutesUseLazyGenerators:
+    def test_memo_registry_generators_are_lazy(self):
+        from routes.export_memos import _STANDARD_REGISTRY
+
+        for entry, _schema in _STANDARD_REGISTRY:
+            assert isinstance(entry.generator, LazyCallable), entry.route_path
+
+    def test_lazy_generator_resolves_to_real_function(self):
+        from je_testing_memo_generator import generate_je_testing_memo
+        from routes.export_memos import _STANDARD_REGISTRY
+
+        entry = next(e for e, _ in _STANDARD_REGISTRY if e.route_path == "/export/je-testing-memo")
+        assert entry.generator.resolve() is generate_je_testing_memo
+
+
+# ---------------------------------------------------------------------------
+# scripts/check_import_budget.py
+# ---------------------------------------------------------------------------
+
+_SAMPLE_IMPORTTIME = textwrap.dedent(
+    """\
+    import time: self [us] | cumulative | imported package
+    import time:       100 |        100 |   _io
+    import time:      2000 |      50000 |     routes.export_memos
+    import time:      3000 |      80000 |   routes
+    import time:      5000 |      95000 | main
+    """
+)
+
+
+class TestParseImporttime:
+    def test_total_is_root_module_cumulative(self):
+        profile = parse_importtime(_SAMPLE_IMPORTTIME)
+        assert profile.total_ms == pytest.approx(95.0)
+        assert profile.modules["routes.export_memos"] == pytest.approx(50.0)
+
+    def test_missing_root_raises(self):
+        with pytest.raises(ValueError, match="not found"):
+            parse_importtime("import time:       100 |        100 | json\n")
+
+
+class TestCheck:
+    def test_within_budget_passes(self):
+        profile = ImportProfile(total_ms=900, modules={"main": 900, "routes": 500})
+        assert check(profile, Budget(max_total_ms=1000, deferred=frozenset())) == []
+
+    def test_total_over_budget_fails(self):
+        profile = ImportProfile(total_ms=1500, modules={"main": 1500})
+        violations = check(profile, Budget(max_total_ms=1000, deferred=frozenset()))
+        assert len(violations) == 1
+        assert "1500 ms" in violations[0]
+
+    def test_eager_deferred_module_fails(self):
+        profile = ImportProfile(total_ms=100, modules={"main": 100, "je_testing_memo_generator": 40})
+        violations = check(profile, Budget(max_total_ms=1000, deferred=frozenset({"je_testing_memo_generator"})))
+        assert violations == ["deferred module 'je_testing_memo_generator' imported at startup (40 ms)"]
+
+
+class TestLoadBudget:
+    def test_repo_budget_file_parses(self):
+        budget = load_budget(REPO_ROOT / "backend" / "import_budget.toml")
+        assert budget.max_total_ms > 0
+        assert "je_testing_memo_generator" in budget.deferred
+
+    def test_non_positive_budget_rejected(self, tmp_path: Path):
+        path = tmp_path / "budget.toml"
+        path.write_text("[budget]\nmax_total_ms = 0\n")
+        with pytest.raises(ValueError, match="positive"):
+            load_budget(path)
+
+    def test_cli_missing_file_is_usage_error(self, tmp_path: Path):
+        assert main(["--budget", str(tmp_path / "nope.toml")]) == EXIT_USAGE_ERROR
@@ -2,15 +2,19 @@
 Test Suite: Loki Handler — Sprint 716.
 
 Covers payload construction, HTTP push, failure handling, queue backpressure,
-and thread lifecycle for the in-process Loki HTTPS push handler.
+and thread lifecycle for the in-process Loki HTTPS push handler. Pushes go to
+a local stand-in HTTP server.
 """
 
+import gzip
 import json
 import logging
+import threading
 import time
-import urllib.error
 from base64 import b64decode
-from unittest.mock import MagicMock, patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
 
 from loki_handler import LokiHandler
 
@@ -50,6 +54,53 @@ def _new_handler(**overrides) -> LokiHandler:
     return LokiHandler(**defaults)
 
 
+class _LokiStub(BaseHTTPRequestHandler):
+    """Records each push; answers ``server.status`` over a keep-alive connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        wire = self.rfile.read(int(self.headers["Content-Length"]))
+        body = gzip.decompress(wire) if self.headers.get("Content-Encoding") == "gzip" else wire
+        self.server.pushes.append(
+            {
+                "headers": self.headers,
+                "body": json.loads(body),
+                "peer": self.client_address,
+                "wire_bytes": len(wire),
+            }
+        )
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        # Drop the connection without announcing it, like an idle timeout would.
+        self.close_connection = self.server.hang_up
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def loki_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LokiStub)
+    server.pushes = []
+    server.status = 204
+    server.hang_up = False
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/loki/api/v1/push"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
 class TestBuildPayload:
     """Unit tests for LokiHandler._build_payload()."""
 
@@ -97,6 +148,20 @@ class TestBuildPayload:
         finally:
             handler.close()
 
+    def test_record_labels_split_streams(self):
+        handler = _new_handler()
+        try:
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            tagged = _make_record(message="tagged", created=1.0)
+            tagged.loki_labels = {"tool": "je_testing"}
+            payload = handler._build_payload([_make_record(created=2.0), tagged, _make_record(created=3.0)])
+            assert sorted(len(s["values"]) for s in payload["streams"]) == [1, 2]
+            tagged_stream = next(s for s in payload["streams"] if "tool" in s["stream"])
+            assert tagged_stream["stream"]["tool"] == "je_testing"
+            assert tagged_stream["stream"]["service"] == "paciolus-api"
+        finally:
+            handler.close()
+
     def test_values_sorted_by_timestamp_within_stream(self):
         handler = _new_handler()
         try:
@@ -114,71 +179,83 @@ class TestBuildPayload:
 
 
 class TestPost:
-    """Unit tests for LokiHandler._post() HTTP behavior."""
-
-    def test_post_sends_basic_auth_header(self):
-        handler = _new_handler(user="1566612", token="glc_test-token")
-        try:
-            fake_resp = MagicMock()
-            fake_resp.__enter__ = lambda s: s
-            fake_resp.__exit__ = lambda *a: None
-            fake_resp.status = 204
-            with patch("loki_handler.urllib.request.urlopen", return_value=fake_resp) as mock_open:
-                handler._post({"streams": []})
-            req = mock_open.call_args[0][0]
-            auth_header = req.get_header("Authorization")
+    """LokiHandler._post() against a local stand-in server."""
+
+    def test_post_sends_basic_auth_header(self, loki_server):
+        handler = _new_handler(url=loki_server.url, user="1566612", token="glc_test-token")
+        try:
+            assert handler._post({"streams": []})
+            auth_header = loki_server.pushes[0]["headers"]["Authorization"]
             assert auth_header.startswith("Basic ")
             decoded = b64decode(auth_header.split(" ", 1)[1]).decode()
             assert decoded == "1566612:glc_test-token"
         finally:
             handler.close()
 
-    def test_post_sends_json_body(self):
-        handler = _new_handler()
+    def test_post_sends_gzipped_json_body(self, loki_server):
+        handler = _new_handler(url=loki_server.url)
         try:
-            fake_resp = MagicMock()
-            fake_resp.__enter__ = lambda s: s
-            fake_resp.__exit__ = lambda *a: None
-            fake_resp.status = 204
-            with patch("loki_handler.urllib.request.urlopen", return_value=fake_resp) as mock_open:
-                handler._post({"streams": [{"stream": {"a": "b"}, "values": []}]})
-            req = mock_open.call_args[0][0]
-            body = json.loads(req.data.decode("utf-8"))
-            assert body == {"streams": [{"stream": {"a": "b"}, "values": []}]}
-            assert req.get_header("Content-type") == "application/json"
+            payload = {"streams": [{"stream": {"a": "b"}, "values": [["1", "x" * 2000]]}]}
+            assert handler._post(payload)
+            push = loki_server.pushes[0]
+            assert push["body"] == payload
+            assert push["headers"]["Content-Type"] == "application/json"
+            assert push["headers"]["Content-Encoding"] == "gzip"
+            stats = handler.stats()
+            assert stats["bytes_sent"] == push["wire_bytes"] < stats["bytes_uncompressed"]
         finally:
             handler.close()
 
-    def test_post_swallows_connection_error(self):
-        handler = _new_handler()
+    def test_compression_can_be_disabled(self, loki_server):
+        handler = _new_handler(url=loki_server.url, compress=False)
         try:
-            with (
-                patch(
-                    "loki_handler.urllib.request.urlopen",
-                    side_effect=urllib.error.URLError("connection refused"),
-                ),
-                patch.object(handler, "_warn_stderr") as mock_warn,
-            ):
-                handler._post({"streams": []})
-            mock_warn.assert_called_once()
-            assert "connection refused" in mock_warn.call_args[0][0]
+            assert handler._post({"streams": []})
+            assert loki_server.pushes[0]["headers"]["Content-Encoding"] is None
         finally:
             handler.close()
 
-    def test_post_warns_on_non_2xx_status(self):
-        handler = _new_handler()
+    def test_pushes_reuse_one_connection(self, loki_server):
+        handler = _new_handler(url=loki_server.url)
         try:
-            fake_resp = MagicMock()
-            fake_resp.__enter__ = lambda s: s
-            fake_resp.__exit__ = lambda *a: None
-            fake_resp.status = 403
-            with (
-                patch("loki_handler.urllib.request.urlopen", return_value=fake_resp),
-                patch.object(handler, "_warn_stderr") as mock_warn,
-            ):
-                handler._post({"streams": []})
-            mock_warn.assert_called_once()
-            assert "403" in mock_warn.call_args[0][0]
+            for _ in range(3):
+                assert handler._post({"streams": []})
+            assert len({push["peer"] for push in loki_server.pushes}) == 1
+        finally:
+            handler.close()
+
+    def test_reconnects_when_server_closed_idle_connection(self, loki_server):
+        loki_server.hang_up = True
+        handler = _new_handler(url=loki_server.url)
+        try:
+            assert handler._post({"streams": []})
+            time.sleep(0.05)
+            assert handler._post({"streams": []})
+            assert len(loki_server.pushes) == 2
+            assert handler.stats()["push_errors"] == 0
+        finally:
+            handler.close()
+
+    def test_post_swallows_connection_error(self, loki_server):
+        handler = _new_handler(url="http://127.0.0.1:1/loki/api/v1/push")
+        try:
+            warnings: list[str] = []
+            handler._warn_stderr = warnings.append
+            assert not handler._post({"streams": []})
+            assert len(warnings) == 1
+            assert "Loki push failed" in warnings[0]
+            assert handler.stats()["push_errors"] == 1
+        finally:
+            handler.close()
+
+    def test_post_warns_on_non_2xx_status(self, loki_server):
+        loki_server.status = 403
+        handler = _new_handler(url=loki_server.url)
+        try:
+            warnings: list[str] = []
+            handler._warn_stderr = warnings.append
+            assert not handler._post({"streams": []})
+            assert len(warnings) == 1
+            assert "403" in warnings[0]
         finally:
             handler.close()
 
@@ -199,8 +276,9 @@ class TestEmitAndQueue:
         try:
             for i in range(10):
                 handler.emit(_make_record(message=f"msg-{i}"))
-            # No exception raised; queue capped at 2
+            # No exception raised; queue capped at 2, the rest counted
             assert handler._queue.qsize() <= 2
+            assert handler.stats()["dropped"] >= 8
         finally:
             handler.close()
 
@@ -216,21 +294,66 @@ class TestThreadLifecycle:
         # join() in close() should have let the thread exit
         assert not thread.is_alive()
 
-    def test_flush_runs_on_interval(self):
-        """emit() → background thread → _post() should happen within flush_interval."""
-        handler = _new_handler(flush_interval=0.05)
-        try:
-            fake_resp = MagicMock()
-            fake_resp.__enter__ = lambda s: s
-            fake_resp.__exit__ = lambda *a: None
-            fake_resp.status = 204
-            with patch("loki_handler.urllib.request.urlopen", return_value=fake_resp) as mock_open:
-                handler.setFormatter(logging.Formatter("%(message)s"))
-                handler.emit(_make_record(message="background-flush"))
-                # Allow the background thread up to 1s to drain and post.
-                deadline = time.monotonic() + 1.0
-                while time.monotonic() < deadline and mock_open.call_count == 0:
-                    time.sleep(0.01)
-                assert mock_open.call_count >= 1
+    def test_flush_runs_on_interval(self, loki_server):
+        """emit() → background thread → push should happen within flush_interval."""
+        handler = _new_handler(url=loki_server.url, flush_interval=0.05)
+        try:
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            handler.emit(_make_record(message="background-flush"))
+            _wait_for(lambda: handler.stats()["sent"] == 1)
+            assert loki_server.pushes[0]["body"]["streams"][0]["values"][0][1] == "background-flush"
+        finally:
+            handler.close()
+
+    def test_batches_are_bounded_by_bytes(self, loki_server):
+        handler = _new_handler(url=loki_server.url, batch_size=1000, batch_bytes=1000, flush_interval=0.2)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            for i in range(20):
+                handler.emit(_make_record(message=f"{i:03d}" + "x" * 197))
+            _wait_for(lambda: handler.stats()["sent"] == 20)
+        finally:
+            handler.close()
+        # 200-byte lines, 1000-byte budget → five records per push
+        sizes = [len(push["body"]["streams"][0]["values"]) for push in loki_server.pushes]
+        assert sizes == [5, 5, 5, 5]
+        stats = handler.stats()
+        assert (stats["pushes"], stats["failed"], stats["dropped"]) == (4, 0, 0)
+
+    def test_close_drains_queue(self, loki_server):
+        handler = _new_handler(url=loki_server.url, flush_interval=0.5, batch_size=3)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        for i in range(7):
+            handler.emit(_make_record(message=f"m{i}"))
+        handler.close()
+        assert handler.stats()["sent"] == 7
+
+    def test_format_errors_are_not_counted_as_dropped(self, loki_server):
+        class _Exploding(logging.Formatter):
+            def format(self, record):
+                if record.getMessage() == "boom":
+                    raise ValueError("bad record")
+                return super().format(record)
+
+        handler = _new_handler(url=loki_server.url, flush_interval=0.05)
+        handler.setFormatter(_Exploding("%(message)s"))
+        try:
+            handler.emit(_make_record(message="boom"))
+            handler.emit(_make_record(message="fine"))
+            _wait_for(lambda: handler.stats()["sent"] == 1)
+            stats = handler.stats()
+            assert (stats["format_errors"], stats["dropped"]) == (1, 0)
+        finally:
+            handler.close()
+
+    def test_failed_push_counts_records(self, loki_server):
+        loki_server.status = 500
+        handler = _new_handler(url=loki_server.url, flush_interval=0.05)
+        handler._warn_stderr = lambda msg: None
+        try:
+            handler.emit(_make_record())
+            handler.emit(_make_record())
+            _wait_for(lambda: handler.stats()["failed"] == 2)
+            assert handler.stats()["sent"] == 0
         finally:
             handler.close()
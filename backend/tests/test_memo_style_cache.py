@@ -0,0 +1,240 @@
+"""
+Tests for the process-wide memo style registry and static flowable templates
+(``shared.memo_base.create_memo_styles`` / ``static_paragraph`` and
+``pdf.styles.create_classical_styles``).
+
+The slow benchmark renders all 18 memo-export generators with the caches
+cleared before every call (the per-request rebuild this replaced) and with
+the caches warm, and reports per-memo latency and traced allocation.
+"""
+
+from __future__ import annotations
+
+import io
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+from freezegun import freeze_time
+from pypdf import PdfReader
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+
+from pdf import styles as pdf_styles
+from shared import memo_base
+from shared.memo_base import build_disclaimer, build_limitations_section, create_memo_styles, static_paragraph
+
+BOILERPLATE = "Results represent data anomalies and are <b>not</b> conclusions regarding fraud. " * 4
+
+
+def _clear_caches() -> None:
+    memo_base._memo_style_registry.cache_clear()
+    memo_base._paragraph_template.cache_clear()
+    memo_base._methodology_table_style.cache_clear()
+    pdf_styles._classical_style_registry.cache_clear()
+
+
+class TestStyleRegistry:
+    def test_memo_styles_shared_but_dict_is_fresh(self):
+        first = create_memo_styles()
+        second = create_memo_styles()
+        assert first is not second
+        assert first["MemoBody"] is second["MemoBody"]
+
+        first["Extra"] = ParagraphStyle("Extra", parent=first["MemoBody"])
+        assert "Extra" not in create_memo_styles()
+
+    def test_memo_styles_skip_the_sample_sheet(self):
+        assert "Normal" not in create_memo_styles()
+        assert set(create_memo_styles()) >= {"MemoTitle", "MemoBody", "MemoDisclaimer"}
+
+    def test_classical_styles_shared_but_dict_is_fresh(self):
+        first = pdf_styles.create_classical_styles()
+        second = pdf_styles.create_classical_styles()
+        assert first is not second
+        assert first["SectionHeader"] is second["SectionHeader"]
+        assert "Normal" in first
+
+
+class TestStaticParagraph:
+    def test_clone_lays_out_like_a_fresh_paragraph(self):
+        style = create_memo_styles()["MemoBody"]
+        fresh = Paragraph(BOILERPLATE, style)
+        clone = static_paragraph(BOILERPLATE, style)
+        assert clone.wrap(300, 800) == fresh.wrap(300, 800)
+        assert len(clone.blPara.lines) == len(fresh.blPara.lines)
+
+    def test_clones_do_not_share_layout_state(self):
+        style = create_memo_styles()["MemoBody"]
+        narrow = static_paragraph(BOILERPLATE, style)
+        wide = static_paragraph(BOILERPLATE, style)
+        _, narrow_height = narrow.wrap(150, 800)
+        _, wide_height = wide.wrap(500, 800)
+        assert narrow_height > wide_height
+        assert narrow.frags is not wide.frags
+        assert static_paragraph(BOILERPLATE, style).wrap(150, 800)[1] == narrow_height
+
+    def test_template_parsed_once_per_text_and_style(self):
+        memo_base._paragraph_template.cache_clear()
+        styles = create_memo_styles()
+        for _ in range(3):
+            build_disclaimer([], styles, domain="three-way match validation", isa_reference="ISA 500")
+            build_limitations_section([], styles, 468)
+        info = memo_base._paragraph_template.cache_info()
+        assert info.misses == 5
+        assert info.hits == 10
+
+    @freeze_time("2026-03-19T10:00:00")
+    def test_rendered_memo_matches_cold_render(self):
+        from je_testing_memo_generator import generate_je_testing_memo
+        from tests.test_je_testing_memo import _make_je_result
+
+        _clear_caches()
+        cold = generate_je_testing_memo(_make_je_result())
+        warm = generate_je_testing_memo(_make_je_result())
+        # The reference number and "Generated" stamp come from the clock (frozen
+        # above); ReportLab also stamps a document id, so compare page text only.
+        cold_text = [page.extract_text() for page in PdfReader(io.BytesIO(cold)).pages]
+        warm_text = [page.extract_text() for page in PdfReader(io.BytesIO(warm)).pages]
+        assert cold_text == warm_text
+
+
+# ---------------------------------------------------------------------------
+# Benchmark — all 18 memo-export generators, cold vs warm caches
+# ---------------------------------------------------------------------------
+
+
+def _memo_generators() -> dict[str, Callable[[], bytes]]:
+    from accrual_completeness_memo import generate_accrual_completeness_memo
+    from ap_testing_memo_generator import generate_ap_testing_memo
+    from ar_aging_memo_generator import generate_ar_aging_memo
+    from bank_reconciliation_memo_generator import generate_bank_rec_memo
+    from currency_memo_generator import generate_currency_conversion_memo
+    from expense_category_memo import generate_expense_category_memo
+    from fixed_asset_testing_memo_generator import generate_fixed_asset_testing_memo
+    from flux_expectations_memo import generate_flux_expectations_memo
+    from inventory_testing_memo_generator import generate_inventory_testing_memo
+    from je_testing_memo_generator import generate_je_testing_memo
+    from multi_period_memo_generator import generate_multi_period_memo
+    from payroll_testing_memo_generator import generate_payroll_testing_memo
+    from population_profile_memo import generate_population_profile_memo
+    from preflight_memo_generator import generate_preflight_memo
+    from revenue_testing_memo_generator import generate_revenue_testing_memo
+    from sampling_memo_generator import generate_sampling_design_memo, generate_sampling_evaluation_memo
+    from tests import test_export_pdf_contract as contract
+    from tests.test_ap_testing_memo import _make_ap_result
+    from tests.test_ar_aging_memo import _make_ar_result
+    from tests.test_bank_rec_memo import _make_rec_result
+    from tests.test_expense_category_memo import SAMPLE_REPORT
+    from tests.test_fixed_asset_testing_memo import _make_fa_result
+    from tests.test_inventory_testing_memo import _make_inv_result
+    from tests.test_je_testing_memo import _make_je_result
+    from tests.test_multi_period_memo import _make_comparison_result
+    from tests.test_payroll_testing_memo import _make_payroll_result
+    from tests.test_preflight_memo import _make_preflight_result
+    from tests.test_revenue_testing_memo import _make_revenue_result
+    from three_way_match_memo_generator import generate_three_way_match_memo
+
+    flux = {
+        "items": [
+            {
+                "account": "Revenue",
+                "type": "Revenue",
+                "current": 500000,
+                "prior": 300000,
+                "delta_amount": 200000,
+                "delta_percent": 66.67,
+                "display_percent": "66.7%",
+                "is_new": False,
+                "is_removed": False,
+                "sign_flip": False,
+                "risk_level": "high",
+                "variance_indicators": ["Large % Variance"],
+            }
+        ],
+        "summary": {
+            "total_items": 1,
+            "high_risk_count": 1,
+            "medium_risk_count": 0,
+            "new_accounts": 0,
+            "removed_accounts": 0,
+            "threshold": 10000,
+        },
+    }
+    return {
+        "je_testing": lambda: generate_je_testing_memo(_make_je_result()),
+        "ap_testing": lambda: generate_ap_testing_memo(_make_ap_result()),
+        "payroll_testing": lambda: generate_payroll_testing_memo(_make_payroll_result()),
+        "three_way_match": lambda: generate_three_way_match_memo(contract._TWM_FIXTURE),
+        "revenue_testing": lambda: generate_revenue_testing_memo(_make_revenue_result()),
+        "ar_aging": lambda: generate_ar_aging_memo(_make_ar_result()),
+        "fixed_asset_testing": lambda: generate_fixed_asset_testing_memo(_make_fa_result()),
+        "inventory_testing": lambda: generate_inventory_testing_memo(_make_inv_result()),
+        "bank_reconciliation": lambda: generate_bank_rec_memo(_make_rec_result()),
+        "multi_period": lambda: generate_multi_period_memo(_make_comparison_result()),
+        "currency_conversion": lambda: generate_currency_conversion_memo(contract._CURRENCY_FIXTURE),
+        "sampling_design": lambda: generate_sampling_design_memo(contract._SAMPLING_DESIGN_FIXTURE),
+        "sampling_evaluation": lambda: generate_sampling_evaluation_memo(
+            contract._SAMPLING_EVAL_FIXTURE, design_result=contract._SAMPLING_DESIGN_FIXTURE
+        ),
+        "preflight": lambda: generate_preflight_memo(_make_preflight_result()),
+        "population_profile": lambda: generate_population_profile_memo(contract._POPULATION_PROFILE_FIXTURE),
+        "expense_category": lambda: generate_expense_category_memo(SAMPLE_REPORT),
+        "accrual_completeness": lambda: generate_accrual_completeness_memo(contract._ACCRUAL_COMPLETENESS_FIXTURE),
+        "flux_expectations": lambda: generate_flux_expectations_memo(flux_result=flux, expectations={}),
+    }
+
+
+def _latency_ms(generate: Callable[[], bytes], *, cold: bool, runs: int = 5) -> float:
+    """Median wall time of ``runs`` renders."""
+    samples = []
+    for _ in range(runs):
+        if cold:
+            _clear_caches()
+        start = time.perf_counter()
+        generate()
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)[runs // 2]
+
+
+def _allocated_bytes(generate: Callable[[], bytes], *, cold: bool) -> int:
+    """Peak traced allocation of one render."""
+    if cold:
+        _clear_caches()
+    tracemalloc.start()
+    try:
+        generate()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.slow
+class TestMemoRenderBenchmark:
+    def test_warm_caches_reduce_allocation(self, capsys: pytest.CaptureFixture[str]):
+        generators = _memo_generators()
+        assert len(generators) == 18
+
+        rows = []
+        for name, generate in generators.items():
+            generate()  # imports and font metrics out of the way
+            rows.append(
+                (
+                    name,
+                    _latency_ms(generate, cold=True),
+                    _latency_ms(generate, cold=False),
+                    _allocated_bytes(generate, cold=True),
+                    _allocated_bytes(generate, cold=False),
+                )
+            )
+
+        with capsys.disabled():
+            print(f"\n{'memo':<22}{'cold ms':>10}{'warm ms':>10}{'cold KiB':>11}{'warm KiB':>11}")
+            for name, cold_ms, warm_ms, cold_peak, warm_peak in rows:
+                print(f"{name:<22}{cold_ms:>10.1f}{warm_ms:>10.1f}{cold_peak / 1024:>11.0f}{warm_peak / 1024:>11.0f}")
+
+        # Latency is printed, not asserted — the saving is small next to layout
+        # and within scheduler noise on shared CI runners.
+        slower = [name for name, _, _, cold_peak, warm_peak in rows if warm_peak >= cold_peak]
+        assert not slower, f"warm caches did not reduce allocation for: {slower}"
@@ -0,0 +1,202 @@
+"""Tests for multi_period_panel — N trial balances aligned into one panel.
+
+Every adjacent pair of panel columns must reproduce ``compare_trial_balances``
+for that pair, so the equivalence test compares the two account by account.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+import random
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from auth import require_current_user, require_verified_user
+from database import get_db
+from models import User, UserTier
+from multi_period_comparison import SignificanceThresholds, compare_trial_balances, normalize_account_name
+from multi_period_panel import MAX_PANEL_PERIODS, PanelInputError, PanelPeriod, build_multi_period_panel
+
+
+def _acct(name: str, balance: float, account_type: str = "asset") -> dict:
+    return {"account": name, "debit": max(balance, 0), "credit": max(-balance, 0), "type": account_type}
+
+
+def _random_periods(seed: int, count: int) -> list[PanelPeriod]:
+    rnd = random.Random(seed)
+    names = [f"Account {i}" for i in range(120)] + ["A/R", "Accounts Receivable", "COGS", "Sales Revenue"]
+    periods = []
+    for p in range(count):
+        accounts = []
+        for name in rnd.sample(names, 100):
+            roll = rnd.random()
+            balance = 0.0 if roll < 0.05 else 0.004 if roll < 0.08 else round(rnd.uniform(-60000, 60000), 2)
+            accounts.append(_acct(name, balance, rnd.choice(["asset", "liability", "revenue", "expense", "unknown"])))
+        periods.append(PanelPeriod(label=f"M{p + 1}", accounts=accounts))
+    return periods
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize("materiality", [0.0, 25000.0])
+    def test_each_step_matches_two_period_comparison(self, materiality):
+        periods = _random_periods(38, 8)
+        thresholds = SignificanceThresholds(variance_percent=15.0, variance_amount=5000.0)
+        panel = build_multi_period_panel(periods, materiality, thresholds).to_dict()
+        rows = {normalize_account_name(r["account_name"]): r for r in panel["accounts"]}
+
+        for step in range(len(periods) - 1):
+            pairwise = compare_trial_balances(
+                periods[step].accounts,
+                periods[step + 1].accounts,
+                materiality_threshold=materiality,
+                thresholds=thresholds,
+            )
+            assert sum(1 for r in panel["accounts"] if r["movements"][step] is not None) == pairwise.total_accounts
+            assert panel["movement_counts"][step]["movements_by_type"] == pairwise.movements_by_type
+            for movement in pairwise.all_movements:
+                expected = movement.to_dict()
+                actual = rows[normalize_account_name(movement.account_name)]["movements"][step]
+                for key in ("movement_type", "significance", "is_dormant", "change_amount"):
+                    assert actual[key] == expected[key], (step, movement.account_name, key)
+                if expected["change_percent"] is None:
+                    assert actual["change_percent"] is None
+                else:
+                    assert math.isclose(actual["change_percent"], expected["change_percent"], rel_tol=1e-12)
+
+
+class TestPanel:
+    def test_alignment_presence_and_rollups(self):
+        periods = [
+            PanelPeriod("Jan", [_acct("Cash", 100), _acct("A/R", 50)]),
+            PanelPeriod("Feb", [_acct("Cash", 150), _acct("Accounts Receivable", 25), _acct("A/R", 25)]),
+            PanelPeriod("Mar", [_acct("Cash", 150), _acct("Prepaid Rent", 10)]),
+        ]
+        panel = build_multi_period_panel(periods)
+        d = panel.to_dict()
+        assert d["step_labels"] == ["Jan → Feb", "Feb → Mar"]
+        by_name = {r["account_name"]: r for r in d["accounts"]}
+        assert by_name["Cash"]["balances"] == [100.0, 150.0, 150.0]
+        # A/R and Accounts Receivable normalize together; the latest period's first name wins.
+        receivable = by_name["Accounts Receivable"]
+        assert receivable["balances"] == [50.0, 50.0, None]
+        assert [m["movement_type"] for m in receivable["movements"]] == ["unchanged", "closed_account"]
+        assert by_name["Prepaid Rent"]["movements"][0] is None
+        assert by_name["Prepaid Rent"]["movements"][1]["movement_type"] == "new_account"
+        assert d["duplicate_account_warnings"][0]["period"] == "Feb"
+
+        rollup_total = sum(r["totals"][1] for r in d["lead_sheet_rollups"])
+        assert rollup_total == pytest.approx(200.0)
+        assert sum(r["account_count"] for r in d["lead_sheet_rollups"]) == 3
+
+    def test_period_limits(self):
+        with pytest.raises(PanelInputError):
+            build_multi_period_panel([PanelPeriod("Only", [])])
+        with pytest.raises(PanelInputError):
+            build_multi_period_panel([PanelPeriod(f"P{i}", []) for i in range(MAX_PANEL_PERIODS + 1)])
+
+    def test_exports(self):
+        from openpyxl import load_workbook
+
+        from multi_period_panel_export import iter_panel_csv, write_panel_workbook
+
+        panel = build_multi_period_panel(_random_periods(7, 4))
+        rows = list(csv.reader(io.StringIO("".join(iter_panel_csv(panel)))))
+        assert rows[0] == ["=== BALANCES ==="]
+        assert rows[1] == ["Account", "Lead Sheet", "Category", "M1", "M2", "M3", "M4"]
+        movement_rows = int((panel.movement_codes >= 0).sum())
+        start = rows.index(["=== MOVEMENTS ==="])
+        end = rows.index(["=== LEAD SHEET ROLLUP ==="])
+        assert end - start - 3 == movement_rows  # title, header, trailing blank
+
+        output = io.BytesIO()
+        write_panel_workbook(panel, output)
+        wb = load_workbook(io.BytesIO(output.getvalue()))
+        assert wb.sheetnames == ["Balances", "Movements", "Lead Sheets"]
+        assert wb["Balances"].max_row == 1 + len(panel.accounts)
+        assert wb["Movements"].max_row == 1 + movement_rows
+
+
+@pytest.fixture
+def override_professional(db_session):
+    from main import app
+
+    user = User(
+        email="panel_api@example.com",
+        name="Panel Tester",
+        hashed_password="$2b$12$fakehashvalue",
+        tier=UserTier.PROFESSIONAL,
+        is_active=True,
+        is_verified=True,
+    )
+    db_session.add(user)
+    db_session.flush()
+    app.dependency_overrides[require_verified_user] = lambda: user
+    app.dependency_overrides[require_current_user] = lambda: user
+    app.dependency_overrides[get_db] = lambda: db_session
+    yield user
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestPanelRoutes:
+    PAYLOAD = {
+        "periods": [
+            {"label": "Q1", "accounts": [_acct("Cash", 10000), _acct("Revenue", -10000, "revenue")]},
+            {"label": "Q2", "accounts": [_acct("Cash", 14000), _acct("Revenue", -14000, "revenue")]},
+            {"label": "Q3", "accounts": [_acct("Cash", 9000), _acct("Revenue", -9000, "revenue")]},
+        ]
+    }
+
+    @pytest.mark.asyncio
+    async def test_compare_panel(self, override_professional):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/compare-panel", json=self.PAYLOAD)
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["period_labels"] == ["Q1", "Q2", "Q3"]
+        assert body["total_accounts"] == 2
+        cash = next(a for a in body["accounts"] if a["account_name"] == "Cash")
+        assert [m["change_amount"] for m in cash["movements"]] == [4000.0, -5000.0]
+
+    @pytest.mark.asyncio
+    async def test_compare_panel_records_tool_run(self, override_professional):
+        from main import app
+
+        with patch("routes.multi_period.maybe_record_tool_run") as record:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+                r = await ac.post("/audit/compare-panel", json=self.PAYLOAD)
+        assert r.status_code == 200, r.text
+        record.assert_called_once()
+        _, engagement_id, user_id, tool_name, success, _, flagged = record.call_args.args
+        assert (engagement_id, user_id, tool_name, success) == (None, override_professional.id, "multi_period", True)
+        assert flagged == ["Cash", "Revenue"]
+
+    @pytest.mark.asyncio
+    async def test_single_period_rejected(self, override_professional):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.post("/audit/compare-panel", json={"periods": self.PAYLOAD["periods"][:1]})
+        assert r.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_csv_and_excel_exports(self, override_professional):
+        from openpyxl import load_workbook
+
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            csv_response = await ac.post("/export/csv/panel", json=self.PAYLOAD)
+            xlsx_response = await ac.post("/export/excel/panel", json=self.PAYLOAD)
+        assert csv_response.status_code == 200
+        assert "Multi_Period_Panel_" in csv_response.headers["content-disposition"]
+        assert ["=== LEAD SHEET ROLLUP ==="] in list(csv.reader(io.StringIO(csv_response.text)))
+        assert xlsx_response.status_code == 200
+        wb = load_workbook(io.BytesIO(xlsx_response.content))
+        assert wb["Balances"].max_row == 3
@@ -4,18 +4,26 @@ Sprint 287: Phase XXXIX — TB Population Profile Report
 Sprint 511: Enrichment — Benford, stratification, exceptions, procedures, data quality
 """
 
+import random
+import time
+from decimal import Decimal
+
+import numpy as np
 import pytest
 
 from population_profile_engine import (
     GINI_HIGH_LABEL,
     ExceptionFlags,
+    PopulationProfileAccumulator,
     _compute_account_type_stratification,
     _compute_data_quality,
     _compute_exception_flags,
     _compute_gini,
     _generate_suggested_procedures,
     _interpret_gini,
+    _top_indices,
     compute_population_profile,
+    compute_population_profile_streaming,
     run_population_profile,
 )
 
@@ -547,6 +555,107 @@ class TestRunPopulationProfile:
         assert result.total_abs_balance == pytest.approx(3500.0)
 
 
+def _random_population(n: int, seed: int = 7) -> tuple[dict, dict, dict]:
+    rng = random.Random(seed)
+    categories = ["asset", "Liability", "equity", "revenue", "expense", "Other", "Unknown"]
+    balances, classified, numbers = {}, {}, {}
+    for i in range(n):
+        amount = Decimal(str(round(rng.choice([0, 50, 1e3, 1e5, 5e6]) * rng.random() * rng.choice([1, -1]), 2)))
+        if rng.random() < 0.1:
+            amount = Decimal("1000.00")  # ties for top-N ordering
+        balances[f"{i:05d} Account"] = {"debit": max(amount, Decimal("0")), "credit": max(-amount, Decimal("0"))}
+        classified[f"{i:05d} Account"] = rng.choice(categories)
+        numbers[f"{i:05d} Account"] = str(i)
+    return balances, classified, numbers
+
+
+def _chunks(balances: dict, size: int) -> list[dict]:
+    items = list(balances.items())
+    return [dict(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+class TestTopIndices:
+    """argpartition-based top-N must match a stable descending sort."""
+
+    def test_matches_stable_sort_with_boundary_ties(self):
+        values = np.array([5.0, 1.0, 5.0, 3.0, 5.0, 9.0, 5.0])
+        expected = sorted(range(len(values)), key=lambda i: values[i], reverse=True)[:3]
+        assert _top_indices(values, 3).tolist() == expected
+
+    def test_tiebreak_order(self):
+        values = np.array([2.0, 2.0, 2.0])
+        assert _top_indices(values, 2, tiebreak=np.array([5, 1, 3])).tolist() == [1, 2]
+
+
+class TestStreamingProfile:
+    """PopulationProfileAccumulator vs compute_population_profile."""
+
+    def test_exact_statistics_match(self):
+        balances, classified, numbers = _random_population(1200)
+        exact = compute_population_profile(balances, classified, numbers).to_dict()
+        streamed = compute_population_profile_streaming(_chunks(balances, 250), classified, numbers).to_dict()
+
+        for key in ("account_count", "total_abs_balance", "mean_abs_balance", "std_dev_abs_balance", "min_abs_balance",
+                    "max_abs_balance", "top_accounts", "account_type_stratification", "benford_analysis",
+                    "exception_flags", "suggested_procedures", "data_quality"):  # fmt: skip
+            if key == "suggested_procedures":
+                # Procedure text quotes the (approximate) Gini coefficient
+                assert [p["area"] for p in streamed[key]] == [p["area"] for p in exact[key]]
+            else:
+                assert streamed[key] == exact[key], key
+        assert [b["count"] for b in streamed["buckets"]] == [b["count"] for b in exact["buckets"]]
+        assert [b["sum_abs"] for b in streamed["buckets"]] == pytest.approx([b["sum_abs"] for b in exact["buckets"]])
+
+    def test_sketched_statistics_within_tolerance(self):
+        balances, classified, numbers = _random_population(3000, seed=11)
+        exact = compute_population_profile(balances, classified, numbers)
+        streamed = compute_population_profile_streaming(_chunks(balances, 700), classified, numbers)
+
+        assert streamed.quantile_relative_error == 0.01
+        for attr in ("median_abs_balance", "p25", "p75"):
+            assert getattr(streamed, attr) == pytest.approx(getattr(exact, attr), rel=0.03), attr
+        assert streamed.gini_coefficient == pytest.approx(exact.gini_coefficient, abs=0.01)
+        assert "quantile_relative_error" in streamed.to_dict()
+        assert "quantile_relative_error" not in exact.to_dict()
+
+    def test_merge_equals_single_stream(self):
+        balances, classified, numbers = _random_population(900, seed=3)
+        chunks = _chunks(balances, 150)
+        single = compute_population_profile_streaming(chunks, classified, numbers).to_dict()
+
+        left, right = PopulationProfileAccumulator(), PopulationProfileAccumulator()
+        for chunk in chunks[:3]:
+            left.add(chunk, classified, numbers)
+        for chunk in chunks[3:]:
+            right.add(chunk, classified, numbers)
+        left.merge(right)
+        merged = left.finalize().to_dict()
+
+        assert merged["top_accounts"] == single["top_accounts"]
+        assert merged["exception_flags"] == single["exception_flags"]
+        assert merged["median_abs_balance"] == single["median_abs_balance"]
+        assert merged["gini_coefficient"] == single["gini_coefficient"]
+        assert merged["std_dev_abs_balance"] == pytest.approx(single["std_dev_abs_balance"])
+
+    def test_empty_stream(self):
+        report = compute_population_profile_streaming([])
+        assert report.account_count == 0
+        assert report.gini_interpretation == "Low"
+
+
+@pytest.mark.slow
+class TestProfilePerformance:
+    """Vectorized profile over a large sub-ledger population."""
+
+    def test_large_population(self):
+        balances, classified, numbers = _random_population(200_000, seed=5)
+        start = time.perf_counter()
+        report = compute_population_profile(balances, classified, numbers)
+        elapsed = time.perf_counter() - start
+        assert report.account_count == 200_000
+        assert elapsed < 10.0, f"Population profile took {elapsed:.2f}s for 200K accounts"
+
+
 class TestRouteRegistration:
     """Test that population profile routes are registered in the app."""
 
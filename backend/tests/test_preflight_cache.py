@@ -0,0 +1,167 @@
+"""
+Tests for ``shared.preflight_cache`` — byte-bounded LRU memory backend,
+Redis backend round-trip, backend selection, and the facade's fallback
+and hit/miss accounting.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from shared import preflight_cache as pc
+from shared.preflight_cache import (
+    MemoryPreflightBackend,
+    PreflightCache,
+    PreflightEntry,
+    RedisPreflightBackend,
+)
+
+
+class _FakeRedis:
+    """Just enough of redis.Redis for the backend (binary values, ``ex`` TTL)."""
+
+    def __init__(self, fail: bool = False):
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.fail = fail
+
+    def _check(self) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self._check()
+        self.data[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+
+    def get(self, key: str) -> bytes | None:
+        self._check()
+        return self.data.get(key)
+
+    def delete(self, key: str) -> None:
+        self._check()
+        self.data.pop(key, None)
+
+
+def _entry(size: int, name: str = "tb.csv") -> PreflightEntry:
+    return PreflightEntry(file_bytes=b"x" * size, filename=name)
+
+
+class TestMemoryBackend:
+    def test_evicts_least_recently_used_by_bytes(self):
+        backend = MemoryPreflightBackend(max_bytes=100, ttl_seconds=60)
+        backend.put("a", _entry(40))
+        backend.put("b", _entry(40))
+        backend.get("a")  # touch — "b" is now LRU
+        backend.put("c", _entry(40))
+
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+        assert backend.get("c") is not None
+        assert backend.total_bytes == 80
+
+    def test_single_large_entry_evicts_several_small(self):
+        backend = MemoryPreflightBackend(max_bytes=100, ttl_seconds=60)
+        for token in "abcd":
+            backend.put(token, _entry(25))
+        backend.put("big", _entry(90))
+        assert len(backend) == 1
+        assert backend.total_bytes == 90
+
+    def test_oversized_entry_not_cached(self):
+        backend = MemoryPreflightBackend(max_bytes=10, ttl_seconds=60)
+        backend.put("a", _entry(5))
+        backend.put("huge", _entry(11))
+        assert backend.get("huge") is None
+        assert backend.get("a") is not None
+
+    def test_expired_entry_dropped_on_get(self):
+        backend = MemoryPreflightBackend(max_bytes=100, ttl_seconds=60)
+        backend.put("a", PreflightEntry(file_bytes=b"abc", filename="a.csv", created_at=time.monotonic() - 61))
+        assert backend.get("a") is None
+        assert backend.total_bytes == 0
+
+    def test_expired_head_purged_on_put(self):
+        backend = MemoryPreflightBackend(max_bytes=100, ttl_seconds=60)
+        backend.put("old", PreflightEntry(file_bytes=b"abc", filename="a.csv", created_at=time.monotonic() - 61))
+        backend.put("new", _entry(3))
+        assert len(backend) == 1
+
+    def test_remove_releases_bytes(self):
+        backend = MemoryPreflightBackend(max_bytes=100, ttl_seconds=60)
+        backend.put("a", _entry(30))
+        backend.remove("a")
+        backend.remove("a")  # idempotent
+        assert backend.total_bytes == 0
+
+
+class TestRedisBackend:
+    def test_round_trip_preserves_bytes_and_metadata(self):
+        client = _FakeRedis()
+        backend = RedisPreflightBackend(client, ttl_seconds=600)
+        payload = bytes(range(256))
+        backend.put("tok", PreflightEntry(file_bytes=payload, filename="wb.xlsx", metadata={"sheets": ["TB"]}))
+
+        entry = backend.get("tok")
+        assert entry is not None
+        assert entry.file_bytes == payload
+        assert entry.filename == "wb.xlsx"
+        assert entry.metadata == {"sheets": ["TB"]}
+        assert client.ttls["preflight:tok"] == 600
+
+    def test_tokens_visible_across_cache_instances(self):
+        # Two workers sharing one Redis.
+        client = _FakeRedis()
+        worker_a = PreflightCache(RedisPreflightBackend(client))
+        worker_b = PreflightCache(RedisPreflightBackend(client))
+        token = worker_a.put(b"data", "tb.csv")
+        assert worker_b.get(token).file_bytes == b"data"
+        worker_b.remove(token)
+        assert worker_a.get(token) is None
+
+
+class TestFacade:
+    def test_hit_miss_counters(self):
+        cache = PreflightCache(MemoryPreflightBackend(max_bytes=100, ttl_seconds=60))
+        token = cache.put(b"abc", "a.csv")
+        assert cache.get(token) is not None
+        assert cache.get("unknown") is None
+        assert cache.stats() == {"backend": "memory", "hits": 1, "misses": 1}
+
+    def test_redis_failure_falls_back_to_memory(self):
+        client = _FakeRedis()
+        cache = PreflightCache(RedisPreflightBackend(client))
+        client.fail = True
+        with patch.object(pc, "_new_memory_backend", return_value=MemoryPreflightBackend(100, 60)):
+            token = cache.put(b"abc", "a.csv")
+        entry = cache.get(token)
+        assert entry is not None and entry.file_bytes == b"abc"
+        cache.remove(token)
+        assert cache.get(token) is None
+
+    @pytest.mark.parametrize("setting", ["auto", "redis"])
+    def test_selects_redis_when_reachable(self, setting: str):
+        with (
+            patch("config.PREFLIGHT_CACHE_BACKEND", setting),
+            patch.object(pc, "_connect_redis", return_value=_FakeRedis()),
+        ):
+            assert PreflightCache().backend.name == "redis"
+
+    def test_memory_setting_never_connects(self):
+        with (
+            patch("config.PREFLIGHT_CACHE_BACKEND", "memory"),
+            patch.object(pc, "_connect_redis") as connect,
+        ):
+            assert PreflightCache().backend.name == "memory"
+        connect.assert_not_called()
+
+    def test_unreachable_redis_uses_memory(self):
+        with (
+            patch("config.PREFLIGHT_CACHE_BACKEND", "auto"),
+            patch.object(pc, "_connect_redis", return_value=None),
+        ):
+            assert PreflightCache().backend.name == "memory"
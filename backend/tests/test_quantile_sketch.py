@@ -0,0 +1,79 @@
+"""
+Tests for shared/quantile_sketch.py — mergeable relative-error quantile sketch.
+"""
+
+import numpy as np
+import pytest
+
+from shared.quantile_sketch import QuantileSketch
+
+
+def _exact_gini(values: np.ndarray) -> float:
+    ordered = np.sort(values)
+    n = ordered.size
+    return float(2 * np.dot(np.arange(1, n + 1), ordered) / (n * ordered.sum()) - (n + 1) / n)
+
+
+@pytest.fixture
+def population() -> np.ndarray:
+    rng = np.random.default_rng(42)
+    values = rng.lognormal(mean=8, sigma=2.5, size=20_000)
+    values[:500] = 0.0
+    return values
+
+
+class TestQuantileSketch:
+    @pytest.mark.parametrize("q", [0.0, 0.01, 0.25, 0.5, 0.75, 0.99, 1.0])
+    def test_quantiles_within_relative_accuracy(self, population, q):
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.add(population)
+        # The estimate is within 1% of a value whose rank is at most one away.
+        exact_low = np.quantile(population, q, method="lower")
+        exact_high = np.quantile(population, q, method="higher")
+        estimate = sketch.quantile(q)
+        assert exact_low * 0.99 <= estimate <= exact_high * 1.01
+
+    def test_zeros_min_max_and_total(self, population):
+        sketch = QuantileSketch()
+        sketch.add(population)
+        assert sketch.count == population.size
+        assert sketch.zero_count == 500
+        assert sketch.quantile(0.01) == 0.0
+        assert sketch.min == 0.0
+        assert sketch.max == population.max()
+        assert sketch.total == pytest.approx(population.sum())
+
+    def test_merge_matches_single_sketch(self, population):
+        whole = QuantileSketch()
+        whole.add(population)
+        parts = [QuantileSketch() for _ in range(4)]
+        for part, chunk in zip(parts, np.array_split(population[::-1], 4), strict=True):
+            part.add(chunk)
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+        assert merged.count == whole.count
+        for q in (0.1, 0.5, 0.9):
+            assert merged.quantile(q) == whole.quantile(q)
+        assert merged.gini() == pytest.approx(whole.gini())
+
+    def test_gini_close_to_exact(self, population):
+        sketch = QuantileSketch()
+        sketch.add(population)
+        assert sketch.gini() == pytest.approx(_exact_gini(population), abs=0.005)
+
+    def test_gini_of_equal_values_is_zero(self):
+        sketch = QuantileSketch()
+        sketch.add([250.0] * 10)
+        assert sketch.gini() == pytest.approx(0.0, abs=1e-12)
+
+    def test_empty_and_invalid(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.gini() == 0.0
+        with pytest.raises(ValueError):
+            sketch.add([-1.0])
+        with pytest.raises(ValueError):
+            sketch.merge(QuantileSketch(relative_accuracy=0.05))
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=1.5)
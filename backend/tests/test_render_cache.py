@@ -0,0 +1,277 @@
+"""
+Tests for ``shared.render_cache`` — cache keys, the byte-bounded memory tier,
+the object-store tier (against a local stand-in for ``shared.storage_client``)
+and repeat memo downloads served without re-rendering.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import time
+from datetime import date
+
+import httpx
+import pytest
+from freezegun import freeze_time
+from pypdf import PdfReader
+
+from shared.pdf_branding import PDFBrandingContext
+from shared.render_cache import (
+    OBJECT_KEY_PREFIX,
+    MemoryRenderBackend,
+    ObjectStoreRenderBackend,
+    RenderCache,
+    render_cache_key,
+)
+
+PAYLOAD = {"result": {"score": 12.5, "rows": [1, 2, 3]}, "workpaper": {"client_name": "Acme"}}
+USER_ID = 7
+BRANDED = PDFBrandingContext(tier_has_branding=True, logo_bytes=b"\x89PNG", header_text="Acme LLP")
+
+
+class _LocalObjectStore:
+    """Stand-in for ``shared.storage_client`` backed by a dict."""
+
+    def __init__(self, fail: bool = False):
+        self.objects: dict[str, bytes] = {}
+        self.fail = fail
+
+    def upload_bytes(self, key: str, data: bytes, content_type: str) -> bool:
+        if self.fail:
+            raise ConnectionError("bucket unreachable")
+        self.objects[key] = data
+        return True
+
+    def download_bytes(self, key: str) -> bytes | None:
+        if self.fail:
+            raise ConnectionError("bucket unreachable")
+        return self.objects.get(key)
+
+    def delete_key(self, key: str) -> bool:
+        self.objects.pop(key, None)
+        return True
+
+
+class _Renderer:
+    def __init__(self, data: bytes = b"%PDF-rendered"):
+        self.data = data
+        self.calls = 0
+
+    def __call__(self) -> bytes:
+        self.calls += 1
+        return self.data
+
+
+class TestRenderCacheKey:
+    def test_key_is_stable_for_equal_input(self):
+        reordered = {"workpaper": {"client_name": "Acme"}, "result": {"rows": [1, 2, 3], "score": 12.5}}
+        assert render_cache_key(USER_ID, "memo", PAYLOAD) == render_cache_key(USER_ID, "memo", reordered)
+
+    def test_every_key_component_matters(self):
+        base = render_cache_key(USER_ID, "memo", PAYLOAD, version="1")
+        assert render_cache_key(USER_ID, "other", PAYLOAD, version="1") != base
+        assert render_cache_key(USER_ID, "memo", {**PAYLOAD, "extra": {}}, version="1") != base
+        assert render_cache_key(USER_ID, "memo", PAYLOAD, BRANDED, version="1") != base
+        assert render_cache_key(USER_ID, "memo", PAYLOAD, version="2") != base
+        assert render_cache_key(USER_ID, "memo", PAYLOAD, version="1", day=date(2026, 3, 20)) != base
+        assert render_cache_key(USER_ID + 1, "memo", PAYLOAD, version="1") != base
+
+    def test_key_rolls_over_at_the_utc_day(self):
+        with freeze_time("2026-03-19T23:59:00Z"):
+            today = render_cache_key(USER_ID, "memo", PAYLOAD)
+        with freeze_time("2026-03-20T00:00:30Z"):
+            tomorrow = render_cache_key(USER_ID, "memo", PAYLOAD)
+        assert today != tomorrow
+        assert render_cache_key(USER_ID, "memo", PAYLOAD, day=date(2026, 3, 19)) == today
+
+    def test_unauthorised_branding_renders_as_default(self):
+        downgraded = PDFBrandingContext(tier_has_branding=False, logo_bytes=b"\x89PNG", header_text="Acme LLP")
+        assert render_cache_key(USER_ID, "memo", PAYLOAD, downgraded) == render_cache_key(USER_ID, "memo", PAYLOAD)
+        new_logo = PDFBrandingContext(tier_has_branding=True, logo_bytes=b"\x89PNG2", header_text="Acme LLP")
+        assert render_cache_key(USER_ID, "memo", PAYLOAD, new_logo) != render_cache_key(
+            USER_ID, "memo", PAYLOAD, BRANDED
+        )
+
+
+class TestMemoryTier:
+    def test_evicts_least_recently_used_by_bytes(self):
+        memory = MemoryRenderBackend(max_bytes=100, ttl_seconds=60)
+        memory.put("a", b"x" * 40)
+        memory.put("b", b"x" * 40)
+        memory.get("a")
+        memory.put("c", b"x" * 40)
+        assert memory.get("b") is None
+        assert memory.get("a") is not None and memory.get("c") is not None
+        assert memory.total_bytes == 80
+
+    def test_expired_and_oversized(self):
+        memory = MemoryRenderBackend(max_bytes=100, ttl_seconds=60)
+        memory.put("big", b"x" * 101)
+        assert len(memory) == 0
+        memory.put("a", b"x")
+        memory._store["a"].created_at = time.monotonic() - 61
+        assert memory.get("a") is None
+        assert memory.total_bytes == 0
+
+
+class TestRenderCache:
+    def test_renders_once_per_key(self):
+        cache = RenderCache(MemoryRenderBackend())
+        render = _Renderer()
+        assert cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID) == render.data
+        assert cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID) == render.data
+        assert cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID, branding=BRANDED) == render.data
+        assert render.calls == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_users_do_not_share_renders(self):
+        bucket = _LocalObjectStore()
+        cache = RenderCache(MemoryRenderBackend(), ObjectStoreRenderBackend(bucket))
+        render = _Renderer()
+        cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID)
+        cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID + 1)
+        assert render.calls == 2
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert sorted(key.split("/")[1] for key in bucket.objects) == [str(USER_ID), str(USER_ID + 1)]
+
+    def test_disabled_cache_always_renders(self):
+        cache = RenderCache(configured=True)
+        render = _Renderer()
+        cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID)
+        cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID)
+        assert render.calls == 2
+
+    def test_object_store_tier_shared_between_processes(self):
+        bucket = _LocalObjectStore()
+        first = RenderCache(MemoryRenderBackend(), ObjectStoreRenderBackend(bucket))
+        render = _Renderer()
+        first.get_or_render("memo", PAYLOAD, render, user_id=USER_ID)
+        assert [key.startswith(f"{OBJECT_KEY_PREFIX}{USER_ID}/") for key in bucket.objects] == [True]
+
+        # A second worker with a cold memory tier is served from the bucket,
+        # then from its own memory tier.
+        memory = MemoryRenderBackend()
+        second = RenderCache(memory, ObjectStoreRenderBackend(bucket))
+        assert second.get_or_render("memo", PAYLOAD, render, user_id=USER_ID) == render.data
+        assert render.calls == 1
+        assert len(memory) == 1
+
+    def test_expired_objects_are_deleted(self):
+        bucket = _LocalObjectStore()
+        cache = RenderCache(object_store=ObjectStoreRenderBackend(bucket, ttl_seconds=60))
+        render = _Renderer()
+        cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID)
+        # Backdate the object's creation time to the epoch.
+        bucket.objects = {key: b"\x00" * 8 + value[8:] for key, value in bucket.objects.items()}
+        assert cache.get(render_cache_key(USER_ID, "memo", PAYLOAD)) is None
+        assert bucket.objects == {}
+
+    def test_object_store_errors_fall_back_to_rendering(self):
+        cache = RenderCache(object_store=ObjectStoreRenderBackend(_LocalObjectStore(fail=True)))
+        render = _Renderer()
+        assert cache.get_or_render("memo", PAYLOAD, render, user_id=USER_ID) == render.data
+        assert render.calls == 1
+
+
+MEMO_PAYLOAD = {
+    "composite_score": {
+        "score": 8.0,
+        "risk_tier": "low",
+        "tests_run": 3,
+        "total_entries": 120,
+        "total_flagged": 0,
+        "flag_rate": 0.0,
+        "flags_by_severity": {"high": 0, "medium": 0, "low": 0},
+        "top_findings": [],
+    },
+    "test_results": [],
+    "data_quality": {"completeness_score": 100.0},
+    "filename": "gl",
+}
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestRepeatMemoDownload:
+    @pytest.mark.asyncio
+    async def test_second_download_served_from_cache(self, override_auth_verified, monkeypatch: pytest.MonkeyPatch):
+        import routes.export_memos
+        from main import app
+
+        cache = RenderCache(MemoryRenderBackend())
+        monkeypatch.setattr(routes.export_memos, "render_cache", cache)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            first = await ac.post("/export/je-testing-memo", json=MEMO_PAYLOAD)
+            second = await ac.post("/export/je-testing-memo", json=MEMO_PAYLOAD)
+            renamed = await ac.post("/export/je-testing-memo", json={**MEMO_PAYLOAD, "client_name": "Other"})
+
+        assert first.status_code == second.status_code == renamed.status_code == 200
+        assert first.content.startswith(b"%PDF")
+        assert second.content == first.content
+        assert renamed.content != first.content
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_other_user_renders_their_own_copy(
+        self, override_auth_verified, db_session, monkeypatch: pytest.MonkeyPatch
+    ):
+        import routes.export_memos
+        from auth import require_current_user, require_verified_user
+        from main import app
+        from models import User, UserTier
+
+        cache = RenderCache(MemoryRenderBackend())
+        monkeypatch.setattr(routes.export_memos, "render_cache", cache)
+        other = User(
+            email="other_firm@example.com",
+            name="Other Firm User",
+            hashed_password="$2b$12$fakehashvalue",
+            tier=UserTier.PROFESSIONAL,
+            is_active=True,
+            is_verified=True,
+        )
+        db_session.add(other)
+        db_session.flush()
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            first = await ac.post("/export/je-testing-memo", json=MEMO_PAYLOAD)
+            app.dependency_overrides[require_verified_user] = lambda: other
+            app.dependency_overrides[require_current_user] = lambda: other
+            second = await ac.post("/export/je-testing-memo", json=MEMO_PAYLOAD)
+
+        assert first.status_code == second.status_code == 200
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    @pytest.mark.asyncio
+    async def test_repeat_download_keeps_reference_and_generated_time(
+        self, override_auth_verified, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A hit replays the first render's reference number and stamp; a new UTC day re-renders."""
+        import routes.export_memos
+        from main import app
+
+        # freeze_time swaps time.monotonic but not the reference _CachedRender's
+        # default_factory captured at import, so the TTL is taken out of play here.
+        cache = RenderCache(MemoryRenderBackend(ttl_seconds=10**10))
+        monkeypatch.setattr(routes.export_memos, "render_cache", cache)
+
+        def header_fields(pdf: bytes) -> tuple[str, str]:
+            text = "".join(page.extract_text() for page in PdfReader(io.BytesIO(pdf)).pages)
+            reference = re.search(r"JET-\d{4}-\d{4}-\d{3}", text)
+            generated = re.search(r"Generated \d{2} \w{3} \d{4} \d{2}:\d{2} UTC", text)
+            assert reference and generated
+            return reference.group(0), generated.group(0)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            with freeze_time("2026-03-19T10:00:00Z") as clock:
+                first = await ac.post("/export/je-testing-memo", json=MEMO_PAYLOAD)
+                clock.move_to("2026-03-19T10:20:07Z")
+                repeat = await ac.post("/export/je-testing-memo", json=MEMO_PAYLOAD)
+                clock.move_to("2026-03-20T00:00:07Z")
+                next_day = await ac.post("/export/je-testing-memo", json=MEMO_PAYLOAD)
+
+        assert repeat.content == first.content
+        assert header_fields(repeat.content) == ("JET-2026-0319-000", "Generated 19 Mar 2026 10:00 UTC")
+        assert header_fields(next_day.content) == ("JET-2026-0320-007", "Generated 20 Mar 2026 00:00 UTC")
+        assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,216 @@
+"""
+Tests for ``shared.result_store`` — compressed, user-scoped tool results that
+memo and CSV exports accept by ``result_id`` instead of the full body.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import time
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from shared import result_store as rs
+from shared.export_schemas import JETestingExportInput, StoredResultExportInput
+from shared.result_store import (
+    MemoryResultBackend,
+    RedisResultBackend,
+    ResultStore,
+    StoredResult,
+    compress_result,
+    decompress_result,
+    resolve_export_input,
+)
+
+RESULT = {
+    "composite_score": {"score": 12.5, "risk_tier": "low", "total_flagged": 1},
+    "test_results": [{"test_key": "JT-04", "flagged_entries": [{"entry": {"entry_id": "JE-1", "debit": 50.0}}]}],
+    "data_quality": {"completeness_score": 100.0},
+}
+
+
+class _FakeRedis:
+    def __init__(self, fail: bool = False):
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.fail = fail
+
+    def _check(self) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        self._check()
+        self.data[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+
+    def get(self, key: str) -> bytes | None:
+        self._check()
+        return self.data.get(key)
+
+    def delete(self, key: str) -> None:
+        self._check()
+        self.data.pop(key, None)
+
+
+def _entry(size: int, user_id: int = 1) -> StoredResult:
+    return StoredResult(payload=b"x" * size, codec=rs.CODEC_GZIP, user_id=user_id, tool="ap_testing")
+
+
+class TestCompression:
+    def test_round_trip(self):
+        payload, codec = compress_result(RESULT)
+        assert decompress_result(payload, codec) == RESULT
+
+    def test_repetitive_results_compress_well(self):
+        big = {"test_results": [{"entry": {"account": "Cash - Operating", "debit": 100.0}}] * 5000}
+        payload, _codec = compress_result(big)
+        assert len(payload) * 20 < len(str(big))
+
+    def test_unknown_codec_rejected(self):
+        with pytest.raises(ValueError):
+            decompress_result(b"", "lz4")
+
+
+class TestMemoryBackend:
+    def test_evicts_least_recently_used_by_bytes(self):
+        backend = MemoryResultBackend(max_bytes=100, ttl_seconds=60)
+        backend.put("a", _entry(40))
+        backend.put("b", _entry(40))
+        backend.get("a")
+        backend.put("c", _entry(40))
+        assert backend.get("b") is None
+        assert backend.get("a") is not None and backend.get("c") is not None
+        assert backend.total_bytes == 80
+
+    def test_expired_entries_are_dropped(self):
+        backend = MemoryResultBackend(max_bytes=100, ttl_seconds=60)
+        backend.put("a", _entry(10))
+        backend._store["a"].created_at = time.monotonic() - 61
+        assert backend.get("a") is None
+        assert backend.total_bytes == 0
+
+
+class TestResultStore:
+    def test_put_get_scoped_to_owner(self):
+        store = ResultStore(MemoryResultBackend(), max_entry_bytes=1024 * 1024)
+        result_id = store.put(RESULT, user_id=7, tool="journal_entry_testing", engagement_id=3)
+        assert result_id is not None
+
+        entry = store.get(result_id, user_id=7)
+        assert entry is not None
+        assert (entry.tool, entry.engagement_id) == ("journal_entry_testing", 3)
+        assert entry.result() == RESULT
+
+        assert store.get(result_id, user_id=8) is None
+        assert store.get("missing", user_id=7) is None
+        assert (store.hits, store.misses) == (1, 2)
+
+    def test_over_entry_cap_is_not_stored(self):
+        store = ResultStore(MemoryResultBackend(), max_entry_bytes=8)
+        assert store.put(RESULT, user_id=1, tool="ap_testing") is None
+        assert store.stats()["rejected"] == 1
+
+    def test_redis_round_trip_and_fallback(self):
+        client = _FakeRedis()
+        store = ResultStore(RedisResultBackend(client, ttl_seconds=90), max_entry_bytes=1024 * 1024)
+        result_id = store.put(RESULT, user_id=1, tool="ap_testing")
+        assert client.ttls[f"result:{result_id}"] == 90
+        assert store.get(result_id, user_id=1).result() == RESULT
+
+        client.fail = True
+        fallback_id = store.put(RESULT, user_id=1, tool="ap_testing")
+        assert store.get(fallback_id, user_id=1).result() == RESULT
+
+
+class TestResolveExportInput:
+    @pytest.fixture
+    def store(self, monkeypatch: pytest.MonkeyPatch) -> ResultStore:
+        store = ResultStore(MemoryResultBackend(), max_entry_bytes=1024 * 1024)
+        monkeypatch.setattr(rs, "result_store", store)
+        return store
+
+    def test_full_payload_passes_through(self, store: ResultStore):
+        payload = JETestingExportInput(**RESULT)
+        assert resolve_export_input(payload, JETestingExportInput, tool="journal_entry_testing", user_id=1) is payload
+
+    def test_stored_result_merged_with_workpaper_fields(self, store: ResultStore):
+        result_id = store.put(RESULT, user_id=1, tool="journal_entry_testing")
+        ref = StoredResultExportInput(result_id=result_id, client_name="Acme")
+        resolved = resolve_export_input(ref, JETestingExportInput, tool="journal_entry_testing", user_id=1)
+        assert isinstance(resolved, JETestingExportInput)
+        assert resolved.test_results == RESULT["test_results"]
+        assert resolved.client_name == "Acme"
+        assert resolved.filename == "je_testing"
+
+    def test_foreign_or_wrong_tool(self, store: ResultStore):
+        result_id = store.put(RESULT, user_id=1, tool="ap_testing")
+        ref = StoredResultExportInput(result_id=result_id)
+        with pytest.raises(HTTPException) as foreign:
+            resolve_export_input(ref, JETestingExportInput, tool="ap_testing", user_id=2)
+        assert foreign.value.status_code == 404
+        with pytest.raises(HTTPException) as wrong_tool:
+            resolve_export_input(ref, JETestingExportInput, tool="journal_entry_testing", user_id=1)
+        assert wrong_tool.value.status_code == 400
+
+
+def _gl_csv() -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["Entry ID", "Date", "Account", "Description", "Debit", "Credit"])
+    for i in range(40):
+        amount = f"{(i + 1) * 1000:.2f}"
+        writer.writerow([f"JE-{i:03d}", f"2024-01-{i % 28 + 1:02d}", "Cash", "Receipt", amount, ""])
+        writer.writerow([f"JE-{i:03d}", f"2024-01-{i % 28 + 1:02d}", "Revenue", "Receipt", "", amount])
+    return buffer.getvalue().encode()
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestStoredResultExportRoutes:
+    @pytest.fixture(autouse=True)
+    def _store(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(rs, "result_store", ResultStore(MemoryResultBackend(), max_entry_bytes=1024 * 1024))
+        import shared.testing_route
+
+        monkeypatch.setattr(shared.testing_route, "result_store", rs.result_store)
+
+    @pytest.mark.asyncio
+    async def test_tool_run_result_exports_by_id(self, override_auth_verified):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            run = await ac.post(
+                "/audit/journal-entries",
+                files={"file": ("gl.csv", _gl_csv(), "text/csv")},
+                data={"store_result": "true"},
+            )
+            assert run.status_code == 200, run.text
+            result_id = run.json()["result_id"]
+            assert result_id
+
+            by_id = await ac.post("/export/csv/je-testing", json={"result_id": result_id, "filename": "gl"})
+            full = await ac.post("/export/csv/je-testing", json={**run.json(), "filename": "gl"})
+            assert by_id.status_code == 200, by_id.text
+            assert by_id.content == full.content
+
+            memo = await ac.post("/export/je-testing-memo", json={"result_id": result_id, "client_name": "Acme"})
+            assert memo.status_code == 200, memo.text
+            assert memo.content.startswith(b"%PDF")
+
+            wrong_tool = await ac.post("/export/ap-testing-memo", json={"result_id": result_id})
+            assert wrong_tool.status_code == 400
+            missing = await ac.post("/export/csv/je-testing", json={"result_id": "0" * 32})
+            assert missing.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_result_id_absent_by_default(self, override_auth_verified):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            run = await ac.post("/audit/journal-entries", files={"file": ("gl.csv", _gl_csv(), "text/csv")})
+        assert run.status_code == 200, run.text
+        assert run.json()["result_id"] is None
@@ -7,6 +7,7 @@ Validates:
 - Boundary behavior at exact cutoff timestamp
 - Idempotent repeated runs (second call archives nothing)
 - run_retention_cleanup aggregates both tables
+- Batched archival (keyset batches, per-batch callback, resumable cap)
 - Startup lifespan integration (import wiring)
 """
 
@@ -16,9 +17,11 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import retention_cleanup
 from models import ActivityLog, DiagnosticSummary
 from retention_cleanup import (
     RETENTION_DAYS,
+    RetentionBatch,
     cleanup_expired_activity_logs,
     cleanup_expired_diagnostic_summaries,
     run_retention_cleanup,
@@ -241,6 +244,86 @@ class TestRunRetentionCleanup:
         assert sum(second.values()) == 0
 
 
+# =============================================================================
+# Batched archival
+# =============================================================================
+
+
+class TestBatchedArchival:
+    """Keyset-batched archival with a commit per batch."""
+
+    def _old_logs(self, db_session, user, n):
+        old_ts = datetime.now(UTC) - timedelta(days=RETENTION_DAYS + 30)
+        return [_make_activity_log(db_session, user, timestamp=old_ts) for _ in range(n)]
+
+    def test_batches_cover_all_rows_in_id_order(self, db_session, make_user):
+        user = make_user(email="ret_batch_ids@test.com")
+        logs = self._old_logs(db_session, user, 5)
+        batches: list[RetentionBatch] = []
+
+        archived = cleanup_expired_activity_logs(db_session, batch_size=2, on_batch=batches.append)
+
+        assert archived == 5
+        assert [b.rows_archived for b in batches] == [2, 2, 1]
+        assert [b.batch_number for b in batches] == [1, 2, 3]
+        assert batches[0].first_id == logs[0].id
+        assert batches[-1].last_id == logs[-1].id
+        assert all(b.table == "activity_logs" for b in batches)
+
+    def test_recent_rows_inside_id_range_untouched(self, db_session, make_user):
+        user = make_user(email="ret_batch_mixed@test.com")
+        old_ts = datetime.now(UTC) - timedelta(days=RETENTION_DAYS + 30)
+        old_a = _make_activity_log(db_session, user, timestamp=old_ts)
+        recent = _make_activity_log(db_session, user, timestamp=datetime.now(UTC) - timedelta(days=1))
+        old_b = _make_activity_log(db_session, user, timestamp=old_ts)
+
+        assert cleanup_expired_activity_logs(db_session, batch_size=10) == 2
+        archived_ids = {
+            row.id for row in db_session.query(ActivityLog).filter(ActivityLog.archived_at.isnot(None))
+        }
+        assert archived_ids == {old_a.id, old_b.id}
+        assert recent.id not in archived_ids
+
+    def test_capped_run_resumes_on_next_run(self, db_session, make_user, monkeypatch):
+        user = make_user(email="ret_batch_resume@test.com")
+        self._old_logs(db_session, user, 5)
+        monkeypatch.setattr(retention_cleanup, "RETENTION_MAX_BATCHES_PER_RUN", 1)
+
+        assert cleanup_expired_activity_logs(db_session, batch_size=2) == 2
+        assert cleanup_expired_activity_logs(db_session, batch_size=2) == 2
+        assert cleanup_expired_activity_logs(db_session, batch_size=2) == 1
+        assert cleanup_expired_activity_logs(db_session, batch_size=2) == 0
+
+    def test_sleeps_between_full_batches(self, db_session, make_user, monkeypatch):
+        user = make_user(email="ret_batch_sleep@test.com")
+        self._old_logs(db_session, user, 4)
+        monkeypatch.setattr(retention_cleanup, "RETENTION_BATCH_SLEEP_MS", 25)
+        sleeps: list[float] = []
+        monkeypatch.setattr(retention_cleanup.time, "sleep", sleeps.append)
+
+        cleanup_expired_activity_logs(db_session, batch_size=2)
+        # Two full batches, then an empty probe — no sleep after the last.
+        assert sleeps == [0.025, 0.025]
+
+    def test_batch_size_zero_uses_single_update(self, db_session, make_user):
+        user = make_user(email="ret_batch_zero@test.com")
+        self._old_logs(db_session, user, 3)
+        batches: list[RetentionBatch] = []
+        assert cleanup_expired_activity_logs(db_session, batch_size=0, on_batch=batches.append) == 3
+        assert batches == []
+
+    def test_run_retention_cleanup_forwards_callback(self, db_session, make_user, make_client):
+        user = make_user(email="ret_batch_run@test.com")
+        client = make_client(user=user)
+        old_ts = datetime.now(UTC) - timedelta(days=RETENTION_DAYS + 30)
+        _make_activity_log(db_session, user, timestamp=old_ts)
+        _make_diagnostic_summary(db_session, user, client, timestamp=old_ts)
+        batches: list[RetentionBatch] = []
+
+        run_retention_cleanup(db_session, on_batch=batches.append)
+        assert {b.table for b in batches} == {"activity_logs", "diagnostic_summaries"}
+
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -260,6 +343,7 @@ class TestRetentionConfig:
         env_path = Path(__file__).parent.parent / ".env.example"
         source = env_path.read_text()
         assert "RETENTION_DAYS" in source
+        assert "RETENTION_BATCH_SIZE" in source
 
 
 # =============================================================================
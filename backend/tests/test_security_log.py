@@ -0,0 +1,106 @@
+"""
+Tests for the in-memory security log (security_utils.log_secure_operation).
+
+The log is a fixed-size ring of raw entries: the newest 1000 operations are
+kept in call order, timestamps are formatted only when read, and configured
+high-frequency operations are sampled.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+import security_utils
+from security_utils import SECURITY_LOG_CAPACITY, get_security_log, log_secure_operation
+
+
+@pytest.fixture(autouse=True)
+def _clean_log(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(security_utils, "_sample_every", {})
+    monkeypatch.setattr(security_utils, "_sample_counts", {})
+    security_utils._security_log.clear()
+    yield
+    security_utils._security_log.clear()
+
+
+class TestSecurityLog:
+    def test_entries_keep_shape_and_order(self):
+        log_secure_operation("first", "a")
+        log_secure_operation("second")
+        entries = get_security_log()
+        assert [(e["operation"], e["details"]) for e in entries] == [("first", "a"), ("second", "")]
+        assert set(entries[0]) == {"timestamp", "operation", "details"}
+        assert datetime.fromisoformat(entries[0]["timestamp"]).utcoffset().total_seconds() == 0
+
+    def test_capacity_drops_oldest(self):
+        for i in range(SECURITY_LOG_CAPACITY + 25):
+            log_secure_operation("op", str(i))
+        entries = get_security_log()
+        assert len(entries) == SECURITY_LOG_CAPACITY
+        assert entries[0]["details"] == "25"
+        assert entries[-1]["details"] == str(SECURITY_LOG_CAPACITY + 24)
+
+    def test_sampling_keeps_every_nth_call(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(security_utils, "_sample_every", {"noisy": 10})
+        for i in range(25):
+            log_secure_operation("noisy", str(i))
+            log_secure_operation("rare", str(i))
+        noisy = [e for e in get_security_log() if e["operation"] == "noisy"]
+        assert [e["details"] for e in noisy] == ["0", "10", "20"]
+        assert all(e["sampled_every"] == 10 for e in noisy)
+        assert sum(e["operation"] == "rare" for e in get_security_log()) == 25
+
+    def test_sample_rates_parse(self):
+        parsed = security_utils._parse_sample_rates(" noisy=10, once=1,bad=x,,=5,other = 3")
+        assert parsed == {"noisy": 10, "other": 3}
+
+    def test_concurrent_writers_lose_nothing(self):
+        def write(n: int) -> None:
+            for i in range(100):
+                log_secure_operation(f"thread_{n}", str(i))
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        entries = get_security_log()
+        assert len(entries) == 800
+        for n in range(8):
+            mine = [e["details"] for e in entries if e["operation"] == f"thread_{n}"]
+            assert mine == [str(i) for i in range(100)]
+
+
+@pytest.mark.slow
+class TestSecurityLogOverhead:
+    """Micro-benchmark: per-call cost of log_secure_operation on a full log."""
+
+    CALLS = 200_000
+
+    def test_per_call_overhead(self):
+        for _ in range(SECURITY_LOG_CAPACITY):
+            log_secure_operation("warmup")
+
+        start = time.perf_counter()
+        for _ in range(self.CALLS):
+            log_secure_operation("bench", "chunk processed")
+        per_call_us = (time.perf_counter() - start) / self.CALLS * 1e6
+
+        # The previous implementation: ISO timestamp per call, list.pop(0) trim.
+        from datetime import UTC
+
+        legacy: list[dict] = [{}] * SECURITY_LOG_CAPACITY
+        start = time.perf_counter()
+        for _ in range(self.CALLS):
+            legacy.append(
+                {"timestamp": datetime.now(UTC).isoformat(), "operation": "bench", "details": "chunk processed"}
+            )
+            if len(legacy) > SECURITY_LOG_CAPACITY:
+                legacy.pop(0)
+        legacy_us = (time.perf_counter() - start) / self.CALLS * 1e6
+
+        print(f"\nlog_secure_operation: {per_call_us:.3f} us/call (list + isoformat: {legacy_us:.3f} us/call)")
+        assert per_call_us < 2.0
+        assert per_call_us < legacy_us
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import sod_engine
 from sod_engine import (
     DEFAULT_SOD_RULES,
     RolePermission,
@@ -204,6 +207,59 @@ class TestAggregation:
         assert u1_summary.risk_tier == "moderate"
 
 
+# =============================================================================
+# Bitset evaluation
+# =============================================================================
+
+
+class TestBitsetEvaluation:
+    def test_permission_index_round_trip(self):
+        index = sod_engine._PermissionIndex()
+        mask = index.mask(["je_post", "je_create", "je_post"])
+        assert index.names(mask) == ["je_create", "je_post"]
+        assert index.known_mask(["je_create", "unknown"]) is None
+
+    def test_rule_requiring_ungranted_permission_is_not_compiled(self):
+        index = sod_engine._PermissionIndex()
+        index.mask(["foo"])
+        never = SodRule("X-1", "x", SodSeverity.LOW, permissions_required=frozenset({"missing"}))
+        partial = SodRule(
+            "X-2",
+            "y",
+            SodSeverity.LOW,
+            permissions_required=frozenset({"foo"}),
+            permissions_alternate=frozenset({"bar"}),
+        )
+        assert sod_engine._compile_rules([never, partial], index) == []
+
+    def test_users_with_same_roles_evaluated_once(self):
+        users = [
+            UserRoleAssignment(user_id=f"u{i}", user_name=f"User {i}", role_codes=["Poster", "creator"])
+            for i in range(5)
+        ] + [UserRoleAssignment(user_id="u9", user_name="Reordered", role_codes=["CREATOR", "poster", "poster"])]
+        roles = [
+            RolePermission(role_code="creator", permissions=["je_create"]),
+            RolePermission(role_code="poster", permissions=["je_post"]),
+        ]
+        real = sod_engine._evaluate_role_combination
+        with patch.object(sod_engine, "_evaluate_role_combination", side_effect=real) as evaluate:
+            result = analyze_segregation_of_duties(users, roles)
+        assert evaluate.call_count == 1
+        assert [c.user_id for c in result.conflicts] == [u.user_id for u in users]
+        assert all(c.triggering_roles == ["creator", "poster"] for c in result.conflicts)
+
+    def test_triggering_roles_only_include_contributing_roles(self):
+        users = [UserRoleAssignment(user_id="u1", user_name="A", role_codes=["creator", "poster", "viewer"])]
+        roles = [
+            RolePermission(role_code="creator", permissions=["je_create"]),
+            RolePermission(role_code="poster", permissions=["je_post"]),
+            RolePermission(role_code="viewer", permissions=["report_view"]),
+        ]
+        conflict = analyze_segregation_of_duties(users, roles).conflicts[0]
+        assert conflict.triggering_permissions == ["je_create", "je_post"]
+        assert conflict.triggering_roles == ["creator", "poster"]
+
+
 # =============================================================================
 # CSV export
 # =============================================================================
@@ -0,0 +1,195 @@
+"""
+Tests for the trial balance analysis bundle (shared.tb_bundle and
+POST /audit/trial-balance/bundle).
+
+The bundle must read the upload once and still agree with the standalone
+diagnostic and its derived analyses.
+"""
+
+import csv
+import io
+
+import httpx
+import pytest
+
+from shared.tb_bundle import TB_BUNDLE_ANALYSES, TBBundleOptions, analyze_trial_balance_bundle
+from shared.tb_post_processor import analyze_trial_balance_upload
+
+TB_ROWS = [
+    ["Account", "Debit", "Credit"],
+    ["1000 Cash", "50000", ""],
+    ["1100 Accounts Receivable", "32000", ""],
+    ["1300 Prepaid Insurance", "4000", ""],
+    ["2000 Accounts Payable", "", "21000"],
+    ["2100 Accrued Liabilities", "", "6000"],
+    ["2400 Deferred Revenue", "", "5000"],
+    ["3000 Retained Earnings", "", "30000"],
+    ["4000 Sales Revenue", "", "120000"],
+    ["5000 Cost of Goods Sold", "60000", ""],
+    ["6000 Rent Expense", "24000", ""],
+    ["6100 Salaries Expense", "12000", ""],
+    ["1900 Suspense", "", "0"],
+]
+
+
+def _tb_csv(rows: list[list[str]] = TB_ROWS) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def _without_timestamp(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "timestamp"}
+
+
+class TestBundleEngine:
+    def test_reads_upload_once(self, monkeypatch: pytest.MonkeyPatch):
+        import security_utils
+        from audit import pipeline
+
+        calls: list[str] = []
+        real = security_utils.process_tb_chunked
+
+        def counting(*args, **kwargs):
+            calls.append("read")
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(security_utils, "process_tb_chunked", counting)
+        monkeypatch.setattr(pipeline, "process_tb_chunked", counting)
+        bundle, _ = analyze_trial_balance_bundle(_tb_csv(), "tb.csv", list(TB_BUNDLE_ANALYSES), TBBundleOptions(), None)
+        assert calls == ["read"]
+        assert bundle["analyses"] == list(TB_BUNDLE_ANALYSES)
+        assert all(bundle.get(name) is not None for name in TB_BUNDLE_ANALYSES)
+
+    def test_diagnostic_matches_standalone(self):
+        data = _tb_csv()
+        standalone, _ = analyze_trial_balance_upload(data, "tb.csv", None, 1000.0, None, None, None)
+        bundle, _ = analyze_trial_balance_bundle(
+            data, "tb.csv", ["diagnostic"], TBBundleOptions(materiality_threshold=1000.0), None
+        )
+        assert _without_timestamp(bundle["diagnostic"]) == _without_timestamp(standalone)
+        for name in ("population_profile", "cutoff_risk", "going_concern"):
+            assert name not in bundle
+
+    def test_derived_analyses_match_diagnostic_and_standalone_engines(self):
+        from accrual_completeness_engine import run_accrual_completeness
+        from expense_category_engine import run_expense_category_analytics
+        from shared.upload_pipeline import parse_uploaded_file
+
+        data = _tb_csv()
+        options = TBBundleOptions(
+            prior_total_expenses=90000.0, prior_operating_expenses=30000.0, accrual_threshold_pct=40.0
+        )
+        bundle, _ = analyze_trial_balance_bundle(data, "tb.csv", list(TB_BUNDLE_ANALYSES), options, None)
+        diagnostic = bundle["diagnostic"]
+        assert bundle["cutoff_risk"] == diagnostic["cutoff_risk"]
+        assert bundle["going_concern"] == diagnostic["going_concern"]
+        assert bundle["population_profile"] == diagnostic["population_profile"]
+
+        columns, rows = parse_uploaded_file(data, "tb.csv")
+        expense = run_expense_category_analytics(columns, rows, "tb.csv", prior_total_expenses=90000.0).to_dict()
+        accrual = run_accrual_completeness(
+            columns, rows, "tb.csv", prior_operating_expenses=30000.0, threshold_pct=40.0
+        ).to_dict()
+        assert bundle["expense_category_analytics"]["total_expenses"] == expense["total_expenses"]
+        assert bundle["expense_category_analytics"]["prior_available"] is True
+        assert bundle["accrual_completeness"]["total_accrued_balance"] == accrual["total_accrued_balance"]
+        assert bundle["accrual_completeness"]["threshold_pct"] == 40.0
+
+        preflight = bundle["preflight"]
+        assert preflight["row_count"] == len(TB_ROWS) - 1
+        assert preflight["balance_check"]["balanced"] is True
+
+        heatmap = bundle["risk_heatmap"]
+        assert heatmap["total_signals"] >= len(diagnostic["abnormal_balances"])
+
+    @pytest.mark.parametrize("filename", ["tb.csv", "tb.xlsx"])
+    def test_preflight_matches_standalone_parse(self, filename: str):
+        """Bundle preflight checks string-typed chunks; the endpoint checks inferred frames."""
+        import pandas as pd
+
+        from preflight_engine import run_preflight
+        from shared.intake_utils import count_raw_data_rows
+        from shared.upload_pipeline import parse_uploaded_file
+
+        rows = [
+            *TB_ROWS,
+            [" 1000 Cash ", "1e3", ""],
+            ["7000 Misc", "-250.50", "n/a"],
+            ["", "", ""],
+            ["8000 Interest", "", "0.10"],
+            ["Total", "182000", "182000"],
+        ]
+        data = _tb_csv(rows)
+        if filename.endswith(".xlsx"):
+            buffer = io.BytesIO()
+            pd.read_csv(io.BytesIO(data)).to_excel(buffer, index=False, engine="openpyxl")
+            data = buffer.getvalue()
+
+        columns, parsed = parse_uploaded_file(data, filename)
+        standalone = run_preflight(
+            columns, parsed, filename, rows_submitted=count_raw_data_rows(data, filename)
+        ).to_dict()
+        bundle, _ = analyze_trial_balance_bundle(data, filename, ["preflight"], TBBundleOptions(), None)
+        assert _without_timestamp(bundle["preflight"]) == _without_timestamp(standalone)
+
+    def test_failed_diagnostic_omits_derived_analyses(self):
+        data = _tb_csv([["Name", "Amount"], ["Cash", "10"]])
+        bundle, _ = analyze_trial_balance_bundle(data, "tb.csv", ["preflight", "cutoff_risk"], TBBundleOptions(), None)
+        assert bundle["failure_reason"] == "zero_rows_ingested"
+        assert "cutoff_risk" not in bundle
+        assert bundle["preflight"]["row_count"] == 1
+
+    def test_preflight_only_skips_diagnostic(self, monkeypatch: pytest.MonkeyPatch):
+        import audit_engine
+
+        def fail(*args, **kwargs):
+            raise AssertionError("diagnostic should not run")
+
+        monkeypatch.setattr(audit_engine, "audit_trial_balance_streaming", fail)
+        bundle, _ = analyze_trial_balance_bundle(_tb_csv(), "tb.csv", ["preflight"], TBBundleOptions(), None)
+        assert bundle["analyses"] == ["preflight"]
+        assert bundle["preflight"]["filename"] == "tb.csv"
+
+
+@pytest.fixture
+def override_diagnostic_user(override_auth_verified):
+    from main import app
+    from shared.entitlement_checks import check_diagnostic_limit
+
+    app.dependency_overrides[check_diagnostic_limit] = lambda: override_auth_verified
+    yield override_auth_verified
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestBundleRoute:
+    @pytest.mark.asyncio
+    async def test_bundle_subset(self, override_diagnostic_user):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.post(
+                "/audit/trial-balance/bundle",
+                files={"file": ("tb.csv", _tb_csv(), "text/csv")},
+                data={"analyses": '["diagnostic", "going_concern", "risk_heatmap"]'},
+            )
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body["analyses"] == ["diagnostic", "going_concern", "risk_heatmap"]
+        assert body["diagnostic"]["balanced"] is True
+        assert body["diagnostic"]["materiality_source"] == body["materiality_source"]
+        assert body["going_concern"] is not None
+        assert body["preflight"] is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_analysis_rejected(self, override_diagnostic_user):
+        from main import app
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.post(
+                "/audit/trial-balance/bundle",
+                files={"file": ("tb.csv", _tb_csv(), "text/csv")},
+                data={"analyses": '["diagnostic", "benford"]'},
+            )
+        assert response.status_code == 400
+        assert "benford" in response.json()["detail"]
@@ -0,0 +1,117 @@
+"""
+Tests for the column-plan trial balance read — ``StreamingAuditor.column_plan``,
+``process_tb_chunked(column_plan=...)`` and ``parse_amount_column``.
+"""
+
+from __future__ import annotations
+
+import io
+
+import pandas as pd
+import pytest
+
+from audit.pipeline import audit_trial_balance_streaming
+from audit.streaming_auditor import StreamingAuditor
+from column_detector import ColumnMapping
+from security_utils import parse_amount_column, process_tb_chunked, read_tb_header
+
+TB_CSV = (
+    b"Account,Description,Type,Subtype,Department,Notes,Debit,Credit\n"
+    b'0010,Cash,Asset,Current,HQ,Operating account,"$284,500.00",\n'
+    b"0020,Accounts Receivable,Asset,Current,HQ,,45200,\n"
+    b'2000,Accounts Payable,Liability,Current,HQ,Trade,,"(1,250.00)"\n'
+    b"3000,Common Stock,Equity,,HQ,,,150000\n"
+    b'4000,Revenue,Revenue,,Sales,,,"180,950.00"\n'
+    b",,,,,,329700,329700\n"
+)
+
+
+def _tb_xlsx() -> bytes:
+    frame = pd.read_csv(io.BytesIO(TB_CSV), dtype=str)
+    buffer = io.BytesIO()
+    frame.to_excel(buffer, index=False, engine="openpyxl")
+    return buffer.getvalue()
+
+
+def _without_timestamp(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "timestamp"}
+
+
+class TestParseAmountColumn:
+    def test_currency_formats(self):
+        values = pd.Series(["100", "$1,234.50", "(1,234.56)", "$(5)", "  7 ", "-3", "1e2"], dtype=object)
+        assert parse_amount_column(values).tolist() == [100.0, 1234.5, -1234.56, -5.0, 7.0, -3.0, 100.0]
+
+    def test_text_and_blanks_become_nan(self):
+        parsed = parse_amount_column(pd.Series(["n/a", None, "", "Dr"], dtype=object))
+        assert parsed.isna().all()
+
+    def test_numeric_columns_pass_through(self):
+        parsed = parse_amount_column(pd.Series([1, 2]))
+        assert parsed.dtype == "float64"
+        assert parsed.tolist() == [1.0, 2.0]
+
+
+class TestColumnPlan:
+    def test_plan_keeps_mapped_columns_only(self):
+        auditor = StreamingAuditor()
+        header = read_tb_header(TB_CSV, "tb.csv")
+        plan = auditor.column_plan(header)
+        assert plan is not None
+        kept = {header[i] for i in plan.usecols}
+        assert kept == {"Account", "Description", "Type", "Subtype", "Debit", "Credit"}
+        assert plan.amount_names == ["Debit", "Credit"]
+        # Discovery saw the whole header, not just the planned columns.
+        assert "Notes" in auditor.get_column_detection().all_columns
+
+    @pytest.mark.parametrize("filename", ["tb.csv", "tb.xlsx"])
+    def test_planned_read_types(self, filename: str):
+        data = TB_CSV if filename.endswith(".csv") else _tb_xlsx()
+        plan = StreamingAuditor().column_plan(read_tb_header(data, filename))
+        (chunk, rows), *_ = process_tb_chunked(data, filename, column_plan=plan)
+        assert rows == 6
+        assert "Notes" not in chunk.columns
+        assert chunk["Account"].iloc[0] == "0010"
+        assert chunk["Debit"].dtype == "float64"
+        assert chunk["Debit"].iloc[0] == 284500.0
+        assert chunk["Credit"].iloc[2] == -1250.0
+
+    def test_user_mapping_is_planned(self):
+        mapping = ColumnMapping.from_dict(
+            {"account_column": "Description", "debit_column": "Debit", "credit_column": "Credit"}
+        )
+        auditor = StreamingAuditor(column_mapping=mapping)
+        header = read_tb_header(TB_CSV, "tb.csv")
+        plan = auditor.column_plan(header)
+        assert header.index("Description") in plan.text_columns
+        assert auditor.account_col == "Description"
+
+    def test_no_plan_without_amount_columns(self):
+        auditor = StreamingAuditor()
+        assert auditor.column_plan(["Account", "Description"]) is None
+        assert auditor.columns_discovered is False
+
+    def test_no_header_for_other_formats(self):
+        assert read_tb_header(b"Account\tDebit\tCredit\n", "tb.tsv") is None
+        assert read_tb_header(b"\x00\x01not a workbook", "tb.xlsx") is None
+
+
+class TestPlannedPipeline:
+    @pytest.mark.parametrize("filename", ["tb.csv", "tb.xlsx"])
+    def test_matches_full_string_read(self, filename: str):
+        data = TB_CSV if filename.endswith(".csv") else _tb_xlsx()
+        planned = audit_trial_balance_streaming(data, filename, materiality_threshold=500.0)
+        full = audit_trial_balance_streaming(
+            data, filename, materiality_threshold=500.0, chunks=process_tb_chunked(data, filename)
+        )
+        assert _without_timestamp(planned) == _without_timestamp(full)
+        assert planned["balanced"] is True
+        assert planned["total_debits"] == "329700.00"
+        assert planned["totals_rows_excluded"] == 1
+
+    def test_missing_columns_fail_as_before(self):
+        data = b"Account,Description\nCash,Bank\n"
+        planned = audit_trial_balance_streaming(data, "tb.csv")
+        full = audit_trial_balance_streaming(data, "tb.csv", chunks=process_tb_chunked(data, "tb.csv"))
+        assert planned["analysis_failed"] is True
+        assert planned["failure_reason"] == full["failure_reason"]
@@ -0,0 +1,241 @@
+"""
+Tests for the incrementally maintained client trend series.
+
+Covers ``shared.trend_series``: stored analyses must match a from-scratch
+``TrendAnalyzer`` / ``RollingWindowAnalyzer`` run, the write hook appends
+one period (and skips recomputation outside the analysis window), stale
+rows are rebuilt, repeat reads are served from the analysis cache, and the
+portfolio endpoint returns every owned client in one page.
+"""
+
+import sys
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import httpx
+import pytest
+from pydantic_core import to_jsonable_python
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models import DiagnosticSummary, PeriodType
+from ratio_engine import RollingWindowAnalyzer, TrendAnalyzer
+from shared import trend_series as ts
+from shared.trend_series import (
+    MAX_SERIES_PERIODS,
+    client_rolling_analysis,
+    client_trend_analysis,
+    query_client_summaries,
+    record_diagnostic_summary,
+    summary_to_snapshot,
+)
+from trend_series_model import ClientTrendSeries
+
+
+def _summary(db_session, client, period_date, *, assets=1000.0, ratio=1.5, period_type=PeriodType.QUARTERLY, hook=True):
+    summary = DiagnosticSummary(
+        client_id=client.id,
+        user_id=client.user_id,
+        period_date=period_date,
+        period_type=period_type,
+        total_assets=assets,
+        current_assets=assets / 2,
+        total_liabilities=assets / 3,
+        total_equity=assets - assets / 3,
+        total_revenue=assets / 4,
+        total_expenses=assets / 5,
+        current_ratio=ratio,
+        debt_to_equity=0.5,
+    )
+    db_session.add(summary)
+    db_session.commit()
+    if hook:
+        record_diagnostic_summary(db_session, summary)
+    return summary
+
+
+def _quarters(n):
+    return [date(2020 + i // 4, 3 * (i % 4) + 1, 28) for i in range(n)]
+
+
+def _fresh(db_session, client, analyzer_cls, limit, period_type=None):
+    summaries = query_client_summaries(db_session, client.id, client.user_id, period_type, limit)
+    analysis = analyzer_cls([summary_to_snapshot(s) for s in summaries]).get_full_analysis()
+    return to_jsonable_python(analysis)
+
+
+class TestEquivalence:
+    def test_stored_trend_matches_fresh_analysis(self, db_session, make_client):
+        client = make_client()
+        for i, period in enumerate(_quarters(5)):
+            _summary(db_session, client, period, assets=1000.0 + 137.31 * i, ratio=1.2 + 0.07 * i)
+
+        analysis, periods = client_trend_analysis(db_session, client.id, client.user_id, None)
+        assert periods == 5
+        assert analysis == _fresh(db_session, client, TrendAnalyzer, 12)
+
+    def test_non_default_limit_and_rolling_match(self, db_session, make_client):
+        client = make_client()
+        for i, period in enumerate(_quarters(6)):
+            _summary(db_session, client, period, assets=500.0 * (i + 1), ratio=2.0 - 0.1 * i)
+
+        analysis, periods = client_trend_analysis(db_session, client.id, client.user_id, None, limit=3)
+        assert periods == 3
+        assert analysis == _fresh(db_session, client, TrendAnalyzer, 3)
+
+        rolling, _ = client_rolling_analysis(db_session, client.id, client.user_id, None)
+        assert rolling == _fresh(db_session, client, RollingWindowAnalyzer, MAX_SERIES_PERIODS)
+
+    def test_period_type_series_kept_separately(self, db_session, make_client):
+        client = make_client()
+        for period in _quarters(2):
+            _summary(db_session, client, period)
+        _summary(db_session, client, date(2021, 12, 31), period_type=PeriodType.ANNUAL)
+
+        _, quarterly = client_trend_analysis(db_session, client.id, client.user_id, PeriodType.QUARTERLY)
+        _, everything = client_trend_analysis(db_session, client.id, client.user_id, None)
+        assert (quarterly, everything) == (2, 3)
+        keys = {r.period_type for r in db_session.query(ClientTrendSeries).filter_by(client_id=client.id)}
+        assert keys == {"all", "quarterly", "annual"}
+
+
+class TestIncrementalAppend:
+    def test_back_dated_summary_inserted_in_order(self, db_session, make_client):
+        client = make_client()
+        _summary(db_session, client, date(2024, 6, 30), assets=2000.0)
+        _summary(db_session, client, date(2024, 12, 31), assets=3000.0)
+        _summary(db_session, client, date(2024, 3, 31), assets=1000.0)
+
+        row = db_session.query(ClientTrendSeries).filter_by(client_id=client.id, period_type="all").one()
+        series = ts.TrendSeries.from_row(row)
+        assert [e["period_date"] for e in series.entries] == ["2024-03-31", "2024-06-30", "2024-12-31"]
+        assert series.trend_analysis == _fresh(db_session, client, TrendAnalyzer, 12)
+
+    def test_append_past_window_skips_trend_recompute(self, db_session, make_client, monkeypatch):
+        client = make_client()
+        for period in _quarters(12):
+            _summary(db_session, client, period)
+
+        calls = []
+        original = ts._trend_analysis
+        monkeypatch.setattr(ts, "_trend_analysis", lambda entries: calls.append(len(entries)) or original(entries))
+        _summary(db_session, client, date(2030, 1, 1))
+        assert calls == []
+
+        row = db_session.query(ClientTrendSeries).filter_by(client_id=client.id, period_type="all").one()
+        assert row.summary_count == 13
+        assert len(ts.TrendSeries.from_row(row).entries) == 13
+
+    def test_series_capped_at_analysis_window(self, db_session, make_client):
+        client = make_client()
+        for period in _quarters(MAX_SERIES_PERIODS + 2):
+            _summary(db_session, client, period)
+        row = db_session.query(ClientTrendSeries).filter_by(client_id=client.id, period_type="all").one()
+        assert len(ts.TrendSeries.from_row(row).entries) == MAX_SERIES_PERIODS
+        assert row.summary_count == MAX_SERIES_PERIODS + 2
+
+
+class TestFreshness:
+    def test_summary_written_without_hook_triggers_rebuild(self, db_session, make_client):
+        client = make_client()
+        for period in _quarters(2):
+            _summary(db_session, client, period)
+        _summary(db_session, client, date(2019, 1, 31), assets=50.0, hook=False)
+
+        analysis, periods = client_trend_analysis(db_session, client.id, client.user_id, None)
+        assert periods == 3
+        assert analysis == _fresh(db_session, client, TrendAnalyzer, 12)
+
+    def test_archived_summary_drops_out(self, db_session, make_client):
+        client = make_client()
+        summaries = [_summary(db_session, client, period) for period in _quarters(3)]
+        summaries[0].archived_at = datetime.now(UTC)
+        db_session.commit()
+
+        _, periods = client_trend_analysis(db_session, client.id, client.user_id, None)
+        assert periods == 2
+
+    def test_repeat_read_served_from_cache(self, db_session, make_client, monkeypatch):
+        client = make_client()
+        for period in _quarters(3):
+            _summary(db_session, client, period)
+        first = client_trend_analysis(db_session, client.id, client.user_id, None)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("series should not be reloaded")
+
+        monkeypatch.setattr(ts, "_load_series", _fail)
+        assert client_trend_analysis(db_session, client.id, client.user_id, None) == first
+
+    def test_rolling_result_is_private_copy(self, db_session, make_client):
+        client = make_client()
+        for period in _quarters(3):
+            _summary(db_session, client, period)
+        rolling, _ = client_rolling_analysis(db_session, client.id, client.user_id, None)
+        rolling["category_rolling"].clear()
+        again, _ = client_rolling_analysis(db_session, client.id, client.user_id, None)
+        assert again["category_rolling"]
+
+
+class TestPortfolioEndpoint:
+    @pytest.mark.asyncio
+    async def test_returns_all_owned_clients(self, db_session, override_auth_verified, make_client, make_user):
+        from main import app
+
+        alpha = make_client(name="Alpha", user=override_auth_verified)
+        beta = make_client(name="Beta", user=override_auth_verified)
+        make_client(name="Someone Else's", user=make_user(email="other_portfolio@example.com"))
+        for i, period in enumerate(_quarters(3)):
+            _summary(db_session, alpha, period, assets=1000.0 + i)
+        # Written without the hook — the portfolio view backfills it.
+        _summary(db_session, beta, date(2024, 3, 31), hook=False)
+        _summary(db_session, beta, date(2024, 6, 30), hook=False)
+        ts._analysis_cache.clear()
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.get("/clients/portfolio/trends")
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["total_count"] == 2
+        assert [item["client_name"] for item in body["items"]] == ["Alpha", "Beta"]
+        assert body["items"][0]["periods_analyzed"] == 3
+        assert body["items"][0]["analysis"] == _fresh(db_session, alpha, TrendAnalyzer, 12)
+        assert body["items"][1]["analysis"] == _fresh(db_session, beta, TrendAnalyzer, 12)
+        assert db_session.query(ClientTrendSeries).filter_by(client_id=beta.id, period_type="all").count() == 1
+
+    @pytest.mark.asyncio
+    async def test_client_without_history_has_no_analysis(self, db_session, override_auth_verified, make_client):
+        from main import app
+
+        make_client(name="Fresh", user=override_auth_verified)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            r = await ac.get("/clients/portfolio/trends")
+        item = r.json()["items"][0]
+        assert item["analysis"] is None
+        assert item["periods_analyzed"] == 0
+
+
+@pytest.mark.usefixtures("bypass_csrf")
+class TestSummaryWriteHook:
+    @pytest.mark.asyncio
+    async def test_saving_summary_updates_series(self, db_session, override_auth_verified, make_client):
+        from main import app
+
+        client = make_client(user=override_auth_verified)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            for period in ("2025-03-31", "2025-06-30"):
+                r = await ac.post(
+                    "/diagnostics/summary",
+                    json={
+                        "client_id": client.id,
+                        "filename": "tb.csv",
+                        "period_date": period,
+                        "period_type": "quarterly",
+                        "total_assets": 1000.0,
+                    },
+                )
+                assert r.status_code == 201, r.text
+
+        row = db_session.query(ClientTrendSeries).filter_by(client_id=client.id, period_type="quarterly").one()
+        assert row.summary_count == 2
+        assert row.trend_json is not None
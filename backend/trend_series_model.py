@@ -0,0 +1,57 @@
+"""
+Derived per-client trend series.
+
+One row per (client, user, period type) holding the ordered period snapshots
+that feed ``TrendAnalyzer`` / ``RollingWindowAnalyzer`` plus the analyses
+computed from them, maintained incrementally as diagnostic summaries are
+written (see ``shared.trend_series``).
+
+ZERO-STORAGE COMPLIANCE:
+  - Derived entirely from ``diagnostic_summaries`` aggregate totals and
+    ratios — no account names, row data, or file content.
+
+``latest_summary_id`` / ``summary_count`` record the active summaries the row
+was built from; a mismatch with the live table (new summary written outside
+the hook, retention archival) makes the row stale and it is rebuilt on read.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database import Base
+
+
+class ClientTrendSeries(Base):
+    """Stored trend inputs and analyses for one client / user / period type."""
+
+    __tablename__ = "client_trend_series"
+    __table_args__ = (UniqueConstraint("client_id", "user_id", "period_type", name="uq_client_trend_series_key"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    client_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("clients.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    # "all" for the unfiltered series, otherwise a PeriodType value
+    period_type: Mapped[str] = mapped_column(String(16), nullable=False)
+
+    latest_summary_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    summary_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # JSON: ordered period snapshots (oldest first, capped at the analysis window)
+    snapshots_json: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    # JSON: TrendAnalyzer / RollingWindowAnalyzer output (NULL below 2 periods)
+    trend_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    rolling_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ClientTrendSeries(client_id={self.client_id}, period_type={self.period_type}, "
+            f"latest_summary_id={self.latest_summary_id})>"
+        )
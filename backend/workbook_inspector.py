@@ -6,8 +6,6 @@ from dataclasses import asdict, dataclass
 from typing import Any
 
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.utils.exceptions import InvalidFileException
 
 from security_utils import log_secure_operation
 
@@ -72,6 +70,8 @@ def inspect_workbook(file_bytes: bytes, filename: str = "") -> WorkbookInfo:
         else:
             raise ValueError("File is not a recognized spreadsheet format (.xlsx, .xls, or .ods)")
 
+    from openpyxl.utils.exceptions import InvalidFileException
+
     buffer = io.BytesIO(file_bytes)
     sheets: list[SheetInfo] = []
 
@@ -118,6 +118,8 @@ def inspect_workbook(file_bytes: bytes, filename: str = "") -> WorkbookInfo:
 
 def _inspect_xlsx(buffer: io.BytesIO, filename: str) -> list[SheetInfo]:
     """Inspect an .xlsx file using openpyxl in read-only mode."""
+    from openpyxl import load_workbook
+
     sheets: list[SheetInfo] = []
 
     # Use read_only mode for faster inspection
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""API cold-start import budget check.
+
+Runs ``python -X importtime -c "import main"`` in a fresh interpreter from
+``backend/`` and compares the result against ``backend/import_budget.toml``:
+
+    - ``[budget] max_total_ms`` — cumulative import time of ``main``
+    - ``[deferred] modules``    — modules that must NOT be imported at startup
+                                  (they load through ``shared.lazy_import``)
+
+Exit codes:
+    0 — within budget and no deferred module imported eagerly
+    1 — budget exceeded or a deferred module was imported at startup
+    2 — usage / IO error (missing TOML, ``import main`` failed)
+
+Usage:
+    python scripts/check_import_budget.py [--budget <toml>] [--max-total-ms N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+
+EXIT_OK = 0
+EXIT_BUDGET_BREACH = 1
+EXIT_USAGE_ERROR = 2
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = REPO_ROOT / "backend"
+DEFAULT_BUDGET_PATH = BACKEND_DIR / "import_budget.toml"
+
+# "import time:      self [us] |  cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+# Minimal config so ``import main`` works without a real .env (mirrors
+# scripts/check_openapi_drift.py).
+_MIN_ENV = {
+    "API_HOST": "0.0.0.0",
+    "API_PORT": "8000",
+    "CORS_ORIGINS": "http://localhost:3000",
+    "DATABASE_URL": "sqlite:///./import_budget_check.db",
+    "ENV_MODE": "development",
+}
+
+
+@dataclass(frozen=True)
+class Budget:
+    max_total_ms: float
+    deferred: frozenset[str]
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    total_ms: float
+    modules: dict[str, float]  # module -> cumulative ms
+
+
+def load_budget(budget_path: Path) -> Budget:
+    """Load ``import_budget.toml``. Raises ValueError on a malformed file."""
+    data = tomllib.loads(budget_path.read_bytes().decode("utf-8"))
+    budget_section = data.get("budget") or {}
+    max_total = budget_section.get("max_total_ms")
+    if not isinstance(max_total, (int, float)) or max_total <= 0:
+        raise ValueError(f"{budget_path}: [budget] max_total_ms must be a positive number")
+    deferred = (data.get("deferred") or {}).get("modules", [])
+    if not isinstance(deferred, list) or not all(isinstance(m, str) for m in deferred):
+        raise ValueError(f"{budget_path}: [deferred] modules must be a list of strings")
+    return Budget(max_total_ms=float(max_total), deferred=frozenset(deferred))
+
+
+def parse_importtime(stderr: str, root_module: str = "main") -> ImportProfile:
+    """Parse ``-X importtime`` output into a profile.
+
+    The root module's cumulative time is the total; if it never appears
+    (import failed part-way) a ValueError is raised.
+    """
+    modules: dict[str, float] = {}
+    total_ms: float | None = None
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_ms = int(match.group(2)) / 1000
+        name = match.group(4)
+        modules[name] = cumulative_ms
+        if name == root_module and len(match.group(3)) <= 1:
+            total_ms = cumulative_ms
+    if total_ms is None:
+        raise ValueError(f"'{root_module}' not found in importtime output")
+    return ImportProfile(total_ms=total_ms, modules=modules)
+
+
+def measure(root_module: str = "main") -> ImportProfile:
+    """Import ``root_module`` in a fresh interpreter and profile it."""
+    env = {**_MIN_ENV, **os.environ}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {root_module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-10:])
+        raise RuntimeError(f"import {root_module} failed (exit {proc.returncode}):\n{tail}")
+    return parse_importtime(proc.stderr, root_module)
+
+
+def check(profile: ImportProfile, budget: Budget) -> list[str]:
+    """Return human-readable violations (empty list = pass)."""
+    violations: list[str] = []
+    if profile.total_ms > budget.max_total_ms:
+        violations.append(f"import main took {profile.total_ms:.0f} ms (budget {budget.max_total_ms:.0f} ms)")
+    for module in sorted(budget.deferred & profile.modules.keys()):
+        violations.append(f"deferred module '{module}' imported at startup ({profile.modules[module]:.0f} ms)")
+    return violations
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET_PATH, help="Path to import_budget.toml")
+    parser.add_argument("--max-total-ms", type=float, default=None, help="Override [budget] max_total_ms")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest top-level imports to print")
+    args = parser.parse_args(argv)
+
+    try:
+        budget = load_budget(args.budget)
+    except (OSError, ValueError, tomllib.TOMLDecodeError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    if args.max_total_ms is not None:
+        budget = Budget(max_total_ms=args.max_total_ms, deferred=budget.deferred)
+
+    try:
+        profile = measure()
+    except (RuntimeError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+
+    print(f"import main: {profile.total_ms:.0f} ms (budget {budget.max_total_ms:.0f} ms)")
+    slowest = sorted(profile.modules.items(), key=lambda kv: kv[1], reverse=True)[1 : args.top + 1]
+    for name, ms in slowest:
+        print(f"  {ms:8.0f} ms  {name}")
+
+    violations = check(profile, budget)
+    if violations:
+        print("\nImport budget violations:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return EXIT_BUDGET_BREACH
+    print("OK: import budget met")
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())